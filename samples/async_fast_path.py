@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Async micro-benchmark: ``AsyncConnection.execute()`` vs ``fast_execute()``.
+
+Runs a primary-key SELECT and a single-row INSERT many times through both
+paths and prints per-call latency percentiles.  Tiny queries are where the
+greenlet bridge overhead shows.
+
+Requirements:
+    pip install sqlalchemy-cubrid pycubrid
+
+Usage:
+    # Start CUBRID (e.g. via Docker):
+    #   docker run -d --name cubrid -p 33000:33000 cubrid/cubrid:11.2
+    python samples/async_fast_path.py [iterations]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from sqlalchemy_cubrid.aio import fast_execute
+
+DB_URL = "cubrid+aiopycubrid://dba:@localhost:33000/demodb"
+
+metadata = MetaData()
+items = Table(
+    "async_fast_path_items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+
+
+async def measure(label: str, iterations: int, call: Callable[[int], Awaitable[Any]]) -> None:
+    # Warm up the compiled cache and the connection.
+    for i in range(10):
+        await call(i)
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await call(i)
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    p50 = statistics.median(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"  {label:<34} p50={p50:8.1f}us  p99={p99:8.1f}us")
+
+
+async def main(iterations: int) -> None:
+    engine = create_async_engine(DB_URL)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS async_fast_path_items"))
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(items.insert(), [{"id": i, "name": f"item{i}"} for i in range(100)])
+
+    by_id = select(items.c.name).where(items.c.id == 42)
+
+    async with engine.connect() as conn:
+        print(f"SELECT by primary key ({iterations} calls)")
+        await measure("AsyncConnection.execute()", iterations, lambda i: conn.execute(by_id))
+        await measure("fast_execute()", iterations, lambda i: fast_execute(conn, by_id))
+
+        print(f"Single-row INSERT ({iterations} calls)")
+        await measure(
+            "AsyncConnection.execute()",
+            iterations,
+            lambda i: conn.execute(items.insert(), {"id": 1000 + i, "name": "x"}),
+        )
+        await measure(
+            "fast_execute()",
+            iterations,
+            lambda i: fast_execute(conn, items.insert(), {"id": 100000 + i, "name": "x"}),
+        )
+        await conn.rollback()
+
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS async_fast_path_items"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""Async throughput and latency benchmark for the ``cubrid+aiopycubrid`` dialect.
+
+Scenarios, each run at every concurrency level (number of tasks):
+
+- ``single_row_latency`` — primary-key SELECT per call; latency percentiles
+- ``checkout_throughput`` — pool checkout + ``SELECT 1`` + checkin per call
+- ``bulk_insert`` — ``executemany()`` INSERT batches; rows per second
+- ``streaming_fetch`` — ``AsyncConnection.stream()`` with ``yield_per``
+
+By default the benchmark runs against an in-process stand-in for
+``pycubrid.aio`` that answers each request after ``--stub-latency-ms``,
+serialized per connection like a CAS.  That isolates dialect, SQLAlchemy
+and event-loop overhead from the server.  Pass ``--dsn`` to run against a
+live CUBRID instead.  Each loop in ``--loops`` (``asyncio``, ``uvloop``)
+runs all scenarios; uvloop is skipped if it is not installed.
+
+The JSON report has the same top-level layout as
+``scripts/profile_orm.py`` (``total_request_time_s`` plus per-section
+dicts with ``*_s`` fields in seconds).
+
+Usage:
+    python scripts/bench_async.py
+    python scripts/bench_async.py --concurrency 1,10,100 --loops asyncio,uvloop
+    python scripts/bench_async.py --dsn cubrid+aiopycubrid://dba@localhost:33000/benchdb
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+import sqlalchemy
+from sqlalchemy import Column, Integer, MetaData, String, Table, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+DEFAULT_OUTPUT_PATH = Path("bench_async_report.json")
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+metadata = MetaData()
+bench_items = Table(
+    "bench_async_items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+    Column("score", Integer),
+)
+
+
+# ---------------------------------------------------------------------------
+# Stand-in pycubrid.aio driver
+# ---------------------------------------------------------------------------
+
+
+class StubServer:
+    """Shared state of the stand-in: simulated latency and the row set."""
+
+    def __init__(self, latency_s: float, rows: int) -> None:
+        self.latency_s = latency_s
+        self.rows = [(i, f"item{i:06d}", i % 100) for i in range(rows)]
+        self.requests = 0
+
+    async def round_trip(self, lock: asyncio.Lock) -> None:
+        async with lock:
+            self.requests += 1
+            await asyncio.sleep(self.latency_s)
+
+
+class StubCursor:
+    def __init__(self, connection: StubConnection) -> None:
+        self._connection = connection
+        self._server = connection.server
+        self.description: Any = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self.fetch_size = 100
+        self._rows: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> StubCursor:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def execute(self, operation: str, parameters: Any = None) -> StubCursor:
+        await self._server.round_trip(self._connection.lock)
+        if operation.startswith("SELECT VERSION()"):
+            rows: list[tuple[Any, ...]] = [("11.2.0.0378",)]
+        elif operation.startswith("SELECT SCHEMA()"):
+            rows = [("PUBLIC",)]
+        elif operation.startswith("SELECT 1"):
+            rows = [(1,)]
+        elif operation.startswith("SELECT") and parameters:
+            rows = [self._server.rows[int(parameters[0]) % len(self._server.rows)]]
+        elif operation.startswith("SELECT"):
+            rows = self._server.rows
+        else:
+            self.description = None
+            self.rowcount = 1
+            return self
+        self.description = [(f"c{i}", 2, None, None, None, None, None) for i in range(len(rows[0]))]
+        self.rowcount = len(rows)
+        self._rows = list(rows)
+        return self
+
+    async def executemany(self, operation: str, seq_of_parameters: Any, **kw: Any) -> StubCursor:
+        await self._server.round_trip(self._connection.lock)
+        self.description = None
+        self.rowcount = len(seq_of_parameters)
+        return self
+
+    async def fetchall(self) -> list[tuple[Any, ...]]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    async def fetchmany(self, size: int | None = None) -> list[tuple[Any, ...]]:
+        size = size or self.fetch_size
+        if not self._rows:
+            return []
+        # Each CAS fetch page is one more round trip.
+        await self._server.round_trip(self._connection.lock)
+        page, self._rows = self._rows[:size], self._rows[size:]
+        return page
+
+    async def fetchone(self) -> tuple[Any, ...] | None:
+        rows = await self.fetchmany(1)
+        return rows[0] if rows else None
+
+    async def close(self) -> None:
+        pass
+
+
+class StubConnection:
+    """Stand-in for ``pycubrid.aio.AsyncConnection``."""
+
+    def __init__(self, server: StubServer) -> None:
+        self.server = server
+        self.lock = asyncio.Lock()
+        self.autocommit = False
+
+    def cursor(self) -> StubCursor:
+        return StubCursor(self)
+
+    async def set_autocommit(self, value: bool) -> None:
+        self.autocommit = value
+
+    async def commit(self) -> None:
+        await self.server.round_trip(self.lock)
+
+    async def rollback(self) -> None:
+        await self.server.round_trip(self.lock)
+
+    async def ping(self, reconnect: bool = False) -> bool:
+        await self.server.round_trip(self.lock)
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def _latency_summary(latencies: list[float], wall_s: float, operations: int) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "operations": operations,
+        "wall_time_s": wall_s,
+        "ops_per_s": operations / wall_s if wall_s else 0.0,
+        "mean_s": statistics.fmean(ordered) if ordered else 0.0,
+        "p50_s": _percentile(ordered, 50),
+        "p95_s": _percentile(ordered, 95),
+        "p99_s": _percentile(ordered, 99),
+        "max_s": ordered[-1] if ordered else 0.0,
+    }
+
+
+async def _run_workers(
+    concurrency: int, per_worker: int, op: Callable[[int, int], Awaitable[None]]
+) -> tuple[list[float], float]:
+    latencies: list[float] = []
+
+    async def worker(worker_id: int) -> None:
+        for i in range(per_worker):
+            started = perf_counter()
+            await op(worker_id, i)
+            latencies.append(perf_counter() - started)
+
+    started = perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    return latencies, perf_counter() - started
+
+
+async def bench_single_row_latency(
+    engine: AsyncEngine, concurrency: int, ops: int
+) -> dict[str, Any]:
+    stmt = select(bench_items).where(bench_items.c.id == 0)
+    per_worker = max(1, ops // concurrency)
+    connections = [await engine.connect() for _ in range(concurrency)]
+    try:
+
+        async def op(worker_id: int, i: int) -> None:
+            result = await connections[worker_id].execute(stmt.params(id_1=i))
+            result.one()
+
+        latencies, wall = await _run_workers(concurrency, per_worker, op)
+    finally:
+        for conn in connections:
+            await conn.close()
+    return _latency_summary(latencies, wall, per_worker * concurrency)
+
+
+async def bench_checkout_throughput(
+    engine: AsyncEngine, concurrency: int, ops: int
+) -> dict[str, Any]:
+    per_worker = max(1, ops // concurrency)
+
+    async def op(worker_id: int, i: int) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    latencies, wall = await _run_workers(concurrency, per_worker, op)
+    return _latency_summary(latencies, wall, per_worker * concurrency)
+
+
+async def bench_bulk_insert(
+    engine: AsyncEngine, concurrency: int, rows: int, batch_size: int
+) -> dict[str, Any]:
+    per_worker = max(1, rows // concurrency)
+
+    async def worker(worker_id: int) -> None:
+        base = 1_000_000 + worker_id * per_worker
+        async with engine.begin() as conn:
+            for start in range(0, per_worker, batch_size):
+                count = min(batch_size, per_worker - start)
+                await conn.execute(
+                    bench_items.insert(),
+                    [{"id": base + start + i, "name": "bulk", "score": i} for i in range(count)],
+                )
+
+    started = perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    wall = perf_counter() - started
+    async with engine.begin() as conn:
+        await conn.execute(bench_items.delete().where(bench_items.c.id >= 1_000_000))
+    total = per_worker * concurrency
+    return {"rows": total, "wall_time_s": wall, "rows_per_s": total / wall if wall else 0.0}
+
+
+async def bench_streaming_fetch(
+    engine: AsyncEngine, concurrency: int, yield_per: int
+) -> dict[str, Any]:
+    stmt = select(bench_items).execution_options(yield_per=yield_per)
+    counts: list[int] = []
+
+    async def worker(worker_id: int) -> None:
+        async with engine.connect() as conn:
+            result = await conn.stream(stmt)
+            count = 0
+            async for partition in result.partitions():
+                count += len(partition)
+            counts.append(count)
+
+    started = perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    wall = perf_counter() - started
+    total = sum(counts)
+    return {"rows": total, "wall_time_s": wall, "rows_per_s": total / wall if wall else 0.0}
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+def _make_engine(args: argparse.Namespace, server: StubServer | None) -> AsyncEngine:
+    # Size the pool for the highest concurrency level unless told otherwise,
+    # so single_row_latency (one pinned connection per task) never waits.
+    pool_size = args.pool_size or max(args.concurrency)
+    pool_kw = {"pool_size": pool_size, "max_overflow": args.max_overflow}
+    if server is None:
+        return create_async_engine(args.dsn, **pool_kw)
+
+    async def creator() -> StubConnection:
+        return StubConnection(server)
+
+    return create_async_engine("cubrid+aiopycubrid://", async_creator=creator, **pool_kw)
+
+
+async def _prepare(engine: AsyncEngine, rows: int, live: bool) -> None:
+    if not live:
+        return
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(
+            bench_items.insert(),
+            [{"id": i, "name": f"item{i:06d}", "score": i % 100} for i in range(rows)],
+        )
+
+
+async def _teardown(engine: AsyncEngine, live: bool) -> None:
+    if live:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+    await engine.dispose()
+
+
+async def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    live = args.dsn is not None
+    server = None if live else StubServer(args.stub_latency_ms / 1000, args.stream_rows)
+    engine = _make_engine(args, server)
+    await _prepare(engine, args.stream_rows, live)
+    scenarios: dict[str, dict[str, Any]] = {
+        "single_row_latency": {},
+        "checkout_throughput": {},
+        "bulk_insert": {},
+        "streaming_fetch": {},
+    }
+    try:
+        for level in args.concurrency:
+            key = f"concurrency_{level}"
+            scenarios["single_row_latency"][key] = await bench_single_row_latency(
+                engine, level, args.ops
+            )
+            scenarios["checkout_throughput"][key] = await bench_checkout_throughput(
+                engine, level, args.ops
+            )
+            scenarios["bulk_insert"][key] = await bench_bulk_insert(
+                engine, level, args.bulk_rows, args.batch_size
+            )
+            scenarios["streaming_fetch"][key] = await bench_streaming_fetch(
+                engine, level, args.yield_per
+            )
+    finally:
+        await _teardown(engine, live)
+    if server is not None:
+        scenarios["stub_requests"] = {"count": server.requests}
+    return scenarios
+
+
+def _loop_factory(name: str) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    if name == "asyncio":
+        return asyncio.new_event_loop
+    if name == "uvloop":
+        try:
+            uvloop = importlib.import_module("uvloop")
+        except ImportError:
+            return None
+        return uvloop.new_event_loop  # type: ignore[no-any-return]
+    raise SystemExit(f"unknown loop {name!r}; expected asyncio or uvloop")
+
+
+def _run_on_loop(
+    factory: Callable[[], asyncio.AbstractEventLoop], args: argparse.Namespace
+) -> dict[str, Any]:
+    loop = factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(run_suite(args))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def _build_report(
+    args: argparse.Namespace, loops: dict[str, Any], total_wall_time_s: float
+) -> dict[str, Any]:
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "total_request_time_s": total_wall_time_s,
+        "environment": {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "mode": "live" if args.dsn else "stub",
+            "stub_latency_s": None if args.dsn else args.stub_latency_ms / 1000,
+            "pool_size": args.pool_size or max(args.concurrency),
+            "max_overflow": args.max_overflow,
+        },
+        "loops": loops,
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print("== Async dialect benchmark ==")
+    print(f"Mode: {report['environment']['mode']}")
+    print(f"Total time: {report['total_request_time_s']:.3f}s")
+    for loop_name, scenarios in report["loops"].items():
+        print(f"\n[{loop_name}]")
+        if scenarios is None:
+            print("  skipped (not installed)")
+            continue
+        for level, data in scenarios["single_row_latency"].items():
+            print(
+                f"  single_row_latency {level:<16} p50={data['p50_s'] * 1e6:8.1f}us "
+                f"p99={data['p99_s'] * 1e6:8.1f}us  {data['ops_per_s']:9.0f} ops/s"
+            )
+        for level, data in scenarios["checkout_throughput"].items():
+            print(f"  checkout_throughput {level:<15} {data['ops_per_s']:9.0f} ops/s")
+        for level, data in scenarios["bulk_insert"].items():
+            print(f"  bulk_insert {level:<23} {data['rows_per_s']:9.0f} rows/s")
+        for level, data in scenarios["streaming_fetch"].items():
+            print(f"  streaming_fetch {level:<19} {data['rows_per_s']:9.0f} rows/s")
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    _ = parser.add_argument("--dsn", default=None, help="Live cubrid+aiopycubrid DSN")
+    _ = parser.add_argument(
+        "--loops", default="asyncio,uvloop", help="Comma-separated event loops to run"
+    )
+    _ = parser.add_argument(
+        "--concurrency", type=_int_list, default=[1, 10, 100], help="Task counts, e.g. 1,10,100"
+    )
+    _ = parser.add_argument("--ops", type=int, default=2000, help="Operations per latency run")
+    _ = parser.add_argument("--bulk-rows", type=int, default=20000, help="Rows per bulk run")
+    _ = parser.add_argument("--batch-size", type=int, default=1000, help="Rows per executemany")
+    _ = parser.add_argument("--stream-rows", type=int, default=10000, help="Rows to stream")
+    _ = parser.add_argument("--yield-per", type=int, default=500, help="Streaming page size")
+    _ = parser.add_argument(
+        "--pool-size", type=int, default=None, help="Async pool size (default: max concurrency)"
+    )
+    _ = parser.add_argument("--max-overflow", type=int, default=0, help="Async pool overflow")
+    _ = parser.add_argument(
+        "--stub-latency-ms",
+        type=float,
+        default=0.2,
+        help="Simulated CAS round-trip time of the stand-in driver",
+    )
+    _ = parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT_PATH, help="JSON report path"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    args = parse_args(argv)
+    loops: dict[str, Any] = {}
+    started = perf_counter()
+    for name in args.loops.split(","):
+        factory = _loop_factory(name.strip())
+        loops[name] = None if factory is None else _run_on_loop(factory, args)
+    report = _build_report(args, loops, perf_counter() - started)
+    _print_report(report)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote JSON report to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
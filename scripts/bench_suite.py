@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+"""Regression benchmark suite for the CUBRID dialect, with stored baselines.
+
+Scenarios (``<group>.<name>``; select groups with ``--scenarios``):
+
+- ``compile.*`` — statement compilation without the compiled cache
+  (SELECT + LIMIT/OFFSET, INSERT, INSERT ... ON DUPLICATE KEY UPDATE,
+  MERGE, SELECT ... FOR UPDATE)
+- ``reflection.table`` — columns, primary key, indexes, foreign keys and
+  unique constraints of one table through a fresh ``Inspector``
+- ``bind_result.select_rows`` — executing a cached SELECT with typed bind
+  parameters and processing 100 typed result rows
+- ``bulk_insert.executemany`` — one ``executemany()`` INSERT of 1000 rows
+- ``streaming_fetch.yield_per`` — 5000 rows fetched with ``yield_per``
+
+By default every scenario runs against an in-process stand-in for the
+``pycubrid`` DBAPI that answers immediately, so timings cover only the
+dialect and SQLAlchemy.  ``--dsn`` runs the same scenarios against a live
+CUBRID.
+
+Each scenario is timed ``--repeats`` times; one sample is the mean time
+of one operation over a loop long enough to last ``--min-sample-ms``.
+Samples are summarized by median and MAD (median absolute deviation).
+A pure-Python ``calibration`` loop is timed the same way and used to
+scale baselines recorded on another machine.
+
+``check`` compares a run with the baseline file and exits with status 1
+when a scenario's median is slower than the scaled baseline median by
+more than ``max(--tolerance, --noise-factor * relative MAD)``.
+
+Usage:
+    python scripts/bench_suite.py run
+    python scripts/bench_suite.py record                       # rewrite the baseline
+    python scripts/bench_suite.py check --tolerance 0.15
+    python scripts/bench_suite.py check --scenarios compile,reflection
+    python scripts/bench_suite.py check --current bench_suite_report.json
+    python scripts/bench_suite.py run --dsn cubrid+pycubrid://dba@localhost:33000/benchdb
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import decimal
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+import sqlalchemy
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    bindparam,
+    create_engine,
+    inspect,
+    insert,
+    select,
+)
+from sqlalchemy.engine import Engine
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+DEFAULT_BASELINE_PATH = REPO_ROOT / "scripts" / "baselines" / "bench_suite_stub.json"
+DEFAULT_OUTPUT_PATH = Path("bench_suite_report.json")
+SELECT_ROWS = 100
+BULK_ROWS = 1000
+STREAM_ROWS = 5000
+YIELD_PER = 500
+# Scales a MAD to a standard deviation for normally distributed samples.
+MAD_TO_SIGMA = 1.4826
+
+metadata = MetaData()
+bench_teams = Table(
+    "bench_suite_teams",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+bench_items = Table(
+    "bench_suite_items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("team_id", Integer, ForeignKey("bench_suite_teams.id")),
+    Column("name", String(100), unique=True),
+    Column("price", Numeric(10, 2)),
+    Column("active", Boolean),
+    Column("created_at", DateTime),
+)
+merge_source = Table(
+    "bench_suite_staging",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+
+
+def _item_row(i: int) -> tuple[Any, ...]:
+    return (
+        i,
+        i % 10,
+        f"item{i:06d}",
+        decimal.Decimal(i % 1000) / 10,
+        i % 2,
+        dt.datetime(2026, 1, 1) + dt.timedelta(seconds=i),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Stand-in pycubrid driver
+# ---------------------------------------------------------------------------
+
+_SHOW_COLUMNS = [
+    ("id", "INTEGER", "NO", "PRI", None, "auto_increment"),
+    ("team_id", "INTEGER", "YES", "MUL", None, ""),
+    ("name", "VARCHAR(100)", "YES", "UNI", None, ""),
+    ("price", "NUMERIC(10,2)", "YES", "", None, ""),
+    ("active", "SMALLINT", "YES", "", None, ""),
+    ("created_at", "DATETIME", "YES", "", None, ""),
+]
+_SHOW_INDEXES = [
+    ("bench_suite_items", 1, "pk_bench_suite_items", 1, "id"),
+    ("bench_suite_items", 0, "u_bench_suite_items_name", 1, "name"),
+    ("bench_suite_items", 1, "fk_bench_suite_items_team_id", 1, "team_id"),
+]
+_SHOW_CREATE = [
+    (
+        "bench_suite_items",
+        "CREATE TABLE [bench_suite_items] (\n"
+        "  [id] INTEGER NOT NULL AUTO_INCREMENT,\n"
+        "  [team_id] INTEGER,\n"
+        "  [name] VARCHAR(100),\n"
+        "  [price] NUMERIC(10,2),\n"
+        "  [active] SMALLINT,\n"
+        "  [created_at] DATETIME,\n"
+        "  CONSTRAINT [pk_bench_suite_items] PRIMARY KEY ([id]),\n"
+        "  CONSTRAINT [u_bench_suite_items_name] UNIQUE KEY ([name]),\n"
+        "  CONSTRAINT [fk_bench_suite_items_team_id] FOREIGN KEY ([team_id]) "
+        "REFERENCES [dba.bench_suite_teams] ([id])\n"
+        ")",
+    )
+]
+_DB_INDEX = [
+    ("pk_bench_suite_items", "YES", "NO"),
+    ("u_bench_suite_items_name", "NO", "NO"),
+    ("fk_bench_suite_items_team_id", "NO", "YES"),
+]
+
+
+class StubCursor:
+    def __init__(self, connection: StubConnection) -> None:
+        self._connection = connection
+        self.description: Any = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self._rows: list[tuple[Any, ...]] = []
+
+    def _answer(self, operation: str) -> list[tuple[Any, ...]] | None:
+        if operation.startswith("SELECT VERSION()"):
+            return [("11.2.0.0378",)]
+        if operation.startswith("SELECT SCHEMA()"):
+            return [("PUBLIC",)]
+        if operation.startswith("SHOW COLUMNS IN"):
+            return _SHOW_COLUMNS
+        if operation.startswith("SHOW INDEXES IN"):
+            return _SHOW_INDEXES
+        if operation.startswith("SHOW CREATE TABLE"):
+            return _SHOW_CREATE
+        if "FROM _db_index" in operation:
+            return _DB_INDEX
+        if "FROM db_constraint" in operation:
+            return [("pk_bench_suite_items",)]
+        if "FROM _db_attribute" in operation:
+            return [(row[0], None) for row in _SHOW_COLUMNS]
+        if "FROM db_class" in operation:
+            return [(None,)]
+        if operation.startswith("SELECT"):
+            limit = STREAM_ROWS if "LIMIT" not in operation else SELECT_ROWS
+            return self._connection.rows[:limit]
+        return None
+
+    def execute(self, operation: str, parameters: Any = None) -> None:
+        rows = self._answer(operation)
+        if rows is None:
+            self.description = None
+            self.rowcount = 1
+            return
+        width = len(rows[0]) if rows else 1
+        self.description = [(f"c{i}", 2, None, None, None, None, None) for i in range(width)]
+        self.rowcount = len(rows)
+        self._rows = list(rows)
+
+    def executemany(self, operation: str, seq_of_parameters: Any) -> None:
+        self.description = None
+        self.rowcount = len(seq_of_parameters)
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size: int = 1) -> list[tuple[Any, ...]]:
+        page, self._rows = self._rows[:size], self._rows[size:]
+        return page
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        pass
+
+
+class StubConnection:
+    """Stand-in for a ``pycubrid`` connection answering benchmark queries."""
+
+    def __init__(self) -> None:
+        self.rows = [_item_row(i) for i in range(STREAM_ROWS)]
+        self.autocommit = False
+
+    def cursor(self) -> StubCursor:
+        return StubCursor(self)
+
+    def set_autocommit(self, value: bool) -> None:
+        self.autocommit = value
+
+    def get_autocommit(self) -> bool:
+        return self.autocommit
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+# A scenario takes the engine and returns the operation to time.
+Scenario = Callable[[Engine], Callable[[], None]]
+
+
+def _compile(build: Callable[[], Any]) -> Scenario:
+    def setup(engine: Engine) -> Callable[[], None]:
+        stmt, dialect = build(), engine.dialect
+
+        def op() -> None:
+            stmt.compile(dialect=dialect)
+
+        return op
+
+    return setup
+
+
+def _select_limit() -> Any:
+    return select(bench_items).where(bench_items.c.price > 25).limit(100).offset(50)
+
+
+def _insert() -> Any:
+    return insert(bench_items).values(name="a", price=1, active=True)
+
+
+def _insert_odku() -> Any:
+    from sqlalchemy_cubrid import insert as cubrid_insert
+
+    return (
+        cubrid_insert(bench_items)
+        .values(id=1, name="a", price=1)
+        .on_duplicate_key_update(name="b", price=2)
+    )
+
+
+def _merge() -> Any:
+    from sqlalchemy_cubrid import merge
+
+    return (
+        merge(bench_items)
+        .using(merge_source)
+        .on(bench_items.c.id == merge_source.c.id)
+        .when_matched_then_update({"name": merge_source.c.name})
+        .when_not_matched_then_insert({"id": merge_source.c.id, "name": merge_source.c.name})
+    )
+
+
+def _select_for_update() -> Any:
+    return select(bench_items).where(bench_items.c.id == 1).with_for_update()
+
+
+def _reflection(engine: Engine) -> Callable[[], None]:
+    connection = engine.connect()
+
+    def op() -> None:
+        inspector = inspect(connection)
+        name = bench_items.name
+        inspector.get_columns(name)
+        inspector.get_pk_constraint(name)
+        inspector.get_indexes(name)
+        inspector.get_foreign_keys(name)
+        inspector.get_unique_constraints(name)
+
+    return op
+
+
+def _bind_result(engine: Engine) -> Callable[[], None]:
+    connection = engine.connect()
+    stmt = (
+        select(bench_items)
+        .where(
+            bench_items.c.price >= bindparam("low"),
+            bench_items.c.active == bindparam("active"),
+            bench_items.c.created_at > bindparam("since"),
+        )
+        .limit(SELECT_ROWS)
+    )
+    params = {"low": decimal.Decimal("1.50"), "active": True, "since": dt.datetime(2026, 1, 1)}
+
+    def op() -> None:
+        connection.execute(stmt, params).all()
+
+    return op
+
+
+def _bulk_insert(engine: Engine) -> Callable[[], None]:
+    connection = engine.connect()
+    rows = [dict(zip(bench_items.c.keys(), _item_row(100_000 + i))) for i in range(BULK_ROWS)]
+
+    def op() -> None:
+        with connection.begin() as transaction:
+            connection.execute(insert(bench_items), rows)
+            # Leave a live database as it was.
+            transaction.rollback()
+
+    return op
+
+
+def _streaming_fetch(engine: Engine) -> Callable[[], None]:
+    connection = engine.connect().execution_options(yield_per=YIELD_PER)
+    stmt = select(bench_items)
+
+    def op() -> None:
+        for _partition in connection.execute(stmt).partitions():
+            pass
+
+    return op
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "compile.select_limit": _compile(_select_limit),
+    "compile.insert": _compile(_insert),
+    "compile.insert_on_duplicate_key_update": _compile(_insert_odku),
+    "compile.merge": _compile(_merge),
+    "compile.select_for_update": _compile(_select_for_update),
+    "reflection.table": _reflection,
+    "bind_result.select_rows": _bind_result,
+    "bulk_insert.executemany": _bulk_insert,
+    "streaming_fetch.yield_per": _streaming_fetch,
+}
+
+
+def _calibration_op() -> None:
+    total = 0
+    for i in range(1000):
+        total += i * i % 7
+
+
+# ---------------------------------------------------------------------------
+# Timing and statistics
+# ---------------------------------------------------------------------------
+
+
+def _loop_count(op: Callable[[], None], min_sample_s: float) -> int:
+    """Smallest power-of-two loop count whose run lasts *min_sample_s*."""
+    number = 1
+    while True:
+        started = perf_counter()
+        for _ in range(number):
+            op()
+        if perf_counter() - started >= min_sample_s:
+            return number
+        number *= 2
+
+
+def measure(op: Callable[[], None], repeats: int, min_sample_s: float) -> dict[str, Any]:
+    """Time *op*; return per-operation samples and their summary in seconds."""
+    number = _loop_count(op, min_sample_s)
+    samples = []
+    for _ in range(repeats):
+        started = perf_counter()
+        for _ in range(number):
+            op()
+        samples.append((perf_counter() - started) / number)
+    return summarize(samples, number)
+
+
+def summarize(samples: list[float], number: int) -> dict[str, Any]:
+    median = statistics.median(samples)
+    return {
+        "number": number,
+        "repeats": len(samples),
+        "median_s": median,
+        "mad_s": statistics.median(abs(sample - median) for sample in samples),
+        "mean_s": statistics.fmean(samples),
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "samples_s": samples,
+    }
+
+
+def _relative_noise(summary: dict[str, Any]) -> float:
+    median = summary["median_s"]
+    return MAD_TO_SIGMA * summary["mad_s"] / median if median else 0.0
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    tolerance: float = 0.10,
+    noise_factor: float = 3.0,
+    normalize: bool = True,
+) -> list[dict[str, Any]]:
+    """Compare two reports scenario by scenario.
+
+    The baseline median is scaled by the ratio of the two calibration
+    medians (unless *normalize* is false).  A scenario regresses when the
+    current median exceeds the scaled baseline median by more than
+    ``max(tolerance, noise_factor * relative noise)``, where relative noise
+    is the larger of the two runs' ``1.4826 * MAD / median``.
+    """
+    scale = 1.0
+    if normalize:
+        scale = current["calibration"]["median_s"] / baseline["calibration"]["median_s"]
+    rows = []
+    names = sorted(set(baseline["scenarios"]) | set(current["scenarios"]))
+    for name in names:
+        before = baseline["scenarios"].get(name)
+        after = current["scenarios"].get(name)
+        if before is None or after is None:
+            status = "new" if before is None else "not_run"
+            rows.append({"scenario": name, "status": status})
+            continue
+        expected = before["median_s"] * scale
+        ratio = after["median_s"] / expected if expected else 1.0
+        limit = max(tolerance, noise_factor * max(_relative_noise(before), _relative_noise(after)))
+        if ratio > 1 + limit:
+            status = "regression"
+        elif ratio < 1 - limit:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "scenario": name,
+                "status": status,
+                "baseline_s": expected,
+                "current_s": after["median_s"],
+                "ratio": ratio,
+                "limit": limit,
+            }
+        )
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+def _make_engine(dsn: str | None) -> Engine:
+    if dsn is None:
+        server = StubConnection()
+        return create_engine("cubrid+pycubrid://", creator=lambda: server)
+    return create_engine(dsn)
+
+
+def _prepare(engine: Engine, live: bool) -> None:
+    if not live:
+        return
+    with engine.begin() as conn:
+        metadata.drop_all(conn)
+        metadata.create_all(conn)
+        conn.execute(insert(bench_teams), [{"id": i, "name": f"team{i}"} for i in range(10)])
+        conn.execute(
+            insert(bench_items),
+            [dict(zip(bench_items.c.keys(), _item_row(i))) for i in range(STREAM_ROWS)],
+        )
+
+
+def _selected(groups: list[str] | None) -> list[str]:
+    if not groups:
+        return list(SCENARIOS)
+    names = [name for name in SCENARIOS if name in groups or name.split(".", 1)[0] in groups]
+    if not names:
+        raise SystemExit(f"no scenario matches {','.join(groups)}")
+    return names
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    live = args.dsn is not None
+    engine = _make_engine(args.dsn)
+    min_sample_s = args.min_sample_ms / 1000
+    started = perf_counter()
+    scenarios: dict[str, Any] = {}
+    try:
+        _prepare(engine, live)
+        calibration = measure(_calibration_op, args.repeats, min_sample_s)
+        for name in _selected(args.scenarios):
+            op = SCENARIOS[name](engine)
+            op()  # warm the compiled cache and the connection
+            scenarios[name] = measure(op, args.repeats, min_sample_s)
+    finally:
+        if live:
+            with engine.begin() as conn:
+                metadata.drop_all(conn)
+        engine.dispose()
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "total_request_time_s": perf_counter() - started,
+        "environment": {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "mode": "live" if live else "stub",
+        },
+        "calibration": calibration,
+        "scenarios": scenarios,
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(f"== Dialect benchmark suite ({report['environment']['mode']}) ==")
+    print(f"{'Scenario':<42} {'median':>12} {'MAD':>10} {'loops':>8}")
+    for name, data in [("calibration", report["calibration"]), *report["scenarios"].items()]:
+        print(
+            f"{name:<42} {data['median_s'] * 1e6:10.1f}us "
+            f"{data['mad_s'] * 1e6:8.1f}us {data['number']:>8}"
+        )
+
+
+def _print_comparison(rows: list[dict[str, Any]]) -> None:
+    print(f"\n{'Scenario':<42} {'baseline':>12} {'current':>12} {'ratio':>7}  status")
+    for row in rows:
+        if "ratio" not in row:
+            print(f"{row['scenario']:<42} {'':>12} {'':>12} {'':>7}  {row['status']}")
+            continue
+        print(
+            f"{row['scenario']:<42} {row['baseline_s'] * 1e6:10.1f}us "
+            f"{row['current_s'] * 1e6:10.1f}us {row['ratio']:7.2f}  {row['status']}"
+            f" (limit ±{row['limit']:.0%})"
+        )
+
+
+def _load(path: Path) -> dict[str, Any]:
+    try:
+        report: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise SystemExit(f"{path} does not exist; run `record` first") from None
+    return report
+
+
+def _write(path: Path, report: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def _str_list(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    _ = parser.add_argument("command", choices=("run", "record", "check"))
+    _ = parser.add_argument("--dsn", default=None, help="Live cubrid+pycubrid DSN")
+    _ = parser.add_argument(
+        "--scenarios", type=_str_list, default=None, help="Scenario names or groups, e.g. compile"
+    )
+    _ = parser.add_argument("--repeats", type=int, default=11, help="Samples per scenario")
+    _ = parser.add_argument(
+        "--min-sample-ms", type=float, default=50.0, help="Minimum duration of one sample"
+    )
+    _ = parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="Baseline JSON path"
+    )
+    _ = parser.add_argument(
+        "--current", type=Path, default=None, help="check: compare this report instead of running"
+    )
+    _ = parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="Allowed slowdown ratio (default 0.10)"
+    )
+    _ = parser.add_argument(
+        "--noise-factor",
+        type=float,
+        default=3.0,
+        help="Allowed slowdown in multiples of the relative MAD-based noise",
+    )
+    _ = parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="Do not scale the baseline by the calibration ratio",
+    )
+    _ = parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT_PATH, help="JSON report path"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "check" and args.current is not None:
+        report = _load(args.current)
+    else:
+        report = run_suite(args)
+        _print_report(report)
+        _write(args.output, report)
+        print(f"\nWrote JSON report to {args.output}")
+
+    if args.command == "record":
+        _write(args.baseline, report)
+        print(f"Recorded baseline {args.baseline}")
+        return 0
+    if args.command == "run":
+        return 0
+
+    baseline = _load(args.baseline)
+    if baseline["environment"]["mode"] != report["environment"]["mode"]:
+        raise SystemExit(
+            f"baseline was recorded in {baseline['environment']['mode']} mode, "
+            f"this run is {report['environment']['mode']}"
+        )
+    if args.scenarios:
+        selected = set(_selected(args.scenarios))
+        baseline, report = (
+            {**data, "scenarios": {k: v for k, v in data["scenarios"].items() if k in selected}}
+            for data in (baseline, report)
+        )
+    rows = compare(
+        baseline,
+        report,
+        tolerance=args.tolerance,
+        noise_factor=args.noise_factor,
+        normalize=not args.no_normalize,
+    )
+    _print_comparison(rows)
+    regressions = [row["scenario"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\nFAILED: {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\nOK: no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -42,7 +42,7 @@ from .types import (
     VARCHAR,
 )
 from .dml import insert, merge, replace
-from .trace import trace_query
+from .trace import atrace_query, parse_trace, trace_query
 
 from sqlalchemy.sql.sqltypes import (
     DATE,
@@ -58,6 +58,8 @@ __all__ = (
     "insert",
     "merge",
     "replace",
+    "atrace_query",
+    "parse_trace",
     "trace_query",
     "SMALLINT",
     "INTEGER",
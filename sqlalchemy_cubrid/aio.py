@@ -0,0 +1,480 @@
+# sqlalchemy_cubrid/aio.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Async helpers for the ``cubrid+aiopycubrid`` dialect.
+
+:func:`fast_execute` runs simple Core ``select()`` / ``insert()``
+statements on an :class:`~sqlalchemy.ext.asyncio.AsyncConnection`
+without entering the greenlet bridge.  ``AsyncConnection.execute()``
+spawns a greenlet for the call and switches back to the event loop for
+each driver await (cursor execute, fetch, close).  For tiny queries those
+switches cost about as much as the round trip itself.  The fast path
+compiles through the engine's statement cache as usual, then awaits
+``pycubrid.aio`` directly.
+
+Usage::
+
+    from sqlalchemy_cubrid.aio import fast_execute
+
+    async with engine.connect() as conn:
+        result = await fast_execute(conn, select(users).where(users.c.id == 5))
+        row = result.first()
+
+        await fast_execute(conn, users.insert(), {"name": "Alice"})
+        await conn.commit()
+
+Statements the fast path cannot run identically fall back to
+``AsyncConnection.execute()``: statements with ``expanding`` /
+literal-execute parameters, Python-side column defaults, ``RETURNING``,
+execution options, ORM-enabled statements, connections with event
+listeners or ``echo`` (which includes engines instrumented with
+:func:`~sqlalchemy_cubrid.phases.instrument_phases`), engines with
+``cubrid_trace_sample_rate`` / ``cubrid_trace_slow_threshold``, and
+dialects other than ``cubrid+aiopycubrid``.
+The rows and the data written are the same either way, but a fast-path
+result is a :class:`FastResult`, not a ``CursorResult``: it is meant for
+reading rows.  Code that needs ``inserted_primary_key`` and similar
+``CursorResult`` APIs should call ``execute()``.
+
+:func:`gather_queries` runs independent statements concurrently, each on
+its own pooled connection, and returns their results in order::
+
+    from sqlalchemy_cubrid.aio import gather_queries
+
+    totals, recent, top = await gather_queries(
+        engine, [total_stmt, recent_stmt, (top_stmt, {"n": 10})], timeout=2.0
+    )
+
+:func:`async_bulk_insert` writes rows from an async iterator in batches,
+pausing the producer while the database falls behind::
+
+    async with engine.connect() as conn:
+        stats = await async_bulk_insert(
+            conn, events, consume_topic(), batch_size=1000, commit_every=10
+        )
+    log.info("loaded %d rows at %.0f rows/s", stats.rows, stats.rows_per_second)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine.result import IteratorResult, Result, SimpleResultMetaData
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.sql import compiler
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.schema import Table
+
+from sqlalchemy_cubrid.aio_pycubrid_dialect import AsyncAdapt_pycubrid_connection
+from sqlalchemy_cubrid.dml import insert
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    "BulkInsertStats",
+    "FastResult",
+    "async_bulk_insert",
+    "fast_execute",
+    "gather_queries",
+)
+
+
+class FastResult(IteratorResult[Any]):
+    """Buffered result of a :func:`fast_execute` call.
+
+    Offers the :class:`~sqlalchemy.engine.Result` API (``all()``,
+    ``first()``, ``scalar()``, ``mappings()`` …) plus ``rowcount`` and
+    ``lastrowid``, both as the driver reports them.  Unlike a
+    ``CursorResult``, ``rowcount`` is not adjusted for DML: it is the
+    pycubrid cursor's value, for a ``SELECT`` too.  It has no
+    ``inserted_primary_key``, ``returned_defaults``, ``is_insert``,
+    ``returns_rows`` or ``supports_sane_rowcount()``.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        rows: List[Any],
+        rowcount: int,
+        lastrowid: Optional[int],
+    ) -> None:
+        super().__init__(SimpleResultMetaData(keys), iter(rows))
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+
+
+def _fast_path_connection(
+    conn: AsyncConnection, statement: Executable
+) -> Optional[AsyncAdapt_pycubrid_connection]:
+    """Return the adapted DBAPI connection if *statement* may skip the bridge."""
+    sync_conn: Any = conn.sync_connection
+    if sync_conn is None or sync_conn.closed or sync_conn.invalidated:
+        return None
+    if not (getattr(statement, "is_select", False) or getattr(statement, "is_insert", False)):
+        return None
+    if getattr(statement, "_returning", ()) or statement._execution_options:
+        return None
+    # ORM-enabled statements compile through the ORM plugin.
+    if statement._propagate_attrs:
+        return None
+    # Event listeners and echo would silently be skipped.
+    if sync_conn._has_events or sync_conn.engine._has_events or sync_conn.dialect._has_events:
+        return None
+    if sync_conn._echo or sync_conn._execution_options:
+        return None
+    # cubrid_trace_* wraps the execute in SET TRACE round trips, which only
+    # the dialect's do_execute() on the greenlet bridge can run.
+    if getattr(sync_conn.dialect, "_statement_tracer", None) is not None:
+        return None
+    dbapi_connection = sync_conn.connection.dbapi_connection
+    if not isinstance(dbapi_connection, AsyncAdapt_pycubrid_connection):
+        return None
+    return dbapi_connection
+
+
+def _compile(sync_conn: Any, statement: Any, keys: List[str]) -> Any:
+    """Compile *statement* through the engine's compiled cache.
+
+    Returns ``(compiled, extracted_parameters)``, the same pair
+    ``Connection.execute()`` would use, so both paths share cache entries.
+    """
+    dialect = sync_conn.dialect
+    # SA 2.1 returns a 4-tuple (with the collected param dict), SA 2.0 a 3-tuple.
+    compiled_w_cache = statement._compile_w_cache(
+        dialect=dialect,
+        compiled_cache=sync_conn.engine._compiled_cache,
+        column_keys=keys,
+        for_executemany=False,
+        schema_translate_map=None,
+        linting=dialect.compiler_linting | compiler.WARN_LINTING,
+    )
+    return compiled_w_cache[0], compiled_w_cache[1]
+
+
+def _bind_parameters(compiled: Any, parameters: Mapping[str, Any], extracted: Any) -> List[Any]:
+    """Build the positional DBAPI parameters, as ``DefaultExecutionContext`` does."""
+    compiled_params = compiled.construct_params(
+        dict(parameters) or None, escape_names=False, extracted_parameters=extracted
+    )
+    processors = compiled._bind_processors
+    return [
+        processors[key](compiled_params[key]) if key in processors else compiled_params[key]
+        for key in compiled.positiontup
+    ]
+
+
+def _process_rows(compiled: Any, description: Any, rows: List[Any]) -> tuple[List[str], List[Any]]:
+    """Apply result processors; return ``(keys, rows)``."""
+    dialect = compiled.dialect
+    columns = compiled._result_columns
+    if len(columns) != len(description):
+        # Not a plain positional column list; keep the driver's names.
+        return [str(entry[0]) for entry in description], rows
+    keys = [column.keyname for column in columns]
+    processors = [
+        column.type._cached_result_processor(dialect, entry[1])
+        for column, entry in zip(columns, description)
+    ]
+    if not any(processors):
+        return keys, rows
+    return keys, [
+        tuple(proc(value) if proc else value for proc, value in zip(processors, row))
+        for row in rows
+    ]
+
+
+async def fast_execute(
+    conn: AsyncConnection,
+    statement: Executable,
+    parameters: Optional[Mapping[str, Any]] = None,
+) -> Result[Any]:
+    """Execute a Core ``select()`` or ``insert()`` on *conn* without greenlets.
+
+    :param conn: An :class:`~sqlalchemy.ext.asyncio.AsyncConnection` on a
+        ``cubrid+aiopycubrid`` engine.
+    :param statement: A Core ``select()`` or single-row ``insert()``.
+    :param parameters: Bind parameter values, as for ``execute()``.
+    :returns: A :class:`FastResult`, or the ``CursorResult`` of
+        ``conn.execute()`` when the statement falls back.  Only the
+        ``Result`` row API, ``rowcount`` and ``lastrowid`` are common to
+        both; see :class:`FastResult`.
+
+    Transaction handling matches ``execute()``: the connection autobegins
+    and the statement belongs to the transaction committed by
+    ``conn.commit()``.  Driver errors are raised wrapped in
+    :class:`~sqlalchemy.exc.DBAPIError`; a disconnect invalidates the
+    connection.
+
+    The fast path skips the dialect's ``do_execute()``.  It refreshes the
+    ``cubrid_ping_window`` itself; engines with ``cubrid_trace_*`` statement
+    tracing or a phase tracer attached always fall back, so those options
+    still see every statement.
+    """
+    parameters = parameters or {}
+    adapt_connection = _fast_path_connection(conn, statement)
+    if adapt_connection is None:
+        return await conn.execute(statement, parameters)
+
+    sync_conn: Any = conn.sync_connection
+    compiled, extracted = _compile(sync_conn, statement, sorted(parameters))
+    if (
+        compiled.post_compile_params
+        or compiled.literal_execute_params
+        or compiled.insert_prefetch
+        or compiled.effective_returning
+    ):
+        return await conn.execute(statement, parameters)
+
+    dialect = sync_conn.dialect
+    sql = compiled.string
+    dbapi_parameters = _bind_parameters(compiled, parameters, extracted)
+    if not sync_conn.in_transaction():
+        # What autobegin does; CUBRID's do_begin() sends nothing.
+        sync_conn.begin()
+
+    cursor: Any = adapt_connection._connection.cursor()
+    try:
+        async with adapt_connection._execute_mutex:
+            try:
+                await cursor.execute(sql, dbapi_parameters)
+                description = cursor.description
+                rows: List[Any] = await cursor.fetchall() if description else []
+                rowcount, lastrowid = int(cursor.rowcount), cursor.lastrowid
+            finally:
+                await cursor.close()
+    except dialect.loaded_dbapi.Error as err:
+        invalidated = dialect.is_disconnect(err, adapt_connection, cursor)
+        if invalidated:
+            await conn.invalidate(err)
+        raise sa_exc.DBAPIError.instance(
+            sql,
+            dbapi_parameters,
+            err,
+            dialect.loaded_dbapi.Error,
+            connection_invalidated=invalidated,
+            dialect=dialect,
+        ) from err
+
+    if dialect._ping_window is not None:
+        dialect._ping_window.touch(adapt_connection)
+    if description:
+        keys, rows = _process_rows(compiled, description, rows)
+    else:
+        keys = []
+    return FastResult(keys, rows, rowcount, lastrowid)
+
+
+async def _run_isolated(
+    engine: AsyncEngine,
+    statement: Executable,
+    parameters: Optional[Mapping[str, Any]],
+    timeout: Optional[float],
+) -> Result[Any]:
+    async with engine.connect() as conn:
+        try:
+            return await asyncio.wait_for(fast_execute(conn, statement, parameters), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # CAS has no cancel request: the reply to the abandoned request
+            # would arrive on the next one.  Closing the socket makes the
+            # broker roll back and recycle the CAS.
+            try:
+                await conn.invalidate()
+            except Exception:  # nosec B110 — the original error matters
+                log.debug("Invalidating a cancelled connection failed", exc_info=True)
+            raise
+
+
+async def gather_queries(
+    engine: AsyncEngine,
+    statements: Sequence[Union[Executable, Tuple[Executable, Mapping[str, Any]]]],
+    *,
+    max_concurrency: int = 10,
+    timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Run independent *statements* concurrently on pooled connections.
+
+    Each statement runs on its own connection checked out from *engine*'s
+    pool, at most *max_concurrency* at a time, through
+    :func:`fast_execute`.  Results are buffered and returned in the order
+    of *statements*.  Keep *max_concurrency* at or below ``pool_size +
+    max_overflow``; extra statements wait for a connection up to
+    ``pool_timeout``.
+
+    :param engine: An :class:`~sqlalchemy.ext.asyncio.AsyncEngine`.
+    :param statements: Statements, or ``(statement, parameters)`` pairs.
+        They run in separate transactions, so use this for reads.
+    :param max_concurrency: Connections used at once.
+    :param timeout: Per-statement time limit in seconds, not counting the
+        wait for a connection.  A statement that runs out of time raises
+        :class:`asyncio.TimeoutError`.
+    :param return_exceptions: Return errors in place of results instead
+        of raising the first one.
+    :returns: A list of results, as returned by ``AsyncConnection.execute()``.
+
+    A statement that times out or is cancelled leaves its CAS request
+    unanswered, so its connection is invalidated rather than returned to
+    the pool.  Without *return_exceptions*, the first error cancels the
+    remaining statements.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency!r}")
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: Any) -> Result[Any]:
+        statement, parameters = item if isinstance(item, tuple) else (item, None)
+        async with slots:
+            return await _run_isolated(engine, statement, parameters, timeout)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in statements]
+    try:
+        return list(await asyncio.gather(*tasks, return_exceptions=return_exceptions))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class BulkInsertStats:
+    """Progress of an :func:`async_bulk_insert` call.
+
+    ``committed_rows`` counts rows covered by a commit, so after a failure
+    it tells how far a resumed load can skip.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.batches = 0
+        self.commits = 0
+        self.committed_rows = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "commits": self.commits,
+            "committed_rows": self.committed_rows,
+            "elapsed": self.elapsed,
+            "rows_per_second": self.rows_per_second,
+        }
+
+
+_END_OF_ROWS = object()
+
+
+async def async_bulk_insert(
+    conn: AsyncConnection,
+    table: Table,
+    rows: AsyncIterable[Mapping[str, Any]],
+    *,
+    batch_size: int = 1000,
+    max_inflight: int = 2,
+    commit_every: Optional[int] = None,
+    on_duplicate_key_update: Union[Sequence[str], Mapping[str, Any], None] = None,
+    stats: Optional[BulkInsertStats] = None,
+) -> BulkInsertStats:
+    """Insert *rows* from an async iterator into *table* in batches.
+
+    A producer task pulls rows from *rows* into batches of *batch_size*
+    and queues them; *conn* executes each batch as one ``executemany()``
+    INSERT.  At most *max_inflight* full batches wait in the queue, after
+    which the producer stops pulling from the source until the database
+    catches up.
+
+    :param conn: An :class:`~sqlalchemy.ext.asyncio.AsyncConnection`.
+    :param table: The target table.
+    :param rows: Async iterable of row dicts; all rows need the same keys.
+    :param batch_size: Rows per ``executemany()``.  By default the dialect
+        sends it as multi-``VALUES`` INSERT pages of
+        ``insertmanyvalues_page_size`` rows, or as prepared
+        ``EXECUTE_ARRAY`` batches with ``cubrid_executemany_batch_size``.
+    :param max_inflight: Batches buffered ahead of the database.
+    :param commit_every: Commit after this many batches and at the end.
+        ``None`` leaves the transaction to the caller.
+    :param on_duplicate_key_update: Column names to overwrite from the
+        incoming row when it hits an existing key, or a mapping of column
+        names to update values, as for
+        :meth:`~sqlalchemy_cubrid.dml.Insert.on_duplicate_key_update`.
+    :param stats: A :class:`BulkInsertStats` to update while loading, so
+        progress is visible to other tasks.
+    :returns: The :class:`BulkInsertStats` of the load.
+    :raises: Errors from the source iterator or from an INSERT; batches
+        committed before the error stay committed.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size!r}")
+    if max_inflight < 1:
+        raise ValueError(f"max_inflight must be >= 1, got {max_inflight!r}")
+    if commit_every is not None and commit_every < 1:
+        raise ValueError(f"commit_every must be >= 1, got {commit_every!r}")
+
+    stmt = insert(table)
+    if on_duplicate_key_update is not None:
+        if isinstance(on_duplicate_key_update, Mapping):
+            updates = dict(on_duplicate_key_update)
+        else:
+            updates = {name: stmt.inserted[name] for name in on_duplicate_key_update}
+        stmt = stmt.on_duplicate_key_update(updates)
+
+    queue: asyncio.Queue[Any] = asyncio.Queue(max_inflight)
+
+    async def produce() -> None:
+        try:
+            batch: List[Mapping[str, Any]] = []
+            async for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+            await queue.put(_END_OF_ROWS)
+        except Exception as err:
+            await queue.put(err)
+
+    if stats is None:
+        stats = BulkInsertStats()
+    start = time.perf_counter()
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_ROWS:
+                break
+            if isinstance(item, Exception):
+                raise item
+            await conn.execute(stmt, item)
+            stats.rows += len(item)
+            stats.batches += 1
+            if commit_every is not None and stats.batches % commit_every == 0:
+                await conn.commit()
+                stats.commits += 1
+                stats.committed_rows = stats.rows
+                log.debug(
+                    "Bulk insert into %s: %d rows committed (%.0f rows/s)",
+                    table.name,
+                    stats.rows,
+                    stats.rows / (time.perf_counter() - start),
+                )
+        if commit_every is not None and stats.committed_rows < stats.rows:
+            await conn.commit()
+            stats.commits += 1
+            stats.committed_rows = stats.rows
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        stats.elapsed = time.perf_counter() - start
+    return stats
@@ -7,12 +7,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import re
 from importlib import import_module
-from typing import Any, Callable, cast
+from typing import Any, Awaitable, Callable, Optional, Sequence, cast
 
 from sqlalchemy.connectors.asyncio import (
     AsyncAdapt_dbapi_connection,
     AsyncAdapt_dbapi_cursor,
+    AsyncAdapt_dbapi_ss_cursor,
 )
 
 # AsyncAdapt_dbapi_module was added in SQLAlchemy 2.1.
@@ -20,27 +24,202 @@ try:
     from sqlalchemy.connectors.asyncio import AsyncAdapt_dbapi_module
 except ImportError:  # pragma: no cover — SA 2.0
     AsyncAdapt_dbapi_module = object  # type: ignore[assignment,misc]
-from sqlalchemy import pool as pool_module
+from sqlalchemy import exc as sa_exc, pool as pool_module
 from sqlalchemy.engine.interfaces import ConnectArgsType
 from sqlalchemy_cubrid._compat import DBAPIModule
 from sqlalchemy.engine.url import URL
 from sqlalchemy.util.concurrency import await_only
 
-from sqlalchemy_cubrid.pycubrid_dialect import PyCubridDialect, PyCubridExecutionContext
+from sqlalchemy_cubrid.pycubrid_dialect import (
+    PyCubridDialect,
+    PyCubridExecutionContext,
+    _connect_accepts,
+)
+
+
+# Statements pycubrid can run as PREPARE + EXECUTE_ARRAY.
+_RE_PREPARED_BATCH = re.compile(r"\s*(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+_prepared_batch_support: dict[type, bool] = {}
+
+
+def _supports_prepared_batch(cursor: Any) -> bool:
+    """Return True if *cursor*'s ``executemany`` takes ``prepared=``."""
+    cursor_cls = type(cursor)
+    supported = _prepared_batch_support.get(cursor_cls)
+    if supported is None:
+        try:
+            parameters = inspect.signature(cursor_cls.executemany).parameters
+        except (TypeError, ValueError):
+            parameters = {}  # type: ignore[assignment]
+        supported = _prepared_batch_support[cursor_cls] = "prepared" in parameters
+    return supported
+
+
+async def _pipelined_executemany(
+    connection: Any,
+    operation: str,
+    seq_of_parameters: Sequence[Any],
+    batch_size: int,
+    in_flight: int,
+) -> int:
+    """Run *seq_of_parameters* as ``EXECUTE_ARRAY`` batches of *batch_size* rows.
+
+    The CAS protocol allows one outstanding request per connection, so
+    batches are still sent one after another.  Each batch runs in its own
+    task on its own cursor, though, and pycubrid encodes a batch before
+    queueing for the connection: while batch *n* waits for its reply,
+    batch *n + 1* is encoded.  At most *in_flight* encoded batches exist
+    at a time.  When a batch fails, the batches still queued are cancelled
+    so that none of them is sent; the error of the earliest failed batch
+    is raised.  Returns the total row count.
+    """
+    slots = asyncio.Semaphore(in_flight)
+    tasks: list[asyncio.Future[int]] = []
+    failed = False
+
+    async def run(batch: Sequence[Any]) -> int:
+        nonlocal failed
+        async with slots:
+            cursor = connection.cursor()
+            try:
+                if failed:
+                    return 0
+                await cursor.executemany(operation, batch, prepared=True)
+                return max(int(cursor.rowcount), 0)
+            except asyncio.CancelledError:
+                raise
+            except BaseException:
+                if not failed:
+                    failed = True
+                    # Only one batch holds the connection's request lock and
+                    # it is this one: the others wait for the lock or a slot
+                    # and have sent nothing, so cancelling them is safe.
+                    for task in tasks:
+                        if not task.done() and task is not asyncio.current_task():
+                            task.cancel()
+                raise
+            finally:
+                await cursor.close()
+
+    tasks.extend(
+        asyncio.ensure_future(run(seq_of_parameters[start : start + batch_size]))
+        for start in range(0, len(seq_of_parameters), batch_size)
+    )
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise next(
+            (error for error in errors if not isinstance(error, asyncio.CancelledError)),
+            errors[0],
+        )
+    return sum(cast("list[int]", results))
+
+
+async def _bounded(cursor: Any, awaitable: Awaitable[Any]) -> Any:
+    """Await *awaitable* within the cursor's ``cubrid_timeout``.
+
+    CAS has no cancel request: a reply to an abandoned request can only
+    arrive on the socket later and poison the next read.  pycubrid's aio
+    layer therefore drops the transport when it is cancelled during a
+    round trip, which is what ``asyncio.wait_for`` does on a timeout.  A
+    cancellation that arrives before the request was sent leaves the
+    connection usable.  A timeout is raised as ``OperationalError``;
+    :meth:`PyCubridAsyncDialect.is_disconnect` reports it as a disconnect
+    when the transport was dropped, so the pool invalidates the
+    connection, and the broker rolls the transaction back and recycles
+    the CAS when the socket closes.
+    """
+    timeout = cursor._timeout
+    adapt_connection = cursor._adapt_connection
+    try:
+        if timeout is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        adapt_connection._check_abandoned()
+        raise adapt_connection.dbapi.OperationalError(
+            f"statement timeout: no reply within cubrid_timeout={timeout}s"
+        ) from None
+    except asyncio.CancelledError:
+        adapt_connection._check_abandoned()
+        raise
 
 
 class AsyncAdapt_pycubrid_cursor(AsyncAdapt_dbapi_cursor):
     _awaitable_cursor_close: bool = True
 
+    # Set from the ``cubrid_timeout`` execution option.
+    _timeout: Optional[float] = None
+
+    # Total row count of the last pipelined executemany().
+    _batch_rowcount: Optional[int] = None
+
+    @property
+    def rowcount(self) -> int:
+        if self._batch_rowcount is not None:
+            return self._batch_rowcount
+        return int(self._cursor.rowcount)
+
     def setinputsizes(self, *inputsizes: Any) -> None:
         pass
 
     def nextset(self) -> None:
         pass
 
+    async def _execute_async(self, operation: Any, parameters: Any) -> Any:
+        self._batch_rowcount = None
+        return await _bounded(self, super()._execute_async(operation, parameters))
+
+    async def _executemany_async(self, operation: Any, seq_of_parameters: Any) -> Any:
+        self._batch_rowcount = None
+        return await _bounded(self, self._executemany_batched(operation, seq_of_parameters))
+
+    async def _executemany_batched(self, operation: Any, seq_of_parameters: Any) -> Any:
+        adapt_connection = cast(AsyncAdapt_pycubrid_connection, self._adapt_connection)
+        batch_size = adapt_connection._executemany_batch_size
+        if (
+            batch_size is None
+            or len(seq_of_parameters) <= batch_size
+            or not _RE_PREPARED_BATCH.match(operation)
+            or not _supports_prepared_batch(self._cursor)
+        ):
+            return await super()._executemany_async(operation, seq_of_parameters)
+        async with adapt_connection._execute_mutex:
+            self._batch_rowcount = await _pipelined_executemany(
+                self._connection,
+                operation,
+                seq_of_parameters,
+                batch_size,
+                adapt_connection._executemany_in_flight,
+            )
+
+
+class AsyncAdapt_pycubrid_ss_cursor(AsyncAdapt_dbapi_ss_cursor):
+    """Server-side cursor used for ``stream_results`` / ``AsyncConnection.stream()``.
+
+    ``execute`` leaves the result set open on the broker instead of
+    buffering it; ``fetchmany`` awaits pycubrid, which requests the next
+    CAS fetch page only once the current page is consumed.
+    """
+
+    _awaitable_cursor_close: bool = True
+
+    _timeout: Optional[float] = None
+
+    def setinputsizes(self, *inputsizes: Any) -> None:
+        pass
+
+    def nextset(self) -> None:
+        pass
+
+    async def _execute_async(self, operation: Any, parameters: Any) -> Any:
+        return await _bounded(self, super()._execute_async(operation, parameters))
+
 
 class AsyncAdapt_pycubrid_connection(AsyncAdapt_dbapi_connection):
     _cursor_cls = AsyncAdapt_pycubrid_cursor
+    _ss_cursor_cls = AsyncAdapt_pycubrid_ss_cursor
     # SA 2.0 exposed ``await_`` on AsyncAdapt_dbapi_connection; SA 2.1 dropped
     # it in favour of the module-level helper. Redeclare so ``self.await_(...)``
     # works on both versions and remains patchable in tests.
@@ -54,9 +233,48 @@ class AsyncAdapt_pycubrid_connection(AsyncAdapt_dbapi_connection):
     def autocommit(self, value: bool) -> None:
         self.await_(self._connection.set_autocommit(value))
 
+    # Set by PyCubridAsyncDialect.on_connect from the
+    # ``cubrid_executemany_batch_size`` / ``cubrid_executemany_in_flight``
+    # options; ``None`` keeps pycubrid's single-request executemany().
+    _executemany_batch_size: Optional[int] = None
+    _executemany_in_flight: int = 2
+
+    # Set by aclose(); the pool then closes the record synchronously,
+    # outside any greenlet, and close() must not await again.
+    _closed_natively: bool = False
+
+    # Set by _check_abandoned(); the transport is gone and close() has
+    # nothing to send.
+    _abandoned: bool = False
+
     def ping(self, reconnect: bool = True) -> bool:
         return bool(self.await_(self._connection.ping(reconnect)))
 
+    def close(self) -> None:
+        if not (self._closed_natively or self._abandoned):
+            self.await_(self._connection.close())
+
+    def _check_abandoned(self) -> bool:
+        """Record whether an interrupted request took the transport down.
+
+        pycubrid drops the transport itself when a round trip is cancelled;
+        its ``autocommit`` property then raises ``InterfaceError``.
+        """
+        try:
+            self._connection.autocommit
+        except self.dbapi.InterfaceError:
+            self._abandoned = True
+        return self._abandoned
+
+    async def aping(self, reconnect: bool = False) -> bool:
+        """Awaitable ping for code running directly on the event loop."""
+        return bool(await self._connection.ping(reconnect))
+
+    async def aclose(self) -> None:
+        """Awaitable close for code running directly on the event loop."""
+        self._closed_natively = True
+        await self._connection.close()
+
 
 class AsyncAdapt_pycubrid_dbapi(AsyncAdapt_dbapi_module):
     def __init__(self, aio_module: Any) -> None:
@@ -88,11 +306,59 @@ class AsyncAdapt_pycubrid_dbapi(AsyncAdapt_dbapi_module):
         return AsyncAdapt_pycubrid_connection(self, async_conn)
 
 
+class PyCubridAsyncExecutionContext(PyCubridExecutionContext):
+    def _cubrid_timeout(self) -> Optional[float]:
+        timeout = self.execution_options.get("cubrid_timeout")
+        if timeout is None:
+            return None
+        if timeout <= 0:
+            raise sa_exc.ArgumentError(f"cubrid_timeout must be > 0, got {timeout!r}")
+        return float(timeout)
+
+    def create_default_cursor(self) -> Any:
+        cursor: Any = super().create_default_cursor()
+        cursor._timeout = self._cubrid_timeout()
+        return cursor
+
+    def create_server_side_cursor(self) -> Any:
+        cursor: Any = self._dbapi_connection.cursor(server_side=True)
+        cursor._timeout = self._cubrid_timeout()
+        # ``yield_per(n)`` sets max_row_buffer; fetch CAS pages of the
+        # same size so each buffer refill is one round trip.
+        page_size = self.execution_options.get("max_row_buffer")
+        if page_size and hasattr(cursor._cursor, "fetch_size"):
+            cursor._cursor.fetch_size = int(page_size)
+        return cursor
+
+
 class PyCubridAsyncDialect(PyCubridDialect):
     driver = "aiopycubrid"
     is_async = True
     supports_statement_cache = True
-    execution_ctx_cls = PyCubridExecutionContext
+    supports_server_side_cursors = True
+    execution_ctx_cls = PyCubridAsyncExecutionContext
+
+    def __init__(
+        self,
+        cubrid_executemany_batch_size: Optional[int] = None,
+        cubrid_executemany_in_flight: int = 2,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if cubrid_executemany_batch_size is not None and cubrid_executemany_batch_size < 1:
+            raise ValueError(
+                f"cubrid_executemany_batch_size must be >= 1, got {cubrid_executemany_batch_size!r}"
+            )
+        if cubrid_executemany_in_flight < 1:
+            raise ValueError(
+                f"cubrid_executemany_in_flight must be >= 1, got {cubrid_executemany_in_flight!r}"
+            )
+        self._executemany_batch_size = cubrid_executemany_batch_size
+        self._executemany_in_flight = cubrid_executemany_in_flight
+        if cubrid_executemany_batch_size is not None:
+            # Send executemany() INSERTs to do_executemany() as a pipelined
+            # EXECUTE_ARRAY instead of one multi-VALUES statement per page.
+            self.use_insertmanyvalues_wo_returning = False
 
     @classmethod
     def get_pool_class(cls, url: URL) -> type[pool_module.Pool]:
@@ -113,13 +379,16 @@ class PyCubridAsyncDialect(PyCubridDialect):
             raise ValueError("Unexpected database URL format")
 
         opts = url.translate_connect_args(username="user", database="database")
-        return (), {
+        kwargs = {
             "host": opts.get("host", "localhost"),
             "port": opts.get("port", 33000),
             "database": opts.get("database", ""),
             "user": opts.get("user", "dba"),
             "password": opts.get("password", ""),
         }
+        if _connect_accepts("pycubrid.aio", "decode_collections"):
+            kwargs["decode_collections"] = True
+        return (), kwargs
 
     def on_connect(self) -> Callable[[Any], None] | None:
         isolation_level = self.isolation_level
@@ -128,10 +397,19 @@ class PyCubridAsyncDialect(PyCubridDialect):
             conn.autocommit = False
             if isolation_level is not None:
                 self.set_isolation_level(conn, isolation_level)
+            if self._executemany_batch_size is not None:
+                conn._executemany_batch_size = self._executemany_batch_size
+                conn._executemany_in_flight = self._executemany_in_flight
 
         return connect
 
-    def do_ping(self, dbapi_connection: Any) -> bool:
+    def is_disconnect(self, e: Exception, connection: Any, cursor: Any) -> bool:
+        """Also report errors on a connection dropped by a timeout or cancel."""
+        if connection is not None and getattr(connection, "_abandoned", False) is True:
+            return True
+        return super().is_disconnect(e, connection, cursor)
+
+    def _ping(self, dbapi_connection: Any) -> bool:
         return bool(dbapi_connection.ping(False))
 
 
@@ -399,6 +399,31 @@ class CubridIdentifierPreparer(compiler.IdentifierPreparer):
 class CubridExecutionContext(default.DefaultExecutionContext):
     """Execution context for CUBRID connections."""
 
+    # The phase hooks below are no-ops unless ``phases.instrument_phases``
+    # installed a tracer on the dialect.
+
+    @classmethod
+    def _init_compiled(cls, dialect: Any, connection: Any, *args: Any, **kw: Any) -> Any:
+        tracer = getattr(dialect, "_phase_tracer", None)
+        if tracer is None:
+            return super()._init_compiled(dialect, connection, *args, **kw)
+        tracer._compiled()
+        context = super()._init_compiled(dialect, connection, *args, **kw)
+        tracer._bound(context)
+        return context
+
+    def create_cursor(self) -> Any:
+        cursor = super().create_cursor()
+        tracer = getattr(self.dialect, "_phase_tracer", None)
+        return cursor if tracer is None else tracer._cursor(self, cursor)
+
+    def get_result_processor(self, type_: Any, colname: str, coltype: Any) -> Any:
+        processor = super().get_result_processor(type_, colname, coltype)
+        tracer = getattr(self.dialect, "_phase_tracer", None)
+        if processor is None or tracer is None:
+            return processor
+        return tracer._result_processor(processor)
+
     def should_autocommit_text(self, statement: str) -> Any:
         return AUTOCOMMIT_REGEXP.match(statement)
 
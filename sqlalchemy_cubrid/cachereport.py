@@ -0,0 +1,460 @@
+# sqlalchemy_cubrid/cachereport.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Compiled-cache effectiveness report and cache-key explosion detector.
+
+SQLAlchemy caches each statement's compiled form under a key derived from
+the statement's structure.  Code that renders literal values into the
+SQL, builds ad-hoc ``text()`` strings or varies a statement's shape per
+call creates a new cache entry on every execution; constructs without
+cache support (CUBRID's :class:`~sqlalchemy_cubrid.dml.Merge` and
+``INSERT ... ON DUPLICATE KEY UPDATE``) are recompiled every time.
+
+:class:`CacheReport` tracks, per call site (the first stack frame outside
+SQLAlchemy and this package):
+
+- executions by cache outcome (``hit``, ``miss``, ``no_key``, ...);
+- distinct compiled SQL strings, standing in for distinct cache keys, and
+  distinct statement shapes once literals and bind lists are normalized
+  with :func:`~sqlalchemy_cubrid.slowlog.fingerprint_sql`;
+- recompilations of SQL already seen at that site (cache evictions);
+- the constructs that made a statement uncacheable.
+
+:meth:`CacheReport.findings` turns these into problems with suggested
+fixes.  At runtime, :func:`instrument_cache` feeds the report from an
+engine's executions; in CI, :meth:`CacheReport.analyze` feeds it from a
+query corpus without a database.
+
+Usage::
+
+    from sqlalchemy_cubrid.cachereport import instrument_cache
+
+    report = instrument_cache(engine)
+    ...
+    for finding in report.findings():
+        print(finding.site, finding.message, finding.suggestion)
+
+    # CI: build each corpus query with a few representative inputs
+    report = CacheReport()
+    for ids in ([1], [1, 2], [1, 2, 3]):
+        report.analyze(orders_by_ids(ids), site="orders_by_ids")
+    assert not report.findings()
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import weakref
+from types import FrameType
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.cache_key import NO_CACHE, HasCacheKey
+
+from sqlalchemy_cubrid.slowlog import fingerprint_sql
+
+__all__ = (
+    "CacheFinding",
+    "CacheReport",
+    "instrument_cache",
+    "uncacheable_constructs",
+)
+
+_OTHER = "<other>"
+_UNKNOWN = "<unknown>"
+
+_OUTCOMES: Dict[Any, str] = {
+    DefaultDialect.CACHE_HIT: "hit",
+    DefaultDialect.CACHE_MISS: "miss",
+    DefaultDialect.CACHING_DISABLED: "disabled",
+    DefaultDialect.NO_CACHE_KEY: "no_key",
+    DefaultDialect.NO_DIALECT_SUPPORT: "no_dialect_support",
+}
+
+# Frames inside these directories are never reported as call sites.
+_SKIPPED_DIRS = tuple(
+    os.path.dirname(os.path.abspath(path)) + os.sep
+    for path in (sqlalchemy.__file__ or "", __file__)
+)
+
+_CUBRID_CONSTRUCTS = {
+    "Merge": "MERGE",
+    "OnDuplicateClause": "INSERT ... ON DUPLICATE KEY UPDATE",
+}
+
+
+def uncacheable_constructs(statement: Any) -> List[str]:
+    """Return the class names of elements in *statement* that disable caching.
+
+    An empty list means the statement can be cached (or consists only of
+    elements that compute their own cache key, such as tables).
+    """
+    names: List[str] = []
+    own_key = HasCacheKey._gen_cache_key
+    for element in visitors.iterate(statement):
+        cls: Any = type(element)
+        # Tables and columns override _gen_cache_key and are always cacheable.
+        if not isinstance(element, HasCacheKey) or cls._gen_cache_key is not own_key:
+            continue
+        if cls._generate_cache_attrs() is NO_CACHE and cls.__name__ not in names:
+            names.append(cls.__name__)
+    return names
+
+
+def _call_site() -> str:
+    frame: Optional[FrameType] = sys._getframe()
+    # greenlet is only loaded when an async engine is in use.
+    greenlet: Any = sys.modules.get("greenlet")
+    current = greenlet.getcurrent() if greenlet is not None else None
+    while True:
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if not os.path.abspath(filename).startswith(_SKIPPED_DIRS):
+                return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+            frame = frame.f_back
+        # Async engines execute inside a greenlet whose stack stops at
+        # greenlet_spawn(); the caller is in the parent greenlet.
+        current = getattr(current, "parent", None)
+        if current is None:
+            return _UNKNOWN
+        frame = current.gr_frame
+
+
+class _SiteStats:
+    __slots__ = (
+        "outcomes",
+        "evictions",
+        "sql",
+        "shapes",
+        "saturated",
+        "statement_types",
+        "uncacheable",
+    )
+
+    def __init__(self) -> None:
+        self.outcomes: Dict[str, int] = {}
+        self.evictions = 0
+        self.sql: Set[str] = set()
+        self.shapes: Set[str] = set()
+        self.saturated = False
+        self.statement_types: List[str] = []
+        self.uncacheable: List[str] = []
+
+    def snapshot(self, site: str) -> Dict[str, Any]:
+        executions = sum(self.outcomes.values())
+        hits = self.outcomes.get("hit", 0)
+        lookups = hits + self.outcomes.get("miss", 0)
+        return {
+            "site": site,
+            "executions": executions,
+            "outcomes": dict(self.outcomes),
+            "hit_ratio": hits / lookups if lookups else None,
+            "evictions": self.evictions,
+            "distinct_sql": len(self.sql),
+            "distinct_shapes": len(self.shapes),
+            "saturated": self.saturated,
+            "statement_types": list(self.statement_types),
+            "uncacheable": list(self.uncacheable),
+            "sample_sql": min(self.sql, key=len) if self.sql else None,
+        }
+
+
+class CacheFinding:
+    """One cache problem at a call site (``site`` is ``None`` when global)."""
+
+    __slots__ = ("kind", "site", "message", "suggestion")
+
+    def __init__(self, kind: str, site: Optional[str], message: str, suggestion: str) -> None:
+        self.kind = kind
+        self.site = site
+        self.message = message
+        self.suggestion = suggestion
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "site": self.site,
+            "message": self.message,
+            "suggestion": self.suggestion,
+        }
+
+    def __repr__(self) -> str:
+        return f"CacheFinding({self.kind!r}, {self.site!r}, {self.message!r})"
+
+
+class CacheReport:
+    """Per-call-site compiled-cache statistics.
+
+    :param explosion_threshold: distinct compiled SQL strings at one call
+        site from which :meth:`findings` reports a cache-key explosion.
+    :param max_sites: call sites tracked individually; later ones are
+        folded into one ``<other>`` entry.
+    :param max_sql_per_site: distinct SQL strings remembered per site;
+        past it the site is marked ``saturated`` and new strings are
+        neither counted nor checked for eviction.
+    """
+
+    def __init__(
+        self,
+        *,
+        explosion_threshold: int = 20,
+        max_sites: int = 1000,
+        max_sql_per_site: int = 1000,
+    ) -> None:
+        self.explosion_threshold = explosion_threshold
+        self.max_sites = max_sites
+        self.max_sql_per_site = max_sql_per_site
+        self._sites: Dict[str, _SiteStats] = {}
+        self._engines: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    # ----- recording -----
+
+    def record(
+        self,
+        site: str,
+        outcome: str,
+        sql: str,
+        statement: Any = None,
+    ) -> None:
+        """Record one execution of *sql* at *site* with cache *outcome*.
+
+        *statement*, the executed construct, supplies the statement type
+        and, for ``no_key`` executions, the constructs that prevented
+        caching.
+        """
+        with self._lock:
+            stats = self._sites.get(site)
+            if stats is None:
+                if len(self._sites) >= self.max_sites:
+                    site = _OTHER
+                stats = self._sites.get(site)
+                if stats is None:
+                    stats = self._sites[site] = _SiteStats()
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+            if sql in stats.sql:
+                # A miss on SQL this site already compiled means the
+                # cache dropped the entry in between.
+                if outcome == "miss":
+                    stats.evictions += 1
+            elif len(stats.sql) < self.max_sql_per_site:
+                stats.sql.add(sql)
+                stats.shapes.add(fingerprint_sql(sql))
+            else:
+                stats.saturated = True
+            if statement is None:
+                return
+            type_name = type(statement).__name__
+            if type_name not in stats.statement_types:
+                stats.statement_types.append(type_name)
+            if outcome == "no_key" and not stats.uncacheable:
+                stats.uncacheable = uncacheable_constructs(statement) or [type_name]
+
+    def analyze(self, statement: Any, *, dialect: Any = None, site: Optional[str] = None) -> str:
+        """Record *statement* as if executed once, without a database.
+
+        The outcome is ``no_key`` when the statement has no cache key,
+        ``hit`` when *site* already produced the same SQL and ``miss``
+        otherwise.  *dialect* defaults to the CUBRID dialect; *site*
+        defaults to the caller's location.  Returns the outcome.
+        """
+        if dialect is None:
+            from sqlalchemy_cubrid.dialect import CubridDialect
+
+            dialect = CubridDialect()
+        if site is None:
+            site = _call_site()
+        sql = str(statement.compile(dialect=dialect))
+        if statement._generate_cache_key() is None:
+            outcome = "no_key"
+        else:
+            with self._lock:
+                stats = self._sites.get(site)
+                outcome = "hit" if stats is not None and sql in stats.sql else "miss"
+        self.record(site, outcome, sql, statement)
+        return outcome
+
+    # ----- export -----
+
+    def sites(self) -> List[Dict[str, Any]]:
+        """Per-site statistics, most distinct SQL strings first."""
+        with self._lock:
+            entries = [stats.snapshot(site) for site, stats in self._sites.items()]
+        entries.sort(key=lambda entry: (-entry["distinct_sql"], -entry["executions"]))
+        return entries
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return totals, engine cache occupancy and :meth:`sites`."""
+        sites = self.sites()
+        outcomes: Dict[str, int] = {}
+        for entry in sites:
+            for outcome, count in entry["outcomes"].items():
+                outcomes[outcome] = outcomes.get(outcome, 0) + count
+        hits = outcomes.get("hit", 0)
+        lookups = hits + outcomes.get("miss", 0)
+        evictions = sum(entry["evictions"] for entry in sites)
+        return {
+            "executions": sum(outcomes.values()),
+            "outcomes": outcomes,
+            "hit_ratio": hits / lookups if lookups else None,
+            "evictions": evictions,
+            "eviction_rate": evictions / lookups if lookups else None,
+            "cache": self._cache_occupancy(),
+            "sites": sites,
+        }
+
+    def _cache_occupancy(self) -> Optional[Dict[str, int]]:
+        caches = [
+            engine._compiled_cache
+            for engine in list(self._engines)
+            if getattr(engine, "_compiled_cache", None) is not None
+        ]
+        if not caches:
+            return None
+        return {
+            "size": sum(len(cache) for cache in caches),
+            "capacity": sum(getattr(cache, "capacity", 0) for cache in caches),
+        }
+
+    def findings(self) -> List[CacheFinding]:
+        """Return the cache problems found so far, with suggested fixes."""
+        snapshot = self.snapshot()
+        found: List[CacheFinding] = []
+        for entry in snapshot["sites"]:
+            found.extend(self._site_findings(entry))
+
+        evictions = snapshot["evictions"]
+        if evictions:
+            cache = snapshot["cache"]
+            occupancy = (
+                f" (cache holds {cache['size']} of {cache['capacity']} entries)" if cache else ""
+            )
+            distinct = sum(entry["distinct_sql"] for entry in snapshot["sites"])
+            found.append(
+                CacheFinding(
+                    "evictions",
+                    None,
+                    f"{evictions} executions recompiled SQL that had been cached before{occupancy}",
+                    "fix the cache-key explosions reported for individual call sites "
+                    "first; if the statements are legitimately distinct, raise "
+                    f"create_engine(query_cache_size=...) above {distinct}",
+                )
+            )
+        return found
+
+    def _site_findings(self, entry: Dict[str, Any]) -> Iterable[CacheFinding]:
+        site = entry["site"]
+        outcomes = entry["outcomes"]
+
+        no_key = outcomes.get("no_key", 0)
+        if no_key:
+            constructs = entry["uncacheable"]
+            cubrid = [_CUBRID_CONSTRUCTS[name] for name in constructs if name in _CUBRID_CONSTRUCTS]
+            if cubrid:
+                suggestion = (
+                    f"{', '.join(cubrid)} does not take part in the compiled cache; keep it "
+                    "off hot paths, or send many rows per statement with executemany()"
+                )
+            else:
+                suggestion = (
+                    f"set inherit_cache = True on {', '.join(constructs)} if its superclass "
+                    "cache key covers its state, or define _traverse_internals for it"
+                )
+            yield CacheFinding(
+                "uncacheable",
+                site,
+                f"{no_key} executions compiled without caching because of {', '.join(constructs)}",
+                suggestion,
+            )
+
+        disabled = outcomes.get("disabled", 0)
+        if disabled:
+            yield CacheFinding(
+                "caching_disabled",
+                site,
+                f"{disabled} executions ran with the compiled cache disabled",
+                "remove query_cache_size=0 from create_engine() or "
+                "compiled_cache=None from the execution options",
+            )
+
+        distinct = entry["distinct_sql"]
+        if distinct < self.explosion_threshold:
+            return
+        plus = "+" if entry["saturated"] else ""
+        message = f"{distinct}{plus} distinct compiled statements from one call site"
+        if entry["distinct_shapes"] < distinct:
+            if "TextClause" in entry["statement_types"]:
+                suggestion = (
+                    "values are formatted into the text() string; use :name placeholders "
+                    "with text(...).bindparams() and pass the values as parameters"
+                )
+            else:
+                suggestion = (
+                    "literal values or IN-list lengths are rendered into the SQL; pass "
+                    "values as bound parameters and use column.in_(values) or "
+                    "bindparam(name, expanding=True) so every list length shares one "
+                    "cache entry"
+                )
+            message += f" ({entry['distinct_shapes']} after normalizing literals)"
+        else:
+            suggestion = (
+                "the statement's structure changes per call (optional filters, column "
+                "lists, joins); build a small fixed set of shapes, or use "
+                "sqlalchemy.lambda_stmt() for the variable parts"
+            )
+        yield CacheFinding("key_explosion", site, message, suggestion)
+
+    def reset(self) -> None:
+        """Clear all statistics; instrumented engines stay hooked."""
+        with self._lock:
+            self._sites.clear()
+
+
+_instrumented: "weakref.WeakKeyDictionary[Any, CacheReport]" = weakref.WeakKeyDictionary()
+
+
+def instrument_cache(engine: Any, report: Optional[CacheReport] = None) -> CacheReport:
+    """Attach *report* (a new :class:`CacheReport` by default) to *engine*.
+
+    *engine* may be an :class:`~sqlalchemy.engine.Engine` or an
+    :class:`~sqlalchemy.ext.asyncio.AsyncEngine`; one report may serve
+    several engines.  Finding the call site walks the Python stack, a few
+    microseconds per execution: affordable while diagnosing, not meant to
+    stay on permanently.
+
+    :raises ValueError: if *engine* is already instrumented.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    if engine in _instrumented:
+        raise ValueError("engine is already instrumented")
+    if report is None:
+        report = CacheReport()
+    _instrumented[engine] = report
+    report._engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        # exec_driver_sql() and DDL executed as strings never reach the cache.
+        compiled = getattr(context, "compiled", None)
+        outcome = _OUTCOMES.get(getattr(context, "cache_hit", None))
+        if compiled is None or outcome is None:
+            return
+        report.record(_call_site(), outcome, compiled.string, compiled.statement)
+
+    return report
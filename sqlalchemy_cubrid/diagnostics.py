@@ -0,0 +1,798 @@
+# sqlalchemy_cubrid/diagnostics.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Lock wait and transaction contention diagnostics.
+
+:func:`lock_snapshot` reports which CUBRID transactions are waiting for
+locks and, where the server says so, which transactions hold them::
+
+    from sqlalchemy_cubrid.diagnostics import lock_snapshot
+
+    with engine.connect() as conn:
+        snapshot = lock_snapshot(conn)
+    for waiter in snapshot.waiters:
+        print(waiter.tran_index, waiter.mode, waiter.table, waiter.blockers)
+
+Over SQL, CUBRID exposes transactions (``SHOW TRANSACTION TABLES``) and
+the lock each server thread is suspended on (``SHOW THREADS``), but not
+lock owners or statement text.  Those come from the ``cubrid tranlist``
+and ``cubrid lockdb`` utilities on the database host; pass their output
+to fill in holders, locked tables and SQL::
+
+    out = subprocess.run(["cubrid", "tranlist", "demodb"], capture_output=True, text=True)
+    snapshot = lock_snapshot(conn, tranlist=out.stdout)
+    for blocker, waiter in snapshot.blocking():
+        print(f"{blocker} blocks {waiter}: {snapshot.transactions[waiter].sql}")
+
+The ``SHOW`` statements require a DBA connection.  On an
+:class:`~sqlalchemy.ext.asyncio.AsyncConnection` use
+``await conn.run_sync(lock_snapshot)``.
+
+:func:`instrument_contention` starts a :class:`ContentionSampler` that
+takes a snapshot every *interval* seconds, logs lock waits and counts
+contention hot spots per table and statement fingerprint
+(:func:`~sqlalchemy_cubrid.slowlog.fingerprint_sql`), including the
+statements of this process that were in flight while other transactions
+waited::
+
+    sampler = instrument_contention(engine, interval=5.0, min_wait=0.5)
+    ...
+    for spot in sampler.hotspots(10):
+        print(spot["samples"], spot["table"], spot["waiter"], spot["blocker"])
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, text
+
+from sqlalchemy_cubrid.slowlog import fingerprint_sql
+
+__all__ = (
+    "ContentionSampler",
+    "LockHolder",
+    "LockSnapshot",
+    "LockWaiter",
+    "TransactionInfo",
+    "instrument_contention",
+    "lock_snapshot",
+    "parse_lockdb",
+    "parse_tranlist",
+)
+
+log = logging.getLogger(__name__)
+
+#: Execution option marking the sampler's own queries.
+_OWN_QUERY = "cubrid_diagnostics"
+_NOT_WAITING = (None, "", "NULL_LOCK")
+
+# ``cubrid tranlist`` row, e.g.
+#   4(ACTIVE)  PUBLIC  host  1684  broker1_cub_cas_4  1.80  1.80  3, 2  e5899a1b76253  update ...
+_TRANLIST_RE = re.compile(
+    r"^\s*(?P<index>\d+)\((?P<state>[^)]*)\)\s+(?P<user>\S+)\s+(?P<host>\S+)\s+"
+    r"(?P<pid>-?\d+)\s+(?P<program>\S+)\s+(?P<query_time>-?[\d.]+)\s+"
+    r"(?P<tran_time>-?[\d.]+)\s+(?P<holders>-1|\d+(?:\s*,\s*\d+)*)"
+    r"(?:\s+(?:\*\*\* empty \*\*\*|(?P<sql_id>\S+)\s+(?P<sql>.*?)))?\s*$"
+)
+_OID_RE = re.compile(r"^\s*OID\s*=\s*\(?\s*(?P<oid>-?\d+\s*\|\s*-?\d+\s*\|\s*-?\d+)")
+_OBJECT_RE = re.compile(
+    r"^\s*Object type:\s*(?P<kind>[^=(]*?)\s*(?:\([^)]*\))?\s*=\s*(?P<name>.*)$"
+)
+_ENTRY_RE = re.compile(r"Tran_index\s*=\s*(?P<index>\d+)\s*,\s*(?P<rest>.*)$")
+_FIELD_RE = re.compile(r"(\w+)\s*=\s*([^,]+)")
+_SINCE_RE = re.compile(r"^\s*Start_waiting_at\s*=\s*(?P<since>.+?)\s*$")
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+class TransactionInfo:
+    """One server transaction, merged from every source available."""
+
+    __slots__ = (
+        "tran_index",
+        "state",
+        "isolation",
+        "user",
+        "host",
+        "pid",
+        "program",
+        "query_time_s",
+        "tran_time_s",
+        "sql",
+        "sql_id",
+        "waits_for",
+    )
+
+    def __init__(self, tran_index: int) -> None:
+        self.tran_index = tran_index
+        self.state: Optional[str] = None
+        self.isolation: Optional[str] = None
+        self.user: Optional[str] = None
+        self.host: Optional[str] = None
+        self.pid: Optional[int] = None
+        #: Client program; the broker CAS process for pycubrid connections.
+        self.program: Optional[str] = None
+        self.query_time_s: Optional[float] = None
+        self.tran_time_s: Optional[float] = None
+        self.sql: Optional[str] = None
+        self.sql_id: Optional[str] = None
+        #: Transactions holding the lock this one waits for (``tranlist``).
+        self.waits_for: Tuple[int, ...] = ()
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return None if self.sql is None else fingerprint_sql(self.sql)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["waits_for"] = list(self.waits_for)
+        data["fingerprint"] = self.fingerprint
+        return data
+
+    def __repr__(self) -> str:
+        return f"TransactionInfo({self.tran_index!r}, state={self.state!r}, sql={self.sql!r})"
+
+
+class _Lock:
+    __slots__ = ("tran_index", "mode", "table", "oid", "transaction")
+
+    def __init__(
+        self,
+        tran_index: int,
+        mode: Optional[str],
+        table: Optional[str] = None,
+        oid: Optional[str] = None,
+    ) -> None:
+        self.tran_index = tran_index
+        self.mode = mode
+        #: Locked table (``lockdb``); ``None`` when unknown.
+        self.table = table
+        #: Locked object id ``volume|page|slot`` (``lockdb``).
+        self.oid = oid
+        self.transaction: Optional[TransactionInfo] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        transaction = self.transaction
+        return {
+            "tran_index": self.tran_index,
+            "mode": self.mode,
+            "table": self.table,
+            "oid": self.oid,
+            "sql": None if transaction is None else transaction.sql,
+            "fingerprint": None if transaction is None else transaction.fingerprint,
+        }
+
+
+class LockHolder(_Lock):
+    """A transaction holding a lock that another transaction waits for."""
+
+    __slots__ = ("count",)
+
+    def __init__(
+        self,
+        tran_index: int,
+        mode: Optional[str],
+        table: Optional[str] = None,
+        oid: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> None:
+        super().__init__(tran_index, mode, table, oid)
+        self.count = count
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data["count"] = self.count
+        return data
+
+    def __repr__(self) -> str:
+        return f"LockHolder({self.tran_index!r}, {self.mode!r}, table={self.table!r})"
+
+
+class LockWaiter(_Lock):
+    """A transaction suspended on a lock request."""
+
+    __slots__ = ("since", "timeout_ms", "blockers")
+
+    def __init__(
+        self,
+        tran_index: int,
+        mode: Optional[str],
+        table: Optional[str] = None,
+        oid: Optional[str] = None,
+        *,
+        since: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        blockers: Tuple[int, ...] = (),
+    ) -> None:
+        super().__init__(tran_index, mode, table, oid)
+        #: Wait start as reported by the server (server clock).
+        self.since = since
+        #: Lock timeout of the request; ``-1`` waits forever.
+        self.timeout_ms = timeout_ms
+        #: Transactions holding the lock.
+        self.blockers = blockers
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update(since=self.since, timeout_ms=self.timeout_ms, blockers=list(self.blockers))
+        return data
+
+    def __repr__(self) -> str:
+        return (
+            f"LockWaiter({self.tran_index!r}, {self.mode!r}, table={self.table!r}, "
+            f"blockers={self.blockers!r})"
+        )
+
+
+class LockSnapshot:
+    """Transactions, lock waiters and lock holders at one point in time."""
+
+    __slots__ = ("taken_at", "transactions", "waiters", "holders")
+
+    def __init__(
+        self,
+        transactions: Dict[int, TransactionInfo],
+        waiters: List[LockWaiter],
+        holders: List[LockHolder],
+    ) -> None:
+        self.taken_at = datetime.now(timezone.utc)
+        self.transactions = transactions
+        self.waiters = waiters
+        self.holders = holders
+
+    def blocking(self) -> List[Tuple[int, int]]:
+        """Return ``(blocker, waiter)`` transaction index pairs."""
+        return sorted(
+            {(blocker, waiter.tran_index) for waiter in self.waiters for blocker in waiter.blockers}
+        )
+
+    def root_blockers(self) -> List[int]:
+        """Blocking transactions that are not waiting themselves."""
+        waiting = {waiter.tran_index for waiter in self.waiters}
+        return sorted({blocker for blocker, _ in self.blocking()} - waiting)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "taken_at": self.taken_at.isoformat(),
+            "transactions": [info.to_dict() for _, info in sorted(self.transactions.items())],
+            "waiters": [waiter.to_dict() for waiter in self.waiters],
+            "holders": [holder.to_dict() for holder in self.holders],
+            "blocking": [list(pair) for pair in self.blocking()],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"LockSnapshot(transactions={len(self.transactions)}, "
+            f"waiters={len(self.waiters)}, holders={len(self.holders)})"
+        )
+
+
+# ----- parsers -----
+
+
+def parse_tranlist(output: str) -> Dict[int, TransactionInfo]:
+    """Parse ``cubrid tranlist`` output into transactions by index.
+
+    Lines that are not transaction rows (headers, rules, messages) are
+    ignored.  ``waits_for`` comes from the "Wait for lock holder" column.
+    """
+    transactions: Dict[int, TransactionInfo] = {}
+    for line in output.splitlines():
+        match = _TRANLIST_RE.match(line)
+        if match is None:
+            continue
+        info = TransactionInfo(int(match["index"]))
+        info.state = match["state"]
+        info.user = match["user"]
+        info.host = match["host"]
+        info.pid = _int(match["pid"])
+        info.program = match["program"]
+        info.query_time_s = _float(match["query_time"])
+        info.tran_time_s = _float(match["tran_time"])
+        info.sql_id = match["sql_id"]
+        info.sql = _str(match["sql"])
+        if match["holders"] != "-1":
+            info.waits_for = tuple(int(part) for part in match["holders"].split(","))
+        transactions[info.tran_index] = info
+    return transactions
+
+
+def parse_lockdb(output: str) -> Tuple[List[LockHolder], List[LockWaiter]]:
+    """Parse ``cubrid lockdb`` output into holders and waiters.
+
+    Only objects with waiters are of interest, but every holder is
+    returned; a waiter's ``blockers`` are the other holders of its object.
+    A blocked holder (lock conversion) is reported as both.
+    """
+    holders: List[LockHolder] = []
+    waiters: List[LockWaiter] = []
+    oid: Optional[str] = None
+    table: Optional[str] = None
+    object_holders: List[LockHolder] = []
+    object_waiters: List[LockWaiter] = []
+
+    def close_object() -> None:
+        owners = tuple(holder.tran_index for holder in object_holders)
+        for waiter in object_waiters:
+            waiter.blockers = tuple(index for index in owners if index != waiter.tran_index)
+        object_holders.clear()
+        object_waiters.clear()
+
+    for line in output.splitlines():
+        match = _OID_RE.match(line)
+        if match is not None:
+            close_object()
+            oid, table = re.sub(r"\s+", "", match["oid"]), None
+            continue
+        match = _OBJECT_RE.match(line)
+        if match is not None:
+            table = match["name"].strip().rstrip(".") or None
+            continue
+        match = _SINCE_RE.match(line)
+        if match is not None:
+            if object_waiters:
+                object_waiters[-1].since = match["since"]
+            continue
+        match = _ENTRY_RE.search(line)
+        if match is None:
+            continue
+        index = int(match["index"])
+        fields = {key.lower(): value.strip() for key, value in _FIELD_RE.findall(match["rest"])}
+        if "granted_mode" in fields:
+            holder = LockHolder(
+                index, fields["granted_mode"], table, oid, count=_int(fields.get("count"))
+            )
+            holders.append(holder)
+            object_holders.append(holder)
+        if "blocked_mode" in fields:
+            waiter = LockWaiter(index, fields["blocked_mode"], table, oid)
+            waiters.append(waiter)
+            object_waiters.append(waiter)
+    close_object()
+    return holders, waiters
+
+
+# ----- snapshot -----
+
+
+def _rows(connection: Any, sql: str) -> List[Dict[str, Any]]:
+    result = connection.execute(text(sql), execution_options={_OWN_QUERY: True})
+    try:
+        return [{key.lower(): value for key, value in row.items()} for row in result.mappings()]
+    finally:
+        result.close()
+
+
+def _transaction(transactions: Dict[int, TransactionInfo], index: int) -> TransactionInfo:
+    info = transactions.get(index)
+    if info is None:
+        info = transactions[index] = TransactionInfo(index)
+    return info
+
+
+def lock_snapshot(
+    connection: Any,
+    *,
+    tranlist: Optional[str] = None,
+    lockdb: Optional[str] = None,
+) -> LockSnapshot:
+    """Return the lock waits and holders of the database *connection* is on.
+
+    Transactions come from ``SHOW TRANSACTION TABLES`` and waiters from
+    the lock-wait columns of ``SHOW THREADS``.  *tranlist* and *lockdb*
+    are optional ``cubrid tranlist`` / ``cubrid lockdb`` outputs taken at
+    about the same time; they add the SQL each transaction runs, lock
+    holders, blocker relations and the locked tables.
+
+    :param connection: a :class:`~sqlalchemy.engine.Connection` with DBA
+        privileges.
+    """
+    transactions: Dict[int, TransactionInfo] = {}
+    for row in _rows(connection, "SHOW TRANSACTION TABLES"):
+        index = _int(row.get("tran_index"))
+        if index is None:
+            continue
+        info = _transaction(transactions, index)
+        info.state = _str(row.get("state"))
+        info.isolation = _str(row.get("isolation"))
+        info.user = _str(row.get("client_db_user"))
+        info.host = _str(row.get("client_host"))
+        info.pid = _int(row.get("client_pid"))
+        info.program = _str(row.get("client_program"))
+
+    waiters: Dict[int, LockWaiter] = {}
+    for row in _rows(connection, "SHOW THREADS"):
+        index = _int(row.get("tran_index"))
+        mode = _str(row.get("lockwait_blocked_mode"))
+        if index is None or index < 0 or mode in _NOT_WAITING:
+            continue
+        waiters[index] = LockWaiter(
+            index,
+            mode,
+            since=_str(row.get("lockwait_start_time")),
+            timeout_ms=_int(row.get("lockwait_msecs")),
+        )
+
+    if tranlist is not None:
+        for index, listed in parse_tranlist(tranlist).items():
+            info = _transaction(transactions, index)
+            for name in TransactionInfo.__slots__:
+                if getattr(info, name) in (None, ()):
+                    setattr(info, name, getattr(listed, name))
+            if listed.waits_for:
+                waiter = waiters.get(index)
+                if waiter is None:
+                    waiter = waiters[index] = LockWaiter(index, None)
+                waiter.blockers = listed.waits_for
+
+    holders: Dict[Tuple[int, Optional[str]], LockHolder] = {}
+    if lockdb is not None:
+        dumped_holders, dumped_waiters = parse_lockdb(lockdb)
+        blocking = {(index, waiter.oid) for waiter in dumped_waiters for index in waiter.blockers}
+        for holder in dumped_holders:
+            if (holder.tran_index, holder.oid) in blocking:
+                holders.setdefault((holder.tran_index, holder.oid), holder)
+        for dumped in dumped_waiters:
+            waiter = waiters.get(dumped.tran_index)
+            if waiter is None:
+                waiters[dumped.tran_index] = dumped
+                continue
+            waiter.mode = waiter.mode or dumped.mode
+            waiter.table, waiter.oid = dumped.table, dumped.oid
+            waiter.since = waiter.since or dumped.since
+            waiter.blockers = waiter.blockers or dumped.blockers
+
+    # Blockers named only by tranlist are holders of an unknown lock.
+    for waiter in waiters.values():
+        for index in waiter.blockers:
+            if not any(key[0] == index for key in holders):
+                holders[(index, None)] = LockHolder(index, None)
+
+    for lock in [*waiters.values(), *holders.values()]:
+        lock.transaction = _transaction(transactions, lock.tran_index)
+    return LockSnapshot(
+        transactions,
+        sorted(waiters.values(), key=lambda waiter: waiter.tran_index),
+        sorted(holders.values(), key=lambda holder: holder.tran_index),
+    )
+
+
+# ----- sampler -----
+
+
+class _Hotspot:
+    __slots__ = ("samples", "max_waiters", "first_seen", "last_seen")
+
+    def __init__(self, now: float) -> None:
+        self.samples = 0
+        self.max_waiters = 0
+        self.first_seen = now
+        self.last_seen = now
+
+
+class ContentionSampler:
+    """Periodic lock snapshots aggregated into contention hot spots.
+
+    A hot spot is a ``(table, waiter fingerprint, blocker fingerprint)``
+    triple seen in a snapshot; parts the server did not report are
+    ``None``.  While any transaction waits, the statements of this
+    process that have been executing for at least *min_wait* seconds are
+    counted as *stalled*: those are the local statements likely to be
+    stuck behind (or holding) the contended locks.
+
+    :param interval: seconds between snapshots of the background thread.
+    :param min_wait: execution time from which an in-flight local
+        statement counts as stalled.
+    :param tranlist: returns current ``cubrid tranlist`` output; see
+        :func:`lock_snapshot`.
+    :param lockdb: returns current ``cubrid lockdb`` output.
+    :param log_level: level of the per-waiter log records.
+    :param max_hotspots: distinct hot spots and stalled fingerprints kept;
+        later ones are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 5.0,
+        min_wait: float = 0.5,
+        tranlist: Optional[Callable[[], str]] = None,
+        lockdb: Optional[Callable[[], str]] = None,
+        log_level: int = logging.WARNING,
+        max_hotspots: int = 500,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval!r}")
+        self.interval = interval
+        self.min_wait = min_wait
+        self.tranlist = tranlist
+        self.lockdb = lockdb
+        self.log_level = log_level
+        self.max_hotspots = max_hotspots
+        self.samples = 0
+        self.contended_samples = 0
+        self.errors = 0
+        self._engine: Any = None
+        self._hotspots: Dict[Tuple[Optional[str], Optional[str], Optional[str]], _Hotspot] = {}
+        # fingerprint -> (samples, longest execution seen in seconds).
+        self._stalled: Dict[str, Tuple[int, float]] = {}
+        # id(execution context) -> (fingerprint, perf_counter at execute).
+        self._inflight: Dict[int, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ----- in-flight statements -----
+
+    def _started(self, context: Any, statement: str) -> None:
+        if context is None or context.execution_options.get(_OWN_QUERY):
+            return
+        compiled = getattr(context, "compiled", None)
+        string = getattr(compiled, "string", None)
+        sql = string if isinstance(string, str) else statement
+        with self._lock:
+            self._inflight[id(context)] = (fingerprint_sql(sql), time.perf_counter())
+
+    def _ended(self, context: Any) -> None:
+        with self._lock:
+            self._inflight.pop(id(context), None)
+
+    def inflight(self) -> List[Tuple[str, float]]:
+        """Return ``(fingerprint, seconds executing)`` of local statements."""
+        now = time.perf_counter()
+        with self._lock:
+            entries = list(self._inflight.values())
+        return sorted(
+            ((fingerprint, now - started) for fingerprint, started in entries),
+            key=lambda entry: entry[1],
+            reverse=True,
+        )
+
+    # ----- sampling -----
+
+    def sample(self, connection: Any = None) -> LockSnapshot:
+        """Take one snapshot now, record it and return it.
+
+        *connection* defaults to a new connection of the instrumented engine.
+        """
+        tranlist = self.tranlist() if self.tranlist is not None else None
+        lockdb = self.lockdb() if self.lockdb is not None else None
+        if connection is None:
+            if self._engine is None:
+                raise RuntimeError("sampler is not attached to an engine")
+            with self._engine.connect() as connection:
+                snapshot = lock_snapshot(connection, tranlist=tranlist, lockdb=lockdb)
+        else:
+            snapshot = lock_snapshot(connection, tranlist=tranlist, lockdb=lockdb)
+        self.record(snapshot)
+        return snapshot
+
+    def record(self, snapshot: LockSnapshot) -> None:
+        """Add *snapshot* to the hot spot statistics and log its waits."""
+        stalled = [entry for entry in self.inflight() if entry[1] >= self.min_wait]
+        now = time.time()
+        spots: Dict[Tuple[Optional[str], Optional[str], Optional[str]], int] = {}
+        for waiter in snapshot.waiters:
+            waiting = waiter.transaction.fingerprint if waiter.transaction else None
+            blockers = [snapshot.transactions.get(index) for index in waiter.blockers]
+            blocking = [info.fingerprint if info else None for info in blockers] or [None]
+            for fingerprint in blocking:
+                key = (waiter.table, waiting, fingerprint)
+                spots[key] = spots.get(key, 0) + 1
+            if log.isEnabledFor(self.log_level):
+                log.log(
+                    self.log_level,
+                    "lock wait: transaction %d requests %s on %s, blocked by %s; sql=%s",
+                    waiter.tran_index,
+                    waiter.mode or "?",
+                    waiter.table or "?",
+                    ", ".join(map(str, waiter.blockers)) or "?",
+                    waiting,
+                )
+        if snapshot.waiters and stalled and log.isEnabledFor(self.log_level):
+            log.log(
+                self.log_level,
+                "lock wait: %d local statement(s) in flight >= %.3fs: %s",
+                len(stalled),
+                self.min_wait,
+                "; ".join(f"{elapsed:.3f}s {fingerprint}" for fingerprint, elapsed in stalled),
+            )
+
+        with self._lock:
+            self.samples += 1
+            if not snapshot.waiters:
+                return
+            self.contended_samples += 1
+            for key, waiters in spots.items():
+                spot = self._hotspots.get(key)
+                if spot is None:
+                    if len(self._hotspots) >= self.max_hotspots:
+                        continue
+                    spot = self._hotspots[key] = _Hotspot(now)
+                spot.samples += 1
+                spot.max_waiters = max(spot.max_waiters, waiters)
+                spot.last_seen = now
+            for fingerprint, elapsed in stalled:
+                seen = self._stalled.get(fingerprint)
+                if seen is None and len(self._stalled) >= self.max_hotspots:
+                    continue
+                samples, longest = seen or (0, 0.0)
+                self._stalled[fingerprint] = (samples + 1, max(longest, elapsed))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:  # noqa: BLE001 - keep sampling; the next round may succeed
+                self.errors += 1
+                log.debug("lock snapshot failed", exc_info=True)
+
+    def start(self) -> None:
+        """Sample every :attr:`interval` seconds from a daemon thread."""
+        if self._engine is None:
+            raise RuntimeError("sampler is not attached to an engine")
+        if self._thread is not None:
+            raise RuntimeError("sampler already running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sqlalchemy-cubrid-contention", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    # ----- export -----
+
+    def hotspots(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return hot spots, most frequently contended first."""
+        with self._lock:
+            items = list(self._hotspots.items())
+        entries: List[Dict[str, Any]] = [
+            {
+                "table": table,
+                "waiter": waiter,
+                "blocker": blocker,
+                "samples": spot.samples,
+                "max_waiters": spot.max_waiters,
+                "first_seen": spot.first_seen,
+                "last_seen": spot.last_seen,
+            }
+            for (table, waiter, blocker), spot in items
+        ]
+        entries.sort(key=lambda entry: entry["samples"], reverse=True)
+        return entries if n is None else entries[:n]
+
+    def stalled(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return local statements seen in flight during lock waits."""
+        with self._lock:
+            items = list(self._stalled.items())
+        entries: List[Dict[str, Any]] = [
+            {"fingerprint": key, "samples": samples, "max_elapsed_s": elapsed}
+            for key, (samples, elapsed) in items
+        ]
+        entries.sort(key=lambda entry: entry["samples"], reverse=True)
+        return entries if n is None else entries[:n]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all statistics as a JSON-serializable dict."""
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "samples": self.samples,
+            "contended_samples": self.contended_samples,
+            "errors": self.errors,
+            "hotspots": self.hotspots(),
+            "stalled": self.stalled(),
+        }
+
+    def reset(self) -> None:
+        """Clear all statistics; the engine stays hooked."""
+        with self._lock:
+            self.samples = self.contended_samples = self.errors = 0
+            self._hotspots.clear()
+            self._stalled.clear()
+
+
+_instrumented: "weakref.WeakKeyDictionary[Any, ContentionSampler]" = weakref.WeakKeyDictionary()
+
+
+def instrument_contention(
+    engine: Any,
+    sampler: Optional[ContentionSampler] = None,
+    *,
+    sample_engine: Any = None,
+    start: bool = True,
+    **kwargs: Any,
+) -> ContentionSampler:
+    """Track *engine*'s in-flight statements and sample lock contention.
+
+    *kwargs* are passed to a new :class:`ContentionSampler` when *sampler*
+    is not given.  Snapshots are taken on a connection of *sample_engine*
+    (default: *engine*), which must be a synchronous engine with DBA
+    privileges; for an :class:`~sqlalchemy.ext.asyncio.AsyncEngine` pass a
+    synchronous ``cubrid+pycubrid://`` engine to the same database.  With
+    *start* false, call :meth:`ContentionSampler.start` or
+    :meth:`ContentionSampler.sample` yourself.
+
+    :raises ValueError: if *engine* is already instrumented, or is
+        asynchronous and no *sample_engine* is given.
+    """
+    is_async = hasattr(engine, "sync_engine")
+    engine = getattr(engine, "sync_engine", engine)
+    if engine in _instrumented:
+        raise ValueError("engine is already instrumented")
+    if sample_engine is None:
+        if is_async:
+            raise ValueError("pass a synchronous sample_engine for an AsyncEngine")
+        sample_engine = engine
+    if sampler is None:
+        sampler = ContentionSampler(**kwargs)
+    elif kwargs:
+        raise TypeError("pass sampler options to ContentionSampler, not with a sampler")
+    if sampler._engine is not None:
+        raise ValueError("sampler is already attached to an engine")
+    sampler._engine = sample_engine
+    _instrumented[engine] = sampler
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        sampler._started(context, statement)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        sampler._ended(context)
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context: Any) -> None:
+        sampler._ended(exception_context.execution_context)
+
+    if start:
+        sampler.start()
+    return sampler
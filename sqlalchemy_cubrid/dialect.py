@@ -11,8 +11,10 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from typing import Any, Callable, Optional, Sequence, cast
 
+from sqlalchemy import exc as sa_exc
 from sqlalchemy import types as sqltypes
 from sqlalchemy.engine import default, reflection
 from sqlalchemy.engine.interfaces import (
@@ -34,6 +36,16 @@ from sqlalchemy.sql.compiler import IdentifierPreparer
 from sqlalchemy.sql.compiler import InsertmanyvaluesSentinelOpts
 
 from sqlalchemy_cubrid.base import CubridExecutionContext, CubridIdentifierPreparer
+from sqlalchemy_cubrid.errors import (
+    DISCONNECT_MESSAGES,
+    ErrorCategory,
+    classify_error,
+    error_code,
+)
+from sqlalchemy_cubrid.jsoncodec import JsonCodec, get_json_codec
+from sqlalchemy_cubrid.phases import PhaseTracer
+from sqlalchemy_cubrid.pool import PingWindow
+from sqlalchemy_cubrid.trace import StatementTracer
 from sqlalchemy_cubrid.compiler import (
     CubridCompiler,
     CubridDDLCompiler,
@@ -190,6 +202,23 @@ ischema_names = {
 }
 
 
+_dbapi_error_classes: dict[type[Any], Optional[type[BaseException]]] = {}
+
+
+def _imported_dbapi_error_class(dialect_cls: type[Any]) -> Optional[type[BaseException]]:
+    """Import the DBAPI of *dialect_cls* once, for dialects used without an engine."""
+    try:
+        return _dbapi_error_classes[dialect_cls]
+    except KeyError:
+        pass
+    try:
+        error_cls: Optional[type[BaseException]] = dialect_cls.import_dbapi().Error
+    except ImportError:
+        error_cls = None
+    _dbapi_error_classes[dialect_cls] = error_cls
+    return error_cls
+
+
 # -----------------------------------------------------------------------
 # Dialect
 # -----------------------------------------------------------------------
@@ -263,12 +292,44 @@ class CubridDialect(default.DefaultDialect):
         isolation_level: str | None = None,
         json_serializer: Any = None,
         json_deserializer: Any = None,
+        cubrid_json_codec: str | None = None,
+        cubrid_json_lazy: bool = False,
+        cubrid_ping_window: float | None = None,
+        cubrid_trace_sample_rate: float = 0.0,
+        cubrid_trace_slow_threshold: float | None = None,
+        cubrid_trace_sink: Callable[[dict[str, Any]], Any] | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.isolation_level = isolation_level
         self._json_serializer = json_serializer
         self._json_deserializer = json_deserializer
+        # JSON columns call this codec directly (see types.JSON); without
+        # it they use SQLAlchemy's generic JSON processors.
+        self._json_codec: Optional[JsonCodec] = None
+        self._json_lazy = cubrid_json_lazy
+        if cubrid_json_codec is not None or cubrid_json_lazy:
+            self._json_codec = get_json_codec(
+                cubrid_json_codec, serializer=json_serializer, deserializer=json_deserializer
+            )
+            self._json_serializer = self._json_codec.dumps
+            self._json_deserializer = self._json_codec.loads
+        # ``pool_pre_ping`` skips the CHECK_CAS round trip for connections
+        # that succeeded less than this many seconds ago.
+        self._ping_window = PingWindow(cubrid_ping_window) if cubrid_ping_window else None
+        # Installed by ``metrics.instrument_engine``; called with the ping
+        # outcome and its duration in seconds.
+        self._ping_observer: Optional[Callable[[str, float], None]] = None
+        # Installed by ``phases.instrument_phases``; see CubridExecutionContext.
+        self._phase_tracer: Optional[PhaseTracer] = None
+        # Sampled SET TRACE ON / SHOW TRACE around real executions.
+        self._statement_tracer = (
+            StatementTracer(
+                cubrid_trace_sample_rate, cubrid_trace_slow_threshold, cubrid_trace_sink
+            )
+            if cubrid_trace_sample_rate or cubrid_trace_slow_threshold is not None
+            else None
+        )
 
     @classmethod
     def import_dbapi(cls) -> DBAPIModule:
@@ -874,27 +935,51 @@ class CubridDialect(default.DefaultDialect):
         """CUBRID does not support RELEASE SAVEPOINT; no-op."""
         pass
 
+    # ----- Statement execution -----
+
+    def do_execute(self, cursor: Any, statement: str, parameters: Any, context: Any = None) -> None:
+        if self._statement_tracer is not None and context is not None:
+            connection = context.root_connection.connection
+            self._statement_tracer.execute(
+                connection.dbapi_connection,
+                statement,
+                lambda: cursor.execute(statement, parameters),
+                connection.info,
+            )
+        else:
+            cursor.execute(statement, parameters)
+        self._touch_ping_window(context)
+
+    def do_execute_no_params(self, cursor: Any, statement: str, context: Any = None) -> None:
+        if self._statement_tracer is not None and context is not None:
+            connection = context.root_connection.connection
+            self._statement_tracer.execute(
+                connection.dbapi_connection,
+                statement,
+                lambda: cursor.execute(statement),
+                connection.info,
+            )
+        else:
+            cursor.execute(statement)
+        self._touch_ping_window(context)
+
+    def do_executemany(
+        self, cursor: Any, statement: str, parameters: Any, context: Any = None
+    ) -> None:
+        cursor.executemany(statement, parameters)
+        self._touch_ping_window(context)
+
+    def _touch_ping_window(self, context: Any) -> None:
+        """Record a successful statement for the ``cubrid_ping_window`` check."""
+        if self._ping_window is not None and context is not None:
+            self._ping_window.touch(context.root_connection.connection.dbapi_connection)
+
     # ----- Error handling & connection health -----
 
     # Disconnect message patterns (lowercase) for is_disconnect().
     # Modeled after psycopg2's string-based approach since CUBRIDdb has
     # only Error, InterfaceError, DatabaseError, and NotSupportedError.
-    _disconnect_messages = (
-        "connection is closed",
-        "closed connection",
-        "lost connection",
-        "server has gone away",
-        "connection reset",
-        "broken pipe",
-        "cannot communicate with the broker",
-        "received invalid packet",
-        "broker is not available",
-        "communication error",
-        "connection timed out",
-        "connection refused",
-        "connection was killed",
-        "failed to connect",
-    )
+    _disconnect_messages = DISCONNECT_MESSAGES
 
     def is_disconnect(self, e: Exception, connection: Any, cursor: Any) -> bool:
         """Return True if *e* indicates a dropped connection.
@@ -902,63 +987,113 @@ class CubridDialect(default.DefaultDialect):
         CUBRID's Python driver exposes a limited exception hierarchy:
         ``Error``, ``InterfaceError``, ``DatabaseError``, and
         ``NotSupportedError``.  There is no ``OperationalError`` class,
-        so we rely primarily on string-based message matching (similar
-        to psycopg2) supplemented by known numeric error codes.
+        so we rely on known numeric error codes supplemented by
+        string-based message matching (similar to psycopg2); see
+        :meth:`classify_error`.
+
+        A disconnect also marks every connection tracked by the
+        ``cubrid_ping_window`` as suspect, since its siblings talk to the
+        same broker.
         """
-        dbapi_module = getattr(self, "dbapi", None)
-        if dbapi_module is None or not hasattr(dbapi_module, "Error"):
-            try:
-                dbapi_module = self.import_dbapi()
-            except ImportError:
-                dbapi_module = None
-
-        if dbapi_module is not None and isinstance(e, dbapi_module.Error):
-            msg = str(e).lower()
-            for pattern in self._disconnect_messages:
-                if pattern in msg:
-                    return True
-
-            # Check numeric error code for known disconnect codes
-            error_code = self._extract_error_code(e)
-            if error_code is not None and error_code in (
-                -21003,  # CAS_ER_COMMUNICATION
-                -21005,  # CAS_ER_COMMUNICATION (alternate)
-                -10005,  # ER_NET_CANT_CONNECT
-                -10007,  # ER_NET_SERVER_COMM_ERROR
-            ):
-                return True
+        if self.classify_error(e) is ErrorCategory.DISCONNECT:
+            if self._ping_window is not None:
+                self._ping_window.mark_suspect()
+            return True
         return False
 
+    def classify_error(self, e: BaseException) -> Optional[ErrorCategory]:
+        """Return the :class:`~sqlalchemy_cubrid.errors.ErrorCategory` of *e*.
+
+        Returns ``None`` for errors outside the known categories and for
+        exceptions that do not come from the CUBRID driver.  SQLAlchemy
+        ``DBAPIError`` wrappers are unwrapped first, so the result can feed
+        retry logic and metrics directly.
+        """
+        if isinstance(e, sa_exc.DBAPIError):
+            if e.connection_invalidated:
+                return ErrorCategory.DISCONNECT
+            if e.orig is None:
+                return None
+            e = e.orig
+        error_cls = self._dbapi_error_class()
+        if error_cls is None or not isinstance(e, error_cls):
+            return None
+        return classify_error(e)
+
+    def _dbapi_error_class(self) -> Optional[type[BaseException]]:
+        """Return the driver's ``Error`` class without re-importing per call."""
+        dbapi_module = getattr(self, "dbapi", None)
+        if dbapi_module is not None and hasattr(dbapi_module, "Error"):
+            return cast("type[BaseException]", dbapi_module.Error)
+        return _imported_dbapi_error_class(type(self))
+
     @staticmethod
     def _extract_error_code(exception: Exception) -> Optional[int]:
         """Extract a numeric error code from a CUBRID DBAPI exception.
 
-        CUBRIDdb stores the error code in ``exception.args[0]``.
-        Returns ``None`` if no numeric code can be extracted.
+        CUBRIDdb stores the error code in ``exception.args[0]``; pycubrid
+        exposes it as ``errno``/``code``.  Returns ``None`` if no numeric
+        code can be extracted.
         """
-        if exception.args:
-            first_arg = exception.args[0]
-            if isinstance(first_arg, int):
-                return first_arg
-            # Some errors embed the code at the start: "-21003 ..."
-            if isinstance(first_arg, str):
-                parts = first_arg.split(None, 1)
-                if parts:
-                    try:
-                        return int(parts[0])
-                    except (ValueError, IndexError):
-                        pass
-        return None
+        return error_code(exception)
+
+    def _recently_alive(self, dbapi_connection: Any) -> bool:
+        """Return True if the ping for *dbapi_connection* can be skipped."""
+        return self._ping_window is not None and self._ping_window.is_fresh(dbapi_connection)
+
+    def _record_ping(self, dbapi_connection: Any, alive: bool) -> bool:
+        if self._ping_window is not None:
+            if alive:
+                self._ping_window.touch(dbapi_connection)
+            else:
+                self._ping_window.forget(dbapi_connection)
+        return alive
 
     def do_ping(self, dbapi_connection: DBAPIConnection) -> bool:
         """Ping the server to check connection liveness.
 
-        Used by SQLAlchemy's ``pool_pre_ping`` feature.  The CUBRID
-        Python driver exposes a ``ping()`` method on the connection
-        that delegates to the C-level CCI ping.
+        Used by SQLAlchemy's ``pool_pre_ping`` feature.  The round trip
+        itself is done by :meth:`_ping`.  With ``cubrid_ping_window`` set,
+        connections that succeeded within the window are reported alive
+        without a round trip.  Each outcome (``"skipped"``, ``"ok"``,
+        ``"failed"`` or ``"error"``) and its duration are reported to
+        ``_ping_observer`` when one is installed (see
+        :func:`sqlalchemy_cubrid.metrics.instrument_engine`).
+        """
+        observer = self._ping_observer
+        if self._recently_alive(dbapi_connection):
+            if observer is not None:
+                observer("skipped", 0.0)
+            return True
+        if observer is None:
+            return self._record_ping(dbapi_connection, self._ping(dbapi_connection))
+        start = time.perf_counter()
+        try:
+            alive = self._ping(dbapi_connection)
+        except Exception:
+            observer("error", time.perf_counter() - start)
+            raise
+        observer("ok" if alive else "failed", time.perf_counter() - start)
+        return self._record_ping(dbapi_connection, alive)
+
+    def _ping(self, dbapi_connection: Any) -> bool:
+        """Do one liveness round trip; driver dialects override this.
+
+        The CUBRID Python driver exposes a ``ping()`` method on the
+        connection that delegates to the C-level CCI ping and raises on
+        failure.
         """
         dbapi_connection.ping()
         return True
 
+    def _collection_param_types(self) -> dict[str, Callable[[Any], Any]]:
+        """Map ``SET`` / ``MULTISET`` / ``SEQUENCE`` to the driver's parameter types.
+
+        Collection columns bind values through these (see
+        ``types._CollectionType``); a missing entry binds a plain ``list``.
+        The CUBRID Python driver has no typed collection parameters.
+        """
+        return {}
+
 
 dialect = CubridDialect
@@ -0,0 +1,176 @@
+# sqlalchemy_cubrid/errors.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Classification of CUBRID driver errors.
+
+Maps CUBRID server, CAS and CCI error codes to a small set of categories
+that retry logic and metrics care about.  Codes are looked up in a
+precomputed table first; the exception message is only scanned (with a
+single compiled pattern) when no code is recognised, which keeps the
+classifier cheap during error storms such as a broker restart.
+
+Usage::
+
+    from sqlalchemy_cubrid.errors import ErrorCategory, classify_error
+
+    try:
+        conn.execute(stmt)
+    except DBAPIError as exc:
+        if classify_error(exc) is ErrorCategory.DEADLOCK:
+            ...
+"""
+
+from __future__ import annotations
+
+import enum
+import re
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import exc as sa_exc
+
+__all__ = (
+    "ErrorCategory",
+    "ERROR_CODE_CATEGORIES",
+    "classify_error",
+    "error_code",
+)
+
+
+class ErrorCategory(str, enum.Enum):
+    """Categories of CUBRID errors with distinct handling needs."""
+
+    DISCONNECT = "disconnect"
+    LOCK_TIMEOUT = "lock_timeout"
+    DEADLOCK = "deadlock"
+    UNIQUE_VIOLATION = "unique_violation"
+    BROKER_BUSY = "broker_busy"
+
+
+# https://github.com/CUBRID/cubrid/blob/develop/src/base/error_code.h
+ERROR_CODE_CATEGORIES: Mapping[int, ErrorCategory] = MappingProxyType(
+    {
+        -21003: ErrorCategory.DISCONNECT,  # CAS_ER_COMMUNICATION
+        -21005: ErrorCategory.DISCONNECT,  # CAS_ER_COMMUNICATION (alternate)
+        -10005: ErrorCategory.DISCONNECT,  # ER_NET_CANT_CONNECT
+        -10007: ErrorCategory.DISCONNECT,  # ER_NET_SERVER_COMM_ERROR
+        -671: ErrorCategory.DISCONNECT,  # ER_CSS_RECV_OR_SEND
+        -111: ErrorCategory.DISCONNECT,  # ER_TM_SERVER_DOWN_UNILATERALLY_ABORTED
+        -72: ErrorCategory.DEADLOCK,  # ER_LK_UNILATERALLY_ABORTED (deadlock victim)
+        -966: ErrorCategory.DEADLOCK,  # ER_LK_DEADLOCK_CYCLE_DETECTED
+        -73: ErrorCategory.LOCK_TIMEOUT,  # ER_LK_OBJECT_TIMEOUT_SIMPLE_MSG
+        -74: ErrorCategory.LOCK_TIMEOUT,  # ER_LK_OBJECT_TIMEOUT_CLASS_MSG
+        -75: ErrorCategory.LOCK_TIMEOUT,  # ER_LK_OBJECT_TIMEOUT_CLASSOF_MSG
+        -76: ErrorCategory.LOCK_TIMEOUT,  # ER_LK_PAGE_TIMEOUT
+        -670: ErrorCategory.UNIQUE_VIOLATION,  # ER_BTREE_UNIQUE_FAILED
+        -886: ErrorCategory.UNIQUE_VIOLATION,  # ER_UNIQUE_VIOLATION_WITHKEY
+    }
+)
+
+# Message fragments used when an error carries no known code.  CUBRIDdb
+# has no OperationalError class and often reports only text, and the
+# broker reports "busy" conditions without a stable code across versions.
+_MESSAGE_PATTERNS: Mapping[ErrorCategory, tuple[str, ...]] = MappingProxyType(
+    {
+        ErrorCategory.DISCONNECT: (
+            "connection is closed",
+            "closed connection",
+            "lost connection",
+            "server has gone away",
+            "connection reset",
+            "broken pipe",
+            "cannot communicate with the broker",
+            "received invalid packet",
+            "broker is not available",
+            "communication error",
+            "connection timed out",
+            "connection refused",
+            "connection was killed",
+            "failed to connect",
+        ),
+        ErrorCategory.DEADLOCK: (
+            "deadlock",
+            "unilaterally aborted",
+        ),
+        ErrorCategory.LOCK_TIMEOUT: (
+            "timed out waiting on",
+            "lock timeout",
+        ),
+        ErrorCategory.UNIQUE_VIOLATION: (
+            "unique constraint violation",
+            "unique key violation",
+        ),
+        ErrorCategory.BROKER_BUSY: (
+            "broker is busy",
+            "job queue is full",
+            "max client exceeded",
+            "too many connections",
+        ),
+    }
+)
+
+DISCONNECT_MESSAGES = _MESSAGE_PATTERNS[ErrorCategory.DISCONNECT]
+
+# One pattern per category, searched in the order above so that a message
+# naming both a disconnect and e.g. an aborted transaction is a disconnect.
+_RE_MESSAGES: tuple[tuple[ErrorCategory, re.Pattern[str]], ...] = tuple(
+    (category, re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE))
+    for category, patterns in _MESSAGE_PATTERNS.items()
+)
+
+
+def error_code(exception: BaseException) -> Optional[int]:
+    """Extract a numeric CUBRID error code from a driver exception.
+
+    pycubrid's typed exceptions carry the server code in ``errno`` and the
+    CAS/driver code in ``code``; CUBRIDdb stores it in ``args[0]``, either
+    as an int or at the start of the message (``"-21003 ..."``).  Returns
+    ``None`` if no numeric code can be extracted.
+    """
+    for attr in ("errno", "code"):
+        value = getattr(exception, attr, None)
+        if type(value) is int and value != 0:
+            return value
+    if exception.args:
+        first_arg = exception.args[0]
+        if isinstance(first_arg, int):
+            return first_arg
+        if isinstance(first_arg, str):
+            parts = first_arg.split(None, 1)
+            if parts:
+                try:
+                    return int(parts[0])
+                except ValueError:
+                    pass
+    return None
+
+
+def classify_error(exception: BaseException) -> Optional[ErrorCategory]:
+    """Return the :class:`ErrorCategory` of *exception*, or ``None``.
+
+    SQLAlchemy ``DBAPIError`` wrappers are unwrapped to the driver
+    exception; a wrapper whose connection was invalidated is always a
+    :attr:`ErrorCategory.DISCONNECT`.  No check is made that the
+    exception comes from a CUBRID driver — use
+    :meth:`CubridDialect.classify_error` for that.
+    """
+    if isinstance(exception, sa_exc.DBAPIError):
+        if exception.connection_invalidated:
+            return ErrorCategory.DISCONNECT
+        if exception.orig is None:
+            return None
+        exception = exception.orig
+    code = error_code(exception)
+    if code is not None:
+        category = ERROR_CODE_CATEGORIES.get(code)
+        if category is not None:
+            return category
+    message = str(exception)
+    for category, pattern in _RE_MESSAGES:
+        if pattern.search(message):
+            return category
+    return None
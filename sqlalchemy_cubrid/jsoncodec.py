@@ -0,0 +1,231 @@
+# sqlalchemy_cubrid/jsoncodec.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Pluggable JSON codecs for the CUBRID :class:`~sqlalchemy_cubrid.types.JSON` type.
+
+Select a codec with the ``cubrid_json_codec`` engine option; ``orjson``
+and ``msgspec`` are C-accelerated and are optional dependencies
+(``pip install sqlalchemy-cubrid[orjson]``)::
+
+    engine = create_engine(url, cubrid_json_codec="orjson")
+
+With a codec, JSON columns are encoded and decoded by one processor per
+column that calls the codec directly.  Values the driver returns as
+``bytes`` are handed to the decoder as they are, without decoding them
+to ``str`` first.
+
+``cubrid_json_lazy=True`` returns JSON values as :class:`LazyJSON`
+wrappers that decode on first access, so rows whose JSON is never read
+— or is forwarded as is through :attr:`LazyJSON.raw` — never pay for
+decoding::
+
+    engine = create_engine(url, cubrid_json_codec="orjson", cubrid_json_lazy=True)
+    with engine.connect() as conn:
+        for row in conn.execute(select(events.c.id, events.c.payload)):
+            if row.payload["type"] == "signup":  # decoded here
+                ...
+            body = row.payload.raw  # the JSON text from the server
+"""
+
+from __future__ import annotations
+
+import copy
+import importlib
+import json
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+__all__ = (
+    "JSON_CODECS",
+    "JsonCodec",
+    "LazyJSON",
+    "get_json_codec",
+)
+
+#: Codec names accepted by ``cubrid_json_codec``.
+JSON_CODECS: Tuple[str, ...] = ("stdlib", "orjson", "msgspec")
+
+
+class JsonCodec:
+    """A JSON encoder / decoder pair.
+
+    ``dumps`` returns ``str`` (the driver renders ``bytes`` as a binary
+    literal); ``loads`` accepts ``str`` or ``bytes``.
+    """
+
+    __slots__ = ("name", "dumps", "loads")
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], str],
+        loads: Callable[[Union[str, bytes]], Any],
+    ) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _import(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as exc:
+        raise ImportError(
+            f"cubrid_json_codec={name!r} requires the {name!r} package: "
+            f"pip install sqlalchemy-cubrid[{name}]"
+        ) from exc
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("stdlib", json.dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = _import("orjson")
+    encode = orjson.dumps
+
+    def dumps(value: Any) -> str:
+        return encode(value).decode("utf-8")  # type: ignore[no-any-return]
+
+    return JsonCodec("orjson", dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    msgspec = _import("msgspec")
+    encode = msgspec.json.Encoder().encode
+
+    def dumps(value: Any) -> str:
+        return encode(value).decode("utf-8")  # type: ignore[no-any-return]
+
+    return JsonCodec("msgspec", dumps, msgspec.json.Decoder().decode)
+
+
+_FACTORIES: Dict[str, Callable[[], JsonCodec]] = {
+    "stdlib": _stdlib_codec,
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+}
+
+
+def get_json_codec(
+    name: Optional[str] = None,
+    *,
+    serializer: Optional[Callable[[Any], str]] = None,
+    deserializer: Optional[Callable[[Any], Any]] = None,
+) -> JsonCodec:
+    """Return the codec *name*, or one built from the given callables.
+
+    *serializer* / *deserializer* are the dialect's ``json_serializer`` /
+    ``json_deserializer``; they cannot be combined with *name*, and fall
+    back to :mod:`json` individually.
+
+    :raises ValueError: for an unknown name or a name combined with callables.
+    :raises ImportError: if the codec's package is not installed.
+    """
+    if name is None:
+        return JsonCodec(
+            "custom" if serializer or deserializer else "stdlib",
+            serializer or json.dumps,
+            deserializer or json.loads,
+        )
+    if serializer is not None or deserializer is not None:
+        raise ValueError(
+            "cubrid_json_codec cannot be combined with json_serializer / json_deserializer"
+        )
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"unknown cubrid_json_codec {name!r}; expected one of {JSON_CODECS}")
+    return factory()
+
+
+_PENDING: Any = object()
+
+
+class LazyJSON:
+    """A JSON value decoded on first access.
+
+    Item access, iteration, ``len()``, ``in``, ``==`` and attribute access
+    (``.get()``, ``.items()``, ...) go to the decoded value, which is kept;
+    :attr:`value` returns it.  :attr:`raw` is the text the driver returned.
+    Binding an undecoded ``LazyJSON`` to a JSON column sends :attr:`raw`
+    without re-encoding.
+    """
+
+    __slots__ = ("raw", "_loads", "_value")
+
+    def __init__(self, raw: Union[str, bytes], loads: Callable[[Union[str, bytes]], Any]) -> None:
+        self.raw = raw
+        self._loads = loads
+        self._value = _PENDING
+
+    @property
+    def decoded(self) -> bool:
+        return self._value is not _PENDING
+
+    @property
+    def value(self) -> Any:
+        if self._value is _PENDING:
+            self._value = self._loads(self.raw)
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        # Private and special names are never forwarded: copy and pickle
+        # probe them on instances whose slots are not set yet.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.value
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyJSON):
+            other = other.value
+        return bool(self.value == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> LazyJSON:
+        copied = LazyJSON(self.raw, self._loads)
+        copied._value = self._value
+        return copied
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> LazyJSON:
+        copied = LazyJSON(self.raw, self._loads)
+        if self._value is not _PENDING:
+            copied._value = copy.deepcopy(self._value, memo)
+        return copied
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The codec's loads may not be picklable (msgspec decoders, lambdas),
+        # so the decoded value is pickled instead.
+        return (_unpickle_lazy_json, (self.raw, self.value))
+
+    def __repr__(self) -> str:
+        if self._value is _PENDING:
+            return f"LazyJSON({self.raw!r})"
+        return f"LazyJSON(value={self._value!r})"
+
+
+def _unpickle_lazy_json(raw: Union[str, bytes], value: Any) -> LazyJSON:
+    restored = LazyJSON(raw, json.loads)
+    restored._value = value
+    return restored
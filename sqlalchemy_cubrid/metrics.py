@@ -0,0 +1,384 @@
+# sqlalchemy_cubrid/metrics.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""In-process connection pool metrics for CUBRID engines.
+
+:func:`instrument_engine` hooks an engine's pool and dialect events and
+records, per broker (``host:port``):
+
+- checkout latency, including ``pool_pre_ping`` and queue waits, and
+  checkout timeouts;
+- pre-ping cost and outcome (``ok``, ``failed``, ``error``, or
+  ``skipped`` by ``cubrid_ping_window``);
+- connection age when a DBAPI connection is closed;
+- invalidations by cause (``explicit``, ``soft`` or the
+  :class:`~sqlalchemy_cubrid.errors.ErrorCategory` of the error);
+- statement errors by category and ``is_disconnect`` hits;
+- live pool size, checked-out and overflow gauges.
+
+Counters and histograms live in memory; export them with
+:meth:`CubridMetrics.snapshot` (a plain dict) or
+:meth:`CubridMetrics.to_prometheus` (text exposition format).
+
+Usage::
+
+    from sqlalchemy_cubrid.metrics import instrument_engine
+
+    engine = create_engine("cubrid+pycubrid://dba@db1:33000/demodb", pool_pre_ping=True)
+    metrics = instrument_engine(engine)
+    ...
+    print(metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+
+from sqlalchemy_cubrid.errors import classify_error
+
+__all__ = (
+    "AGE_BUCKETS",
+    "CubridMetrics",
+    "Histogram",
+    "LATENCY_BUCKETS",
+    "instrument_engine",
+)
+
+#: Default upper bounds (seconds) for checkout and ping latency.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+#: Default upper bounds (seconds) for connection age at close.
+AGE_BUCKETS: Tuple[float, ...] = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0, 86400.0)
+
+# Second label of labelled series; every series is also labelled by broker.
+_SUBLABELS: Dict[str, str] = {
+    "pings_total": "outcome",
+    "invalidations_total": "cause",
+    "errors_total": "category",
+}
+
+_HELP: Dict[str, str] = {
+    "connections_opened_total": "DBAPI connections opened by the pool.",
+    "connections_closed_total": "DBAPI connections closed by the pool.",
+    "checkout_timeouts_total": "Checkouts that failed with a pool timeout.",
+    "pings_total": "Pre-ping calls by outcome.",
+    "invalidations_total": "Pooled connections invalidated, by cause.",
+    "errors_total": "DBAPI errors raised by statements, by category.",
+    "disconnects_total": "Errors the dialect classified as disconnects.",
+    "checkout_seconds": "Time to check a connection out of the pool.",
+    "ping_seconds": "Time spent in pre-ping round trips.",
+    "connection_age_seconds": "Age of DBAPI connections when closed.",
+    "pool_size": "Configured pool size.",
+    "pool_checked_out": "Connections currently checked out.",
+    "pool_checked_in": "Idle connections in the pool.",
+    "pool_overflow": "Connections open beyond pool_size.",
+}
+
+_CONNECTED_AT = "cubrid_metrics_connected_at"
+
+_SeriesKey = Tuple[str, str, Optional[str]]
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus ``le`` semantics."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        # One slot per bucket plus the implicit ``+Inf`` bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return ``(le, cumulative count)`` pairs ending with ``+Inf``."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "buckets": dict(self.cumulative())}
+
+
+class CubridMetrics:
+    """Thread-safe counters and histograms for one or more engines.
+
+    One instance may instrument several engines; series are broken down
+    by the broker address of each engine's URL.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        age_buckets: Sequence[float] = AGE_BUCKETS,
+    ) -> None:
+        self._bucket_sets = {
+            "checkout_seconds": tuple(latency_buckets),
+            "ping_seconds": tuple(latency_buckets),
+            "connection_age_seconds": tuple(age_buckets),
+        }
+        self._counters: Dict[_SeriesKey, float] = {}
+        self._histograms: Dict[_SeriesKey, Histogram] = {}
+        self._engines: list[tuple[str, weakref.ReferenceType[Any]]] = []
+        self._lock = threading.Lock()
+
+    # ----- recording -----
+
+    def inc(self, name: str, broker: str, label: Optional[str] = None, amount: float = 1) -> None:
+        key = (name, broker, label)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, broker: str, value: float) -> None:
+        key = (name, broker, None)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self._bucket_sets[name])
+            histogram.observe(value)
+
+    def _observe_ping(self, broker: str, outcome: str, seconds: float) -> None:
+        self.inc("pings_total", broker, outcome)
+        if outcome != "skipped":
+            self.observe("ping_seconds", broker, seconds)
+
+    # ----- export -----
+
+    def _gauges(self) -> Dict[str, Dict[str, int]]:
+        gauges: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            engines = [(broker, ref()) for broker, ref in self._engines]
+        for broker, engine in engines:
+            if engine is None:
+                continue
+            pool = engine.pool
+            for name, method in (
+                ("pool_size", "size"),
+                ("pool_checked_out", "checkedout"),
+                ("pool_checked_in", "checkedin"),
+                ("pool_overflow", "overflow"),
+            ):
+                getter = getattr(pool, method, None)
+                if getter is None:
+                    continue
+                per_broker = gauges.setdefault(broker, {})
+                # QueuePool reports negative overflow while below pool_size.
+                per_broker[name] = per_broker.get(name, 0) + max(int(getter()), 0)
+        return gauges
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all series as ``{"brokers": {broker: {metric: value}}}``.
+
+        Labelled counters map their second label to a value, histograms
+        are dicts with ``count``, ``sum`` and cumulative ``buckets``.
+        """
+        brokers: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for (name, broker, label), value in sorted(self._counters.items(), key=_sort_key):
+                metrics = brokers.setdefault(broker, {})
+                if label is None:
+                    metrics[name] = value
+                else:
+                    metrics.setdefault(name, {})[label] = value
+            for (name, broker, _), histogram in self._histograms.items():
+                brokers.setdefault(broker, {})[name] = histogram.snapshot()
+        for broker, gauges in self._gauges().items():
+            brokers.setdefault(broker, {}).update(gauges)
+        return {"brokers": brokers}
+
+    def to_prometheus(self, prefix: str = "sqlalchemy_cubrid") -> str:
+        """Render all series in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            counters = sorted(self._counters.items(), key=_sort_key)
+            histograms = [
+                (key, histogram.cumulative(), histogram.count, histogram.sum)
+                for key, histogram in sorted(self._histograms.items(), key=_sort_key)
+            ]
+        seen: set[str] = set()
+
+        def header(name: str, kind: str) -> None:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {prefix}_{name} {_HELP[name]}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        for (name, broker, label), value in counters:
+            header(name, "counter")
+            labels = _labels(broker, _SUBLABELS.get(name), label)
+            lines.append(f"{prefix}_{name}{{{labels}}} {_number(value)}")
+        for (name, broker, _), buckets, count, total in histograms:
+            header(name, "histogram")
+            labels = _labels(broker)
+            for le, cumulative in buckets:
+                lines.append(f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{prefix}_{name}_sum{{{labels}}} {_number(total)}")
+            lines.append(f"{prefix}_{name}_count{{{labels}}} {count}")
+        for broker, gauges in sorted(self._gauges().items()):
+            for name, value in gauges.items():
+                header(name, "gauge")
+                lines.append(f"{prefix}_{name}{{{_labels(broker)}}} {value}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """Clear all counters and histograms; instrumented engines stay hooked."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _sort_key(item: tuple[_SeriesKey, Any]) -> tuple[str, str, str]:
+    name, broker, label = item[0]
+    return (name, broker, label or "")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(broker: str, label_name: Optional[str] = None, label: Optional[str] = None) -> str:
+    labels = f'broker="{_escape(broker)}"'
+    if label_name is not None and label is not None:
+        labels += f',{label_name}="{_escape(label)}"'
+    return labels
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_instrumented: "weakref.WeakKeyDictionary[Any, CubridMetrics]" = weakref.WeakKeyDictionary()
+
+
+def _broker(engine: Any) -> str:
+    url = engine.url
+    return f"{url.host or 'localhost'}:{url.port or 33000}"
+
+
+def _cause(dialect: Any, exception: Optional[BaseException]) -> str:
+    if exception is None:
+        return "explicit"
+    classify = getattr(dialect, "classify_error", classify_error)
+    category = classify(exception)
+    return "other" if category is None else str(category.value)
+
+
+def instrument_engine(engine: Any, metrics: Optional[CubridMetrics] = None) -> CubridMetrics:
+    """Attach *metrics* (a new :class:`CubridMetrics` by default) to *engine*.
+
+    *engine* may be an :class:`~sqlalchemy.engine.Engine` or an
+    :class:`~sqlalchemy.ext.asyncio.AsyncEngine`.  Pool listeners are
+    registered on the engine, so they survive ``engine.dispose()``.
+    Pre-ping timing requires a CUBRID dialect; other dialects still get
+    pool and error metrics.
+
+    :raises ValueError: if *engine* is already instrumented.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    if engine in _instrumented:
+        raise ValueError("engine is already instrumented")
+    if metrics is None:
+        metrics = CubridMetrics()
+    broker = _broker(engine)
+    dialect = engine.dialect
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, record: Any) -> None:
+        record.info[_CONNECTED_AT] = time.monotonic()
+        metrics.inc("connections_opened_total", broker)
+
+    @event.listens_for(engine, "close")
+    def _on_close(dbapi_connection: Any, record: Any) -> None:
+        metrics.inc("connections_closed_total", broker)
+        connected_at = record.info.pop(_CONNECTED_AT, None)
+        if connected_at is not None:
+            metrics.observe("connection_age_seconds", broker, time.monotonic() - connected_at)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection: Any, record: Any, exception: Any) -> None:
+        metrics.inc("invalidations_total", broker, _cause(dialect, exception))
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection: Any, record: Any, exception: Any) -> None:
+        metrics.inc("invalidations_total", broker, "soft")
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(context: Any) -> None:
+        if context.is_pre_ping:
+            return  # already counted as a failed ping
+        if not isinstance(context.sqlalchemy_exception, sa_exc.DBAPIError):
+            return  # not a driver error, e.g. a failing bind processor
+        metrics.inc("errors_total", broker, _cause(dialect, context.original_exception))
+        if context.is_disconnect:
+            metrics.inc("disconnects_total", broker)
+
+    # Checkout latency has no pool event marking its start, so time the
+    # pool's connect().  The pool is shared with every OptionEngine made by
+    # engine.execution_options() and is the single way into it; dispose()
+    # replaces it, so the new pool is wrapped from engine_disposed.
+    def _time_checkouts(pool: Any) -> None:
+        connect = pool.connect
+
+        @functools.wraps(connect)
+        def _timed_connect() -> Any:
+            start = time.perf_counter()
+            try:
+                connection = connect()
+            except sa_exc.TimeoutError:
+                metrics.inc("checkout_timeouts_total", broker)
+                raise
+            metrics.observe("checkout_seconds", broker, time.perf_counter() - start)
+            return connection
+
+        pool.connect = _timed_connect
+
+    @event.listens_for(engine, "engine_disposed")
+    def _on_dispose(disposed: Any) -> None:
+        _time_checkouts(disposed.pool)
+
+    _time_checkouts(engine.pool)
+    _instrumented[engine] = metrics
+
+    if hasattr(dialect, "_ping_observer"):
+        dialect._ping_observer = functools.partial(metrics._observe_ping, broker)
+
+    with metrics._lock:
+        metrics._engines.append((broker, weakref.ref(engine)))
+    return metrics
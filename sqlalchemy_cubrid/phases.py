@@ -0,0 +1,551 @@
+# sqlalchemy_cubrid/phases.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Per-phase latency breakdown of statement executions.
+
+:func:`instrument_phases` times each execution of an engine in five
+phases:
+
+``compile``
+    From ``Connection.execute()`` to a compiled statement (a compiled-cache
+    lookup on a hit, the full compilation on a miss).
+``bind``
+    Building the execution context: parameter processing and bind
+    processors.
+``execute``
+    The driver's ``cursor.execute()`` / ``executemany()`` calls.
+``fetch``
+    The driver's ``fetchone()`` / ``fetchmany()`` / ``fetchall()`` calls.
+``hydrate``
+    Result processors turning fetched values into Python objects.
+
+A statement's span ends when its cursor is closed (the result is
+exhausted or closed) and its last rows are processed; time the
+application spends between fetches is part of the span but of no phase.
+A statement that returned rows is recorded when its thread runs the
+next statement, or on :meth:`PhaseTracer.flush`.  Each phase is aggregated
+into a latency histogram per statement fingerprint
+(:func:`~sqlalchemy_cubrid.slowlog.fingerprint_sql`), and, with an
+*exporter*, every traced statement is passed on as OpenTelemetry spans:
+one ``CLIENT`` span for the statement with one child span per phase.
+:class:`OtlpJsonExporter` writes them as OTLP/JSON lines, the format of
+the OpenTelemetry Collector's file exporter and ``otlpjsonfile``
+receiver.
+
+Usage::
+
+    from sqlalchemy_cubrid.phases import OtlpJsonExporter, instrument_phases
+
+    tracer = instrument_phases(engine, exporter=OtlpJsonExporter("spans.jsonl"))
+    ...
+    for entry in tracer.top(5):
+        print(entry["sql"], {k: v["p95_s"] for k, v in entry["phases"].items()})
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
+
+from sqlalchemy import event
+
+from sqlalchemy_cubrid.metrics import LATENCY_BUCKETS, Histogram
+from sqlalchemy_cubrid.slowlog import _quantile, fingerprint_sql
+from sqlalchemy_cubrid.trace import JsonlTraceSink
+
+__all__ = (
+    "PHASES",
+    "OtlpJsonExporter",
+    "PhaseTracer",
+    "instrument_phases",
+)
+
+#: Phase names, in execution order.
+PHASES = ("compile", "bind", "execute", "fetch", "hydrate")
+
+_OTHER = "<other>"
+
+# OTLP enum values.
+_SPAN_KIND_INTERNAL = 1
+_SPAN_KIND_CLIENT = 3
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+SpanExporter = Callable[[List[Dict[str, Any]]], Any]
+
+
+class _Span:
+    """Timings of one execution, collected by its :class:`_PhaseCursor`."""
+
+    __slots__ = (
+        "sql",
+        "started",
+        "wall_ns",
+        "phases",
+        "rows",
+        "error",
+        "last",
+        "ended",
+        "finished",
+    )
+
+    def __init__(self, sql: str, started: float) -> None:
+        self.sql = sql
+        self.started = started
+        self.last = started
+        self.ended: Optional[float] = None
+        self.wall_ns = time.time_ns() - int((time.perf_counter() - started) * 1e9)
+        # phase -> [first start, total seconds, calls]
+        self.phases: Dict[str, List[float]] = {}
+        self.rows = 0
+        self.error: Optional[str] = None
+        self.finished = False
+
+    def add(self, phase: str, started: float, ended: float) -> None:
+        if ended > self.last:
+            self.last = ended
+        entry = self.phases.get(phase)
+        if entry is None:
+            self.phases[phase] = [started, ended - started, 1]
+        else:
+            entry[1] += ended - started
+            entry[2] += 1
+
+
+class _PhaseCursor:
+    """DBAPI cursor proxy timing the driver calls of one execution."""
+
+    __slots__ = ("_cursor", "_span", "_tracer")
+
+    def __init__(self, cursor: Any, span: _Span, tracer: PhaseTracer) -> None:
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_span", span)
+        object.__setattr__(self, "_tracer", tracer)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._cursor, name, value)
+
+    def _call(self, phase: str, method: str, *args: Any) -> Any:
+        span = self._span
+        started = time.perf_counter()
+        try:
+            return getattr(self._cursor, method)(*args)
+        except Exception as error:
+            span.error = type(error).__name__
+            raise
+        finally:
+            span.add(phase, started, time.perf_counter())
+
+    def execute(self, *args: Any) -> Any:
+        return self._call("execute", "execute", *args)
+
+    def executemany(self, *args: Any) -> Any:
+        return self._call("execute", "executemany", *args)
+
+    def _fetched(self, rows: Any, many: bool) -> Any:
+        # Result processors run on these rows before the next fetch.
+        local = self._tracer._local
+        if getattr(local, "span", None) is not self._span:
+            self._tracer._settle()
+            local.span = self._span
+        if many:
+            self._span.rows += len(rows)
+        elif rows is not None:
+            self._span.rows += 1
+        return rows
+
+    def fetchone(self) -> Any:
+        return self._fetched(self._call("fetch", "fetchone"), False)
+
+    def fetchmany(self, *args: Any) -> Any:
+        return self._fetched(self._call("fetch", "fetchmany", *args), True)
+
+    def fetchall(self) -> Any:
+        return self._fetched(self._call("fetch", "fetchall"), True)
+
+    def close(self) -> None:
+        try:
+            self._cursor.close()
+        finally:
+            self._tracer._closed(self._span)
+
+
+class _FingerprintStats:
+    __slots__ = ("sql", "count", "errors", "total", "latency", "maxima")
+
+    def __init__(self, sql: str, latency_buckets: Sequence[float]) -> None:
+        self.sql = sql
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.latency = {phase: Histogram(latency_buckets) for phase in PHASES + ("total",)}
+        self.maxima = dict.fromkeys(PHASES + ("total",), 0.0)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        self.latency[phase].observe(seconds)
+        if seconds > self.maxima[phase]:
+            self.maxima[phase] = seconds
+
+    def snapshot(self, fingerprint: str) -> Dict[str, Any]:
+        phases = {}
+        for phase in PHASES + ("total",):
+            histogram, maximum = self.latency[phase], self.maxima[phase]
+            phases[phase] = {
+                "count": histogram.count,
+                "total_s": histogram.sum,
+                "mean_s": histogram.sum / histogram.count if histogram.count else 0.0,
+                "max_s": maximum,
+                "p50_s": _quantile(histogram, maximum, 0.5),
+                "p95_s": _quantile(histogram, maximum, 0.95),
+                "p99_s": _quantile(histogram, maximum, 0.99),
+            }
+        return {
+            "fingerprint": fingerprint,
+            "sql": self.sql,
+            "count": self.count,
+            "errors": self.errors,
+            "total_s": self.total,
+            "phases": phases,
+        }
+
+
+class PhaseTracer:
+    """Per-phase timings of an engine's executions.
+
+    :param exporter: called with the list of OTLP/JSON span dicts of each
+        traced statement (the statement span first); ``None`` only
+        aggregates.
+    :param sample_rate: fraction of executions traced.
+    :param max_fingerprints: statement shapes tracked individually; later
+        ones are folded into one ``<other>`` entry.
+
+    Installed with :func:`instrument_phases`; the CUBRID execution
+    context calls the underscore hooks.
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        *,
+        sample_rate: float = 1.0,
+        seed: Optional[int] = None,
+        max_fingerprints: int = 2000,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate!r}")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.max_fingerprints = max_fingerprints
+        self._latency_buckets = tuple(latency_buckets)
+        self._random = random.Random(seed)  # nosec B311 — sampling, not security
+        self._stats: Dict[str, _FingerprintStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Closed spans whose last rows may still be being processed.
+        self._pending: Set[_Span] = set()
+
+    # ----- execution context hooks -----
+
+    def _before_execute(self) -> None:
+        self._local.started = time.perf_counter()
+
+    def _compiled(self) -> None:
+        self._local.compiled = time.perf_counter()
+
+    def _cursor(self, context: Any, cursor: Any) -> Any:
+        self._settle()
+        local = self._local
+        started: Optional[float] = getattr(local, "started", None)
+        compiled: Optional[float] = getattr(local, "compiled", None)
+        local.started = local.compiled = None
+        sql = getattr(context, "unicode_statement", None)
+        if sql is None or (self.sample_rate < 1.0 and self._random.random() >= self.sample_rate):
+            return cursor
+        now = time.perf_counter()
+        if getattr(context, "compiled", None) is None:
+            # exec_driver_sql(): nothing was compiled.
+            started = None
+        elif started is None:
+            # Executed without the before_execute event (dialect
+            # initialization); the compile phase is unknown.
+            started = compiled
+        span = _Span(sql, now if started is None else started)
+        if started is not None and started != compiled:
+            span.add("compile", started, now if compiled is None else compiled)
+        if compiled is not None:
+            # Finished by _bound() once the context is fully built.
+            span.phases["bind"] = [compiled, now, 1]
+        return _PhaseCursor(cursor, span, self)
+
+    def _bound(self, context: Any) -> None:
+        cursor = getattr(context, "cursor", None)
+        if isinstance(cursor, _PhaseCursor):
+            entry = cursor._span.phases.get("bind")
+            if entry is not None:
+                entry[1] = time.perf_counter() - entry[0]
+
+    def _result_processor(self, processor: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        local = self._local
+
+        def process(value: Any) -> Any:
+            span: Optional[_Span] = getattr(local, "span", None)
+            if span is None:
+                return processor(value)
+            started = time.perf_counter()
+            try:
+                return processor(value)
+            finally:
+                span.add("hydrate", started, time.perf_counter())
+
+        return process
+
+    def _closed(self, span: _Span) -> None:
+        if span.ended is not None:
+            return
+        span.ended = time.perf_counter()
+        if "fetch" not in span.phases:
+            self._finish(span)
+            return
+        # SQLAlchemy closes the cursor as soon as the last rows are
+        # fetched and only then runs the result processors on them, so
+        # the span is finished when this thread starts another statement
+        # or fetches from another cursor, or on flush().
+        with self._lock:
+            self._pending.add(span)
+        pending: Optional[List[_Span]] = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = self._local.pending = []
+        pending.append(span)
+
+    def _settle(self) -> None:
+        pending: Optional[List[_Span]] = getattr(self._local, "pending", None)
+        if pending:
+            self._local.pending = []
+            for span in pending:
+                self._finish(span)
+
+    def _finish(self, span: _Span) -> None:
+        if getattr(self._local, "span", None) is span:
+            self._local.span = None
+        ended = max(span.ended or 0.0, span.last)
+        fingerprint = fingerprint_sql(span.sql)
+        with self._lock:
+            if span.finished:
+                return
+            span.finished = True
+            self._pending.discard(span)
+            stats = self._stats.get(fingerprint)
+            if stats is None:
+                key = fingerprint
+                if len(self._stats) >= self.max_fingerprints:
+                    key = _OTHER
+                    stats = self._stats.get(key)
+                if stats is None:
+                    stats = self._stats[key] = _FingerprintStats(
+                        span.sql if key != _OTHER else _OTHER, self._latency_buckets
+                    )
+            stats.count += 1
+            stats.errors += span.error is not None
+            stats.total += ended - span.started
+            stats.observe("total", ended - span.started)
+            for phase, (_, seconds, _) in span.phases.items():
+                stats.observe(phase, seconds)
+        if self.exporter is not None:
+            self.exporter(self._spans(span, fingerprint, ended))
+
+    # ----- OTLP -----
+
+    def _spans(self, span: _Span, fingerprint: str, ended: float) -> List[Dict[str, Any]]:
+        def nanos(at: float) -> str:
+            return str(span.wall_ns + int((at - span.started) * 1e9))
+
+        trace_id = f"{self._random.getrandbits(128):032x}"
+        span_id = f"{self._random.getrandbits(64):016x}"
+        operation = fingerprint.split(None, 1)[0].upper() if fingerprint.strip() else "SQL"
+        attributes: Dict[str, Any] = {
+            "db.system.name": "cubrid",
+            "db.operation.name": operation,
+            "db.query.text": fingerprint,
+            "db.response.returned_rows": span.rows,
+        }
+        for phase, (_, seconds, _) in span.phases.items():
+            attributes[f"cubrid.phase.{phase}_s"] = seconds
+        status: Dict[str, Any] = {"code": _STATUS_OK}
+        if span.error is not None:
+            status = {"code": _STATUS_ERROR, "message": span.error}
+        spans = [
+            {
+                "traceId": trace_id,
+                "spanId": span_id,
+                "parentSpanId": "",
+                "name": operation,
+                "kind": _SPAN_KIND_CLIENT,
+                "startTimeUnixNano": nanos(span.started),
+                "endTimeUnixNano": nanos(ended),
+                "attributes": _otlp_attributes(attributes),
+                "status": status,
+            }
+        ]
+        # Repeated phases (several fetches) are drawn as one span from the
+        # first call, as long as their summed duration.
+        for phase in PHASES:
+            entry = span.phases.get(phase)
+            if entry is None:
+                continue
+            first, seconds, calls = entry
+            spans.append(
+                {
+                    "traceId": trace_id,
+                    "spanId": f"{self._random.getrandbits(64):016x}",
+                    "parentSpanId": span_id,
+                    "name": f"cubrid.{phase}",
+                    "kind": _SPAN_KIND_INTERNAL,
+                    "startTimeUnixNano": nanos(first),
+                    "endTimeUnixNano": nanos(first + seconds),
+                    "attributes": _otlp_attributes({"cubrid.phase.calls": int(calls)}),
+                    "status": {"code": _STATUS_OK},
+                }
+            )
+        return spans
+
+    # ----- export -----
+
+    def flush(self) -> None:
+        """Finish every closed statement, including those whose rows a
+        thread may still be processing."""
+        with self._lock:
+            pending = list(self._pending)
+        for span in pending:
+            self._finish(span)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-fingerprint phase statistics, highest total time first.
+
+        Closed statements are :meth:`flush`-ed first.
+        """
+        self.flush()
+        with self._lock:
+            entries = [stats.snapshot(key) for key, stats in self._stats.items()]
+        entries.sort(key=lambda entry: entry["total_s"], reverse=True)
+        return entries
+
+    def top(self, n: int = 10, *, phase: str = "total") -> List[Dict[str, Any]]:
+        """Return the *n* fingerprints spending the most time in *phase*."""
+        if phase not in PHASES + ("total",):
+            raise ValueError(f"unknown phase {phase!r}")
+        entries = self.snapshot()
+        entries.sort(key=lambda entry: entry["phases"][phase]["total_s"], reverse=True)
+        return entries[:n]
+
+    def reset(self) -> None:
+        """Clear all statistics; instrumented engines stay hooked."""
+        with self._lock:
+            self._stats.clear()
+            self._pending.clear()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class OtlpJsonExporter(JsonlTraceSink):
+    """Write spans as OTLP/JSON lines to a size-rotated local file.
+
+    Each line is one ``{"resourceSpans": [...]}`` export request holding
+    one statement's spans, readable by the OpenTelemetry Collector's
+    ``otlpjsonfile`` receiver.  *resource* adds resource attributes to
+    the default ``service.name``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        resource: Optional[Mapping[str, Any]] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        super().__init__(path, max_bytes=max_bytes, backup_count=backup_count)
+        self._resource = _otlp_attributes({"service.name": "sqlalchemy-cubrid", **(resource or {})})
+
+    def __call__(self, spans: Any) -> None:
+        super().__call__(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {"attributes": self._resource},
+                        "scopeSpans": [
+                            {"scope": {"name": "sqlalchemy_cubrid.phases"}, "spans": spans}
+                        ],
+                    }
+                ]
+            }
+        )
+
+
+_instrumented_lock = threading.Lock()
+
+
+def instrument_phases(
+    engine: Any,
+    tracer: Optional[PhaseTracer] = None,
+    *,
+    exporter: Optional[SpanExporter] = None,
+    sample_rate: float = 1.0,
+) -> PhaseTracer:
+    """Attach *tracer* (a new :class:`PhaseTracer` by default) to *engine*.
+
+    *engine* may be an :class:`~sqlalchemy.engine.Engine` or an
+    :class:`~sqlalchemy.ext.asyncio.AsyncEngine` using a CUBRID dialect.
+    *exporter* and *sample_rate* configure the default tracer.
+    While the tracer is attached, :func:`sqlalchemy_cubrid.aio.fast_execute`
+    falls back to the regular execution path, so its statements are
+    traced too.
+
+    :raises ValueError: if *engine* is already instrumented or does not
+        use a CUBRID dialect.
+    """
+    from sqlalchemy_cubrid.base import CubridExecutionContext
+
+    engine = getattr(engine, "sync_engine", engine)
+    dialect = engine.dialect
+    if not issubclass(dialect.execution_ctx_cls, CubridExecutionContext):
+        raise ValueError("engine does not use a CUBRID dialect")
+    with _instrumented_lock:
+        if getattr(dialect, "_phase_tracer", None) is not None:
+            raise ValueError("engine is already instrumented")
+        if tracer is None:
+            tracer = PhaseTracer(exporter, sample_rate=sample_rate)
+        dialect._phase_tracer = tracer
+
+    hook = tracer._before_execute
+
+    @event.listens_for(engine, "before_execute")
+    def _before_execute(
+        conn: Any, clauseelement: Any, multiparams: Any, params: Any, execution_options: Any
+    ) -> None:
+        hook()
+
+    return tracer
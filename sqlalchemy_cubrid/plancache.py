@@ -0,0 +1,507 @@
+# sqlalchemy_cubrid/plancache.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Server-side query plan (XASL) cache statistics and reuse checks.
+
+CUBRID caches compiled query plans (XASL) on the server, keyed by the
+statement text.  The ``pycubrid`` driver interpolates parameters into
+the SQL on the client, so plan reuse depends on the server recognizing
+statements that differ only in values; statements whose *shape* varies —
+IN lists of different lengths, values rendered into the SQL by
+``literal_binds`` / ``literal_execute`` /
+:meth:`~sqlalchemy.sql.compiler.SQLCompiler.render_literal_value`,
+string-formatted :func:`~sqlalchemy.sql.expression.text` — each need a
+plan of their own and push other plans out of the cache.
+
+:func:`plan_cache_stats` reads the server's plan cache counters::
+
+    from sqlalchemy_cubrid.plancache import plan_cache_stats
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET @collect_exec_stats = 1")
+        ...  # workload on this connection
+        print(plan_cache_stats(conn))  # {'lookup': 120, 'hit': 118, ..., 'hit_ratio': 0.98}
+
+:func:`instrument_plan_cache` groups the SQL an engine sends by statement
+fingerprint (:func:`~sqlalchemy_cubrid.slowlog.fingerprint_sql`) and
+flags shapes that the server cannot share one plan for.  Entries from
+``cubrid plandump`` can be correlated with those fingerprints to see how
+many server plans each statement really uses::
+
+    report = instrument_plan_cache(engine)
+    ...
+    dump = subprocess.run(["cubrid", "plandump", "demodb"], capture_output=True, text=True)
+    report.correlate(parse_plandump(dump.stdout))
+    for finding in report.findings(stats=plan_cache_stats(statdump_output)):
+        print(finding.kind, finding.fingerprint, finding.suggestion)
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import event, text
+
+from sqlalchemy_cubrid.slowlog import (
+    _LIST_RE,
+    _NUMBER_RE,
+    _POSTCOMPILE_RE,
+    _SPACE_RE,
+    _STRING_RE,
+    fingerprint_sql,
+)
+
+__all__ = (
+    "PlanCacheEntry",
+    "PlanCacheFinding",
+    "PlanCacheReport",
+    "instrument_plan_cache",
+    "parse_plandump",
+    "plan_cache_stats",
+)
+
+_OTHER = "<other>"
+_COUNTER_PREFIX = "num_plan_cache_"
+# ``Num_plan_cache_hit = 118`` in ``cubrid statdump`` output.
+_STATDUMP_RE = re.compile(r"^\s*(?P<name>Num_plan_cache_\w+)\s*[=:]\s*(?P<value>-?\d+)", re.I)
+# plandump keys are lower-case words, except a few upper-case ids; SQL
+# continuation lines (``WHERE t.a = 1``) must not parse as fields.
+_FIELD_RE = re.compile(r"^\s*(?P<key>[a-z][a-z_ ]*?|XASL_ID|SQL_ID|OID)\s*=\s*(?P<value>.*?)\s*$")
+_LIMIT_RE = re.compile(r"\bLIMIT\s+[^\s,()]+(?:\s*,\s*[^\s,()]+)?(\s*OFFSET\s+\S+)?", re.I)
+_TEXT_KEYS = {"sql user text": "sql", "sql_id": "sql_id", "sql hash text": "hash_text"}
+_CACHEABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "REPLACE", "WITH")
+
+_SUGGESTIONS = {
+    "literal_sql": (
+        "values are rendered into the SQL (literal_binds, literal_column(), "
+        "render_literal_value() or string-formatted text()); pass them as bind "
+        "parameters so every execution has the same statement text"
+    ),
+    "literal_execute": (
+        "literal_execute=True parameters are rendered into the statement at "
+        "execution time; use plain bind parameters where CUBRID accepts them"
+    ),
+    "in_list": (
+        "IN lists of different lengths produce one statement text per length; "
+        "pad the list to a few fixed sizes (e.g. powers of two) or load the keys "
+        "into a temporary table and join"
+    ),
+    "limit": (
+        "LIMIT/OFFSET values differ between executions; use a small set of page "
+        "sizes, or keyset pagination (WHERE key > :last ORDER BY key LIMIT :n)"
+    ),
+}
+
+
+def _fingerprint(sql: str) -> str:
+    # The compiled ``IN (__[POSTCOMPILE_x])`` must match the server's
+    # ``IN (1, 2)``, which fingerprints to ``IN (?)``.
+    return fingerprint_sql(_POSTCOMPILE_RE.sub("?", sql))
+
+
+def plan_cache_stats(source: Any) -> Dict[str, Any]:
+    """Return the server's plan cache counters.
+
+    *source* is a :class:`~sqlalchemy.engine.Connection`, whose session
+    counters are read with ``SHOW EXEC STATISTICS ALL`` (they only count
+    after ``SET @collect_exec_stats = 1`` on that connection), or the text
+    output of ``cubrid statdump`` for server-wide counters.
+
+    Keys are the ``Num_plan_cache_*`` counter names without the prefix,
+    lower-cased (``lookup``, ``hit``, ``miss``, ``add``, ``full``,
+    ``delete``, ...), plus ``hit_ratio`` (``None`` before any lookup).
+    """
+    if isinstance(source, str):
+        rows = [
+            (match["name"], match["value"])
+            for match in map(_STATDUMP_RE.match, source.splitlines())
+            if match is not None
+        ]
+    else:
+        result = source.execute(text("SHOW EXEC STATISTICS ALL"))
+        try:
+            rows = [(row[0], row[1]) for row in result.fetchall()]
+        finally:
+            result.close()
+    stats: Dict[str, Any] = {}
+    for name, value in rows:
+        name = str(name).strip().lower()
+        if name.startswith(_COUNTER_PREFIX):
+            stats[name[len(_COUNTER_PREFIX) :]] = int(value)
+    lookups = stats.get("lookup")
+    stats["hit_ratio"] = stats.get("hit", 0) / lookups if lookups else None
+    return stats
+
+
+class PlanCacheEntry:
+    """One XASL cache entry from ``cubrid plandump``.
+
+    ``fields`` holds every ``key = value`` line of the entry, keys
+    lower-cased, for details that vary between server versions.
+    """
+
+    __slots__ = ("sql_id", "sql", "hash_text", "fields")
+
+    def __init__(
+        self,
+        sql: Optional[str],
+        *,
+        sql_id: Optional[str] = None,
+        hash_text: Optional[str] = None,
+        fields: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.sql = sql
+        self.sql_id = sql_id
+        self.hash_text = hash_text
+        self.fields = fields or {}
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return None if self.sql is None else _fingerprint(self.sql)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sql_id": self.sql_id,
+            "sql": self.sql,
+            "hash_text": self.hash_text,
+            "fingerprint": self.fingerprint,
+            "fields": dict(self.fields),
+        }
+
+    def __repr__(self) -> str:
+        return f"PlanCacheEntry({self.sql!r}, sql_id={self.sql_id!r})"
+
+
+def parse_plandump(output: str) -> List[PlanCacheEntry]:
+    """Parse the XASL cache entries of ``cubrid plandump`` output.
+
+    An entry starts at each ``XASL_ID`` line; lines before the first
+    entry (cache-wide totals) are ignored.
+    """
+    entries: List[PlanCacheEntry] = []
+    fields: Optional[Dict[str, str]] = None
+
+    def close_entry() -> None:
+        if fields is not None:
+            known = {_TEXT_KEYS[key]: value for key, value in fields.items() if key in _TEXT_KEYS}
+            entries.append(
+                PlanCacheEntry(
+                    known.get("sql"),
+                    sql_id=known.get("sql_id"),
+                    hash_text=known.get("hash_text"),
+                    fields=fields,
+                )
+            )
+
+    # Statement texts keep their line breaks; later lines continue them.
+    continued: Optional[str] = None
+    for line in output.splitlines():
+        match = _FIELD_RE.match(line)
+        if match is None:
+            if fields is not None and continued is not None and line.strip():
+                fields[continued] += "\n" + line.strip()
+            else:
+                continued = None
+            continue
+        key = match["key"].lower()
+        if key == "xasl_id":
+            close_entry()
+            fields = {}
+        if fields is not None and key not in fields:
+            fields[key] = match["value"]
+            continued = key if key in _TEXT_KEYS else None
+        else:
+            continued = None
+    close_entry()
+    return entries
+
+
+def _differs_in_limit(texts: Set[str]) -> bool:
+    return len({_LIMIT_RE.sub("LIMIT ?", sql) for sql in texts}) < len(texts)
+
+
+def _variant_cause(texts: Iterable[str]) -> str:
+    """Name what makes *texts* of one fingerprint differ: in_list, limit or literal_sql."""
+    texts = set(texts)
+    values = {_NUMBER_RE.sub("?", _STRING_RE.sub("?", sql)) for sql in texts}
+    if len({_LIST_RE.sub("(?)", sql) for sql in values}) < len(values):
+        return "in_list"
+    return "limit" if _differs_in_limit(texts) else "literal_sql"
+
+
+class PlanCacheFinding:
+    """One plan-reuse problem (``fingerprint`` is ``None`` when server-wide)."""
+
+    __slots__ = ("kind", "fingerprint", "message", "suggestion")
+
+    def __init__(
+        self, kind: str, fingerprint: Optional[str], message: str, suggestion: str
+    ) -> None:
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.message = message
+        self.suggestion = suggestion
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "fingerprint": self.fingerprint,
+            "message": self.message,
+            "suggestion": self.suggestion,
+        }
+
+    def __repr__(self) -> str:
+        return f"PlanCacheFinding({self.kind!r}, {self.fingerprint!r}, {self.message!r})"
+
+
+class _ShapeStats:
+    __slots__ = ("executions", "compiled", "statements", "literal_execute", "saturated")
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.compiled: Set[str] = set()
+        self.statements: Set[str] = set()
+        self.literal_execute = 0
+        self.saturated = False
+
+
+class PlanCacheReport:
+    """Statement texts sent per fingerprint, checked for plan reuse.
+
+    :param variant_threshold: distinct statement texts (or server plans)
+        for one fingerprint from which :meth:`findings` reports it.
+    :param max_fingerprints: fingerprints tracked individually; later ones
+        are folded into one ``<other>`` entry.
+    :param max_texts: distinct texts remembered per fingerprint.
+    """
+
+    def __init__(
+        self,
+        *,
+        variant_threshold: int = 10,
+        max_fingerprints: int = 2000,
+        max_texts: int = 200,
+    ) -> None:
+        if variant_threshold < 2:
+            raise ValueError("variant_threshold must be >= 2")
+        self.variant_threshold = variant_threshold
+        self.max_fingerprints = max_fingerprints
+        self.max_texts = max_texts
+        self._shapes: Dict[str, _ShapeStats] = {}
+        self._server: Optional[Dict[str, List[PlanCacheEntry]]] = None
+        self._lock = threading.Lock()
+
+    def record(self, compiled_sql: str, statement: str, *, literal_execute: bool = False) -> None:
+        """Record one execution.
+
+        *compiled_sql* is the dialect's compiled string and *statement* the
+        text sent to the driver (IN lists expanded, ``literal_execute``
+        values rendered).
+        """
+        fingerprint = _fingerprint(compiled_sql)
+        statement = _SPACE_RE.sub(" ", statement).strip()
+        with self._lock:
+            stats = self._shapes.get(fingerprint)
+            if stats is None:
+                if len(self._shapes) >= self.max_fingerprints:
+                    fingerprint = _OTHER
+                stats = self._shapes.get(fingerprint)
+                if stats is None:
+                    stats = self._shapes[fingerprint] = _ShapeStats()
+            stats.executions += 1
+            if literal_execute:
+                stats.literal_execute += 1
+            for texts, sql in ((stats.compiled, compiled_sql), (stats.statements, statement)):
+                if sql not in texts:
+                    if len(texts) < self.max_texts:
+                        texts.add(sql)
+                    else:
+                        stats.saturated = True
+
+    def correlate(self, entries: Iterable[PlanCacheEntry]) -> None:
+        """Group server plan cache *entries* by fingerprint for :meth:`findings`."""
+        server: Dict[str, List[PlanCacheEntry]] = {}
+        for entry in entries:
+            fingerprint = entry.fingerprint
+            if fingerprint is not None:
+                server.setdefault(fingerprint, []).append(entry)
+        with self._lock:
+            self._server = server
+
+    def fingerprints(self) -> List[Dict[str, Any]]:
+        """Per-fingerprint statistics, most statement texts first."""
+        with self._lock:
+            items = [
+                (key, stats.executions, len(stats.compiled), set(stats.statements), stats)
+                for key, stats in self._shapes.items()
+            ]
+            server = self._server
+        entries: List[Dict[str, Any]] = []
+        for key, executions, compiled, statements, stats in items:
+            entry: Dict[str, Any] = {
+                "fingerprint": key,
+                "executions": executions,
+                "compiled_texts": compiled,
+                "statement_texts": len(statements),
+                "literal_execute": stats.literal_execute,
+                "saturated": stats.saturated,
+            }
+            if server is not None:
+                entry["server_plans"] = len(server.get(key, ()))
+            entries.append(entry)
+        entries.sort(key=lambda entry: int(entry["statement_texts"]), reverse=True)
+        return entries
+
+    def findings(self, *, stats: Optional[Mapping[str, Any]] = None) -> List[PlanCacheFinding]:
+        """Return fingerprints that defeat server plan reuse, worst first.
+
+        *stats* (from :func:`plan_cache_stats`) adds server-wide findings
+        for a low hit ratio and for plans evicted from a full cache.
+        """
+        threshold = self.variant_threshold
+        with self._lock:
+            shapes = [
+                (key, stats_.executions, set(stats_.compiled), set(stats_.statements), stats_)
+                for key, stats_ in self._shapes.items()
+                if key != _OTHER
+            ]
+            server = self._server
+        found: List[Tuple[int, PlanCacheFinding]] = []
+        for key, executions, compiled, statements, shape in shapes:
+            if len(compiled) >= threshold:
+                # The dialect itself rendered the differing values.
+                cause = "limit" if _differs_in_limit(compiled) else "literal_sql"
+                message = f"{len(compiled)} distinct compiled statements in {executions} executions"
+            elif len(statements) >= threshold:
+                cause = "literal_execute" if shape.literal_execute else _variant_cause(statements)
+                message = f"{len(statements)} distinct statement texts in {executions} executions"
+            else:
+                cause = None
+            if cause is not None:
+                found.append(
+                    (
+                        max(len(compiled), len(statements)),
+                        PlanCacheFinding(cause, key, message, _SUGGESTIONS[cause]),
+                    )
+                )
+            if server is None:
+                continue
+            plans = server.get(key, [])
+            if len(plans) >= threshold and cause is None:
+                plan_cause = _variant_cause(entry.sql or "" for entry in plans)
+                found.append(
+                    (
+                        len(plans),
+                        PlanCacheFinding(
+                            "server_plans",
+                            key,
+                            f"{len(plans)} server plan cache entries for one statement shape",
+                            _SUGGESTIONS[plan_cause],
+                        ),
+                    )
+                )
+            elif (
+                not plans
+                and executions >= threshold
+                and key.lstrip("(").upper().startswith(_CACHEABLE)
+            ):
+                found.append(
+                    (
+                        0,
+                        PlanCacheFinding(
+                            "not_cached",
+                            key,
+                            f"executed {executions} times but has no server plan cache entry",
+                            "the plan was evicted or never cached; check the plan cache "
+                            "size (max_plan_cache_entries) and the findings of statements "
+                            "filling it",
+                        ),
+                    )
+                )
+        found.sort(key=lambda item: item[0], reverse=True)
+        findings = [finding for _, finding in found]
+
+        if stats is not None:
+            lookups = stats.get("lookup") or 0
+            ratio = stats.get("hit_ratio")
+            if lookups >= 100 and ratio is not None and ratio < 0.9:
+                findings.append(
+                    PlanCacheFinding(
+                        "low_hit_ratio",
+                        None,
+                        f"plan cache hit ratio {ratio:.1%} over {lookups} lookups",
+                        "fix the statement findings above; statements that vary in "
+                        "shape never hit the plan cache",
+                    )
+                )
+            evicted = stats.get("delete") or 0
+            if stats.get("full") or evicted:
+                findings.append(
+                    PlanCacheFinding(
+                        "evictions",
+                        None,
+                        f"plan cache full {stats.get('full') or 0} times, {evicted} plans deleted",
+                        "raise max_plan_cache_entries in cubrid.conf or reduce the "
+                        "number of distinct statement texts",
+                    )
+                )
+        return findings
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all statistics as a JSON-serializable dict."""
+        return {
+            "fingerprints": self.fingerprints(),
+            "findings": [finding.to_dict() for finding in self.findings()],
+        }
+
+    def reset(self) -> None:
+        """Clear all statistics and correlated entries; engines stay hooked."""
+        with self._lock:
+            self._shapes.clear()
+            self._server = None
+
+
+_instrumented: "weakref.WeakKeyDictionary[Any, PlanCacheReport]" = weakref.WeakKeyDictionary()
+
+
+def instrument_plan_cache(engine: Any, report: Optional[PlanCacheReport] = None) -> PlanCacheReport:
+    """Attach *report* (a new :class:`PlanCacheReport` by default) to *engine*.
+
+    *engine* may be an :class:`~sqlalchemy.engine.Engine` or an
+    :class:`~sqlalchemy.ext.asyncio.AsyncEngine`; one report may serve
+    several engines.
+
+    :raises ValueError: if *engine* is already instrumented.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    if engine in _instrumented:
+        raise ValueError("engine is already instrumented")
+    if report is None:
+        report = PlanCacheReport()
+    _instrumented[engine] = report
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        compiled = getattr(context, "compiled", None)
+        string = getattr(compiled, "string", None)
+        report.record(
+            string if isinstance(string, str) else statement,
+            statement,
+            literal_execute=bool(getattr(compiled, "literal_execute_params", None)),
+        )
+
+    return report
@@ -0,0 +1,476 @@
+# sqlalchemy_cubrid/plancheck.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Query plan baselines: catch silent plan changes of named queries.
+
+Each named query is traced with :func:`~sqlalchemy_cubrid.trace.trace_query`
+and reduced to a *plan signature*: which tables are scanned, how (table,
+index or temp scan), with which index, in what join order, and which
+operators sort.  The first run stores the signature as
+``<baselines>/<name>.json``; later runs compare against it and fail on
+regressions, e.g. an index scan that became a full table scan after a
+schema migration or a CUBRID upgrade.
+
+Traces come from a live connection, or, in local mode, from recorded
+``<traces>/<name>.trace`` files (raw ``SHOW TRACE`` output, text or
+JSON), so suites can run without a database.
+
+Usage::
+
+    from sqlalchemy_cubrid.plancheck import PlanChecker, PlanSuite
+
+    suite = PlanSuite()
+    suite.add("orders_by_customer", select(orders).where(orders.c.customer_id == 42))
+
+    checker = PlanChecker("tests/plan_baselines")
+    with engine.connect() as conn:
+        report = checker.run(suite, conn)  # {name: [PlanChange, ...]}
+
+The same checks are available as a pytest fixture
+(:mod:`sqlalchemy_cubrid.pytest_plugin`) and from the command line::
+
+    python -m sqlalchemy_cubrid.plancheck check myapp.plans:suite \\
+        --baselines tests/plan_baselines --url cubrid+pycubrid://dba@localhost/demodb
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.expression import Executable
+
+from sqlalchemy_cubrid.trace import TracePlan, parse_trace, trace_query
+
+__all__ = (
+    "PlanChange",
+    "PlanChecker",
+    "PlanQuery",
+    "PlanRegressionError",
+    "PlanSuite",
+    "compare_signatures",
+    "main",
+    "plan_signature",
+)
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def _check_name(name: str) -> str:
+    if not _NAME_RE.match(name) or name.startswith("."):
+        raise ValueError(f"plan name {name!r} must match [A-Za-z0-9_.-]+ (it names a file)")
+    return name
+
+
+# ---------------------------------------------------------------------------
+# Signatures
+# ---------------------------------------------------------------------------
+
+
+def _split_target(access: Optional[str], target: Optional[str]) -> tuple[Optional[str], Any]:
+    """Return ``(table, index)`` for a SCAN target."""
+    if target is None:
+        return None, None
+    if access == "index":
+        table, _, index = target.rpartition(".")
+        return table or None, index
+    return target, None
+
+
+def plan_signature(plan: TracePlan) -> Dict[str, Any]:
+    """Reduce *plan* to the parts that define its access paths.
+
+    Returns ``{"scans": [...], "join_order": [...], "sorts": [...]}``.
+    Each scan is ``{"table", "access", "index", "covered", "depth"}`` in
+    tree order; ``join_order`` lists the scanned tables in that order.
+    Times and row counts are left out: they vary between runs.
+    """
+    scans: List[Dict[str, Any]] = []
+
+    def walk(node: Any, depth: int) -> None:
+        if node.kind == "SCAN":
+            table, index = _split_target(node.access, node.target)
+            scans.append(
+                {
+                    "table": table,
+                    "access": node.access,
+                    "index": index,
+                    "covered": node.covered,
+                    "depth": depth,
+                }
+            )
+        for child in node.children:
+            walk(child, depth + 1)
+
+    for root in plan.roots:
+        walk(root, 0)
+    return {
+        "scans": scans,
+        "join_order": [scan["table"] for scan in scans if scan["table"] is not None],
+        "sorts": [node.kind for node in plan.sorts()],
+    }
+
+
+class PlanChange:
+    """One difference between a baseline and a current plan signature.
+
+    :attr:`regression` is True for changes that usually make a query
+    slower: a full table scan replacing an index scan, a new full scan,
+    or a new sort.
+    """
+
+    __slots__ = ("kind", "message", "regression")
+
+    def __init__(self, kind: str, message: str, regression: bool) -> None:
+        self.kind = kind
+        self.message = message
+        self.regression = regression
+
+    def __repr__(self) -> str:
+        flag = "REGRESSION" if self.regression else "changed"
+        return f"<PlanChange {flag} {self.kind}: {self.message}>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlanChange):
+            return NotImplemented
+        return (self.kind, self.message, self.regression) == (
+            other.kind,
+            other.message,
+            other.regression,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.kind, self.message, self.regression))
+
+
+def _describe(scan: Mapping[str, Any]) -> str:
+    if scan["access"] == "index":
+        return f"index scan ({scan['index']})"
+    return f"{scan['access']} scan"
+
+
+def _by_table(scans: Sequence[Mapping[str, Any]]) -> Dict[str, List[Mapping[str, Any]]]:
+    grouped: Dict[str, List[Mapping[str, Any]]] = {}
+    for scan in scans:
+        if scan["table"] is not None:
+            grouped.setdefault(scan["table"], []).append(scan)
+    return grouped
+
+
+def compare_signatures(baseline: Mapping[str, Any], current: Mapping[str, Any]) -> List[PlanChange]:
+    """Return the changes from *baseline* to *current* (see :func:`plan_signature`)."""
+    changes: List[PlanChange] = []
+    old_scans = _by_table(baseline["scans"])
+    new_scans = _by_table(current["scans"])
+
+    for table, olds in old_scans.items():
+        news = new_scans.get(table, [])
+        for old, new in zip(olds, news):
+            if old["access"] == new["access"] and old["index"] == new["index"]:
+                if old["covered"] and not new["covered"]:
+                    changes.append(
+                        PlanChange(
+                            "covered", f"{table}: {_describe(new)} is no longer covering", False
+                        )
+                    )
+                continue
+            regression = new["access"] == "table" and old["access"] != "table"
+            changes.append(
+                PlanChange(
+                    "full_scan" if regression else "access",
+                    f"{table}: {_describe(old)} became {_describe(new)}",
+                    regression,
+                )
+            )
+        for old in olds[len(news) :]:
+            changes.append(PlanChange("scan_removed", f"{table}: {_describe(old)} removed", False))
+    for table, news in new_scans.items():
+        for new in news[len(old_scans.get(table, [])) :]:
+            changes.append(
+                PlanChange(
+                    "scan_added",
+                    f"{table}: new {_describe(new)}",
+                    new["access"] == "table",
+                )
+            )
+
+    if baseline["join_order"] != current["join_order"] and set(baseline["join_order"]) == set(
+        current["join_order"]
+    ):
+        changes.append(
+            PlanChange(
+                "join_order",
+                f"join order {' > '.join(baseline['join_order'])} "
+                f"became {' > '.join(current['join_order'])}",
+                False,
+            )
+        )
+
+    added_sorts = list(current["sorts"])
+    for kind in baseline["sorts"]:
+        if kind in added_sorts:
+            added_sorts.remove(kind)
+    for kind in added_sorts:
+        changes.append(PlanChange("sort", f"new {kind} sort", True))
+    return changes
+
+
+# ---------------------------------------------------------------------------
+# Suites and baselines
+# ---------------------------------------------------------------------------
+
+
+class PlanQuery:
+    """A named statement whose plan is guarded."""
+
+    __slots__ = ("name", "statement", "parameters")
+
+    def __init__(
+        self,
+        name: str,
+        statement: Optional[Executable] = None,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.name = _check_name(name)
+        self.statement = statement
+        self.parameters = parameters
+
+
+class PlanSuite:
+    """An ordered collection of :class:`PlanQuery` objects."""
+
+    def __init__(self) -> None:
+        self._queries: Dict[str, PlanQuery] = {}
+
+    def add(
+        self,
+        name: str,
+        statement: Optional[Executable] = None,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> PlanQuery:
+        """Add a query; *statement* may be omitted for trace-only local suites."""
+        if name in self._queries:
+            raise ValueError(f"duplicate plan name {name!r}")
+        query = self._queries[name] = PlanQuery(name, statement, parameters)
+        return query
+
+    def __iter__(self) -> Iterator[PlanQuery]:
+        return iter(self._queries.values())
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+
+class PlanRegressionError(AssertionError):
+    """Raised by :meth:`PlanChecker.check` when a plan regressed."""
+
+    def __init__(self, name: str, changes: Sequence[PlanChange]) -> None:
+        self.name = name
+        self.changes = list(changes)
+        lines = "\n".join(f"  - {change.message}" for change in self.changes)
+        super().__init__(f"query plan of {name!r} changed:\n{lines}")
+
+
+_PathLike = Union[str, "os.PathLike[str]"]
+
+
+class PlanChecker:
+    """Compare traced plans with stored baselines.
+
+    :param baselines: Directory of ``<name>.json`` baseline files.
+    :param traces: Local mode: directory of recorded ``<name>.trace``
+        files used instead of tracing on a live connection.
+    :param update: Overwrite baselines with the current plans instead of
+        comparing.
+    :param strict: Fail on any plan change, not only on regressions.
+    """
+
+    def __init__(
+        self,
+        baselines: _PathLike,
+        *,
+        traces: Optional[_PathLike] = None,
+        update: bool = False,
+        strict: bool = False,
+    ) -> None:
+        self.baselines = Path(baselines)
+        self.traces = Path(traces) if traces is not None else None
+        self.update = update
+        self.strict = strict
+
+    def _trace(
+        self,
+        name: str,
+        connection: Optional[Connection],
+        statement: Optional[Executable],
+        parameters: Optional[Mapping[str, Any]],
+    ) -> List[str]:
+        if self.traces is not None:
+            path = self.traces / f"{name}.trace"
+            if not path.exists():
+                raise FileNotFoundError(f"no recorded trace for {name!r} at {path}")
+            return [path.read_text(encoding="utf-8")]
+        if connection is None or statement is None:
+            raise ValueError(f"{name!r}: a connection and a statement are needed without traces")
+        return trace_query(connection, statement, parameters=parameters)
+
+    def load_baseline(self, name: str) -> Optional[Dict[str, Any]]:
+        path = self.baselines / f"{_check_name(name)}.json"
+        if not path.exists():
+            return None
+        data: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        return data
+
+    def save_baseline(self, name: str, signature: Mapping[str, Any], trace: List[str]) -> None:
+        self.baselines.mkdir(parents=True, exist_ok=True)
+        path = self.baselines / f"{_check_name(name)}.json"
+        record = {"name": name, "signature": signature, "trace": trace}
+        path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+
+    def compare(
+        self,
+        name: str,
+        connection: Optional[Connection] = None,
+        statement: Optional[Executable] = None,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> List[PlanChange]:
+        """Trace *name* and return its changes; store a baseline if none exists."""
+        _check_name(name)
+        trace = self._trace(name, connection, statement, parameters)
+        signature = plan_signature(parse_trace(trace))
+        baseline = self.load_baseline(name)
+        if baseline is None or self.update:
+            self.save_baseline(name, signature, trace)
+            return []
+        return compare_signatures(baseline["signature"], signature)
+
+    def check(
+        self,
+        name: str,
+        connection: Optional[Connection] = None,
+        statement: Optional[Executable] = None,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> List[PlanChange]:
+        """Like :meth:`compare`, but raise :class:`PlanRegressionError` on failure.
+
+        Returns the changes that were tolerated (non-regressions when not
+        strict).
+        """
+        changes = self.compare(name, connection, statement, parameters)
+        failing = [change for change in changes if self.strict or change.regression]
+        if failing:
+            raise PlanRegressionError(name, failing)
+        return changes
+
+    def run(
+        self, suite: PlanSuite, connection: Optional[Connection] = None
+    ) -> Dict[str, List[PlanChange]]:
+        """Compare every query of *suite*; returns ``{name: changes}``."""
+        return {
+            query.name: self.compare(query.name, connection, query.statement, query.parameters)
+            for query in suite
+        }
+
+    def failing(self, report: Mapping[str, Sequence[PlanChange]]) -> Dict[str, List[PlanChange]]:
+        """Filter a :meth:`run` report down to the changes that fail."""
+        result = {}
+        for name, changes in report.items():
+            failing = [change for change in changes if self.strict or change.regression]
+            if failing:
+                result[name] = failing
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def _load_suite(spec: str) -> PlanSuite:
+    module_name, _, attribute = spec.partition(":")
+    suite = getattr(importlib.import_module(module_name), attribute or "suite")
+    if callable(suite) and not isinstance(suite, PlanSuite):
+        suite = suite()
+    if not isinstance(suite, PlanSuite):
+        raise SystemExit(f"{spec} is not a PlanSuite")
+    return suite
+
+
+def _suite_from_traces(traces: Path) -> PlanSuite:
+    suite = PlanSuite()
+    for path in sorted(traces.glob("*.trace")):
+        suite.add(path.stem)
+    return suite
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of ``python -m sqlalchemy_cubrid.plancheck``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m sqlalchemy_cubrid.plancheck",
+        description="Record or check query plan baselines.",
+    )
+    _ = parser.add_argument("command", choices=("check", "record"))
+    _ = parser.add_argument(
+        "suite",
+        nargs="?",
+        help="module:attribute of a PlanSuite (optional with --traces)",
+    )
+    _ = parser.add_argument("--baselines", required=True, help="Baseline directory")
+    source = parser.add_mutually_exclusive_group(required=True)
+    _ = source.add_argument("--url", help="Database URL to trace on")
+    _ = source.add_argument("--traces", help="Directory of recorded <name>.trace files")
+    _ = parser.add_argument(
+        "--strict", action="store_true", help="Fail on any plan change, not only regressions"
+    )
+    args = parser.parse_args(argv)
+
+    checker = PlanChecker(
+        args.baselines,
+        traces=args.traces,
+        update=args.command == "record",
+        strict=args.strict,
+    )
+    if args.suite:
+        suite = _load_suite(args.suite)
+    elif args.traces:
+        suite = _suite_from_traces(Path(args.traces))
+    else:
+        parser.error("a suite is required with --url")
+
+    if args.url:
+        from sqlalchemy import create_engine
+
+        engine = create_engine(args.url)
+        try:
+            with engine.connect() as conn:
+                report = checker.run(suite, conn)
+        finally:
+            engine.dispose()
+    else:
+        report = checker.run(suite)
+
+    failing = checker.failing(report)
+    for name, changes in report.items():
+        status = "FAIL" if name in failing else ("changed" if changes else "ok")
+        print(f"{status:<8} {name}")
+        for change in changes:
+            marker = "!" if change in failing.get(name, ()) else "~"
+            print(f"    {marker} {change.message}")
+    if args.command == "record":
+        print(f"recorded {len(report)} baseline(s) in {args.baselines}")
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
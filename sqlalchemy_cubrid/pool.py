@@ -0,0 +1,433 @@
+# sqlalchemy_cubrid/pool.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Connection pool helpers for the CUBRID dialects."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Coroutine, Optional
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+from sqlalchemy.pool.base import _AsyncConnDialect
+from sqlalchemy.util import queue as sqla_queue
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+log = logging.getLogger(__name__)
+
+__all__ = ("AsyncLoopAffinityPool", "PingWindow")
+
+
+class PingWindow:
+    """Remember when DBAPI connections last talked to the broker successfully.
+
+    With ``pool_pre_ping=True`` SQLAlchemy calls ``do_ping()`` on every
+    checkout, which costs one ``CHECK_CAS`` round trip per request.  A
+    connection that completed a statement or a ping less than *window*
+    seconds ago is very unlikely to be dead, so the dialect skips the
+    ping for it.
+
+    All connections of one dialect talk to the same broker.  When any of
+    them raises a disconnect error, :meth:`mark_suspect` forgets every
+    recorded success, so the siblings are pinged again on their next
+    checkout instead of being trusted for the rest of the window.
+    """
+
+    __slots__ = ("window", "_last_ok", "_lock")
+
+    def __init__(self, window: float) -> None:
+        if window <= 0:
+            raise ValueError(f"ping window must be positive, got {window!r}")
+        self.window = float(window)
+        self._last_ok: weakref.WeakKeyDictionary[Any, float] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def touch(self, dbapi_connection: Any) -> None:
+        """Record a successful round trip on *dbapi_connection*."""
+        try:
+            with self._lock:
+                self._last_ok[dbapi_connection] = time.monotonic()
+        except TypeError:
+            # Connection class does not support weak references; it is
+            # simply pinged every time, as without a window.
+            pass
+
+    def is_fresh(self, dbapi_connection: Any) -> bool:
+        """Return True if *dbapi_connection* succeeded within the window."""
+        try:
+            last_ok = self._last_ok.get(dbapi_connection)
+        except TypeError:
+            return False
+        return last_ok is not None and time.monotonic() - last_ok < self.window
+
+    def forget(self, dbapi_connection: Any) -> None:
+        """Drop the record for *dbapi_connection*, forcing its next ping."""
+        try:
+            with self._lock:
+                self._last_ok.pop(dbapi_connection, None)
+        except TypeError:
+            pass
+
+    def mark_suspect(self) -> None:
+        """Force a real ping on every tracked connection."""
+        with self._lock:
+            self._last_ok.clear()
+
+    def __len__(self) -> int:
+        return len(self._last_ok)
+
+
+class _LoopQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool for the connections of one event loop.
+
+    Returned connections are timestamped; when reaping is enabled a timer
+    on the owning loop closes connections idle for ``idle_timeout``
+    seconds and pings those idle for ``idle_ping`` seconds.  The timer
+    runs as a plain task, so it awaits the pycubrid connection directly
+    instead of going through a greenlet.
+    """
+
+    def __init__(
+        self,
+        creator: Any,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop],
+        idle_timeout: Optional[float],
+        idle_ping: Optional[float],
+        **kw: Any,
+    ) -> None:
+        super().__init__(creator, **kw)
+        self._loop_ref = weakref.ref(loop) if loop is not None else None
+        self._idle_timeout = idle_timeout
+        self._idle_ping = idle_ping
+        intervals = [value for value in (idle_timeout, idle_ping) if value]
+        self._reap_interval = min(intervals) / 2 if intervals else None
+        self._idle_since: dict[Any, float] = {}
+        self._pinged_at: dict[Any, float] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._reaper: Optional[asyncio.Task[None]] = None
+
+    def _do_get(self) -> Any:
+        record = super()._do_get()
+        # Use counts as a liveness check: ping age restarts on return.
+        self._forget(record)
+        return record
+
+    def _do_return_conn(self, record: Any) -> None:
+        self._idle_since[record] = time.monotonic()
+        super()._do_return_conn(record)
+        if record.dbapi_connection is None:  # queue was full; closed
+            self._forget(record)
+        else:
+            self._schedule_reap()
+
+    def _forget(self, record: Any) -> None:
+        self._idle_since.pop(record, None)
+        self._pinged_at.pop(record, None)
+
+    def _schedule_reap(self) -> None:
+        if self._reap_interval is None or self._timer is not None or self._reaper is not None:
+            return
+        loop = self._loop_ref() if self._loop_ref is not None else None
+        if loop is None or loop.is_closed():
+            return
+        self._timer = loop.call_later(self._reap_interval, self._start_reap, loop)
+
+    def _start_reap(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        self._reaper = loop.create_task(self._reap())
+        self._reaper.add_done_callback(self._reap_done)
+
+    def _reap_done(self, task: asyncio.Task[None]) -> None:
+        self._reaper = None
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            log.warning("Idle connection reaper failed", exc_info=error)
+        if self._idle_since:
+            self._schedule_reap()
+
+    async def _reap(self) -> None:
+        now = time.monotonic()
+        idle = []
+        while True:
+            try:
+                idle.append(self._pool.get(False))
+            except sqla_queue.Empty:
+                break
+        keep, ping, stale = [], [], []
+        for record in idle:
+            idle_for = now - self._idle_since.get(record, now)
+            if self._idle_timeout and idle_for >= self._idle_timeout:
+                stale.append(record)
+            elif (
+                self._idle_ping
+                and now - self._pinged_at.get(record, now - idle_for) >= self._idle_ping
+            ):
+                ping.append(record)
+            else:
+                keep.append(record)
+        # Put survivors back without awaiting, in their original order, so
+        # checkouts on this loop never see them missing.
+        for record in reversed(keep) if self._pool.use_lifo else keep:
+            self._requeue(record)
+        for record in ping:
+            if await self._aping(record):
+                self._pinged_at[record] = time.monotonic()
+                self._requeue(record)
+            else:
+                stale.append(record)
+        for record in stale:
+            await self._aclose(record)
+
+    async def _aping(self, record: Any) -> bool:
+        dbapi_connection = record.dbapi_connection
+        aping = getattr(dbapi_connection, "aping", None)
+        if aping is None:
+            return True
+        try:
+            alive = bool(await aping())
+        except Exception:
+            alive = False
+        # Lets the next checkout skip its pre-ping under cubrid_ping_window.
+        record_ping = getattr(self._dialect, "_record_ping", None)
+        if record_ping is not None:
+            record_ping(dbapi_connection, alive)
+        return alive
+
+    async def _aclose(self, record: Any) -> None:
+        self._forget(record)
+        try:
+            aclose = getattr(record.dbapi_connection, "aclose", None)
+            if aclose is None:
+                await greenlet_spawn(record.close)
+                return
+            try:
+                await aclose()
+            except Exception:
+                log.debug("Error closing idle connection", exc_info=True)
+            record.close()
+        finally:
+            self._dec_overflow()
+
+    def _requeue(self, record: Any) -> None:
+        try:
+            self._pool.put(record, False)
+        except sqla_queue.Full:
+            # The pool refilled while this connection was out for a ping.
+            self._forget(record)
+            try:
+                record.close()
+            finally:
+                self._dec_overflow()
+
+    def dispose(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        self._idle_since.clear()
+        self._pinged_at.clear()
+        super().dispose()
+
+    async def _adispose(self) -> None:
+        try:
+            await greenlet_spawn(self.dispose)
+        except Exception:
+            log.warning("Error disposing connections of a foreign event loop", exc_info=True)
+
+
+class AsyncLoopAffinityPool(Pool):
+    """Async pool that keeps every connection on the loop that opened it.
+
+    pycubrid.aio connections are bound to the event loop their streams
+    were created on.  :class:`~sqlalchemy.pool.AsyncAdaptedQueuePool`
+    hands any idle connection to any caller, which breaks applications
+    that run one event loop per thread.  This pool keeps a separate
+    queue per running loop; ``pool_size``, ``max_overflow`` and
+    ``pool_timeout`` apply to each loop.
+
+    :param idle_timeout: Close connections idle for this many seconds,
+        using a timer on their loop.  Frees CAS processes on the broker
+        between traffic peaks.
+    :param idle_ping: Ping connections idle for this many seconds from the
+        loop timer, natively and off the checkout path.  With
+        ``cubrid_ping_window`` set, a successful timer ping lets the next
+        checkout skip its ``pool_pre_ping`` round trip.
+
+    Usage::
+
+        from sqlalchemy_cubrid.pool import AsyncLoopAffinityPool
+
+        engine = create_async_engine(
+            "cubrid+aiopycubrid://dba@localhost:33000/demodb",
+            poolclass=AsyncLoopAffinityPool,
+            idle_timeout=120,
+        )
+    """
+
+    _is_asyncio = True
+    _dialect = _AsyncConnDialect()
+
+    def __init__(
+        self,
+        creator: Any,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        use_lifo: bool = False,
+        idle_timeout: Optional[float] = None,
+        idle_ping: Optional[float] = None,
+        **kw: Any,
+    ) -> None:
+        for name, value in (("idle_timeout", idle_timeout), ("idle_ping", idle_ping)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value!r}")
+        Pool.__init__(self, creator, **kw)
+        self._size = pool_size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._use_lifo = use_lifo
+        self._idle_timeout = idle_timeout
+        self._idle_ping = idle_ping
+        self._loop_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueuePool] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Used outside a running loop, e.g. by synchronous test code.
+        self._unbound_pool: Optional[_LoopQueuePool] = None
+        self._loop_pools_lock = threading.Lock()
+
+    def _loop_pool(self) -> _LoopQueuePool:
+        loop = _running_loop()
+        with self._loop_pools_lock:
+            loop_pool = self._unbound_pool if loop is None else self._loop_pools.get(loop)
+            if loop_pool is None:
+                loop_pool = self._new_loop_pool(loop)
+                if loop is None:
+                    self._unbound_pool = loop_pool
+                else:
+                    self._loop_pools[loop] = loop_pool
+            return loop_pool
+
+    def _new_loop_pool(self, loop: Optional[asyncio.AbstractEventLoop]) -> _LoopQueuePool:
+        loop_pool = _LoopQueuePool(
+            self._creator,
+            loop=loop,
+            idle_timeout=self._idle_timeout,
+            idle_ping=self._idle_ping,
+            pool_size=self._size,
+            max_overflow=self._max_overflow,
+            timeout=self._timeout,
+            use_lifo=self._use_lifo,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            pre_ping=self._pre_ping,
+            dialect=self._dialect,
+        )
+        # Records fire pool events through their own pool; share the
+        # dispatcher so listeners added to this pool later still apply.
+        loop_pool.__dict__["dispatch"] = self.dispatch
+        return loop_pool
+
+    def _all_pools(self) -> list[tuple[Optional[asyncio.AbstractEventLoop], _LoopQueuePool]]:
+        with self._loop_pools_lock:
+            pools: list[tuple[Optional[asyncio.AbstractEventLoop], _LoopQueuePool]] = list(
+                self._loop_pools.items()
+            )
+            if self._unbound_pool is not None:
+                pools.append((None, self._unbound_pool))
+        return pools
+
+    def _do_get(self) -> Any:
+        return self._loop_pool()._do_get()
+
+    def _do_return_conn(self, record: Any) -> None:
+        # Records check in through the loop pool that created them; this
+        # is only reached if a caller returns one to the parent directly.
+        self._loop_pool()._do_return_conn(record)
+
+    def dispose(self) -> None:
+        current = _running_loop()
+        pools = self._all_pools()
+        with self._loop_pools_lock:
+            self._loop_pools.clear()
+            self._unbound_pool = None
+        for loop, loop_pool in pools:
+            if loop is None or loop is current:
+                loop_pool.dispose()
+            elif loop.is_running():
+                loop.call_soon_threadsafe(_spawn, loop_pool._adispose())
+            # Connections of a stopped loop cannot be closed from here;
+            # their transports go away with the loop.
+        self.logger.info("Pool disposed. %s", self.status())
+
+    def recreate(self) -> AsyncLoopAffinityPool:
+        self.logger.info("Pool recreating")
+        return self.__class__(
+            self._creator,
+            pool_size=self._size,
+            max_overflow=self._max_overflow,
+            timeout=self._timeout,
+            use_lifo=self._use_lifo,
+            idle_timeout=self._idle_timeout,
+            idle_ping=self._idle_ping,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            pre_ping=self._pre_ping,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+    def status(self) -> str:
+        return "Pool size: %d per loop  Loops: %d  Checked out: %d  Checked in: %d" % (
+            self._size,
+            len(self._all_pools()),
+            self.checkedout(),
+            self.checkedin(),
+        )
+
+    def size(self) -> int:
+        return self._size
+
+    def timeout(self) -> float:
+        return self._timeout
+
+    def checkedin(self) -> int:
+        return sum(loop_pool.checkedin() for _, loop_pool in self._all_pools())
+
+    def checkedout(self) -> int:
+        return sum(loop_pool.checkedout() for _, loop_pool in self._all_pools())
+
+    def overflow(self) -> int:
+        return sum(max(loop_pool.overflow(), 0) for _, loop_pool in self._all_pools())
+
+
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> None:
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
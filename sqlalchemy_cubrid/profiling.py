@@ -0,0 +1,232 @@
+# sqlalchemy_cubrid/profiling.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Opt-in compile-time profiling for the CUBRID compilers.
+
+:func:`profile_compilation` swaps a dialect's statement, DDL and type
+compilers for subclasses that time every ``visit_*`` method, and, for an
+engine, counts SQLAlchemy compiled-cache hits and misses per execution.
+Nothing is wrapped until it is called, and :meth:`CompileProfile.stop`
+restores the original compilers.
+
+Usage::
+
+    from sqlalchemy_cubrid.profiling import profile_compilation
+
+    profile = profile_compilation(engine)
+    ...
+    profile.top(10)            # hottest visit methods by self time
+    profile.snapshot()["cache"]  # {"hit": ..., "miss": ..., "hit_ratio": ...}
+    profile.stop()
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import DefaultDialect
+
+__all__ = ("CompileProfile", "profile_compilation")
+
+# Hooks that are not ``visit_*`` methods but show up in compile profiles.
+_EXTRA_METHODS = (
+    "limit_clause",
+    "update_limit_clause",
+    "for_update_clause",
+    "get_column_specification",
+    "post_create_table",
+)
+
+_CACHE_LABELS: Dict[Any, str] = {
+    DefaultDialect.CACHE_HIT: "hit",
+    DefaultDialect.CACHE_MISS: "miss",
+    DefaultDialect.CACHING_DISABLED: "disabled",
+    DefaultDialect.NO_CACHE_KEY: "no_key",
+    DefaultDialect.NO_DIALECT_SUPPORT: "no_dialect_support",
+}
+
+
+class CompileProfile:
+    """Call counts and timings of compiler methods, plus cache statistics.
+
+    Timings are keyed ``"<CompilerClass>.<method>"`` and cover every
+    ``visit_*`` method plus hooks such as ``limit_clause``.  ``cumulative_s``
+    includes nested visits (a recursive visit is counted at every level,
+    as in :mod:`cProfile`); ``self_s`` excludes them.  The
+    ``<CompilerClass>.compile`` entry is the whole compilation of one
+    statement or DDL construct.
+    """
+
+    def __init__(self) -> None:
+        # key -> [calls, cumulative seconds, self seconds]
+        self._timings: Dict[str, List[float]] = {}
+        self._cache: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._undo: List[Callable[[], None]] = []
+
+    # ----- recording -----
+
+    def _stack(self) -> List[float]:
+        stack: Optional[List[float]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _timed(self, key: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        profile = self
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kw: Any) -> Any:
+            stack = profile._stack()
+            stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kw)
+            finally:
+                elapsed = time.perf_counter() - started
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                with profile._lock:
+                    entry = profile._timings.get(key)
+                    if entry is None:
+                        entry = profile._timings[key] = [0, 0.0, 0.0]
+                    entry[0] += 1
+                    entry[1] += elapsed
+                    entry[2] += elapsed - nested
+
+        return wrapper
+
+    def _profiled_class(self, base: type, *, time_init: bool) -> type:
+        namespace: Dict[str, Any] = {}
+        for name in dir(base):
+            if not name.startswith("visit_") and name not in _EXTRA_METHODS:
+                continue
+            # Static and class methods are left alone; every compiler
+            # visit method is a plain function.
+            if isinstance(inspect.getattr_static(base, name), types.FunctionType):
+                namespace[name] = self._timed(f"{base.__name__}.{name}", getattr(base, name))
+        if time_init:
+            # SQLCompiler / DDLCompiler compile the statement in __init__.
+            init: Callable[..., Any] = getattr(base, "__init__")
+            namespace["__init__"] = self._timed(f"{base.__name__}.compile", init)
+        return type(f"Profiled{base.__name__}", (base,), namespace)
+
+    def _on_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        label = _CACHE_LABELS.get(getattr(context, "cache_hit", None))
+        if label is None:
+            return
+        with self._lock:
+            self._cache[label] = self._cache.get(label, 0) + 1
+
+    # ----- export -----
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return ``{"compilers": {key: {...}}, "cache": {...}}``."""
+        with self._lock:
+            timings = {
+                key: {"calls": int(calls), "cumulative_s": cumulative, "self_s": own}
+                for key, (calls, cumulative, own) in sorted(self._timings.items())
+            }
+            cache: Dict[str, Any] = dict(self._cache)
+        hits = cache.get("hit", 0)
+        lookups = hits + cache.get("miss", 0)
+        cache["hit_ratio"] = hits / lookups if lookups else None
+        return {"compilers": timings, "cache": cache}
+
+    def top(self, n: int = 10, *, by: str = "self_s") -> List[Dict[str, Any]]:
+        """Return the *n* entries with the highest *by* (``self_s``,
+        ``cumulative_s`` or ``calls``), each with its ``"name"``."""
+        entries = [{"name": key, **data} for key, data in self.snapshot()["compilers"].items()]
+        entries.sort(key=lambda entry: entry[by], reverse=True)
+        return entries[:n]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timings.clear()
+            self._cache.clear()
+
+    def stop(self) -> None:
+        """Restore the original compilers and remove the cache listener."""
+        while self._undo:
+            self._undo.pop()()
+
+
+def _override(dialect: Any, attribute: str, value: Any, undo: List[Callable[[], None]]) -> None:
+    had_own = attribute in vars(dialect)
+    previous = vars(dialect).get(attribute)
+
+    def restore() -> None:
+        if had_own:
+            setattr(dialect, attribute, previous)
+        else:
+            delattr(dialect, attribute)
+
+    setattr(dialect, attribute, value)
+    undo.append(restore)
+
+
+def profile_compilation(target: Any, profile: Optional[CompileProfile] = None) -> CompileProfile:
+    """Profile compilation on *target* (an engine, async engine or dialect).
+
+    The dialect's ``statement_compiler``, ``ddl_compiler`` and type
+    compiler are replaced on that dialect instance only.  For an engine,
+    a ``before_cursor_execute`` listener also tallies each execution's
+    compiled-cache outcome (``hit``, ``miss``, ``no_key``, ...); statements
+    compiled directly with ``stmt.compile(dialect=...)`` bypass the cache
+    and are only timed.
+
+    :raises ValueError: if the dialect is already being profiled.
+    """
+    engine = getattr(target, "sync_engine", target)
+    dialect = getattr(engine, "dialect", engine)
+    if getattr(dialect, "_compile_profile", None) is not None:
+        raise ValueError("dialect is already being profiled")
+    if profile is None:
+        profile = CompileProfile()
+    undo = profile._undo
+
+    _override(
+        dialect,
+        "statement_compiler",
+        profile._profiled_class(dialect.statement_compiler, time_init=True),
+        undo,
+    )
+    _override(
+        dialect,
+        "ddl_compiler",
+        profile._profiled_class(dialect.ddl_compiler, time_init=True),
+        undo,
+    )
+    type_compiler = dialect.type_compiler_instance
+    profiled_type_compiler = profile._profiled_class(type(type_compiler), time_init=False)(dialect)
+    for attribute in ("type_compiler_instance", "type_compiler"):
+        if attribute in vars(dialect):
+            _override(dialect, attribute, profiled_type_compiler, undo)
+    _override(dialect, "_compile_profile", profile, undo)
+
+    if engine is not dialect:
+        event.listen(engine, "before_cursor_execute", profile._on_execute)
+        undo.append(
+            functools.partial(event.remove, engine, "before_cursor_execute", profile._on_execute)
+        )
+    return profile
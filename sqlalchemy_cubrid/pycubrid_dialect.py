@@ -9,11 +9,13 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
 from importlib import import_module
 from typing import Any, Callable, cast
 
-from sqlalchemy.engine.interfaces import DBAPIConnection, ConnectArgsType
+from sqlalchemy.engine.interfaces import ConnectArgsType
 from sqlalchemy_cubrid._compat import DBAPIModule
 from sqlalchemy.engine.url import URL
 
@@ -23,6 +25,31 @@ from sqlalchemy_cubrid.dialect import CubridDialect
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _connect_accepts(module_name: str, keyword: str) -> bool:
+    """Return whether ``<module_name>.connect()`` takes the *keyword* argument.
+
+    Older pycubrid releases reject keywords they do not know with a
+    ``TypeError``; a driver that is not installed accepts nothing.
+    """
+    try:
+        connect = import_module(module_name).connect
+        return keyword in inspect.signature(connect).parameters
+    except (ImportError, AttributeError, TypeError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _pycubrid_collection_types() -> dict[str, Callable[[Any], Any]]:
+    module = import_module("pycubrid")
+    types = {
+        "SET": getattr(module, "Set", None),
+        "MULTISET": getattr(module, "Multiset", None),
+        "SEQUENCE": getattr(module, "Sequence", None),
+    }
+    return {name: param for name, param in types.items() if param is not None}
+
+
 class PyCubridExecutionContext(CubridExecutionContext):
     """Execution context for pycubrid connections.
 
@@ -98,6 +125,10 @@ class PyCubridDialect(CubridDialect):
             "user": opts.get("user", "dba"),
             "password": opts.get("password", ""),
         }
+        if _connect_accepts("pycubrid", "decode_collections"):
+            # SET / MULTISET / SEQUENCE values arrive as Python containers
+            # instead of undecoded wire bytes (see types._CollectionType).
+            kwargs["decode_collections"] = True
         log.debug(
             "connect args: host=%s port=%s database=%s user=%s",
             kwargs["host"],
@@ -123,9 +154,13 @@ class PyCubridDialect(CubridDialect):
 
         return connect
 
-    def do_ping(self, dbapi_connection: DBAPIConnection) -> bool:
+    def _ping(self, dbapi_connection: Any) -> bool:
         """Ping using native pycubrid CHECK_CAS (FC=32). Requires pycubrid>=1.3.2."""
         return bool(dbapi_connection.ping(False))
 
+    def _collection_param_types(self) -> dict[str, Callable[[Any], Any]]:
+        """Return pycubrid's ``Set`` / ``Multiset`` / ``Sequence`` parameter types."""
+        return _pycubrid_collection_types()
+
 
 dialect = PyCubridDialect
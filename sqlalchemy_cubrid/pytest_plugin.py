@@ -0,0 +1,79 @@
+# sqlalchemy_cubrid/pytest_plugin.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""pytest plugin exposing :class:`~sqlalchemy_cubrid.plancheck.PlanChecker`.
+
+The plugin is opt-in; enable it in the project's root ``conftest.py``::
+
+    pytest_plugins = ["sqlalchemy_cubrid.pytest_plugin"]
+
+or with ``-p sqlalchemy_cubrid.pytest_plugin``.  It adds the
+``cubrid_plan_checker`` fixture and these options:
+
+``--cubrid-plan-baselines DIR``
+    Baseline directory (default ``plan_baselines``).
+``--cubrid-plan-traces DIR``
+    Local mode: read recorded ``<name>.trace`` files instead of tracing.
+``--cubrid-plan-update``
+    Rewrite the baselines from the current plans.
+``--cubrid-plan-strict``
+    Fail on any plan change, not only on regressions.
+
+Usage::
+
+    def test_orders_plan(cubrid_plan_checker, connection):
+        cubrid_plan_checker.check(
+            "orders_by_customer", connection, select(orders).where(orders.c.customer_id == 42)
+        )
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sqlalchemy_cubrid.plancheck import PlanChecker
+
+__all__ = ("cubrid_plan_checker", "pytest_addoption")
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup("cubrid-plans", "CUBRID query plan baselines")
+    group.addoption(
+        "--cubrid-plan-baselines",
+        default="plan_baselines",
+        help="Directory of query plan baselines (default: plan_baselines)",
+    )
+    group.addoption(
+        "--cubrid-plan-traces",
+        default=None,
+        help="Compare recorded <name>.trace files instead of tracing live",
+    )
+    group.addoption(
+        "--cubrid-plan-update",
+        action="store_true",
+        help="Rewrite query plan baselines from the current plans",
+    )
+    group.addoption(
+        "--cubrid-plan-strict",
+        action="store_true",
+        help="Fail on any query plan change, not only regressions",
+    )
+
+
+@pytest.fixture(scope="session")
+def cubrid_plan_checker(pytestconfig: Any) -> PlanChecker:
+    """A :class:`PlanChecker` configured from the ``--cubrid-plan-*`` options."""
+    baselines = pytestconfig.rootpath / pytestconfig.getoption("cubrid_plan_baselines")
+    traces = pytestconfig.getoption("cubrid_plan_traces")
+    return PlanChecker(
+        baselines,
+        traces=pytestconfig.rootpath / traces if traces is not None else None,
+        update=pytestconfig.getoption("cubrid_plan_update"),
+        strict=pytestconfig.getoption("cubrid_plan_strict"),
+    )
@@ -0,0 +1,393 @@
+# sqlalchemy_cubrid/slowlog.py
+# Copyright (C) 2021-2026 by sqlalchemy-cubrid authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of sqlalchemy-cubrid and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Per-statement latency log keyed by compiled-statement fingerprint.
+
+:func:`instrument_statements` hooks an engine's cursor execution events
+and records, per statement fingerprint:
+
+- execution count, errors, total / max time and a latency histogram;
+- rows reported by the driver (``cursor.rowcount``);
+- ``executemany()`` calls and their batch sizes.
+
+The fingerprint is the SQL the dialect compiled, before IN-list
+expansion, with literals replaced by ``?`` and whitespace collapsed, so
+every execution of one statement shape lands in the same entry whatever
+its parameters.  Parameters are never recorded.
+
+Memory is bounded: at most *max_fingerprints* entries (later shapes are
+folded into one ``<other>`` entry) plus the *top_k* slowest single
+executions.  Recording is one dict lookup and a few additions under a
+lock, cheap enough to leave on in production.
+
+Usage::
+
+    from sqlalchemy_cubrid.slowlog import instrument_statements
+
+    slow_log = instrument_statements(engine)
+    slow_log.start_periodic_dump("/var/log/app/cubrid-statements.json", interval=60)
+    ...
+    for entry in slow_log.top(10):
+        print(entry["total_s"], entry["sql"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import event
+
+from sqlalchemy_cubrid.metrics import LATENCY_BUCKETS, Histogram
+
+__all__ = (
+    "BATCH_BUCKETS",
+    "SlowQueryLog",
+    "fingerprint_sql",
+    "instrument_statements",
+)
+
+#: Default upper bounds for ``executemany()`` batch sizes.
+BATCH_BUCKETS: Tuple[float, ...] = (1, 10, 100, 1000, 10000, 100000)
+
+_OTHER = "<other>"
+_START = "_cubrid_slowlog_start"
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_POSTCOMPILE_RE = re.compile(r"__\[POSTCOMPILE_\w+\]")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """Return *sql* with literals and bind lists normalized to ``?``.
+
+    ``IN (?, ?, ?)`` and expanded ``IN`` parameters become ``IN (?)`` and
+    runs of whitespace become one space.  Quoted identifiers are kept.
+    """
+    sql = _STRING_RE.sub("?", sql)
+    sql = _POSTCOMPILE_RE.sub("(?)", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _LIST_RE.sub("(?)", sql)
+    return _SPACE_RE.sub(" ", sql).strip()
+
+
+def _quantile(histogram: Histogram, maximum: float, q: float) -> float:
+    """Upper bound of the bucket holding quantile *q*, capped at *maximum*."""
+    if not histogram.count:
+        return 0.0
+    rank = q * histogram.count
+    total = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        total += count
+        if total >= rank:
+            return min(bound, maximum)
+    return maximum
+
+
+class _StatementStats:
+    __slots__ = (
+        "sql",
+        "count",
+        "errors",
+        "total",
+        "max",
+        "rows",
+        "latency",
+        "batches",
+        "batch_rows",
+    )
+
+    def __init__(self, sql: str, latency_buckets: Sequence[float]) -> None:
+        self.sql = sql
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.latency = Histogram(latency_buckets)
+        self.batches = Histogram(BATCH_BUCKETS)
+        self.batch_rows = 0
+
+    def snapshot(self, fingerprint: str) -> Dict[str, Any]:
+        return {
+            "fingerprint": fingerprint,
+            "sql": self.sql,
+            "count": self.count,
+            "errors": self.errors,
+            "total_s": self.total,
+            "mean_s": self.total / self.count if self.count else 0.0,
+            "max_s": self.max,
+            "p50_s": _quantile(self.latency, self.max, 0.5),
+            "p95_s": _quantile(self.latency, self.max, 0.95),
+            "p99_s": _quantile(self.latency, self.max, 0.99),
+            "rows": self.rows,
+            "executemany": {
+                "count": self.batches.count,
+                "rows": self.batch_rows,
+                "batch_sizes": self.batches.snapshot()["buckets"],
+            },
+            "latency": self.latency.snapshot(),
+        }
+
+
+class SlowQueryLog:
+    """Thread-safe per-fingerprint statement statistics.
+
+    :param top_k: Number of slowest single executions to keep.
+    :param max_fingerprints: Distinct statement shapes to track; further
+        shapes are aggregated under the ``<other>`` fingerprint.
+    :param latency_buckets: Histogram bounds in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        top_k: int = 50,
+        max_fingerprints: int = 2000,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        if top_k < 0 or max_fingerprints < 1:
+            raise ValueError("top_k must be >= 0 and max_fingerprints >= 1")
+        self.top_k = top_k
+        self.max_fingerprints = max_fingerprints
+        self._latency_buckets = tuple(latency_buckets)
+        self._stats: Dict[str, _StatementStats] = {}
+        # Min-heap of (elapsed, sequence, record): the root is the fastest
+        # of the kept executions and is replaced first.
+        self._slowest: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._sequence = 0
+        # Compiled SQL string -> (fingerprint id, normalized SQL).
+        self._fingerprints: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_stop = threading.Event()
+
+    # ----- recording -----
+
+    def _fingerprint(self, sql: str) -> Tuple[str, str]:
+        cached = self._fingerprints.get(sql)
+        if cached is None:
+            normalized = fingerprint_sql(sql)
+            digest = hashlib.sha1(normalized.encode("utf-8"), usedforsecurity=False)
+            cached = (digest.hexdigest()[:16], normalized)
+            if len(self._fingerprints) < self.max_fingerprints * 4:
+                self._fingerprints[sql] = cached
+        return cached
+
+    def record(
+        self,
+        sql: str,
+        elapsed: float,
+        *,
+        rows: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        error: bool = False,
+    ) -> None:
+        """Record one execution of *sql* (compiled SQL, binds as placeholders)."""
+        fingerprint, normalized = self._fingerprint(sql)
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    fingerprint, normalized = _OTHER, _OTHER
+                    stats = self._stats.get(_OTHER)
+                if stats is None:
+                    stats = self._stats[fingerprint] = _StatementStats(
+                        normalized, self._latency_buckets
+                    )
+            stats.count += 1
+            stats.total += elapsed
+            if elapsed > stats.max:
+                stats.max = elapsed
+            stats.latency.observe(elapsed)
+            if error:
+                stats.errors += 1
+            if rows is not None and rows >= 0:
+                stats.rows += rows
+            if batch_size is not None:
+                stats.batches.observe(batch_size)
+                stats.batch_rows += batch_size
+
+            if self.top_k and (len(self._slowest) < self.top_k or elapsed > self._slowest[0][0]):
+                self._sequence += 1
+                entry = (
+                    elapsed,
+                    self._sequence,
+                    {
+                        "fingerprint": fingerprint,
+                        "sql": normalized,
+                        "elapsed_s": elapsed,
+                        "rows": rows,
+                        "error": error,
+                        "at": time.time(),
+                    },
+                )
+                if len(self._slowest) < self.top_k:
+                    heapq.heappush(self._slowest, entry)
+                else:
+                    heapq.heapreplace(self._slowest, entry)
+
+    # ----- export -----
+
+    def top(self, k: Optional[int] = None, *, by: str = "total_s") -> List[Dict[str, Any]]:
+        """Return the *k* statements with the highest *by* value.
+
+        *by* is any numeric key of a :meth:`snapshot` statement entry,
+        e.g. ``"total_s"``, ``"p95_s"``, ``"max_s"`` or ``"count"``.
+        """
+        entries: List[Dict[str, Any]] = self.snapshot()["statements"]
+        entries.sort(key=lambda entry: entry[by], reverse=True)
+        return entries if k is None else entries[:k]
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        """Return the kept slowest single executions, slowest first."""
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        return [dict(record) for _, _, record in entries]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all statistics as a JSON-serializable dict."""
+        with self._lock:
+            statements = [stats.snapshot(key) for key, stats in self._stats.items()]
+        statements.sort(key=lambda entry: entry["total_s"], reverse=True)
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "statements": statements,
+            "slowest": self.slowest(),
+        }
+
+    def dump(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write :meth:`snapshot` to *path* as JSON, replacing it atomically."""
+        target = os.fspath(path)
+        tmp = f"{target}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.snapshot(), fh, indent=2)
+        os.replace(tmp, target)
+
+    def start_periodic_dump(
+        self, path: Union[str, "os.PathLike[str]"], interval: float = 60.0
+    ) -> None:
+        """Call :meth:`dump` every *interval* seconds from a daemon thread."""
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval!r}")
+        if self._dump_thread is not None:
+            raise RuntimeError("periodic dump already running")
+        self._dump_stop.clear()
+
+        def run() -> None:
+            while not self._dump_stop.wait(interval):
+                try:
+                    self.dump(path)
+                except OSError:
+                    pass  # keep dumping; the next interval may succeed
+
+        self._dump_thread = threading.Thread(
+            target=run, name="sqlalchemy-cubrid-slowlog", daemon=True
+        )
+        self._dump_thread.start()
+
+    def stop_periodic_dump(self) -> None:
+        thread, self._dump_thread = self._dump_thread, None
+        if thread is not None:
+            self._dump_stop.set()
+            thread.join()
+
+    def reset(self) -> None:
+        """Clear all statistics; instrumented engines stay hooked."""
+        with self._lock:
+            self._stats.clear()
+            self._slowest.clear()
+
+
+_instrumented: "weakref.WeakKeyDictionary[Any, SlowQueryLog]" = weakref.WeakKeyDictionary()
+
+
+def instrument_statements(engine: Any, log: Optional[SlowQueryLog] = None) -> SlowQueryLog:
+    """Attach *log* (a new :class:`SlowQueryLog` by default) to *engine*.
+
+    *engine* may be an :class:`~sqlalchemy.engine.Engine` or an
+    :class:`~sqlalchemy.ext.asyncio.AsyncEngine`.  One log may serve
+    several engines.  Statements sent through
+    :func:`sqlalchemy_cubrid.aio.fast_execute` bypass engine events and
+    are therefore not recorded; with the log attached, ``fast_execute``
+    falls back to the regular path anyway.
+
+    :raises ValueError: if *engine* is already instrumented.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    if engine in _instrumented:
+        raise ValueError("engine is already instrumented")
+    if log is None:
+        log = SlowQueryLog()
+    _instrumented[engine] = log
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if context is not None:
+            setattr(context, _START, time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started = getattr(context, _START, None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        # A later fetch error must not count the execution twice.
+        setattr(context, _START, None)
+        rowcount = getattr(cursor, "rowcount", None)
+        log.record(
+            _statement_key(context, statement),
+            elapsed,
+            rows=rowcount if isinstance(rowcount, int) else None,
+            batch_size=len(parameters) if executemany else None,
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context: Any) -> None:
+        context = exception_context.execution_context
+        started = getattr(context, _START, None)
+        if started is None:
+            return
+        log.record(
+            _statement_key(context, exception_context.statement or ""),
+            time.perf_counter() - started,
+            error=True,
+        )
+
+    return log
+
+
+def _statement_key(context: Any, statement: str) -> str:
+    # The compiled string keeps IN-list parameters as one POSTCOMPILE
+    # token, so every list length maps to the same fingerprint.
+    compiled = getattr(context, "compiled", None)
+    string = getattr(compiled, "string", None)
+    return string if isinstance(string, str) else statement
@@ -19,20 +19,81 @@ Usage::
     with engine.connect() as conn:
         result = trace_query(conn, text("SELECT * FROM users WHERE id = 1"))
         print(result)
+
+On ``cubrid+aiopycubrid://`` use :func:`atrace_query`, or
+:class:`AsyncTraceSampler` to trace a random fraction of the statements
+an endpoint runs while still returning their results::
+
+    sampler = AsyncTraceSampler(0.01, sink=lambda sql, trace: log.info("%s\n%s", sql, trace))
+
+    async with async_engine.connect() as conn:
+        result = await sampler.execute(conn, select(users).where(users.c.id == 1))
+
+:func:`parse_trace` turns the output into a :class:`TracePlan` tree, for
+checks such as "this query must not scan the whole table"::
+
+    plan = parse_trace(trace_query(conn, stmt))
+    assert not plan.full_scans(), plan.to_dict()
+
+To trace real traffic instead, pass ``cubrid_trace_sample_rate`` and/or
+``cubrid_trace_slow_threshold`` to ``create_engine()``; see
+:class:`StatementTracer`::
+
+    engine = create_engine(
+        url,
+        cubrid_trace_sample_rate=0.001,
+        cubrid_trace_slow_threshold=0.5,
+        cubrid_trace_sink=JsonlTraceSink("/var/log/app/cubrid-trace.jsonl"),
+    )
 """
 
 from __future__ import annotations
 
+import collections
+import inspect
+import json
 import logging
-from typing import Any, Mapping, Sequence
+import logging.handlers
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Optional, Sequence, Union
 
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, Result
 from sqlalchemy.sql.expression import Executable
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
 _logger = logging.getLogger(__name__)
 
-__all__ = ("trace_query",)
+__all__ = (
+    "AsyncTraceSampler",
+    "JsonlTraceSink",
+    "StatementTracer",
+    "TraceNode",
+    "TracePlan",
+    "atrace_query",
+    "log_trace_sink",
+    "parse_trace",
+    "trace_query",
+)
+
+_Parameters = Optional[Mapping[str, Any] | Sequence[Mapping[str, Any]]]
+
+
+def _trace_lines(rows: Sequence[Any]) -> list[str]:
+    """Return the non-empty ``SHOW TRACE`` output column of *rows*."""
+    return [str(row[0]) for row in rows if row and row[0] is not None]
+
+
+def _statement_sql(statement: Executable, dialect: Any) -> str:
+    compile_ = getattr(statement, "compile", None)
+    return str(compile_(dialect=dialect)) if compile_ is not None else str(statement)
 
 
 def trace_query(
@@ -89,12 +150,7 @@ def trace_query(
         finally:
             result.close()
 
-        trace_output: list[str] = []
-        for row in rows:
-            if row and row[0] is not None:
-                trace_output.append(str(row[0]))
-
-        return trace_output
+        return _trace_lines(rows)
     finally:
         # Best-effort cleanup: intentionally swallow any exception from
         # `SET TRACE OFF` so we never mask the original exception (if any)
@@ -103,3 +159,612 @@ def trace_query(
             connection.execute(text("SET TRACE OFF"))
         except Exception as exc:  # noqa: BLE001 - cleanup must not mask original error
             _logger.debug("Failed to disable CUBRID trace during cleanup: %s", exc)
+
+
+async def atrace_query(
+    connection: AsyncConnection,
+    statement: Executable,
+    *,
+    parameters: _Parameters = None,
+) -> list[str]:
+    """Async version of :func:`trace_query` for an ``AsyncConnection``.
+
+    Each step is awaited on its own, so the event loop keeps serving
+    other tasks between them instead of waiting on one ``run_sync()``
+    call that holds the connection for the whole sequence.
+    """
+    try:
+        await connection.execute(text("SET TRACE ON"))
+        if parameters is not None:
+            await connection.execute(statement, parameters)
+        else:
+            await connection.execute(statement)
+        result = await connection.execute(text("SHOW TRACE"))
+        return _trace_lines(result.fetchall())
+    finally:
+        # Same best-effort cleanup as trace_query().
+        try:
+            await connection.execute(text("SET TRACE OFF"))
+        except Exception as exc:  # noqa: BLE001 - cleanup must not mask original error
+            _logger.debug("Failed to disable CUBRID trace during cleanup: %s", exc)
+
+
+class AsyncTraceSampler:
+    """Trace a random fraction of the statements run through :meth:`execute`.
+
+    :param rate: Fraction of calls to trace, from ``0.0`` to ``1.0``.
+    :param sink: Called as ``sink(sql, trace_lines)`` for each traced
+        statement; may be a coroutine function.  It runs before
+        :meth:`execute` returns, so keep it cheap or hand the work to a
+        queue.  Errors raised by the sink are logged and ignored.
+    :param seed: Seed for the sampling decisions, for reproducible tests.
+
+    Unlike :func:`atrace_query`, :meth:`execute` returns the statement's
+    result.  Tracing failures never fail the statement: the result is
+    returned and the failure is logged at debug level.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        sink: Callable[[str, list[str]], Any],
+        *,
+        seed: Optional[int] = None,
+    ) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"rate must be between 0 and 1, got {rate!r}")
+        self.rate = rate
+        self.sink = sink
+        self._random = random.Random(seed)  # nosec B311 — sampling, not security
+
+    async def execute(
+        self,
+        connection: AsyncConnection,
+        statement: Executable,
+        parameters: _Parameters = None,
+    ) -> Result[Any]:
+        """Execute *statement* on *connection*, tracing it if sampled."""
+        if self._random.random() >= self.rate:
+            return await connection.execute(statement, parameters)
+
+        try:
+            await connection.execute(text("SET TRACE ON"))
+        except Exception as exc:  # noqa: BLE001 - tracing is best effort
+            _logger.debug("Failed to enable CUBRID trace: %s", exc)
+            return await connection.execute(statement, parameters)
+
+        try:
+            result = await connection.execute(statement, parameters)
+            trace = await self._show_trace(connection)
+        finally:
+            try:
+                await connection.execute(text("SET TRACE OFF"))
+            except Exception as exc:  # noqa: BLE001 - cleanup must not mask original error
+                _logger.debug("Failed to disable CUBRID trace during cleanup: %s", exc)
+
+        if trace is not None:
+            await self._emit(_statement_sql(statement, connection.dialect), trace)
+        return result
+
+    async def _show_trace(self, connection: AsyncConnection) -> Optional[list[str]]:
+        try:
+            result = await connection.execute(text("SHOW TRACE"))
+            return _trace_lines(result.fetchall())
+        except Exception as exc:  # noqa: BLE001 - tracing is best effort
+            _logger.debug("Failed to read CUBRID trace: %s", exc)
+            return None
+
+    async def _emit(self, sql: str, trace: list[str]) -> None:
+        try:
+            outcome = self.sink(sql, trace)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception:  # noqa: BLE001 - a broken sink must not fail the request
+            _logger.debug("Trace sink failed", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Trace parsing
+# ---------------------------------------------------------------------------
+
+#: Node kinds that represent a whole statement rather than a plan operator.
+_STATEMENT_KINDS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "MERGE"})
+
+#: Per-access statistic groups of a SCAN node (``heap time: ...`` etc.).
+_SCAN_SECTIONS = ("heap", "btree", "lookup", "temp", "noscan")
+
+_GROUP_RE = re.compile(r"\(([^()]*)\)")
+_ACCESS_RE = re.compile(r"^(table|index|temp)\b\s*(?:\((.*)\))?\s*$")
+
+
+def _scalar(value: str) -> Any:
+    value = value.strip()
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+class TraceNode:
+    """One operator of a CUBRID trace: a statement, SCAN, GROUPBY, ORDERBY...
+
+    :attr:`kind` is the label CUBRID prints (``"SCAN"``, ``"GROUPBY"``...).
+    For SCAN nodes :attr:`access` is ``"table"``, ``"index"`` or ``"temp"``
+    and :attr:`target` the table or ``table.index`` name.  :attr:`time`,
+    :attr:`fetch` and :attr:`ioread` add up the node's statistic groups
+    (``heap``/``btree`` plus ``lookup`` for index scans); :attr:`rows` is
+    the row count the node passed on.  The raw groups are in :attr:`stats`.
+
+    Inner scans of a nested-loop join are children of the outer scan, as
+    CUBRID prints them.
+    """
+
+    __slots__ = ("kind", "access", "target", "detail", "stats", "children")
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.access: Optional[str] = None
+        self.target: Optional[str] = None
+        self.detail: Optional[str] = None
+        self.stats: dict[str, dict[str, Any]] = {}
+        self.children: list[TraceNode] = []
+
+    def _sum(self, key: str) -> int:
+        return sum(
+            value for group in self.stats.values() if isinstance(value := group.get(key), int)
+        )
+
+    @property
+    def time(self) -> int:
+        """Elapsed time in milliseconds."""
+        return self._sum("time")
+
+    @property
+    def fetch(self) -> int:
+        """Page fetches."""
+        return self._sum("fetch")
+
+    @property
+    def ioread(self) -> int:
+        """Pages read from disk."""
+        return self._sum("ioread")
+
+    @property
+    def rows(self) -> Optional[int]:
+        rows = None
+        for group in self.stats.values():
+            if isinstance(group.get("rows"), int):
+                rows = group["rows"]
+        return rows
+
+    @property
+    def covered(self) -> bool:
+        """True for an index scan answered from the index alone."""
+        return any(group.get("covered") is True for group in self.stats.values())
+
+    @property
+    def is_full_scan(self) -> bool:
+        return self.kind == "SCAN" and self.access == "table"
+
+    @property
+    def is_join(self) -> bool:
+        """True for the outer scan of a nested-loop join."""
+        return self.kind == "SCAN" and any(child.kind == "SCAN" for child in self.children)
+
+    @property
+    def is_sort(self) -> bool:
+        return any(group.get("sort") is True for group in self.stats.values())
+
+    def walk(self) -> Iterator[TraceNode]:
+        """Yield this node and its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "access": self.access,
+            "target": self.target,
+            "detail": self.detail,
+            "time": self.time,
+            "fetch": self.fetch,
+            "ioread": self.ioread,
+            "rows": self.rows,
+            "covered": self.covered,
+            "stats": {name: dict(group) for name, group in self.stats.items()},
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def __repr__(self) -> str:
+        target = f" {self.access}:{self.target}" if self.access else ""
+        return f"<TraceNode {self.kind}{target} time={self.time} rows={self.rows}>"
+
+
+class TracePlan:
+    """Parsed ``SHOW TRACE`` output; see :func:`parse_trace`.
+
+    :attr:`roots` holds one node per traced statement (normally one).
+    :attr:`query_plan` and :attr:`rewritten_query` keep the text format's
+    ``Query Plan:`` section and rewritten SQL when present.
+    """
+
+    __slots__ = ("roots", "format", "query_plan", "rewritten_query")
+
+    def __init__(
+        self,
+        roots: list[TraceNode],
+        format: str,
+        query_plan: Optional[str] = None,
+        rewritten_query: Optional[str] = None,
+    ) -> None:
+        self.roots = roots
+        self.format = format
+        self.query_plan = query_plan
+        self.rewritten_query = rewritten_query
+
+    def nodes(self) -> Iterator[TraceNode]:
+        for root in self.roots:
+            yield from root.walk()
+
+    def scans(self) -> list[TraceNode]:
+        return [node for node in self.nodes() if node.kind == "SCAN"]
+
+    def full_scans(self) -> list[TraceNode]:
+        """Table (heap) scans, i.e. scans that used no index."""
+        return [node for node in self.nodes() if node.is_full_scan]
+
+    def joins(self) -> list[TraceNode]:
+        """Outer scans of nested-loop joins; the inner scans are their children."""
+        return [node for node in self.nodes() if node.is_join]
+
+    def sorts(self) -> list[TraceNode]:
+        """GROUPBY / ORDERBY nodes that had to sort."""
+        return [node for node in self.nodes() if node.is_sort]
+
+    def hottest_node(self) -> Optional[TraceNode]:
+        """The operator with the highest time, then fetch count.
+
+        Statement nodes (``SELECT``...) are skipped since their time
+        includes everything below them; ``None`` if there is no operator.
+        """
+        operators = [node for node in self.nodes() if node.kind not in _STATEMENT_KINDS]
+        if not operators:
+            return None
+        return max(operators, key=lambda node: (node.time, node.fetch))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": self.format,
+            "query_plan": self.query_plan,
+            "rewritten_query": self.rewritten_query,
+            "roots": [root.to_dict() for root in self.roots],
+        }
+
+
+def parse_trace(trace: Union[str, Sequence[str]]) -> TracePlan:
+    """Parse CUBRID trace output into a :class:`TracePlan`.
+
+    *trace* is the list :func:`trace_query` returns, or a single string.
+    Both the default text format and ``SET TRACE ON OUTPUT JSON`` are
+    understood.  Labels and statistics the parser does not know are kept
+    as-is in :attr:`TraceNode.kind` and :attr:`TraceNode.stats`.
+
+    :raises ValueError: if the output is neither format.
+    """
+    text_ = trace if isinstance(trace, str) else "\n".join(trace)
+    # SHOW TRACE output is sometimes quoted as a whole.
+    stripped = text_.strip().strip("'").strip()
+    if stripped.startswith("{"):
+        return _parse_json_trace(stripped)
+    return _parse_text_trace(stripped)
+
+
+def _parse_text_trace(text_: str) -> TracePlan:
+    plan_lines: list[str] = []
+    rewritten: Optional[str] = None
+    roots: list[TraceNode] = []
+    stack: list[tuple[int, TraceNode]] = []
+    section = None
+    for line in text_.splitlines():
+        stripped = line.strip()
+        if stripped in ("Query Plan:", "Trace Statistics:"):
+            section = stripped
+            continue
+        if not stripped:
+            continue
+        if section == "Query Plan:":
+            if stripped.startswith("rewritten query:"):
+                rewritten = stripped[len("rewritten query:") :].strip()
+            else:
+                plan_lines.append(line.rstrip())
+            continue
+        if section is None:
+            continue
+
+        node = _parse_text_node(stripped)
+        indent = len(line) - len(line.lstrip())
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        if stack:
+            stack[-1][1].children.append(node)
+        else:
+            roots.append(node)
+        stack.append((indent, node))
+
+    if not roots:
+        raise ValueError("no 'Trace Statistics:' section in trace output")
+    return TracePlan(roots, "text", "\n".join(plan_lines) or None, rewritten)
+
+
+def _parse_text_node(line: str) -> TraceNode:
+    kind, _, rest = line.partition("(")
+    node = TraceNode(kind.strip())
+    for group in _GROUP_RE.findall("(" + rest if rest else ""):
+        pairs = [part.partition(":") for part in group.split(",")]
+        first_key = pairs[0][0].strip()
+        if not pairs[0][1]:
+            # "(uncorrelated)", "(outer)" and similar markers.
+            node.detail = group.strip()
+        elif first_key in ("table", "index") and len(pairs) == 1:
+            node.access = first_key
+            node.target = pairs[0][2].strip()
+        else:
+            name, _, key = first_key.rpartition(" ")
+            name = name or node.kind.lower()
+            if name == "temp" and node.access is None:
+                node.access = "temp"
+            stats = node.stats.setdefault(name, {})
+            stats[key] = _scalar(pairs[0][2])
+            for key, _, value in pairs[1:]:
+                stats[key.strip()] = _scalar(value)
+    return node
+
+
+def _parse_json_trace(text_: str) -> TracePlan:
+    try:
+        # Keep pairs in order: one object may hold several "SCAN" keys.
+        document = json.loads(text_, object_pairs_hook=list)
+    except ValueError as exc:
+        raise ValueError(f"malformed JSON trace output: {exc}") from exc
+    pairs = document
+    for key, value in document:
+        if key == "Trace Statistics" and isinstance(value, list):
+            pairs = value
+    holder = TraceNode("")
+    _add_json_children(holder, pairs)
+    if not holder.children:
+        raise ValueError("no trace statistics in JSON trace output")
+    return TracePlan(holder.children, "json")
+
+
+def _add_json_children(parent: TraceNode, pairs: list[tuple[str, Any]]) -> None:
+    for key, value in pairs:
+        if isinstance(value, list) and key.isupper():
+            parent.children.append(_json_node(key, value))
+        elif isinstance(value, list):
+            # Containers such as MERGELIST's "outer"/"inner".
+            _add_json_children(parent, value)
+
+
+def _json_node(kind: str, pairs: list[tuple[str, Any]]) -> TraceNode:
+    node = TraceNode(kind)
+    own: dict[str, Any] = {}
+    for key, value in pairs:
+        if key == "access" and isinstance(value, str):
+            match = _ACCESS_RE.match(value.strip())
+            if match:
+                node.access, node.target = match.group(1), match.group(2)
+            else:
+                node.detail = value
+        elif key in _SCAN_SECTIONS and isinstance(value, list):
+            node.stats[key] = dict(value)
+            if key == "temp" and node.access is None:
+                node.access = "temp"
+        elif isinstance(value, list):
+            _add_json_children(node, [(key, value)])
+        else:
+            own[key] = value
+    if own:
+        node.stats = {kind.lower(): own, **node.stats}
+    return node
+
+
+# ---------------------------------------------------------------------------
+# Engine-level sampled tracing
+# ---------------------------------------------------------------------------
+
+TraceSink = Callable[[dict[str, Any]], Any]
+
+
+def log_trace_sink(record: dict[str, Any]) -> None:
+    """Default :class:`StatementTracer` sink: log *record* as JSON at INFO."""
+    _logger.info("%s", json.dumps(record, default=str))
+
+
+class JsonlTraceSink:
+    """Append trace records to a size-rotated JSON Lines file.
+
+    Rotation follows :class:`logging.handlers.RotatingFileHandler`: once
+    *path* reaches *max_bytes* it is renamed to ``path.1`` (and older
+    files shifted up to ``path.<backup_count>``).  Safe to share between
+    threads and engines.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        self._handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def __call__(self, record: dict[str, Any]) -> None:
+        self._handler.handle(
+            logging.makeLogRecord({"msg": json.dumps(record, default=str), "levelno": 20})
+        )
+
+    def close(self) -> None:
+        self._handler.close()
+
+
+_TRACE_COMMAND_PREFIXES = ("SET TRACE", "SHOW TRACE")
+
+# Pool connection info key set while the session has SET TRACE ON.
+_TRACE_ON = "cubrid_trace_on"
+
+
+class StatementTracer:
+    """Trace a fraction of the statements an engine runs, on their own connection.
+
+    Installed by the ``cubrid_trace_sample_rate``,
+    ``cubrid_trace_slow_threshold`` and ``cubrid_trace_sink`` engine
+    options; the dialect routes ``do_execute()`` through :meth:`execute`.
+
+    A statement is traced when it is sampled (probability *sample_rate*)
+    or when an earlier execution of the same SQL took at least
+    *slow_threshold* seconds; CUBRID can only trace a statement that is
+    about to run, so a slow statement is traced on its next execution.
+    Tracing runs ``SET TRACE ON`` / ``SHOW TRACE`` / ``SET TRACE OFF`` on
+    a second cursor of the same DBAPI connection, and passes *sink* one
+    JSON-serializable record per traced statement::
+
+        {"timestamp": ..., "reason": "sample" | "slow", "sql": ...,
+         "elapsed_s": ..., "trace": [...], "plan": TracePlan.to_dict() | None}
+
+    Tracing is best effort: failures are logged at debug level and never
+    fail the statement.  ``executemany()`` batches and the trace commands
+    themselves are left alone, and so is every statement on a connection
+    whose session has a trace switched on, e.g. inside :func:`trace_query`:
+    the ``SET TRACE ON`` / ``OFF`` seen by :meth:`execute` is recorded in
+    the pooled connection's ``info``.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        slow_threshold: Optional[float] = None,
+        sink: Optional[TraceSink] = None,
+        *,
+        seed: Optional[int] = None,
+        max_slow_statements: int = 1000,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample rate must be between 0 and 1, got {sample_rate!r}")
+        if slow_threshold is not None and slow_threshold < 0:
+            raise ValueError(f"slow threshold must not be negative, got {slow_threshold!r}")
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.sink: TraceSink = sink if sink is not None else log_trace_sink
+        self._random = random.Random(seed)  # nosec B311 — sampling, not security
+        self._max_slow = max_slow_statements
+        self._slow: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _reason(self, statement: str) -> Optional[str]:
+        if self.slow_threshold is not None and self._slow:
+            with self._lock:
+                if statement in self._slow:
+                    del self._slow[statement]
+                    return "slow"
+        if self.sample_rate and self._random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def _remember_slow(self, statement: str) -> None:
+        with self._lock:
+            self._slow[statement] = None
+            self._slow.move_to_end(statement)
+            while len(self._slow) > self._max_slow:
+                self._slow.popitem(last=False)
+
+    def execute(
+        self,
+        dbapi_connection: Any,
+        statement: str,
+        run: Callable[[], Any],
+        info: Optional[dict[Any, Any]] = None,
+    ) -> None:
+        """Call *run* (which executes *statement*), tracing it if selected.
+
+        *info* is the pooled connection's ``info`` dict, used to remember
+        whether the session's own trace is switched on.
+        """
+        if statement.lstrip()[:10].upper().startswith(_TRACE_COMMAND_PREFIXES):
+            run()
+            if info is not None:
+                command = " ".join(statement.split()[:3]).upper()
+                if command == "SET TRACE ON":
+                    info[_TRACE_ON] = True
+                elif command == "SET TRACE OFF":
+                    info.pop(_TRACE_ON, None)
+            return
+        if info is not None and _TRACE_ON in info:
+            run()
+            return
+        reason = self._reason(statement)
+        if reason is None:
+            if self.slow_threshold is None:
+                run()
+                return
+            started = time.perf_counter()
+            run()
+            if time.perf_counter() - started >= self.slow_threshold:
+                self._remember_slow(statement)
+            return
+        self._traced(dbapi_connection, statement, run, reason)
+
+    def _traced(
+        self, dbapi_connection: Any, statement: str, run: Callable[[], Any], reason: str
+    ) -> None:
+        try:
+            aux = dbapi_connection.cursor()
+            aux.execute("SET TRACE ON")
+        except Exception as exc:  # noqa: BLE001 - tracing is best effort
+            _logger.debug("Failed to enable CUBRID trace: %s", exc)
+            run()
+            return
+
+        lines: Optional[list[str]] = None
+        try:
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            try:
+                aux.execute("SHOW TRACE")
+                lines = _trace_lines(aux.fetchall())
+            except Exception as exc:  # noqa: BLE001 - tracing is best effort
+                _logger.debug("Failed to read CUBRID trace: %s", exc)
+        finally:
+            try:
+                aux.execute("SET TRACE OFF")
+                aux.close()
+            except Exception as exc:  # noqa: BLE001 - cleanup must not mask original error
+                _logger.debug("Failed to disable CUBRID trace during cleanup: %s", exc)
+
+        if lines is not None:
+            self._emit(reason, statement, elapsed, lines)
+
+    def _emit(self, reason: str, statement: str, elapsed: float, lines: list[str]) -> None:
+        try:
+            plan: Optional[dict[str, Any]] = parse_trace(lines).to_dict()
+        except ValueError:
+            plan = None
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "reason": reason,
+            "sql": statement,
+            "elapsed_s": elapsed,
+            "trace": lines,
+            "plan": plan,
+        }
+        try:
+            self.sink(record)
+        except Exception:  # noqa: BLE001 - a broken sink must not fail the request
+            _logger.debug("Trace sink failed", exc_info=True)
@@ -13,9 +13,12 @@ See: https://www.cubrid.org/manual/en/11.0/sql/datatype.html
 from __future__ import annotations
 
 import inspect
-from typing import Any, Sequence
+from collections import Counter
+from typing import Any, Iterable, Sequence
 
-from sqlalchemy.sql import sqltypes
+from sqlalchemy.sql import elements, sqltypes
+
+from sqlalchemy_cubrid.jsoncodec import LazyJSON
 
 
 # ---------------------------------------------------------------------------
@@ -293,37 +296,122 @@ class CLOB(sqltypes.Text):
 # ---------------------------------------------------------------------------
 
 
-class SET(_StringType):
-    """CUBRID SET type."""
+class _CollectionType(_StringType):
+    """Base for CUBRID collection types.
 
-    __visit_name__ = "SET"
+    Member types are given positionally, as type instances or DDL strings.
+    Values are bound as the driver's collection parameter type (see
+    ``CubridDialect._collection_param_types``) and returned as
+    :attr:`python_collection`.  With a single member type instance, its
+    bind / result processors are applied to each element.
+    """
+
+    #: The Python type result values are returned as.
+    python_collection: type = tuple
 
     def __init__(self, *values: Any, **kw: Any) -> None:
-        """Construct a SET."""
         self._ddl_values = values
         super().__init__(**kw)
 
+    @property
+    def python_type(self) -> type:
+        return self.python_collection
+
+    def _member_type(self) -> sqltypes.TypeEngine[Any] | None:
+        if len(self._ddl_values) == 1 and isinstance(self._ddl_values[0], sqltypes.TypeEngine):
+            return self._ddl_values[0]
+        return None
+
+    def _elements(self, value: Any) -> Iterable[Any]:
+        # Iterating these would bind their characters or keys, not elements.
+        if isinstance(value, (str, bytes, dict)):
+            raise TypeError(
+                f"{type(self).__name__} value must be an iterable of elements, "
+                f"not {type(value).__name__}"
+            )
+        return value  # type: ignore[no-any-return]
+
+    def bind_processor(self, dialect: Any) -> Any:
+        member = self._member_type()
+        element_process = (
+            member.dialect_impl(dialect).bind_processor(dialect) if member is not None else None
+        )
+        collection_params = getattr(dialect, "_collection_param_types", None)
+        param = collection_params().get(self.__visit_name__) if collection_params else None
+        to_param = param or list
+        elements = self._elements
+
+        def process(value: Any) -> Any:
+            if value is None or (param is not None and type(value) is param):
+                return value
+            items = elements(value)
+            return to_param(items if element_process is None else map(element_process, items))
+
+        return process
+
+    def result_processor(self, dialect: Any, coltype: object) -> Any:
+        member = self._member_type()
+        element_process = (
+            member.dialect_impl(dialect).result_processor(dialect, coltype)
+            if member is not None
+            else None
+        )
+        collection = self.python_collection
+
+        def process(value: Any) -> Any:
+            # str / bytes: the driver did not decode the collection.
+            if value is None or isinstance(value, (bytes, str)):
+                return value
+            if element_process is None:
+                if type(value) is collection:
+                    return value
+                items = value
+            else:
+                items = map(element_process, value)
+            try:
+                return collection(items)
+            except TypeError:
+                # Unhashable elements (JSON members) in a SET, as pycubrid does.
+                return tuple(value if element_process is None else map(element_process, value))
+
+        return process
+
+
+class SET(_CollectionType):
+    """CUBRID SET type; values are returned as ``frozenset``."""
+
+    __visit_name__ = "SET"
+    python_collection = frozenset
+
 
-class MULTISET(_StringType):
-    """CUBRID MULTISET type."""
+class MULTISET(_CollectionType):
+    """CUBRID MULTISET type; values are returned as :class:`collections.Counter`.
+
+    A ``Counter`` is bound as its :meth:`~collections.Counter.elements`.
+    """
 
     __visit_name__ = "MULTISET"
+    python_collection = Counter
+
+    def _elements(self, value: Any) -> Iterable[Any]:
+        if isinstance(value, Counter):
+            return value.elements()
+        return super()._elements(value)
 
-    def __init__(self, *values: Any, **kw: Any) -> None:
-        """Construct a MULTISET."""
-        self._ddl_values = values
-        super().__init__(**kw)
 
+class SEQUENCE(_CollectionType):
+    """CUBRID SEQUENCE (LIST) type; values are returned as ``tuple``.
 
-class SEQUENCE(_StringType):
-    """CUBRID SEQUENCE type."""
+    A ``set`` or ``frozenset`` is rejected, since its order is arbitrary.
+    """
 
     __visit_name__ = "SEQUENCE"
+    python_collection = tuple
 
-    def __init__(self, *values: Any, **kw: Any) -> None:
-        """Construct a SEQUENCE."""
-        self._ddl_values = values
-        super().__init__(**kw)
+    def _elements(self, value: Any) -> Iterable[Any]:
+        if isinstance(value, (set, frozenset)):
+            raise TypeError("SEQUENCE value must be ordered, not a set")
+        return super()._elements(value)
 
 
 # ---------------------------------------------------------------------------
@@ -480,3 +568,55 @@ class JSON(sqltypes.JSON):
     """
 
     __visit_name__ = "JSON"
+
+    # With ``cubrid_json_codec`` / ``cubrid_json_lazy`` the dialect carries
+    # a JsonCodec; these processors call it directly instead of going
+    # through the generic serializer lookup.
+
+    def bind_processor(self, dialect: Any) -> Any:
+        codec = getattr(dialect, "_json_codec", None)
+        if codec is None:
+            return super().bind_processor(dialect)  # type: ignore[no-untyped-call]
+        string_process = self._str_impl.bind_processor(dialect)
+        dumps = codec.dumps
+        null, none_as_null = self.NULL, self.none_as_null
+
+        def process(value: Any) -> Any:
+            if value is null:
+                value = None
+            elif isinstance(value, elements.Null) or (value is None and none_as_null):
+                return None
+            if type(value) is LazyJSON:
+                if not value.decoded:
+                    raw = value.raw
+                    serialized = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+                    return string_process(serialized) if string_process else serialized
+                value = value.value
+            serialized = dumps(value)
+            return string_process(serialized) if string_process else serialized
+
+        return process
+
+    def result_processor(self, dialect: Any, coltype: object) -> Any:
+        codec = getattr(dialect, "_json_codec", None)
+        if codec is None:
+            return super().result_processor(dialect, coltype)
+        string_process = self._str_impl.result_processor(dialect, coltype)
+        loads = codec.loads
+        lazy = dialect._json_lazy
+
+        if string_process is None and not lazy:
+            # str or bytes go to the decoder as returned by the driver.
+            def process(value: Any) -> Any:
+                return None if value is None else loads(value)
+
+            return process
+
+        def process_slow(value: Any) -> Any:
+            if value is None:
+                return None
+            if string_process:
+                value = string_process(value)
+            return LazyJSON(value, loads) if lazy else loads(value)
+
+        return process_slow
@@ -3,6 +3,9 @@
 The SA testing plugin (pytestplugin) is only loaded when running the full
 SA test suite against a live CUBRID instance via ``--dburi``.  Offline tests
 (test_dialects, test_compiler, test_types) work without it.
+
+``StubConnection`` and ``AsyncStubConnection`` are in-memory ``pycubrid``
+stand-ins for offline tests that run statements through an engine.
 """
 
 import sys
@@ -21,3 +24,157 @@ if "--dburi" in sys.argv or any(a.startswith("--dburi=") for a in sys.argv):
     pytest.register_assert_rewrite("sqlalchemy.testing.assertions")
 
     from sqlalchemy.testing.plugin.pytestplugin import *  # noqa: E402, F401, F403
+
+
+_BOOTSTRAP = {
+    "SELECT VERSION()": [("11.2.0.0378",)],
+    "SELECT SCHEMA()": [("PUBLIC",)],
+}
+
+
+class StubCursor:
+    """Stand-in for a ``pycubrid`` cursor; results come from ``conn.respond()``."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self._rows = []
+
+    def _load(self, result):
+        if result is None:
+            self.rowcount, self.lastrowid = 1, self.conn.lastrowid
+            return
+        columns, rows = result
+        if columns is None:
+            columns = [f"col{i}" for i in range(len(rows[0]))]
+        self.description = [(name, 2, None, None, None, None, None) for name in columns]
+        self.rowcount, self._rows = len(rows), list(rows)
+
+    def execute(self, operation, parameters=None):
+        self._load(self.conn.respond(operation, parameters))
+
+    def executemany(self, operation, seq_of_parameters):
+        self.conn.executed.append((operation, list(seq_of_parameters)))
+        self.rowcount = len(seq_of_parameters)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=1):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        self.conn.cursors_closed += 1
+
+
+class StubConnection:
+    """Stand-in for a ``pycubrid`` connection shared by the offline tests.
+
+    Every statement is recorded in ``executed`` as ``(operation, parameters)``.
+    ``respond()`` answers the dialect's bootstrap queries, raises ``fail`` for
+    anything else when set, serves other SELECTs from ``rows`` and returns
+    ``None`` for writes.  Tests override ``respond()`` for their own results,
+    returning ``(columns, rows)`` with ``columns=None`` for generated names.
+    """
+
+    cursor_class = StubCursor
+
+    def __init__(self, rows=((1, "alice"),)):
+        self.rows = list(rows)
+        self.executed = []
+        self.fail = None
+        self.autocommit = False
+        self.lastrowid = None
+        self.commits = 0
+        self.cursors_closed = 0
+        self.closed = False
+
+    def respond(self, operation, parameters):
+        self.executed.append((operation, parameters))
+        for prefix, rows in _BOOTSTRAP.items():
+            if operation.startswith(prefix):
+                return None, rows
+        if self.fail is not None:
+            raise self.fail
+        if operation.startswith("SELECT"):
+            return None, self.rows
+        return None
+
+    def cursor(self):
+        return self.cursor_class(self)
+
+    def set_autocommit(self, value):
+        self.autocommit = value
+
+    def get_autocommit(self):
+        return self.autocommit
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncStubCursor(StubCursor):
+    """Stand-in for a ``pycubrid.aio`` cursor."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def execute(self, operation, parameters=None):
+        self._load(await self.conn.respond(operation, parameters))
+        return self
+
+    async def executemany(self, operation, seq_of_parameters):
+        super().executemany(operation, seq_of_parameters)
+        return self
+
+    async def fetchone(self):
+        return super().fetchone()
+
+    async def fetchmany(self, size=1):
+        return super().fetchmany(size)
+
+    async def fetchall(self):
+        return super().fetchall()
+
+    async def close(self):
+        super().close()
+
+
+class AsyncStubConnection(StubConnection):
+    """Stand-in for ``pycubrid.aio.AsyncConnection``; ``respond()`` is a coroutine."""
+
+    cursor_class = AsyncStubCursor
+
+    async def respond(self, operation, parameters):
+        return super().respond(operation, parameters)
+
+    async def set_autocommit(self, value):
+        super().set_autocommit(value)
+
+    async def commit(self):
+        super().commit()
+
+    async def rollback(self):
+        pass
+
+    async def ping(self, reconnect=False):
+        return True
+
+    async def close(self):
+        super().close()
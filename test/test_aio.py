@@ -0,0 +1,504 @@
+# test/test_aio.py
+"""Offline tests for the greenlet-free async execution helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    event,
+    exc as sa_exc,
+    select,
+    text,
+)
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+pytest.importorskip("pycubrid")
+
+from sqlalchemy_cubrid.aio import (  # noqa: E402
+    BulkInsertStats,
+    FastResult,
+    async_bulk_insert,
+    fast_execute,
+    gather_queries,
+)
+from sqlalchemy_cubrid.phases import instrument_phases  # noqa: E402
+from test.conftest import AsyncStubConnection  # noqa: E402
+
+metadata = MetaData()
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(50)),
+    Column("active", Boolean),
+    Column("score", Integer, default=0),
+)
+
+
+class _Server:
+    """Answers ``SELECT users.id ... WHERE users.id = ?`` after a per-id delay."""
+
+    def __init__(self, delays=None, errors=None):
+        self.delays = delays or {}
+        self.errors = errors or {}
+        self.active = 0
+        self.peak = 0
+        self.connections = []
+        self.disposing = False
+
+    def discarded(self):
+        """Connections closed before the engine was disposed."""
+        return [conn for conn in self.connections if conn.discarded]
+
+    async def serve(self, uid):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(uid, 0))
+            if uid in self.errors:
+                raise self.errors[uid]
+        finally:
+            self.active -= 1
+
+
+class _AsyncConnection(AsyncStubConnection):
+    """Stub connection whose ``SELECT users.id`` queries are answered by a ``_Server``."""
+
+    def __init__(self, server=None):
+        super().__init__(rows=[(1, "alice", 1)])
+        self.server = server
+        self.discarded = False
+        self.write_delay = 0
+        self.lastrowid = 42
+
+    async def respond(self, operation, parameters):
+        result = await super().respond(operation, parameters)
+        if self.server is not None and operation.startswith("SELECT users.id"):
+            await self.server.serve(parameters[0])
+            return None, [tuple(parameters)]
+        if result is None:
+            await asyncio.sleep(self.write_delay)
+        return result
+
+    async def close(self):
+        self.discarded = self.server is not None and not self.server.disposing
+
+
+def _run(body, **engine_kw):
+    async def main():
+        raw = _AsyncConnection()
+
+        async def creator():
+            return raw
+
+        engine = create_async_engine("cubrid+aiopycubrid://", async_creator=creator, **engine_kw)
+        try:
+            async with engine.connect() as conn:
+                return await body(conn, raw)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def _gather(server, statements, engine_kw=None, **kwargs):
+    async def main():
+        async def creator():
+            server.connections.append(_AsyncConnection(server))
+            return server.connections[-1]
+
+        engine = create_async_engine(
+            "cubrid+aiopycubrid://", async_creator=creator, **(engine_kw or {})
+        )
+        try:
+            return await gather_queries(engine, statements, **kwargs)
+        finally:
+            server.disposing = True
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def _by_id(uid):
+    return select(users.c.id).where(users.c.id == uid)
+
+
+class TestFastExecuteSelect:
+    def test_rows_are_processed_without_greenlet(self):
+        async def body(conn, raw):
+            with patch("sqlalchemy.ext.asyncio.engine.greenlet_spawn") as spawn:
+                result = await fast_execute(
+                    conn, select(users.c.id, users.c.name, users.c.active).where(users.c.id == 5)
+                )
+            spawn.assert_not_called()
+            return result, raw
+
+        result, raw = _run(body)
+
+        assert isinstance(result, FastResult)
+        row = result.one()
+        assert row == (1, "alice", True)
+        assert row.active is True
+        assert raw.executed[-1] == (
+            "SELECT users.id, users.name, users.active \nFROM users \nWHERE users.id = ?",
+            [5],
+        )
+        assert raw.cursors_closed >= 1
+
+    def test_mappings_and_scalar(self):
+        async def body(conn, raw):
+            stmt = select(users.c.name).where(users.c.id == bindparam("uid"))
+            raw.rows = [("alice",), ("bob",)]
+            names = (await fast_execute(conn, stmt, {"uid": 1})).scalars().all()
+            raw.rows = [("carol",)]
+            mapping = (await fast_execute(conn, stmt, {"uid": 2})).mappings().one()
+            return names, mapping, raw
+
+        names, mapping, raw = _run(body)
+
+        assert names == ["alice", "bob"]
+        assert mapping == {"name": "carol"}
+        assert [params for _, params in raw.executed[-2:]] == [[1], [2]]
+
+    def test_shares_engine_compiled_cache(self):
+        async def body(conn, raw):
+            stmt = select(users.c.id).where(users.c.id == 1)
+            raw.rows = [(1,)]
+            await fast_execute(conn, stmt)
+            size = len(conn.engine.sync_engine._compiled_cache)
+            await fast_execute(conn, select(users.c.id).where(users.c.id == 2))
+            await conn.execute(select(users.c.id).where(users.c.id == 3))
+            return size, len(conn.engine.sync_engine._compiled_cache)
+
+        before, after = _run(body)
+        assert before == after
+
+
+class TestFastExecuteInsert:
+    def test_insert_joins_transaction(self):
+        async def body(conn, raw):
+            result = await fast_execute(
+                conn, users.insert(), {"id": 1, "name": "alice", "active": True, "score": 3}
+            )
+            assert conn.in_transaction()
+            await conn.commit()
+            return result, raw
+
+        result, raw = _run(body)
+
+        assert result.rowcount == 1
+        assert result.lastrowid == 42
+        assert result.keys() == []
+        assert raw.commits == 1
+        sql, params = raw.executed[-1]
+        assert sql.startswith("INSERT INTO users")
+        assert params == [1, "alice", 1, 3]
+
+    def test_python_default_falls_back(self):
+        async def body(conn, raw):
+            return await fast_execute(conn, users.insert(), {"id": 1, "name": "a", "active": None})
+
+        assert isinstance(_run(body), CursorResult)
+
+
+class TestFastExecuteFallback:
+    @pytest.mark.parametrize(
+        "stmt, params",
+        [
+            (users.update().values(name="x"), None),
+            (text("SELECT 1"), None),
+            (select(users.c.id).where(users.c.id.in_([1, 2])), None),
+            (select(users.c.id).execution_options(stream_results=False), None),
+        ],
+    )
+    def test_unsupported_statements(self, stmt, params):
+        async def body(conn, raw):
+            raw.rows = [(1,)]
+            return await fast_execute(conn, stmt, params)
+
+        assert isinstance(_run(body), CursorResult)
+
+    def test_orm_statement_falls_back(self):
+        class Base(DeclarativeBase):
+            pass
+
+        class User(Base):
+            __table__ = users
+
+        async def body(conn, raw):
+            return await fast_execute(conn, select(User))
+
+        assert isinstance(_run(body), CursorResult)
+
+    def test_event_listeners_fall_back(self):
+        seen = []
+
+        async def body(conn, raw):
+            event.listen(conn.sync_connection, "before_cursor_execute", lambda *a: seen.append(a))
+            return await fast_execute(conn, select(users.c.id))
+
+        assert isinstance(_run(body), CursorResult)
+        assert seen
+
+    def test_echo_falls_back(self):
+        async def body(conn, raw):
+            return await fast_execute(conn, select(users.c.id))
+
+        assert isinstance(_run(body, echo=True), CursorResult)
+
+    def test_statement_tracing_falls_back(self):
+        async def body(conn, raw):
+            raw.rows = [(1,)]
+            return await fast_execute(conn, select(users.c.id))
+
+        assert isinstance(_run(body, cubrid_trace_slow_threshold=60.0), CursorResult)
+
+    def test_phase_tracing_falls_back(self):
+        async def body(conn, raw):
+            instrument_phases(conn.engine)
+            raw.rows = [(1,)]
+            return await fast_execute(conn, select(users.c.id))
+
+        assert isinstance(_run(body), CursorResult)
+
+    def test_other_driver_falls_back(self):
+        async def body(conn, raw):
+            with patch(
+                "sqlalchemy_cubrid.aio.AsyncAdapt_pycubrid_connection", type("Other", (), {})
+            ):
+                return await fast_execute(conn, select(users.c.id))
+
+        assert isinstance(_run(body), CursorResult)
+
+
+class TestFastExecuteErrors:
+    def test_driver_error_is_wrapped(self):
+        async def body(conn, raw):
+            raw.fail = _driver_error("-493 Syntax error")
+            with pytest.raises(sa_exc.DBAPIError) as raised:
+                await fast_execute(conn, select(users.c.id))
+            return raised.value, conn.invalidated
+
+        error, invalidated = _run(body)
+        assert error.connection_invalidated is False
+        assert invalidated is False
+
+    def test_disconnect_invalidates(self):
+        async def body(conn, raw):
+            raw.fail = _driver_error("-21003 Broken pipe")
+            with pytest.raises(sa_exc.DBAPIError) as raised:
+                await fast_execute(conn, select(users.c.id))
+            return raised.value, conn.invalidated
+
+        error, invalidated = _run(body)
+        assert error.connection_invalidated is True
+        assert invalidated is True
+
+    def test_touches_ping_window(self):
+        async def body(conn, raw):
+            raw.rows = [(1,)]
+            await fast_execute(conn, select(users.c.id))
+            dialect = conn.dialect
+            return dialect._ping_window.is_fresh(conn.sync_connection.connection.dbapi_connection)
+
+        assert _run(body, cubrid_ping_window=30) is True
+
+
+def _driver_error(message):
+    import pycubrid
+
+    return pycubrid.OperationalError(message)
+
+
+class TestGatherQueries:
+    def test_results_in_order_with_bounded_concurrency(self):
+        server = _Server(delays={1: 0.03, 2: 0.01, 3: 0.02, 4: 0, 5: 0.01})
+        statements = [_by_id(uid) for uid in (1, 2, 3, 4)]
+        statements.append((select(users.c.id).where(users.c.id == bindparam("uid")), {"uid": 5}))
+
+        results = _gather(server, statements, max_concurrency=3)
+
+        assert [result.scalar() for result in results] == [1, 2, 3, 4, 5]
+        assert server.peak == 3
+        assert len(server.connections) == 3
+        assert server.discarded() == []
+
+    def test_empty(self):
+        assert _gather(_Server(), []) == []
+
+    def test_timeout_invalidates_connection(self):
+        server = _Server(delays={1: 5, 2: 0})
+
+        with pytest.raises(asyncio.TimeoutError):
+            _gather(server, [_by_id(1), _by_id(2)], timeout=0.05)
+
+        (discarded,) = server.discarded()
+        assert discarded.executed[-1][1] == [1]
+
+    def test_return_exceptions(self):
+        server = _Server(delays={1: 5}, errors={3: _driver_error("-493 Syntax error")})
+
+        results = _gather(
+            server, [_by_id(1), _by_id(2), _by_id(3)], timeout=0.05, return_exceptions=True
+        )
+
+        assert isinstance(results[0], asyncio.TimeoutError)
+        assert results[1].scalar() == 2
+        assert isinstance(results[2], sa_exc.DBAPIError)
+
+    def test_first_error_cancels_the_rest(self):
+        server = _Server(delays={1: 5}, errors={2: _driver_error("-493 Syntax error")})
+
+        with pytest.raises(sa_exc.DBAPIError):
+            _gather(server, [_by_id(1), _by_id(2)])
+
+        assert server.active == 0
+        (discarded,) = server.discarded()
+        assert discarded.executed[-1][1] == [1]
+
+    def test_max_concurrency_is_validated(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            _gather(_Server(), [_by_id(1)], max_concurrency=0)
+
+
+async def _source(count, pulled=None, fail_after=None):
+    for i in range(count):
+        if fail_after is not None and i == fail_after:
+            raise RuntimeError("source went away")
+        if pulled is not None:
+            pulled.append(i)
+        yield {"id": i, "name": f"n{i}", "active": True, "score": i}
+
+
+def _inserts(raw):
+    return [(sql, params) for sql, params in raw.executed if sql.startswith("INSERT")]
+
+
+class TestAsyncBulkInsert:
+    def test_batches_and_commits(self):
+        async def body(conn, raw):
+            stats = await async_bulk_insert(conn, users, _source(25), batch_size=10, commit_every=2)
+            return stats, raw
+
+        stats, raw = _run(body)
+
+        inserts = _inserts(raw)
+        assert len(inserts) == 3
+        assert [len(params) // 4 for _, params in inserts] == [10, 10, 5]
+        assert inserts[0][0].count("(?, ?, ?, ?)") == 10
+        assert raw.commits == 2
+        assert stats.snapshot() == {
+            "rows": 25,
+            "batches": 3,
+            "commits": 2,
+            "committed_rows": 25,
+            "elapsed": stats.elapsed,
+            "rows_per_second": stats.rows_per_second,
+        }
+        assert stats.rows_per_second > 0
+
+    def test_caller_owns_transaction_by_default(self):
+        async def body(conn, raw):
+            await async_bulk_insert(conn, users, _source(3))
+            return conn.in_transaction(), raw.commits
+
+        assert _run(body) == (True, 0)
+
+    def test_backpressure_bounds_rows_pulled_ahead(self):
+        pulled = []
+        ahead = []
+
+        async def body(conn, raw):
+            raw.write_delay = 0.005
+            stats = BulkInsertStats()
+
+            @event.listens_for(conn.sync_connection, "before_cursor_execute")
+            def _observe(*args):
+                ahead.append(len(pulled) - stats.rows)
+
+            await async_bulk_insert(
+                conn, users, _source(200, pulled), batch_size=10, max_inflight=2, stats=stats
+            )
+            return stats
+
+        stats = _run(body)
+
+        assert stats.rows == 200
+        # queued batches + the batch being executed + the one being filled
+        assert max(ahead) <= 10 * (2 + 2)
+
+    def test_on_duplicate_key_update_columns(self):
+        async def body(conn, raw):
+            await async_bulk_insert(
+                conn, users, _source(2), on_duplicate_key_update=["name", "score"]
+            )
+            return raw
+
+        (sql, _), *_ = _inserts(_run(body))
+        assert sql.endswith("ON DUPLICATE KEY UPDATE name = VALUES(name), score = VALUES(score)")
+
+    def test_on_duplicate_key_update_mapping(self):
+        async def body(conn, raw):
+            await async_bulk_insert(
+                conn, users, _source(1), on_duplicate_key_update={"score": users.c.score + 1}
+            )
+            return raw
+
+        (sql, _), *_ = _inserts(_run(body))
+        assert sql.endswith("ON DUPLICATE KEY UPDATE score = (users.score + ?)")
+
+    def test_source_error_keeps_committed_batches(self):
+        stats = BulkInsertStats()
+
+        async def body(conn, raw):
+            with pytest.raises(RuntimeError, match="source went away"):
+                await async_bulk_insert(
+                    conn,
+                    users,
+                    _source(30, fail_after=15),
+                    batch_size=10,
+                    commit_every=1,
+                    stats=stats,
+                )
+            return raw
+
+        raw = _run(body)
+        assert stats.committed_rows == 10
+        assert raw.commits == 1
+        assert stats.elapsed > 0
+
+    def test_insert_error_stops_producer(self):
+        pulled = []
+
+        async def body(conn, raw):
+            raw.fail = _driver_error("-670 unique constraint violation")
+            with pytest.raises(sa_exc.DBAPIError):
+                await async_bulk_insert(
+                    conn, users, _source(1000, pulled), batch_size=10, max_inflight=1
+                )
+
+        _run(body)
+        assert len(pulled) < 1000
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"batch_size": 0}, {"max_inflight": 0}, {"commit_every": 0}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        async def body(conn, raw):
+            with pytest.raises(ValueError):
+                await async_bulk_insert(conn, users, _source(1), **kwargs)
+            return True
+
+        assert _run(body)
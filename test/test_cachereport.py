@@ -0,0 +1,204 @@
+# test/test_cachereport.py
+"""Offline tests for the compiled-cache effectiveness report."""
+
+from __future__ import annotations
+
+import asyncio
+import warnings
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    literal_column,
+    select,
+    text,
+)
+
+from sqlalchemy_cubrid import insert, merge, replace
+from sqlalchemy_cubrid.cachereport import (
+    CacheReport,
+    _call_site,
+    instrument_cache,
+    uncacheable_constructs,
+)
+
+metadata = MetaData()
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+staging = Table(
+    "staging",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", query_cache_size=5)
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _merge():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return (
+            merge(users)
+            .using(staging)
+            .on(users.c.id == staging.c.id)
+            .when_matched_then_update({"name": staging.c.name})
+        )
+
+
+class TestUncacheableConstructs:
+    def test_cacheable_statements(self):
+        assert uncacheable_constructs(select(users).where(users.c.id == 1)) == []
+        assert uncacheable_constructs(replace(users).values(id=1)) == []
+        assert uncacheable_constructs(text("SELECT 1")) == []
+
+    def test_cubrid_constructs(self):
+        odku = insert(users).values(id=1).on_duplicate_key_update(name="x")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            assert uncacheable_constructs(odku) == ["OnDuplicateClause"]
+            assert uncacheable_constructs(_merge()) == ["Merge"]
+
+
+class TestAnalyze:
+    def test_repeated_statement_hits(self):
+        report = CacheReport()
+        outcomes = [
+            report.analyze(select(users).where(users.c.id.in_(ids)), site="by_ids")
+            for ids in ([1], [1, 2], [1, 2, 3])
+        ]
+        assert outcomes == ["miss", "hit", "hit"]
+        assert report.findings() == []
+
+    def test_literal_in_list_explodes(self):
+        report = CacheReport(explosion_threshold=3)
+        for n in range(1, 5):
+            ids = [literal_column(str(i)) for i in range(n)]
+            report.analyze(select(users).where(users.c.id.in_(ids)), site="by_ids")
+
+        (finding,) = report.findings()
+        assert finding.kind == "key_explosion"
+        assert finding.site == "by_ids"
+        assert "4 distinct" in finding.message
+        assert "expanding=True" in finding.suggestion
+
+    def test_formatted_text_explodes(self):
+        report = CacheReport(explosion_threshold=3)
+        for i in range(3):
+            report.analyze(text(f"SELECT * FROM users WHERE id = {i}"), site="raw")
+        (finding,) = report.findings()
+        assert "bindparams()" in finding.suggestion
+
+    def test_varying_shape_explodes(self):
+        report = CacheReport(explosion_threshold=2)
+        report.analyze(select(users.c.id), site="columns")
+        report.analyze(select(users.c.name), site="columns")
+        (finding,) = report.findings()
+        assert "lambda_stmt" in finding.suggestion
+
+    def test_uncacheable_cubrid_constructs(self):
+        report = CacheReport()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            odku = insert(users).values(id=1).on_duplicate_key_update(name="x")
+            assert report.analyze(odku, site="upsert") == "no_key"
+            report.analyze(_merge(), site="sync")
+        report.analyze(replace(users).values(id=1), site="replace")
+
+        findings = {finding.site: finding for finding in report.findings()}
+        assert set(findings) == {"upsert", "sync"}
+        assert findings["upsert"].kind == "uncacheable"
+        assert "ON DUPLICATE KEY UPDATE" in findings["upsert"].suggestion
+        assert "MERGE" in findings["sync"].suggestion
+
+    def test_default_site_is_caller(self):
+        report = CacheReport()
+        report.analyze(select(users))
+        (entry,) = report.sites()
+        assert entry["site"].startswith(__file__)
+        assert "test_default_site_is_caller" in entry["site"]
+
+    def test_sites_are_bounded(self):
+        report = CacheReport(max_sites=2, max_sql_per_site=1)
+        for site in ("a", "b", "c", "d"):
+            report.analyze(select(users.c.id), site=site)
+        report.analyze(select(users.c.name), site="a")
+        sites = {entry["site"]: entry for entry in report.sites()}
+        assert set(sites) == {"a", "b", "<other>"}
+        assert sites["<other>"]["executions"] == 2
+        assert sites["a"]["saturated"] is True
+
+    def test_reset(self):
+        report = CacheReport()
+        report.analyze(select(users), site="a")
+        report.reset()
+        assert report.snapshot()["executions"] == 0
+
+
+class TestInstrumentCache:
+    def test_hits_and_misses_per_site(self, engine):
+        report = instrument_cache(engine)
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(select(users).where(users.c.id == i))
+            conn.exec_driver_sql("SELECT 1")
+
+        snapshot = report.snapshot()
+        assert snapshot["outcomes"] == {"miss": 1, "hit": 2}
+        assert snapshot["hit_ratio"] == pytest.approx(2 / 3)
+        assert snapshot["cache"]["capacity"] == 5
+        (entry,) = snapshot["sites"]
+        assert "test_hits_and_misses_per_site" in entry["site"]
+        assert entry["statement_types"] == ["Select"]
+
+    def test_evictions(self, engine):
+        report = instrument_cache(engine)
+        statements = [select(users).where(users.c.id == literal_column(str(i))) for i in range(20)]
+        with engine.connect() as conn:
+            for stmt in statements + statements:
+                conn.execute(stmt)
+
+        snapshot = report.snapshot()
+        assert snapshot["evictions"] > 0
+        assert 0 < snapshot["eviction_rate"] <= 0.5
+        kinds = {finding.kind for finding in report.findings()}
+        assert kinds == {"key_explosion", "evictions"}
+
+    def test_caching_disabled(self, engine):
+        report = instrument_cache(engine)
+        with engine.connect().execution_options(compiled_cache=None) as conn:
+            conn.execute(select(users))
+        (finding,) = report.findings()
+        assert finding.kind == "caching_disabled"
+
+    def test_double_instrumentation_rejected(self, engine):
+        instrument_cache(engine)
+        with pytest.raises(ValueError, match="already instrumented"):
+            instrument_cache(engine)
+
+
+class TestCallSite:
+    def test_greenlet_parent_frames_are_searched(self):
+        from sqlalchemy.util import greenlet_spawn
+
+        async def caller():
+            return await greenlet_spawn(_call_site)
+
+        # _call_site() itself runs inside the greenlet with no caller frames
+        # of its own; the first frame outside SQLAlchemy is caller().
+        assert "(caller)" in asyncio.run(caller())
@@ -0,0 +1,284 @@
+# test/test_diagnostics.py
+"""Offline tests for the lock contention diagnostics."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+pytest.importorskip("pycubrid")
+
+from sqlalchemy_cubrid.diagnostics import (  # noqa: E402
+    ContentionSampler,
+    instrument_contention,
+    lock_snapshot,
+    parse_lockdb,
+    parse_tranlist,
+)
+from test.conftest import StubConnection  # noqa: E402
+
+TRANLIST = """
+Tran index   User name  Host name  Process id  Program name       Query time  Tran time  Wait for lock holder  SQL_ID         SQL Text
+-----------------------------------------------------------------------------------------------------------------------------------------
+   1(ACTIVE)    PUBLIC  app-host         1681  broker1_cub_cas_1        0.00       9.10                    -1  *** empty ***
+   2(ACTIVE)    PUBLIC  app-host         1682  broker1_cub_cas_2        3.20       3.20                     1  e5899a1b76253  update accounts set balance=balance-10 where id=7
+   3(ACTIVE)    PUBLIC  app-host         1683  broker1_cub_cas_3        1.10       1.10                  2, 1  a1b2c3d4e5f60  delete from accounts where id=7
+-----------------------------------------------------------------------------------------------------------------------------------------
+"""
+
+LOCKDB = """
+*** Lock Table Dump ***
+
+OID =  0|   623|   4
+Object type: Class = dba.accounts.
+Total mode of holders =   IX_LOCK, Total mode of waiters = NULL_LOCK.
+Num holders=  3, Num blocked-holders=  0, Num waiters=  0
+LOCK HOLDERS :
+    Tran_index =   1, Granted_mode =  IX_LOCK, Count =   1, Nsubgranules =  1
+    Tran_index =   2, Granted_mode =  IX_LOCK, Count =   1, Nsubgranules =  0
+
+OID =  0|   650|   5
+Object type: Instance of class ( 0|   623|   4) = dba.accounts.
+Total mode of holders =    X_LOCK, Total mode of waiters =    X_LOCK.
+Num holders=  1, Num blocked-holders=  0, Num waiters=  2
+LOCK HOLDERS :
+    Tran_index =   1, Granted_mode =   X_LOCK, Count =   2
+LOCK WAITERS :
+    Tran_index =   2, Blocked_mode =   X_LOCK
+                      Start_waiting_at = Fri May 22 15:43:52 2026
+                      Wait_for_secs = -1
+    Tran_index =   3, Blocked_mode =   X_LOCK
+                      Start_waiting_at = Fri May 22 15:43:54 2026
+                      Wait_for_secs = -1
+"""
+
+TRAN_COLUMNS = ("Tran_index", "State", "Isolation", "Client_db_user", "Client_host", "Client_pid")
+TRAN_ROWS = [
+    (1, "TRAN_ACTIVE", "READ COMMITTED", "PUBLIC", "app-host", 1681),
+    (2, "TRAN_ACTIVE", "READ COMMITTED", "PUBLIC", "app-host", 1682),
+    (3, "TRAN_ACTIVE", "READ COMMITTED", "PUBLIC", "app-host", 1683),
+]
+THREAD_COLUMNS = ("Index", "Tran_index", "Lockwait_blocked_mode", "Lockwait_msecs")
+THREAD_ROWS = [
+    (1, 1, None, None),
+    (2, 2, "X_LOCK", -1),
+    (3, 3, "X_LOCK", 5000),
+    (4, -1, None, None),
+]
+
+
+class _Connection(StubConnection):
+    """Stub connection answering the SHOW statements from a shared ``_Server``."""
+
+    def __init__(self, server):
+        super().__init__()
+        self.server = server
+        self.executed = server.executed
+
+    def respond(self, operation, parameters):
+        result = super().respond(operation, parameters)
+        if operation == "SHOW TRANSACTION TABLES":
+            return TRAN_COLUMNS, self.server.tran_rows
+        if operation == "SHOW THREADS":
+            return THREAD_COLUMNS, self.server.thread_rows
+        if self.server.hold is not None and operation.startswith("UPDATE"):
+            self.server.entered.set()
+            self.server.hold.wait(5)
+        return result
+
+
+class _Server:
+    def __init__(self):
+        self.executed = []
+        self.tran_rows = TRAN_ROWS
+        self.thread_rows = THREAD_ROWS
+        self.hold = None
+        self.entered = threading.Event()
+
+
+@pytest.fixture
+def server():
+    return _Server()
+
+
+@pytest.fixture
+def engine(server):
+    engine = create_engine("cubrid+pycubrid://", creator=lambda: _Connection(server))
+    yield engine
+    engine.dispose()
+
+
+class TestParsers:
+    def test_tranlist(self):
+        transactions = parse_tranlist(TRANLIST)
+        assert sorted(transactions) == [1, 2, 3]
+        idle, waiting, chained = transactions[1], transactions[2], transactions[3]
+        assert idle.sql is None and idle.waits_for == ()
+        assert idle.tran_time_s == pytest.approx(9.1)
+        assert waiting.sql == "update accounts set balance=balance-10 where id=7"
+        assert waiting.sql_id == "e5899a1b76253"
+        assert waiting.fingerprint == "update accounts set balance=balance-? where id=?"
+        assert waiting.program == "broker1_cub_cas_2" and waiting.pid == 1682
+        assert chained.waits_for == (2, 1)
+
+    def test_lockdb(self):
+        holders, waiters = parse_lockdb(LOCKDB)
+        assert [(h.tran_index, h.mode, h.oid) for h in holders] == [
+            (1, "IX_LOCK", "0|623|4"),
+            (2, "IX_LOCK", "0|623|4"),
+            (1, "X_LOCK", "0|650|5"),
+        ]
+        assert holders[-1].count == 2
+        assert {holder.table for holder in holders} == {"dba.accounts"}
+        first, second = waiters
+        assert (first.tran_index, first.mode, first.blockers) == (2, "X_LOCK", (1,))
+        assert first.since == "Fri May 22 15:43:52 2026"
+        assert second.table == "dba.accounts" and second.oid == "0|650|5"
+
+    def test_blocked_holder_is_holder_and_waiter(self):
+        holders, waiters = parse_lockdb(
+            "OID = 0| 1| 2\nObject type: Class = dba.t.\n"
+            "    Tran_index = 4, Granted_mode = S_LOCK, Count = 1, Blocked_mode = X_LOCK\n"
+            "    Tran_index = 5, Granted_mode = S_LOCK, Count = 1\n"
+        )
+        assert [holder.tran_index for holder in holders] == [4, 5]
+        (waiter,) = waiters
+        assert (waiter.tran_index, waiter.mode, waiter.blockers) == (4, "X_LOCK", (5,))
+
+
+class TestLockSnapshot:
+    def test_server_views_only(self, engine, server):
+        with engine.connect() as conn:
+            snapshot = lock_snapshot(conn)
+
+        assert [op for op, _ in server.executed[-2:]] == ["SHOW TRANSACTION TABLES", "SHOW THREADS"]
+        assert sorted(snapshot.transactions) == [1, 2, 3]
+        assert snapshot.transactions[1].isolation == "READ COMMITTED"
+        assert [(w.tran_index, w.mode, w.timeout_ms) for w in snapshot.waiters] == [
+            (2, "X_LOCK", -1),
+            (3, "X_LOCK", 5000),
+        ]
+        # Without tranlist/lockdb the server does not say who holds the lock.
+        assert snapshot.holders == [] and snapshot.blocking() == []
+
+    def test_with_tranlist_and_lockdb(self, engine):
+        with engine.connect() as conn:
+            snapshot = lock_snapshot(conn, tranlist=TRANLIST, lockdb=LOCKDB)
+
+        assert snapshot.blocking() == [(1, 2), (1, 3), (2, 3)]
+        assert snapshot.root_blockers() == [1]
+        waiter = snapshot.waiters[0]
+        assert waiter.table == "dba.accounts" and waiter.since.startswith("Fri May 22")
+        assert waiter.transaction.sql.startswith("update accounts")
+        assert waiter.transaction.isolation == "READ COMMITTED"
+        # Only locks someone waits for are reported as held.
+        assert [(h.tran_index, h.mode) for h in snapshot.holders] == [(1, "X_LOCK"), (2, None)]
+
+        data = snapshot.to_dict()
+        assert data["blocking"] == [[1, 2], [1, 3], [2, 3]]
+        assert data["waiters"][0]["fingerprint"] == (
+            "update accounts set balance=balance-? where id=?"
+        )
+
+    def test_no_contention(self, engine, server):
+        server.thread_rows = [(1, 1, "NULL_LOCK", None)]
+        with engine.connect() as conn:
+            snapshot = lock_snapshot(conn)
+        assert snapshot.waiters == [] and snapshot.root_blockers() == []
+
+
+class TestContentionSampler:
+    def test_hotspots_and_stalled_statements(self, engine, server, caplog):
+        sampler = instrument_contention(
+            engine, start=False, min_wait=0.0, tranlist=lambda: TRANLIST, lockdb=lambda: LOCKDB
+        )
+        server.hold = threading.Event()
+        worker = threading.Thread(
+            target=lambda: engine.connect().exec_driver_sql("UPDATE accounts SET balance = 0")
+        )
+        worker.start()
+        try:
+            assert server.entered.wait(5)
+            with caplog.at_level(logging.WARNING, "sqlalchemy_cubrid.diagnostics"):
+                snapshot = sampler.sample()
+        finally:
+            server.hold.set()
+            worker.join()
+
+        assert len(snapshot.waiters) == 2
+        assert "transaction 2 requests X_LOCK on dba.accounts, blocked by 1" in caplog.text
+        assert "1 local statement(s) in flight" in caplog.text
+        spots = sampler.hotspots()
+        assert {(s["waiter"], s["blocker"]) for s in spots} == {
+            ("update accounts set balance=balance-? where id=?", None),
+            ("delete from accounts where id=?", "update accounts set balance=balance-? where id=?"),
+            ("delete from accounts where id=?", None),
+        }
+        (stalled,) = sampler.stalled()
+        assert stalled["fingerprint"] == "UPDATE accounts SET balance = ?"
+        # The sampler's own SHOW statements are not tracked.
+        assert sampler.inflight() == []
+
+        data = sampler.snapshot()
+        assert (data["samples"], data["contended_samples"]) == (1, 1)
+        sampler.reset()
+        assert sampler.hotspots() == [] and sampler.snapshot()["samples"] == 0
+
+    def test_uncontended_samples(self, engine, server):
+        server.thread_rows = []
+        sampler = instrument_contention(engine, start=False)
+        sampler.sample()
+        assert sampler.snapshot()["contended_samples"] == 0
+
+    def test_background_thread(self, engine):
+        sampler = instrument_contention(engine, interval=0.01, log_level=logging.DEBUG)
+        try:
+            deadline = time.monotonic() + 5
+            while sampler.samples < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+        assert sampler.samples >= 2
+        assert sampler.hotspots()[0]["samples"] >= 2
+        with pytest.raises(RuntimeError, match="already running"):
+            sampler.start()
+            sampler.start()
+        sampler.stop()
+
+    def test_errors_are_counted(self, engine):
+        sampler = instrument_contention(engine, interval=0.01, tranlist=lambda: 1 / 0)
+        try:
+            deadline = time.monotonic() + 5
+            while not sampler.errors and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+        assert sampler.errors >= 1
+
+    def test_instrumentation_checks(self, engine):
+        instrument_contention(engine, start=False)
+        with pytest.raises(ValueError, match="already instrumented"):
+            instrument_contention(engine, start=False)
+        with pytest.raises(RuntimeError, match="not attached"):
+            ContentionSampler().sample()
+        with pytest.raises(ValueError, match="interval"):
+            ContentionSampler(interval=0)
+
+    def test_async_engine_needs_sample_engine(self, engine):
+        async_engine = create_async_engine("cubrid+aiopycubrid://")
+        with pytest.raises(ValueError, match="sample_engine"):
+            instrument_contention(async_engine, start=False)
+        sampler = instrument_contention(async_engine, sample_engine=engine, start=False)
+        assert len(sampler.sample().waiters) == 2
+
+    def test_sample_on_given_connection(self, engine):
+        sampler = ContentionSampler()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            snapshot = sampler.sample(conn)
+        assert len(snapshot.waiters) == 2
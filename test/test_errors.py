@@ -0,0 +1,180 @@
+# test/test_errors.py
+"""Offline tests for CUBRID error classification."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import exc as sa_exc
+
+from sqlalchemy_cubrid.dialect import CubridDialect, _dbapi_error_classes
+from sqlalchemy_cubrid.errors import (
+    ERROR_CODE_CATEGORIES,
+    ErrorCategory,
+    classify_error,
+    error_code,
+)
+
+
+class Error(Exception):
+    pass
+
+
+class TypedError(Error):
+    """Mimics pycubrid's ``DatabaseError`` with ``errno``/``code``."""
+
+    def __init__(self, msg: str = "", code: int = 0, errno: int | None = None) -> None:
+        super().__init__(msg)
+        self.code = code
+        self.errno = errno
+
+
+@pytest.fixture()
+def dialect():
+    dialect = CubridDialect()
+    dialect.dbapi = MagicMock(Error=Error)
+    return dialect
+
+
+class TestErrorCode:
+    def test_errno_attribute_wins(self):
+        assert error_code(TypedError("-21003 text", code=-1, errno=-670)) == -670
+
+    def test_code_attribute(self):
+        assert error_code(TypedError("text", code=-72)) == -72
+
+    def test_zero_attributes_fall_back_to_args(self):
+        assert error_code(TypedError("-76 lock", code=0, errno=None)) == -76
+
+    def test_non_int_attribute_ignored(self):
+        exc = Exception("-73 timeout")
+        exc.errno = "E1"  # type: ignore[attr-defined]
+        assert error_code(exc) == -73
+
+    def test_no_code(self):
+        assert error_code(Exception("plain")) is None
+
+
+class TestClassifyError:
+    @pytest.mark.parametrize(
+        "code, category",
+        [
+            (-72, ErrorCategory.DEADLOCK),
+            (-966, ErrorCategory.DEADLOCK),
+            (-73, ErrorCategory.LOCK_TIMEOUT),
+            (-76, ErrorCategory.LOCK_TIMEOUT),
+            (-670, ErrorCategory.UNIQUE_VIOLATION),
+            (-886, ErrorCategory.UNIQUE_VIOLATION),
+            (-21003, ErrorCategory.DISCONNECT),
+            (-671, ErrorCategory.DISCONNECT),
+        ],
+    )
+    def test_by_code(self, code, category):
+        assert classify_error(Error(code)) is category
+        assert classify_error(TypedError("no hint", errno=code)) is category
+
+    @pytest.mark.parametrize(
+        "message, category",
+        [
+            ("Broken pipe", ErrorCategory.DISCONNECT),
+            ("A Deadlock cycle is detected", ErrorCategory.DEADLOCK),
+            (
+                "Your transaction (index 3) timed out waiting on X_LOCK lock",
+                ErrorCategory.LOCK_TIMEOUT,
+            ),
+            ("unique constraint violation on idx", ErrorCategory.UNIQUE_VIOLATION),
+            ("Broker job queue is full", ErrorCategory.BROKER_BUSY),
+        ],
+    )
+    def test_by_message(self, message, category):
+        assert classify_error(Error(message)) is category
+
+    def test_code_takes_precedence_over_message(self):
+        assert classify_error(Error("-670 connection reset")) is ErrorCategory.UNIQUE_VIOLATION
+
+    def test_unknown_code_falls_back_to_message(self):
+        assert classify_error(Error("-493 deadlock in parser")) is ErrorCategory.DEADLOCK
+
+    def test_disconnect_phrase_wins(self):
+        message = "Server down: transaction unilaterally aborted, connection reset"
+        assert classify_error(Error(message)) is ErrorCategory.DISCONNECT
+
+    def test_unclassified(self):
+        assert classify_error(Error("-493 Syntax error")) is None
+
+    def test_unwraps_dbapi_error(self):
+        wrapped = sa_exc.DBAPIError("SELECT 1", None, Error(-72))
+        assert classify_error(wrapped) is ErrorCategory.DEADLOCK
+
+    def test_invalidated_wrapper_is_disconnect(self):
+        wrapped = sa_exc.DBAPIError("SELECT 1", None, Error(-670), connection_invalidated=True)
+        assert classify_error(wrapped) is ErrorCategory.DISCONNECT
+
+    def test_wrapper_without_orig(self):
+        wrapped = sa_exc.DBAPIError("SELECT 1", None, Error("x"))
+        wrapped.orig = None
+        assert classify_error(wrapped) is None
+
+    def test_table_is_read_only(self):
+        with pytest.raises(TypeError):
+            ERROR_CODE_CATEGORIES[-1] = ErrorCategory.DEADLOCK  # type: ignore[index]
+
+    def test_category_values_are_strings(self):
+        assert ErrorCategory.LOCK_TIMEOUT == "lock_timeout"
+
+
+class TestDialectClassifyError:
+    def test_driver_error(self, dialect):
+        assert dialect.classify_error(Error(-73)) is ErrorCategory.LOCK_TIMEOUT
+
+    def test_foreign_exception_is_none(self, dialect):
+        assert dialect.classify_error(RuntimeError("deadlock")) is None
+
+    def test_unwraps_dbapi_error(self, dialect):
+        wrapped = sa_exc.DBAPIError("UPDATE t", None, Error(-966))
+        assert dialect.classify_error(wrapped) is ErrorCategory.DEADLOCK
+
+    def test_invalidated_wrapper(self, dialect):
+        wrapped = sa_exc.DBAPIError("UPDATE t", None, Error("x"), connection_invalidated=True)
+        assert dialect.classify_error(wrapped) is ErrorCategory.DISCONNECT
+
+    def test_wrapper_without_orig(self, dialect):
+        wrapped = sa_exc.DBAPIError("UPDATE t", None, Error("x"))
+        wrapped.orig = None
+        assert dialect.classify_error(wrapped) is None
+
+    def test_is_disconnect_only_for_disconnects(self, dialect):
+        assert dialect.is_disconnect(Error(-671), None, None) is True
+        assert dialect.is_disconnect(Error(-72), None, None) is False
+        message = "Server down: transaction unilaterally aborted, connection reset"
+        assert dialect.is_disconnect(Error(message), None, None) is True
+
+    def test_dbapi_imported_once_without_engine(self):
+        class _Dialect(CubridDialect):
+            pass
+
+        fake_dbapi = MagicMock(Error=Error)
+        with patch.object(_Dialect, "import_dbapi", return_value=fake_dbapi) as mock_import:
+            dialect = _Dialect()
+            for _ in range(3):
+                assert dialect.classify_error(Error("broken pipe")) is ErrorCategory.DISCONNECT
+        mock_import.assert_called_once_with()
+        _dbapi_error_classes.pop(_Dialect, None)
+
+    def test_missing_driver_classifies_nothing(self):
+        class _Dialect(CubridDialect):
+            pass
+
+        with patch.object(_Dialect, "import_dbapi", side_effect=ImportError):
+            dialect = _Dialect()
+            assert dialect.classify_error(Error("broken pipe")) is None
+            assert dialect.classify_error(Error("broken pipe")) is None
+        _dbapi_error_classes.pop(_Dialect, None)
+
+    def test_pycubrid_typed_exception(self):
+        pycubrid = pytest.importorskip("pycubrid")
+        dialect = CubridDialect()
+        dialect.dbapi = pycubrid
+        exc = pycubrid.IntegrityError("duplicate", errno=-670)
+        assert dialect.classify_error(exc) is ErrorCategory.UNIQUE_VIOLATION
@@ -0,0 +1,192 @@
+# test/test_jsoncodec.py
+"""Offline tests for the pluggable JSON codecs and lazy JSON values."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import sys
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, null, select
+
+from sqlalchemy_cubrid.dialect import CubridDialect
+from sqlalchemy_cubrid.jsoncodec import JSON_CODECS, LazyJSON, get_json_codec
+from sqlalchemy_cubrid.types import JSON
+from test.conftest import StubConnection
+
+metadata = MetaData()
+events = Table(
+    "events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("payload", JSON),
+)
+
+
+def _processors(type_=None, **kwargs):
+    dialect = CubridDialect(**kwargs)
+    type_ = type_ or JSON()
+    return type_.bind_processor(dialect), type_.result_processor(dialect, None)
+
+
+class TestGetJsonCodec:
+    def test_stdlib(self):
+        codec = get_json_codec("stdlib")
+        assert codec.dumps({"a": [1, 2]}) == '{"a": [1, 2]}'
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+        assert repr(codec) == "JsonCodec('stdlib')"
+
+    def test_orjson(self):
+        pytest.importorskip("orjson")
+        codec = get_json_codec("orjson")
+        assert codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_msgspec_missing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        with pytest.raises(ImportError, match=r"sqlalchemy-cubrid\[msgspec\]"):
+            get_json_codec("msgspec")
+
+    def test_msgspec(self):
+        pytest.importorskip("msgspec")
+        codec = get_json_codec("msgspec")
+        assert codec.loads(codec.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="unknown cubrid_json_codec 'ujson'"):
+            get_json_codec("ujson")
+        assert JSON_CODECS == ("stdlib", "orjson", "msgspec")
+
+    def test_callables(self):
+        codec = get_json_codec(serializer=str)
+        assert (codec.name, codec.dumps, codec.loads) == ("custom", str, json.loads)
+        with pytest.raises(ValueError, match="cannot be combined"):
+            get_json_codec("stdlib", deserializer=json.loads)
+
+
+class TestProcessors:
+    def test_default_uses_generic_processors(self):
+        dialect = CubridDialect()
+        assert dialect._json_codec is None
+        bind, result = _processors()
+        assert bind({"a": 1}) == '{"a": 1}'
+        assert result('{"a": 1}') == {"a": 1}
+
+    @pytest.mark.parametrize("name", ["stdlib", "orjson"])
+    def test_codec_round_trip(self, name):
+        pytest.importorskip(name if name != "stdlib" else "json")
+        bind, result = _processors(cubrid_json_codec=name)
+        assert json.loads(bind({"a": [1, None]})) == {"a": [1, None]}
+        assert result('{"a": [1, null]}') == {"a": [1, None]}
+        assert result(b'{"a": 2}') == {"a": 2}
+        assert result(None) is None
+
+    def test_nulls(self):
+        bind, _ = _processors(cubrid_json_codec="stdlib")
+        assert bind(None) == "null"
+        assert bind(JSON.NULL) == "null"
+        assert bind(null()) is None
+        bind, _ = _processors(JSON(none_as_null=True), cubrid_json_codec="stdlib")
+        assert bind(None) is None
+
+    def test_serializer_with_codec_rejected(self):
+        with pytest.raises(ValueError, match="cannot be combined"):
+            CubridDialect(cubrid_json_codec="stdlib", json_serializer=json.dumps)
+
+
+class TestLazyJSON:
+    def test_decodes_once_on_access(self):
+        calls = []
+
+        def loads(raw):
+            calls.append(raw)
+            return json.loads(raw)
+
+        value = LazyJSON('{"type": "signup", "tags": ["a"]}', loads)
+        assert repr(value) == """LazyJSON('{"type": "signup", "tags": ["a"]}')"""
+        assert not value.decoded and calls == []
+        assert value["type"] == "signup"
+        assert value.get("missing") is None
+        assert "tags" in value and len(value) == 2 and sorted(value) == ["tags", "type"]
+        assert value == {"type": "signup", "tags": ["a"]}
+        assert value == LazyJSON('{"type": "signup", "tags": ["a"]}', json.loads)
+        assert bool(value) and value.decoded and len(calls) == 1
+        assert repr(value).startswith("LazyJSON(value=")
+        with pytest.raises(TypeError):
+            hash(value)
+
+    def test_copy(self):
+        value = LazyJSON('{"tags": ["a"]}', json.loads)
+        shallow = copy.copy(value)
+        assert shallow.raw == value.raw and not shallow.decoded
+        assert value["tags"] == ["a"]
+        shallow = copy.copy(value)
+        assert shallow.decoded and shallow.value is value.value
+        deep = copy.deepcopy(value)
+        assert deep == value and deep.value is not value.value
+        assert copy.deepcopy(LazyJSON("[1]", json.loads)).decoded is False
+
+    def test_pickle_round_trip(self):
+        value = LazyJSON(b'{"tags": ["a"]}', lambda raw: json.loads(raw))
+        restored = pickle.loads(pickle.dumps(value))
+        assert restored.raw == b'{"tags": ["a"]}'
+        assert restored.decoded and restored == {"tags": ["a"]}
+
+    def test_private_names_not_forwarded(self):
+        value = LazyJSON("{}", json.loads)
+        with pytest.raises(AttributeError):
+            value.__setstate__
+        assert not value.decoded
+
+    def test_lazy_result_processor(self):
+        bind, result = _processors(cubrid_json_lazy=True)
+        value = result(b'{"a": 1}')
+        assert isinstance(value, LazyJSON) and value.raw == b'{"a": 1}'
+        assert value.value == {"a": 1}
+        assert result(None) is None
+        # Undecoded values are bound as the original text.
+        assert bind(result(b'{"b":  2}')) == '{"b":  2}'
+        assert bind(result('{"b":  2}')) == '{"b":  2}'
+        assert bind(value) == '{"a": 1}'
+
+    def test_lazy_with_custom_deserializer(self):
+        dialect = CubridDialect(cubrid_json_lazy=True, json_deserializer=lambda raw: "custom")
+        assert dialect._json_codec.name == "custom"
+        value = JSON().result_processor(dialect, None)("{}")
+        assert value.value == "custom"
+
+
+class TestEngineOption:
+    @pytest.fixture
+    def make_engine(self):
+        engines = []
+
+        def make(**kwargs):
+            raw = StubConnection(rows=[(1, b'{"type": "signup"}'), (2, '{"type": "login"}')])
+            engine = create_engine("cubrid+pycubrid://", creator=lambda: raw, **kwargs)
+            engine.raw = raw
+            engines.append(engine)
+            return engine
+
+        yield make
+        for engine in engines:
+            engine.dispose()
+
+    def test_codec_engine_option(self, make_engine):
+        engine = make_engine(cubrid_json_codec="stdlib")
+        assert engine.dialect._json_codec.name == "stdlib"
+        with engine.connect() as conn:
+            rows = conn.execute(select(events)).all()
+            conn.execute(insert(events), {"id": 3, "payload": {"type": "logout"}})
+        assert [row.payload for row in rows] == [{"type": "signup"}, {"type": "login"}]
+        assert '{"type": "logout"}' in list(engine.raw.executed[-1][1])
+
+    def test_lazy_engine_option(self, make_engine):
+        engine = make_engine(cubrid_json_lazy=True)
+        with engine.connect() as conn:
+            first, second = conn.execute(select(events)).all()
+        assert isinstance(first.payload, LazyJSON) and not first.payload.decoded
+        assert first.payload.raw == b'{"type": "signup"}'
+        assert second.payload["type"] == "login"
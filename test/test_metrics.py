@@ -0,0 +1,252 @@
+# test/test_metrics.py
+"""Offline tests for the pool metrics facility."""
+
+from __future__ import annotations
+
+import gc
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event, exc as sa_exc, text
+from sqlalchemy.pool import QueuePool
+
+from sqlalchemy_cubrid.dialect import CubridDialect
+from sqlalchemy_cubrid.metrics import CubridMetrics, Histogram, instrument_engine
+from sqlalchemy_cubrid.pycubrid_dialect import PyCubridDialect
+
+
+class _Conn:
+    """Weak-referenceable stand-in for a DBAPI connection."""
+
+
+def _sqlite_engine(**kwargs):
+    kwargs.setdefault("poolclass", QueuePool)
+    return create_engine("sqlite://", **kwargs)
+
+
+def _broker(metrics):
+    (broker,) = metrics.snapshot()["brokers"].values()
+    return broker
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        assert histogram.snapshot() == {
+            "count": 4,
+            "sum": pytest.approx(3.65),
+            "buckets": {"0.1": 2, "1.0": 3, "+Inf": 4},
+        }
+
+
+class TestCubridMetrics:
+    def test_counters_by_broker_and_label(self):
+        metrics = CubridMetrics()
+        metrics.inc("invalidations_total", "db1:33000", "disconnect")
+        metrics.inc("invalidations_total", "db1:33000", "disconnect")
+        metrics.inc("invalidations_total", "db2:33000", "explicit")
+        metrics.inc("disconnects_total", "db1:33000")
+
+        assert metrics.snapshot() == {
+            "brokers": {
+                "db1:33000": {
+                    "disconnects_total": 1,
+                    "invalidations_total": {"disconnect": 2},
+                },
+                "db2:33000": {"invalidations_total": {"explicit": 1}},
+            }
+        }
+
+    def test_prometheus_text(self):
+        metrics = CubridMetrics(latency_buckets=(0.01,))
+        metrics.inc("pings_total", 'db"1:33000', "ok")
+        metrics.observe("ping_seconds", 'db"1:33000', 0.002)
+
+        lines = metrics.to_prometheus(prefix="app").splitlines()
+
+        assert "# TYPE app_pings_total counter" in lines
+        assert 'app_pings_total{broker="db\\"1:33000",outcome="ok"} 1' in lines
+        assert "# TYPE app_ping_seconds histogram" in lines
+        assert 'app_ping_seconds_bucket{broker="db\\"1:33000",le="0.01"} 1' in lines
+        assert 'app_ping_seconds_bucket{broker="db\\"1:33000",le="+Inf"} 1' in lines
+        assert 'app_ping_seconds_sum{broker="db\\"1:33000"} 0.002' in lines
+        assert 'app_ping_seconds_count{broker="db\\"1:33000"} 1' in lines
+
+    def test_empty_export(self):
+        assert CubridMetrics().to_prometheus() == ""
+        assert CubridMetrics().snapshot() == {"brokers": {}}
+
+    def test_reset(self):
+        metrics = CubridMetrics()
+        metrics.inc("disconnects_total", "db1:33000")
+        metrics.observe("checkout_seconds", "db1:33000", 0.1)
+        metrics.reset()
+        assert metrics.snapshot() == {"brokers": {}}
+
+
+class TestInstrumentEngine:
+    def test_checkout_and_pool_gauges(self):
+        engine = _sqlite_engine(pool_size=3)
+        metrics = instrument_engine(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            broker = _broker(metrics)
+            assert broker["pool_checked_out"] == 1
+        with engine.connect():
+            pass
+
+        broker = _broker(metrics)
+        assert broker["connections_opened_total"] == 1
+        assert broker["checkout_seconds"]["count"] == 2
+        assert broker["pool_size"] == 3
+        assert broker["pool_checked_out"] == 0
+        assert broker["pool_checked_in"] == 1
+        assert broker["pool_overflow"] == 0
+        assert "sqlalchemy_cubrid_pool_size" in metrics.to_prometheus()
+
+    def test_broker_label_from_url(self):
+        engine = create_engine("cubrid+pycubrid://dba@db1/demodb")
+        metrics = instrument_engine(engine)
+        metrics.inc("disconnects_total", "db1:33000")
+        assert list(metrics.snapshot()["brokers"]) == ["db1:33000"]
+
+    def test_checkout_timeout(self):
+        engine = _sqlite_engine(pool_size=1, max_overflow=0, pool_timeout=0.01)
+        metrics = instrument_engine(engine)
+
+        with engine.connect():
+            with pytest.raises(sa_exc.TimeoutError):
+                engine.connect()
+
+        assert _broker(metrics)["checkout_timeouts_total"] == 1
+
+    def test_invalidation_causes_and_connection_age(self):
+        engine = _sqlite_engine()
+        metrics = instrument_engine(engine)
+
+        with engine.connect() as conn:
+            conn.invalidate()
+        with engine.connect() as conn:
+            conn.connection.invalidate(soft=True)
+        with engine.connect() as conn:
+            conn.connection._connection_record.invalidate(RuntimeError("broken pipe"))
+
+        broker = _broker(metrics)
+        assert broker["invalidations_total"] == {"explicit": 1, "soft": 1, "disconnect": 1}
+        assert broker["connections_closed_total"] == 3
+        assert broker["connection_age_seconds"]["count"] == 3
+
+    def test_statement_errors_by_category(self):
+        engine = _sqlite_engine()
+
+        @event.listens_for(engine, "handle_error")
+        def _fake_disconnect(context):
+            if "boom" in str(context.statement):
+                context.is_disconnect = True
+
+        metrics = instrument_engine(engine)
+
+        with engine.connect() as conn:
+            with pytest.raises(sa_exc.DBAPIError):
+                conn.execute(text("SELECT * FROM missing"))
+        with engine.connect() as conn:
+            with pytest.raises(sa_exc.DBAPIError):
+                conn.execute(text("SELECT boom FROM missing"))
+
+        broker = _broker(metrics)
+        assert broker["errors_total"] == {"other": 2}
+        assert broker["disconnects_total"] == 1
+
+    def test_non_driver_errors_are_ignored(self):
+        engine = _sqlite_engine()
+        metrics = instrument_engine(engine)
+
+        with engine.connect() as conn:
+            with pytest.raises(sa_exc.StatementError):
+                conn.execute(text("SELECT :x"), {"y": 1})
+
+        assert "errors_total" not in _broker(metrics)
+
+    def test_survives_dispose(self):
+        engine = _sqlite_engine()
+        metrics = instrument_engine(engine)
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert _broker(metrics)["connections_opened_total"] == 1
+
+    def test_option_engine_checkouts_are_timed(self):
+        engine = _sqlite_engine()
+        metrics = instrument_engine(engine)
+        with engine.execution_options(isolation_level="AUTOCOMMIT").connect():
+            pass
+        engine.dispose()
+        with engine.execution_options(logging_token="x").connect():
+            pass
+        engine.pool.connect().close()
+        assert _broker(metrics)["checkout_seconds"]["count"] == 3
+
+    def test_async_engine_is_unwrapped(self):
+        async_engine = MagicMock()
+        async_engine.sync_engine = _sqlite_engine()
+        metrics = instrument_engine(async_engine)
+        with async_engine.sync_engine.connect():
+            pass
+        assert _broker(metrics)["checkout_seconds"]["count"] == 1
+
+    def test_twice_is_rejected(self):
+        engine = _sqlite_engine()
+        instrument_engine(engine)
+        with pytest.raises(ValueError, match="already instrumented"):
+            instrument_engine(engine)
+
+    def test_shared_metrics_across_engines(self):
+        metrics = CubridMetrics()
+        first = create_engine("cubrid+pycubrid://dba@db1:33000/demodb")
+        second = create_engine("cubrid+pycubrid://dba@db2:33001/demodb")
+        assert instrument_engine(first, metrics) is metrics
+        assert instrument_engine(second, metrics) is metrics
+        assert set(metrics.snapshot()["brokers"]) == {"db1:33000", "db2:33001"}
+
+    def test_collected_engine_is_skipped(self):
+        metrics = instrument_engine(_sqlite_engine())
+        gc.collect()
+        assert metrics.snapshot() == {"brokers": {}}
+
+
+class TestPingObserver:
+    def test_ping_outcomes(self):
+        engine = create_engine("cubrid+pycubrid://dba@db1:33000/demodb", cubrid_ping_window=30)
+        metrics = instrument_engine(engine)
+        dialect = engine.dialect
+        conn = _Conn()
+        conn.ping = MagicMock(side_effect=[False, True])
+
+        assert dialect.do_ping(conn) is False
+        assert dialect.do_ping(conn) is True
+        assert dialect.do_ping(conn) is True
+
+        broker = metrics.snapshot()["brokers"]["db1:33000"]
+        assert broker["pings_total"] == {"failed": 1, "ok": 1, "skipped": 1}
+        assert broker["ping_seconds"]["count"] == 2
+
+    def test_ping_error_is_reraised(self):
+        dialect = PyCubridDialect()
+        observer = dialect._ping_observer = MagicMock()
+        conn = _Conn()
+        conn.ping = MagicMock(side_effect=OSError("reset"))
+
+        with pytest.raises(OSError):
+            dialect.do_ping(conn)
+        assert observer.call_args.args[0] == "error"
+
+    def test_no_observer_by_default(self):
+        dialect = CubridDialect()
+        assert dialect._ping_observer is None
+        conn = MagicMock()
+        with patch("sqlalchemy_cubrid.dialect.time.perf_counter") as clock:
+            assert dialect.do_ping(conn) is True
+        clock.assert_not_called()
@@ -54,6 +54,20 @@ class TestModuleImports:
             "sqlalchemy_cubrid.alembic_impl",
             "sqlalchemy_cubrid.trace",
             "sqlalchemy_cubrid.requirements",
+            "sqlalchemy_cubrid.pool",
+            "sqlalchemy_cubrid.errors",
+            "sqlalchemy_cubrid.retry",
+            "sqlalchemy_cubrid.metrics",
+            "sqlalchemy_cubrid.aio",
+            "sqlalchemy_cubrid.slowlog",
+            "sqlalchemy_cubrid.plancheck",
+            "sqlalchemy_cubrid.pytest_plugin",
+            "sqlalchemy_cubrid.profiling",
+            "sqlalchemy_cubrid.cachereport",
+            "sqlalchemy_cubrid.phases",
+            "sqlalchemy_cubrid.diagnostics",
+            "sqlalchemy_cubrid.plancache",
+            "sqlalchemy_cubrid.jsoncodec",
         ],
     )
     def test_all_modules_importable(self, module_name: str):
@@ -0,0 +1,187 @@
+# test/test_phases.py
+"""Offline tests for the per-phase latency tracer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.types import TypeDecorator
+
+pytest.importorskip("pycubrid")
+
+from sqlalchemy_cubrid.phases import (  # noqa: E402
+    PHASES,
+    OtlpJsonExporter,
+    PhaseTracer,
+    instrument_phases,
+)
+from test.conftest import AsyncStubConnection, StubConnection, StubCursor  # noqa: E402
+
+
+class Upper(TypeDecorator):
+    impl = String(50)
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return value.upper()
+
+
+metadata = MetaData()
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", Upper()),
+)
+
+
+@pytest.fixture
+def engine():
+    raw = StubConnection(rows=[(1, "alice"), (2, "bob")])
+    engine = create_engine("cubrid+pycubrid://", creator=lambda: raw)
+    engine.raw = raw
+    yield engine
+    engine.dispose()
+
+
+def _phases(entry):
+    return {phase: data["count"] for phase, data in entry["phases"].items() if data["count"]}
+
+
+class TestInstrumentPhases:
+    def test_select_phases(self, engine):
+        spans = []
+        tracer = instrument_phases(engine, exporter=spans.extend)
+        with engine.connect() as conn:
+            for uid in range(3):
+                assert conn.execute(select(users).where(users.c.id == uid)).all() == [
+                    (1, "ALICE"),
+                    (2, "BOB"),
+                ]
+
+        (entry,) = [e for e in tracer.snapshot() if e["fingerprint"].startswith("SELECT users")]
+        assert entry["fingerprint"] == ("SELECT users.id, users.name FROM users WHERE users.id = ?")
+        assert entry["count"] == 3
+        assert _phases(entry) == dict.fromkeys(PHASES + ("total",), 3)
+        assert entry["phases"]["hydrate"]["total_s"] > 0
+
+        statement = [s for s in spans if s["name"] == "SELECT" and s["parentSpanId"] == ""][-1]
+        children = [s for s in spans if s["parentSpanId"] == statement["spanId"]]
+        assert [s["name"] for s in children] == [f"cubrid.{phase}" for phase in PHASES]
+        attributes = {a["key"]: a["value"] for a in statement["attributes"]}
+        assert attributes["db.system.name"] == {"stringValue": "cubrid"}
+        assert attributes["db.response.returned_rows"] == {"intValue": "2"}
+        assert statement["kind"] == 3 and statement["status"] == {"code": 1}
+        for child in children:
+            assert child["traceId"] == statement["traceId"]
+            assert int(statement["startTimeUnixNano"]) <= int(child["startTimeUnixNano"])
+            assert int(child["endTimeUnixNano"]) <= int(statement["endTimeUnixNano"])
+
+    def test_driver_sql_and_executemany(self, engine):
+        tracer = instrument_phases(engine)
+        with engine.connect() as conn:
+            conn.exec_driver_sql("UPDATE users SET name = 'x'")
+            conn.execute(users.insert(), [{"id": 1}, {"id": 2}])
+
+        entries = {entry["fingerprint"]: entry for entry in tracer.snapshot()}
+        assert _phases(entries["UPDATE users SET name = ?"]) == {"execute": 1, "total": 1}
+        insert = entries["INSERT INTO users (id) VALUES (?)"]
+        assert set(_phases(insert)) == {"compile", "bind", "execute", "total"}
+
+    def test_errors_are_recorded(self, engine):
+        spans = []
+        tracer = instrument_phases(engine, exporter=spans.extend)
+        with engine.connect() as conn:
+            engine.raw.fail = RuntimeError("boom")
+            with pytest.raises(Exception, match="boom"):
+                conn.execute(select(users))
+
+        (entry,) = [e for e in tracer.snapshot() if e["fingerprint"].startswith("SELECT users")]
+        assert entry["errors"] == 1
+        (statement,) = [s for s in spans if s["status"]["code"] == 2]
+        assert statement["status"]["message"] == "RuntimeError"
+        assert statement["name"] == "SELECT"
+
+    def test_sampling(self, engine):
+        tracer = instrument_phases(engine, PhaseTracer(sample_rate=0.0))
+        with engine.connect() as conn:
+            conn.execute(select(users)).all()
+        assert tracer.snapshot() == []
+
+    def test_top_by_phase(self, engine):
+        tracer = instrument_phases(engine)
+        with engine.connect() as conn:
+            conn.execute(select(users)).all()
+            conn.execute(users.insert(), {"id": 1})
+        (top,) = tracer.top(1, phase="hydrate")
+        assert top["fingerprint"].startswith("SELECT users")
+        with pytest.raises(ValueError, match="unknown phase"):
+            tracer.top(phase="parse")
+        tracer.reset()
+        assert tracer.snapshot() == []
+
+    def test_double_instrumentation_rejected(self, engine):
+        instrument_phases(engine)
+        with pytest.raises(ValueError, match="already instrumented"):
+            instrument_phases(engine)
+
+    def test_non_cubrid_engine_rejected(self):
+        with pytest.raises(ValueError, match="CUBRID dialect"):
+            instrument_phases(create_engine("sqlite://"))
+
+    def test_disabled_by_default(self, engine):
+        with engine.connect() as conn:
+            result = conn.execute(select(users))
+            assert type(result.cursor) is StubCursor
+            assert result.all() == [(1, "ALICE"), (2, "BOB")]
+
+
+class TestAsyncEngine:
+    def test_async_execution_is_traced(self):
+        async def main():
+            async def creator():
+                return AsyncStubConnection(rows=[(7, "carol")])
+
+            engine = create_async_engine("cubrid+aiopycubrid://", async_creator=creator)
+            tracer = instrument_phases(engine)
+            try:
+                async with engine.connect() as conn:
+                    rows = (await conn.execute(select(users))).all()
+            finally:
+                await engine.dispose()
+            return tracer, rows
+
+        tracer, rows = asyncio.run(main())
+        assert rows == [(7, "CAROL")]
+        (entry,) = [e for e in tracer.snapshot() if e["fingerprint"].startswith("SELECT users")]
+        assert set(_phases(entry)) == set(PHASES) | {"total"}
+
+
+class TestOtlpJsonExporter:
+    def test_writes_otlp_lines(self, engine, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        exporter = OtlpJsonExporter(path, resource={"deployment.environment": "test"})
+        try:
+            tracer = instrument_phases(engine, exporter=exporter)
+            with engine.connect() as conn:
+                conn.execute(select(users)).all()
+            # The last statement's rows were processed after its cursor closed.
+            tracer.flush()
+        finally:
+            exporter.close()
+
+        requests = [json.loads(line) for line in path.read_text().splitlines()]
+        (resource_spans,) = requests[-1]["resourceSpans"]
+        resource = {a["key"]: a["value"] for a in resource_spans["resource"]["attributes"]}
+        assert resource == {
+            "service.name": {"stringValue": "sqlalchemy-cubrid"},
+            "deployment.environment": {"stringValue": "test"},
+        }
+        (scope_spans,) = resource_spans["scopeSpans"]
+        assert scope_spans["scope"] == {"name": "sqlalchemy_cubrid.phases"}
+        assert scope_spans["spans"][0]["name"] == "SELECT"
+        assert len(scope_spans["spans"]) == 1 + len(PHASES)
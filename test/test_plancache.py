@@ -0,0 +1,236 @@
+# test/test_plancache.py
+"""Offline tests for the server plan cache statistics and reuse checks."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    create_engine,
+    literal,
+    literal_column,
+    select,
+    text,
+)
+
+from sqlalchemy_cubrid.plancache import (
+    PlanCacheEntry,
+    PlanCacheReport,
+    instrument_plan_cache,
+    parse_plandump,
+    plan_cache_stats,
+)
+
+metadata = MetaData()
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+
+STATDUMP = """
+ *** SERVER EXECUTION STATISTICS ***
+Num_file_creates              =          0
+Num_plan_cache_add            =         40
+Num_plan_cache_lookup         =        200
+Num_plan_cache_hit            =        150
+Num_plan_cache_miss           =         50
+Num_plan_cache_full           =          2
+Num_plan_cache_delete         =          9
+"""
+
+PLANDUMP = """
+XASL cache
+  max elements: 1000
+  elements: 2
+
+  XASL_ID = { sha1 = { 1a2b3c4d 00000000 00000000 00000000 00000000 }, time_stored = 5/22/26 15:43:52 }
+    sql info:
+      SQL_ID = 5b2d1e5e1c2ce
+      sql user text = SELECT users.id, users.name
+FROM users
+WHERE users.id IN (1, 2)
+      sql hash text = select [users].[id], [users].[name] from [dba.users] [users] where [users].[id] in (?:0, ?:1)
+    reference count = 0
+    time last used = 5/22/26 15:44:10
+
+  XASL_ID = { sha1 = { 9f8e7d6c 00000000 00000000 00000000 00000000 }, time_stored = 5/22/26 15:43:55 }
+    sql info:
+      SQL_ID = 77aa01c9b3e12
+      sql user text = SELECT users.id FROM users WHERE users.id = 7
+    reference count = 1
+"""
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestPlanCacheStats:
+    def test_from_statdump(self):
+        stats = plan_cache_stats(STATDUMP)
+        assert stats == {
+            "add": 40,
+            "lookup": 200,
+            "hit": 150,
+            "miss": 50,
+            "full": 2,
+            "delete": 9,
+            "hit_ratio": 0.75,
+        }
+
+    def test_from_connection(self):
+        conn = MagicMock()
+        conn.execute.return_value.fetchall.return_value = [
+            ("Num_data_page_fetches", 12),
+            ("Num_plan_cache_lookup", 0),
+        ]
+        stats = plan_cache_stats(conn)
+        assert str(conn.execute.call_args[0][0]) == "SHOW EXEC STATISTICS ALL"
+        conn.execute.return_value.close.assert_called_once()
+        assert stats == {"lookup": 0, "hit_ratio": None}
+
+
+class TestParsePlandump:
+    def test_entries(self):
+        first, second = parse_plandump(PLANDUMP)
+        assert first.sql_id == "5b2d1e5e1c2ce"
+        assert first.sql == "SELECT users.id, users.name\nFROM users\nWHERE users.id IN (1, 2)"
+        assert first.hash_text.startswith("select [users].[id]")
+        assert first.fingerprint == "SELECT users.id, users.name FROM users WHERE users.id IN (?)"
+        assert first.fields["reference count"] == "0"
+        assert second.fingerprint == "SELECT users.id FROM users WHERE users.id = ?"
+        assert second.to_dict()["fields"]["reference count"] == "1"
+
+    def test_no_entries(self):
+        assert parse_plandump("XASL cache\n  elements: 0\n") == []
+
+
+class TestInstrumentPlanCache:
+    def test_bound_statements_have_one_text(self, engine):
+        report = instrument_plan_cache(engine, PlanCacheReport(variant_threshold=3))
+        with engine.connect() as conn:
+            for i in range(5):
+                conn.execute(select(users).where(users.c.id == i))
+        (entry,) = report.fingerprints()
+        assert (entry["executions"], entry["statement_texts"]) == (5, 1)
+        assert report.findings() == []
+
+    def test_in_list_sizes(self, engine):
+        report = instrument_plan_cache(engine, PlanCacheReport(variant_threshold=3))
+        with engine.connect() as conn:
+            for n in range(1, 5):
+                conn.execute(select(users).where(users.c.id.in_(list(range(n)))))
+        (finding,) = report.findings()
+        assert finding.kind == "in_list"
+        assert finding.fingerprint == "SELECT users.id, users.name FROM users WHERE users.id IN (?)"
+        assert "4 distinct statement texts in 4 executions" in finding.message
+        assert "fixed sizes" in finding.suggestion
+
+    def test_rendered_literals(self, engine):
+        report = instrument_plan_cache(engine, PlanCacheReport(variant_threshold=3))
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(select(users).where(users.c.id == literal_column(str(i))))
+                conn.execute(text(f"SELECT name FROM users LIMIT {i + 1}"))
+        findings = {finding.kind: finding for finding in report.findings()}
+        assert set(findings) == {"literal_sql", "limit"}
+        assert "3 distinct compiled statements" in findings["literal_sql"].message
+        assert "keyset pagination" in findings["limit"].suggestion
+
+    def test_literal_execute(self, engine):
+        report = instrument_plan_cache(engine, PlanCacheReport(variant_threshold=2))
+        with engine.connect() as conn:
+            for i in range(2):
+                conn.execute(select(users).where(users.c.id == literal(i, literal_execute=True)))
+        (finding,) = report.findings()
+        assert finding.kind == "literal_execute"
+        assert report.fingerprints()[0]["literal_execute"] == 2
+
+    def test_double_instrumentation_rejected(self, engine):
+        instrument_plan_cache(engine)
+        with pytest.raises(ValueError, match="already instrumented"):
+            instrument_plan_cache(engine)
+
+
+class TestCorrelate:
+    def _report(self, statements, executions=1):
+        report = PlanCacheReport(variant_threshold=2)
+        for sql in statements:
+            for _ in range(executions):
+                report.record(sql, sql)
+        return report
+
+    def test_server_plans_per_fingerprint(self):
+        report = self._report(["SELECT users.id FROM users LIMIT ?"])
+        report.correlate(
+            [
+                PlanCacheEntry("SELECT users.id FROM users LIMIT 10"),
+                PlanCacheEntry("SELECT users.id FROM users LIMIT 20"),
+                PlanCacheEntry(None),
+            ]
+        )
+        (finding,) = report.findings()
+        assert finding.kind == "server_plans"
+        assert finding.fingerprint == "SELECT users.id FROM users LIMIT ?"
+        assert "2 server plan cache entries" in finding.message
+        assert "page sizes" in finding.suggestion
+        assert report.fingerprints()[0]["server_plans"] == 2
+
+    def test_server_in_list_plans(self):
+        report = self._report(["SELECT id FROM users WHERE id IN (__[POSTCOMPILE_id_1])"])
+        report.correlate(
+            [
+                PlanCacheEntry("SELECT id FROM users WHERE id IN (1, 2)"),
+                PlanCacheEntry("SELECT id FROM users WHERE id IN (3, 4, 5)"),
+            ]
+        )
+        (finding,) = report.findings()
+        assert "fixed sizes" in finding.suggestion
+
+    def test_not_cached(self):
+        report = self._report(["SELECT name FROM users", "CREATE TABLE t (a INT)"], executions=2)
+        report.correlate(parse_plandump(PLANDUMP))
+        (finding,) = report.findings()
+        assert (finding.kind, finding.fingerprint) == ("not_cached", "SELECT name FROM users")
+
+    def test_server_wide_findings(self):
+        report = PlanCacheReport()
+        kinds = [finding.kind for finding in report.findings(stats=plan_cache_stats(STATDUMP))]
+        assert kinds == ["low_hit_ratio", "evictions"]
+        healthy = {"lookup": 1000, "hit": 990, "hit_ratio": 0.99, "full": 0, "delete": 0}
+        assert report.findings(stats=healthy) == []
+
+    def test_bounded_and_reset(self):
+        report = PlanCacheReport(max_fingerprints=1, max_texts=1)
+        report.record("SELECT a FROM t", "SELECT a FROM t")
+        report.record("SELECT b FROM t", "SELECT b FROM t")
+        report.record("SELECT a FROM t WHERE x IN (?)", "SELECT a FROM t WHERE x IN (?, ?)")
+        report.record("SELECT a FROM t", "SELECT a FROM t  ")
+        entries = {entry["fingerprint"]: entry for entry in report.fingerprints()}
+        assert set(entries) == {"SELECT a FROM t", "<other>"}
+        assert entries["<other>"]["saturated"] is True
+        assert report.snapshot()["findings"] == []
+        report.reset()
+        assert report.fingerprints() == []
+
+
+def test_bindparam_limit_is_one_text(engine):
+    report = instrument_plan_cache(engine, PlanCacheReport(variant_threshold=2))
+    stmt = select(users).limit(bindparam("n"))
+    with engine.connect() as conn:
+        for n in (10, 20):
+            conn.execute(stmt, {"n": n})
+    assert report.findings() == []
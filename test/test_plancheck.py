@@ -0,0 +1,263 @@
+# test/test_plancheck.py
+"""Offline tests for query plan baselines, using recorded trace fixtures."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from sqlalchemy_cubrid.plancheck import (
+    PlanChange,
+    PlanChecker,
+    PlanRegressionError,
+    PlanSuite,
+    compare_signatures,
+    main,
+    plan_signature,
+)
+from sqlalchemy_cubrid.trace import parse_trace
+
+pytest_plugins = ["pytester"]
+
+FIXTURES = Path(__file__).parent / "fixtures" / "plans"
+
+
+def _signature(name):
+    return plan_signature(parse_trace((FIXTURES / f"{name}.trace").read_text()))
+
+
+def _traces(tmp_path, **names):
+    """Copy fixture traces into a traces dir, as ``{plan name: fixture name}``."""
+    traces = tmp_path / "traces"
+    traces.mkdir(exist_ok=True)
+    for name, fixture in names.items():
+        shutil.copy(FIXTURES / f"{fixture}.trace", traces / f"{name}.trace")
+    return traces
+
+
+def _scan(table, access="index", index="idx", covered=False, depth=1):
+    return {"table": table, "access": access, "index": index, "covered": covered, "depth": depth}
+
+
+def _sig(*scans, sorts=()):
+    return {
+        "scans": list(scans),
+        "join_order": [scan["table"] for scan in scans],
+        "sorts": list(sorts),
+    }
+
+
+class TestPlanSignature:
+    def test_index_scan(self):
+        assert _signature("orders_by_customer") == {
+            "scans": [
+                {
+                    "table": "orders",
+                    "access": "index",
+                    "index": "idx_orders_customer",
+                    "covered": False,
+                    "depth": 1,
+                }
+            ],
+            "join_order": ["orders"],
+            "sorts": [],
+        }
+
+    def test_json_join(self):
+        signature = _signature("customer_orders_join")
+        assert signature["join_order"] == ["dba.customers", "dba.orders"]
+        assert [scan["depth"] for scan in signature["scans"]] == [1, 2]
+        assert signature["sorts"] == ["ORDERBY"]
+
+
+class TestCompareSignatures:
+    def test_identical(self):
+        signature = _signature("customer_orders_join")
+        assert compare_signatures(signature, signature) == []
+
+    def test_index_to_full_scan_is_a_regression(self):
+        changes = compare_signatures(
+            _signature("orders_by_customer"), _signature("orders_by_customer_regressed")
+        )
+        assert changes == [
+            PlanChange(
+                "full_scan", "orders: index scan (idx_orders_customer) became table scan", True
+            )
+        ]
+
+    def test_full_to_index_scan_is_a_change(self):
+        (change,) = compare_signatures(
+            _signature("orders_by_customer_regressed"), _signature("orders_by_customer")
+        )
+        assert (change.kind, change.regression) == ("access", False)
+
+    def test_other_changes(self):
+        baseline = _sig(_scan("a", covered=True), _scan("b", index="ib"), _scan("c"))
+        current = _sig(
+            _scan("b", index="ib"),
+            _scan("a"),
+            _scan("d", access="table", index=None),
+            sorts=["GROUPBY"],
+        )
+        changes = {change.kind: change for change in compare_signatures(baseline, current)}
+
+        assert not changes["covered"].regression
+        assert changes["scan_removed"].message == "c: index scan (idx) removed"
+        assert changes["scan_added"].regression
+        assert changes["sort"].regression
+        assert "join_order" not in changes  # different table sets
+
+    def test_join_order(self):
+        baseline = _sig(_scan("a"), _scan("b"))
+        current = _sig(_scan("b"), _scan("a"))
+        (change,) = compare_signatures(baseline, current)
+        assert change.kind == "join_order"
+        assert change.message == "join order a > b became b > a"
+        assert not change.regression
+
+
+class TestPlanChecker:
+    def test_records_then_detects_regression(self, tmp_path):
+        traces = _traces(tmp_path, orders="orders_by_customer")
+        checker = PlanChecker(tmp_path / "baselines", traces=traces)
+
+        assert checker.check("orders") == []
+        baseline = json.loads((tmp_path / "baselines" / "orders.json").read_text())
+        assert baseline["signature"]["scans"][0]["index"] == "idx_orders_customer"
+
+        _traces(tmp_path, orders="orders_by_customer_regressed")
+        with pytest.raises(PlanRegressionError, match="became table scan"):
+            checker.check("orders")
+
+    def test_update_overwrites(self, tmp_path):
+        traces = _traces(tmp_path, orders="orders_by_customer")
+        PlanChecker(tmp_path / "b", traces=traces).check("orders")
+        _traces(tmp_path, orders="orders_by_customer_regressed")
+        PlanChecker(tmp_path / "b", traces=traces, update=True).check("orders")
+        assert PlanChecker(tmp_path / "b", traces=traces).check("orders") == []
+
+    def test_strict_fails_on_any_change(self, tmp_path):
+        traces = _traces(tmp_path, orders="orders_by_customer_regressed")
+        PlanChecker(tmp_path / "b", traces=traces).check("orders")
+        _traces(tmp_path, orders="orders_by_customer")
+
+        (change,) = PlanChecker(tmp_path / "b", traces=traces).check("orders")
+        assert not change.regression
+        with pytest.raises(PlanRegressionError):
+            PlanChecker(tmp_path / "b", traces=traces, strict=True).check("orders")
+
+    def test_live_mode_uses_trace_query(self, tmp_path):
+        trace = (FIXTURES / "orders_by_customer.trace").read_text()
+        conn = MagicMock()
+        stmt = text("SELECT * FROM orders WHERE customer_id = :c")
+        suite = PlanSuite()
+        suite.add("orders", stmt, {"c": 1})
+
+        with patch("sqlalchemy_cubrid.plancheck.trace_query", return_value=[trace]) as traced:
+            report = PlanChecker(tmp_path).run(suite, conn)
+
+        traced.assert_called_once_with(conn, stmt, parameters={"c": 1})
+        assert report == {"orders": []}
+        assert (tmp_path / "orders.json").exists()
+
+    def test_missing_inputs(self, tmp_path):
+        with pytest.raises(ValueError, match="connection"):
+            PlanChecker(tmp_path).check("orders")
+        with pytest.raises(FileNotFoundError):
+            PlanChecker(tmp_path, traces=tmp_path).check("orders")
+
+    @pytest.mark.parametrize("name", ["../escape", "a b", ".hidden", ""])
+    def test_names_must_be_file_safe(self, name):
+        with pytest.raises(ValueError):
+            PlanSuite().add(name)
+
+    def test_duplicate_names(self):
+        suite = PlanSuite()
+        suite.add("q")
+        with pytest.raises(ValueError, match="duplicate"):
+            suite.add("q")
+        assert len(suite) == 1
+
+
+# Module-level suite for the CLI tests.
+cli_suite = PlanSuite()
+cli_suite.add("orders")
+
+
+class TestCommandLine:
+    def test_record_and_check_with_traces(self, tmp_path, capsys):
+        traces = _traces(tmp_path, orders="orders_by_customer", join="customer_orders_join")
+        baselines = str(tmp_path / "baselines")
+
+        assert main(["record", "--baselines", baselines, "--traces", str(traces)]) == 0
+        assert "recorded 2 baseline(s)" in capsys.readouterr().out
+
+        _traces(tmp_path, orders="orders_by_customer_regressed")
+        assert main(["check", "--baselines", baselines, "--traces", str(traces)]) == 1
+        out = capsys.readouterr().out
+        assert "FAIL     orders" in out
+        assert "ok       join" in out
+        assert "! orders: index scan (idx_orders_customer) became table scan" in out
+
+    def test_suite_spec(self, tmp_path, capsys):
+        traces = _traces(tmp_path, orders="orders_by_customer")
+        args = ["--baselines", str(tmp_path / "b"), "--traces", str(traces)]
+        assert main(["check", "test.test_plancheck:cli_suite", *args]) == 0
+        assert "ok       orders" in capsys.readouterr().out
+
+    def test_live_url(self, tmp_path):
+        trace = (FIXTURES / "orders_by_customer.trace").read_text()
+        suite = PlanSuite()
+        suite.add("orders", text("SELECT 1"))
+        with (
+            patch("sqlalchemy_cubrid.plancheck._load_suite", return_value=suite),
+            patch("sqlalchemy_cubrid.plancheck.trace_query", return_value=[trace]),
+        ):
+            code = main(["record", "x:suite", "--baselines", str(tmp_path), "--url", "sqlite://"])
+        assert code == 0
+        assert (tmp_path / "orders.json").exists()
+
+    def test_url_requires_suite(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main(["check", "--baselines", str(tmp_path), "--url", "sqlite://"])
+
+    def test_bad_suite_spec(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main(
+                [
+                    "check",
+                    "test.test_plancheck:FIXTURES",
+                    "--baselines",
+                    str(tmp_path),
+                    "--traces",
+                    str(tmp_path),
+                ]
+            )
+
+
+class TestPytestPlugin:
+    def test_fixture_in_local_mode(self, pytester):
+        _traces(pytester.path, orders="orders_by_customer")
+        pytester.makepyfile(
+            """
+            def test_orders(cubrid_plan_checker):
+                cubrid_plan_checker.check("orders")
+            """
+        )
+        # Both directories are relative to the rootdir.
+        args = ["-p", "sqlalchemy_cubrid.pytest_plugin", "--cubrid-plan-traces", "traces"]
+
+        pytester.runpytest(*args).assert_outcomes(passed=1)
+        assert (pytester.path / "plan_baselines" / "orders.json").exists()
+
+        _traces(pytester.path, orders="orders_by_customer_regressed")
+        result = pytester.runpytest(*args)
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*became table scan*"])
+
+        pytester.runpytest(*args, "--cubrid-plan-update").assert_outcomes(passed=1)
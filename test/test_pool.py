@@ -0,0 +1,470 @@
+# test/test_pool.py
+"""Offline tests for the pool helpers: ping window and loop-affinity pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from sqlalchemy_cubrid.aio_pycubrid_dialect import PyCubridAsyncDialect
+from sqlalchemy_cubrid.dialect import CubridDialect
+from sqlalchemy_cubrid.pool import AsyncLoopAffinityPool, PingWindow
+from sqlalchemy_cubrid.pycubrid_dialect import PyCubridDialect
+
+
+class _Conn:
+    """Weak-referenceable stand-in for a DBAPI connection."""
+
+
+def _context_for(dbapi_conn):
+    context = MagicMock()
+    context.root_connection.connection.dbapi_connection = dbapi_conn
+    return context
+
+
+class TestPingWindow:
+    def test_rejects_non_positive_window(self):
+        with pytest.raises(ValueError, match="positive"):
+            PingWindow(0)
+
+    def test_unknown_connection_is_not_fresh(self):
+        assert PingWindow(5).is_fresh(_Conn()) is False
+
+    def test_touch_makes_connection_fresh(self):
+        window = PingWindow(5)
+        conn = _Conn()
+        window.touch(conn)
+        assert window.is_fresh(conn) is True
+        assert len(window) == 1
+
+    def test_freshness_expires(self):
+        window = PingWindow(5)
+        conn = _Conn()
+        with patch("sqlalchemy_cubrid.pool.time.monotonic", return_value=100.0):
+            window.touch(conn)
+        with patch("sqlalchemy_cubrid.pool.time.monotonic", return_value=104.9):
+            assert window.is_fresh(conn) is True
+        with patch("sqlalchemy_cubrid.pool.time.monotonic", return_value=105.0):
+            assert window.is_fresh(conn) is False
+
+    def test_forget(self):
+        window = PingWindow(5)
+        conn = _Conn()
+        window.touch(conn)
+        window.forget(conn)
+        assert window.is_fresh(conn) is False
+
+    def test_mark_suspect_clears_siblings(self):
+        window = PingWindow(5)
+        conns = [_Conn(), _Conn()]
+        for conn in conns:
+            window.touch(conn)
+        window.mark_suspect()
+        assert not any(window.is_fresh(conn) for conn in conns)
+
+    def test_closed_connection_is_dropped(self):
+        window = PingWindow(5)
+        conn = _Conn()
+        window.touch(conn)
+        del conn
+        assert len(window) == 0
+
+    def test_non_weakrefable_connection_is_never_fresh(self):
+        window = PingWindow(5)
+        conn = object()
+        window.touch(conn)
+        window.forget(conn)
+        assert window.is_fresh(conn) is False
+
+
+class TestDialectPingWindow:
+    def test_disabled_by_default(self):
+        assert CubridDialect()._ping_window is None
+
+    def test_create_engine_accepts_option(self):
+        engine = create_engine("cubrid+pycubrid://dba@localhost/db", cubrid_ping_window=2.5)
+        window = engine.dialect._ping_window
+        assert window is not None
+        assert window.window == 2.5
+
+    def test_ping_skipped_after_successful_execute(self):
+        dialect = CubridDialect(cubrid_ping_window=30)
+        conn = _Conn()
+        conn.ping = MagicMock()
+        cursor = MagicMock()
+
+        dialect.do_execute(cursor, "SELECT 1", (), _context_for(conn))
+
+        cursor.execute.assert_called_once_with("SELECT 1", ())
+        assert dialect.do_ping(conn) is True
+        conn.ping.assert_not_called()
+
+    @pytest.mark.parametrize("method", ["do_executemany", "do_execute_no_params"])
+    def test_other_execute_paths_touch_window(self, method):
+        dialect = CubridDialect(cubrid_ping_window=30)
+        conn = _Conn()
+        cursor = MagicMock()
+
+        if method == "do_executemany":
+            dialect.do_executemany(cursor, "INSERT", [(1,)], _context_for(conn))
+        else:
+            dialect.do_execute_no_params(cursor, "COMMIT", _context_for(conn))
+
+        assert dialect._recently_alive(conn) is True
+
+    def test_failed_execute_does_not_touch_window(self):
+        dialect = CubridDialect(cubrid_ping_window=30)
+        conn = _Conn()
+        cursor = MagicMock()
+        cursor.execute.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            dialect.do_execute(cursor, "SELECT 1", (), _context_for(conn))
+        assert dialect._recently_alive(conn) is False
+
+    def test_execute_without_window_or_context(self):
+        dialect = CubridDialect()
+        cursor = MagicMock()
+        dialect.do_execute(cursor, "SELECT 1", (), None)
+        cursor.execute.assert_called_once_with("SELECT 1", ())
+
+    def test_first_ping_goes_to_server(self):
+        dialect = CubridDialect(cubrid_ping_window=30)
+        conn = _Conn()
+        conn.ping = MagicMock()
+
+        assert dialect.do_ping(conn) is True
+        assert dialect.do_ping(conn) is True
+        conn.ping.assert_called_once_with()
+
+    def test_disconnect_marks_siblings_suspect(self):
+        dialect = CubridDialect(cubrid_ping_window=30)
+
+        class Error(Exception):
+            pass
+
+        dialect.dbapi = MagicMock(Error=Error)
+        sibling = _Conn()
+        sibling.ping = MagicMock()
+        dialect.do_ping(sibling)
+
+        assert dialect.is_disconnect(Error("broken pipe"), None, None) is True
+        dialect.do_ping(sibling)
+        assert sibling.ping.call_count == 2
+
+    def test_non_disconnect_keeps_window(self):
+        dialect = CubridDialect(cubrid_ping_window=30)
+
+        class Error(Exception):
+            pass
+
+        dialect.dbapi = MagicMock(Error=Error)
+        conn = _Conn()
+        conn.ping = MagicMock()
+        dialect.do_ping(conn)
+
+        assert dialect.is_disconnect(Error("syntax error"), None, None) is False
+        assert dialect._recently_alive(conn) is True
+
+    @pytest.mark.parametrize("dialect_cls", [PyCubridDialect, PyCubridAsyncDialect])
+    def test_pycubrid_ping_uses_window(self, dialect_cls):
+        dialect = dialect_cls(cubrid_ping_window=30)
+        conn = _Conn()
+        conn.ping = MagicMock(return_value=True)
+
+        assert dialect.do_ping(conn) is True
+        assert dialect.do_ping(conn) is True
+        conn.ping.assert_called_once_with(False)
+
+    @pytest.mark.parametrize("dialect_cls", [PyCubridDialect, PyCubridAsyncDialect])
+    def test_pycubrid_failed_ping_is_not_remembered(self, dialect_cls):
+        dialect = dialect_cls(cubrid_ping_window=30)
+        conn = _Conn()
+        conn.ping = MagicMock(return_value=False)
+
+        assert dialect.do_ping(conn) is False
+        assert dialect.do_ping(conn) is False
+        assert conn.ping.call_count == 2
+
+
+class _AsyncConn:
+    """Adapted async connection stand-in with native ``aping``/``aclose``."""
+
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.alive = True
+        self.pings = 0
+        self.closed = False
+        self.closed_natively = False
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    async def aping(self):
+        self.pings += 1
+        return self.alive
+
+    async def aclose(self):
+        self.closed_natively = True
+
+
+async def _checkout_and_return(pool):
+    fairy = pool.connect()
+    dbapi_conn = fairy.dbapi_connection
+    fairy.close()
+    return dbapi_conn
+
+
+class TestAsyncLoopAffinityPool:
+    @pytest.mark.parametrize("kwargs", [{"idle_timeout": 0}, {"idle_ping": -1}])
+    def test_rejects_non_positive_idle_settings(self, kwargs):
+        with pytest.raises(ValueError, match="positive"):
+            AsyncLoopAffinityPool(_AsyncConn, **kwargs)
+
+    def test_same_loop_reuses_connection(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn)
+
+        async def main():
+            first = await _checkout_and_return(pool)
+            second = await _checkout_and_return(pool)
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert first is second
+
+    def test_connections_stay_on_their_loop(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, pool_size=1)
+        barrier = threading.Barrier(2)
+        seen = {}
+        checked_out = {}
+
+        def worker(name):
+            async def main():
+                fairy = pool.connect()
+                barrier.wait(timeout=5)
+                seen[name] = fairy.dbapi_connection
+                checked_out[name] = pool.checkedout()
+                barrier.wait(timeout=5)
+                fairy.close()
+                return await _checkout_and_return(pool)
+
+            assert asyncio.run(main()) is seen[name]
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert seen["a"] is not seen["b"]
+        assert checked_out == {"a": 2, "b": 2}
+
+    def test_listeners_added_later_apply_to_existing_loop_pools(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn)
+        connects = []
+        checkouts = []
+
+        async def main():
+            await _checkout_and_return(pool)
+            event.listen(pool, "checkout", lambda *args: checkouts.append(args))
+            event.listen(pool, "connect", lambda *args: connects.append(args))
+            pool._loop_pool()._pool.get(False).close()
+            pool._loop_pool()._dec_overflow()
+            await _checkout_and_return(pool)
+
+        asyncio.run(main())
+        assert len(checkouts) == 1
+        assert len(connects) == 1
+
+    def test_idle_connections_are_reaped(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, pool_size=1, max_overflow=0, idle_timeout=0.02)
+
+        async def main():
+            conn = await _checkout_and_return(pool)
+            await asyncio.sleep(0.1)
+            assert pool.checkedin() == 0
+            # The slot was released, so a new connection can be opened.
+            return conn, await _checkout_and_return(pool)
+
+        old, new = asyncio.run(main())
+        assert old.closed_natively and old.closed
+        assert new is not old
+
+    def test_idle_connections_are_pinged_natively(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, idle_ping=0.02)
+        dialect = PyCubridAsyncDialect(cubrid_ping_window=30)
+        pool._dialect = dialect
+
+        async def main():
+            conn = await _checkout_and_return(pool)
+            await asyncio.sleep(0.1)
+            return conn
+
+        conn = asyncio.run(main())
+        assert conn.pings >= 1
+        assert not conn.closed
+        assert pool.checkedin() == 1
+        assert dialect._recently_alive(conn) is True
+
+    def test_failed_idle_ping_closes_connection(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, idle_ping=0.02)
+
+        async def main():
+            conn = await _checkout_and_return(pool)
+            conn.alive = False
+            await asyncio.sleep(0.1)
+            return conn
+
+        conn = asyncio.run(main())
+        assert conn.closed_natively and conn.closed
+        assert pool.checkedin() == 0
+
+    def test_recently_used_connection_is_not_pinged(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, idle_ping=30)
+
+        async def main():
+            conn = await _checkout_and_return(pool)
+            loop_pool = pool._loop_pool()
+            record = next(iter(loop_pool._idle_since))
+            loop_pool._pinged_at[record] = time.monotonic() - 120
+            await _checkout_and_return(pool)
+            await loop_pool._reap()
+            return conn
+
+        conn = asyncio.run(main())
+        assert conn.pings == 0
+        assert pool.checkedin() == 1
+
+    def test_ping_error_closes_connection(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, idle_ping=60)
+
+        async def main():
+            conn = await _checkout_and_return(pool)
+            conn.aping = MagicMock(side_effect=OSError("reset"))
+            loop_pool = pool._loop_pool()
+            loop_pool._idle_since[next(iter(loop_pool._idle_since))] -= 120
+            await loop_pool._reap()
+            return conn
+
+        assert asyncio.run(main()).closed is True
+
+    def test_connection_without_native_methods(self):
+        class _Plain:
+            def rollback(self):
+                pass
+
+            def close(self):
+                self.closed = True
+
+        pool = AsyncLoopAffinityPool(_Plain, idle_timeout=60, idle_ping=30)
+
+        async def main():
+            fairy = pool.connect()
+            conn = fairy.dbapi_connection
+            fairy.close()
+            loop_pool = pool._loop_pool()
+            record = next(iter(loop_pool._idle_since))
+            loop_pool._idle_since[record] -= 45
+            await loop_pool._reap()
+            assert pool.checkedin() == 1
+            loop_pool._idle_since[record] -= 45
+            await loop_pool._reap()
+            return conn
+
+        assert asyncio.run(main()).closed is True
+        assert pool.checkedin() == 0
+
+    def test_lifo_order_survives_reaping(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, use_lifo=True, idle_timeout=60)
+
+        async def main():
+            first, second = pool.connect(), pool.connect()
+            newest = second.dbapi_connection
+            first.close()
+            second.close()
+            await pool._loop_pool()._reap()
+            return newest, await _checkout_and_return(pool)
+
+        newest, checked_out = asyncio.run(main())
+        assert checked_out is newest
+
+    def test_dispose_closes_current_loop_connections(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, idle_timeout=60)
+
+        async def main():
+            conn = await _checkout_and_return(pool)
+            pool.dispose()
+            return conn
+
+        assert asyncio.run(main()).closed is True
+        assert pool.checkedin() == 0
+
+    def test_dispose_from_another_thread_runs_on_owning_loop(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        try:
+            conn = asyncio.run_coroutine_threadsafe(_checkout_and_return(pool), loop).result(5)
+            pool.dispose()
+            for _ in range(100):
+                if conn.closed:
+                    break
+                time.sleep(0.01)
+            assert conn.closed is True
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+    def test_dispose_forgets_stopped_loops(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn)
+        loop = asyncio.new_event_loop()
+        conn = loop.run_until_complete(_checkout_and_return(pool))
+        pool.dispose()
+        loop.close()
+        assert conn.closed is False
+        assert pool.checkedin() == 0
+
+    def test_unbound_pool_outside_event_loop(self):
+        pool = AsyncLoopAffinityPool(_AsyncConn, idle_timeout=1)
+        fairy = pool.connect()
+        assert pool.checkedout() == 1
+        fairy.close()
+        assert pool.checkedin() == 1
+        assert pool.overflow() == 0
+        assert "Loops: 1" in pool.status()
+        pool.dispose()
+
+    def test_recreate_keeps_settings(self):
+        pool = AsyncLoopAffinityPool(
+            _AsyncConn, pool_size=2, max_overflow=1, timeout=3, idle_timeout=9, idle_ping=4
+        )
+        clone = pool.recreate()
+        assert isinstance(clone, AsyncLoopAffinityPool)
+        assert (clone.size(), clone.timeout()) == (2, 3)
+        assert (clone._idle_timeout, clone._idle_ping) == (9, 4)
+
+    def test_create_async_engine_passes_pool_options(self):
+        pytest.importorskip("pycubrid.aio")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine(
+            "cubrid+aiopycubrid://dba@localhost:33000/demodb",
+            poolclass=AsyncLoopAffinityPool,
+            pool_size=3,
+            idle_timeout=120,
+        )
+        pool = engine.sync_engine.pool
+        assert isinstance(pool, AsyncLoopAffinityPool)
+        assert (pool.size(), pool._idle_timeout) == (3, 120)
@@ -0,0 +1,116 @@
+# test/test_profiling.py
+"""Offline tests for compile-time profiling."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select, text
+from sqlalchemy.schema import CreateTable
+
+from sqlalchemy_cubrid import insert
+from sqlalchemy_cubrid.compiler import CubridCompiler, CubridTypeCompiler
+from sqlalchemy_cubrid.dialect import CubridDialect
+from sqlalchemy_cubrid.profiling import CompileProfile, profile_compilation
+
+metadata = MetaData()
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100)),
+)
+
+
+class TestCompilerTimings:
+    def test_visit_methods_are_timed(self):
+        dialect = CubridDialect()
+        profile = profile_compilation(dialect)
+        for i in range(3):
+            select(users).where(users.c.id == i).limit(5).compile(dialect=dialect)
+        insert(users).values(name="a").on_duplicate_key_update(name="b").compile(dialect=dialect)
+        CreateTable(users).compile(dialect=dialect)
+
+        compilers = profile.snapshot()["compilers"]
+        assert compilers["CubridCompiler.compile"]["calls"] == 4
+        assert compilers["CubridCompiler.visit_select"]["calls"] == 3
+        assert compilers["CubridCompiler.limit_clause"]["calls"] == 3
+        assert compilers["CubridCompiler.visit_on_duplicate_key_update"]["calls"] == 1
+        assert compilers["CubridDDLCompiler.compile"]["calls"] == 1
+        assert compilers["CubridDDLCompiler.visit_create_table"]["calls"] == 1
+        assert compilers["CubridTypeCompiler.visit_VARCHAR"]["calls"] == 1
+
+    def test_self_time_excludes_nested_visits(self):
+        dialect = CubridDialect()
+        profile = profile_compilation(dialect)
+        select(users).where(users.c.id == 1).compile(dialect=dialect)
+
+        entry = profile.snapshot()["compilers"]["CubridCompiler.compile"]
+        assert 0 <= entry["self_s"] < entry["cumulative_s"]
+        assert profile.top(1, by="cumulative_s")[0]["name"] == "CubridCompiler.compile"
+        assert len(profile.top(3)) == 3
+
+    def test_output_is_unchanged(self):
+        stmt = select(users).where(users.c.name == "x").limit(10).offset(5)
+        expected = str(stmt.compile(dialect=CubridDialect()))
+        dialect = CubridDialect()
+        profile_compilation(dialect)
+        assert str(stmt.compile(dialect=dialect)) == expected
+
+    def test_stop_restores_compilers(self):
+        dialect = CubridDialect()
+        profile = profile_compilation(dialect)
+        assert dialect.statement_compiler is not CubridCompiler
+        profile.stop()
+
+        assert dialect.statement_compiler is CubridCompiler
+        assert type(dialect.type_compiler_instance) is CubridTypeCompiler
+        select(users).compile(dialect=dialect)
+        assert profile.snapshot()["compilers"] == {}
+        profile_compilation(dialect).stop()  # can be profiled again
+
+    def test_twice_is_rejected(self):
+        dialect = CubridDialect()
+        profile_compilation(dialect)
+        with pytest.raises(ValueError, match="already being profiled"):
+            profile_compilation(dialect)
+
+    def test_reset(self):
+        dialect = CubridDialect()
+        profile = profile_compilation(dialect)
+        select(users).compile(dialect=dialect)
+        profile.reset()
+        assert profile.snapshot() == {"compilers": {}, "cache": {"hit_ratio": None}}
+
+
+class TestCacheStatistics:
+    def test_hit_ratio(self):
+        engine = create_engine("sqlite://")
+        profile = profile_compilation(engine, CompileProfile())
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE users (id INTEGER, name VARCHAR(100))"))
+            for i in range(4):
+                conn.execute(select(users).where(users.c.id == i)).all()
+            conn.exec_driver_sql("SELECT 1")
+
+        cache = profile.snapshot()["cache"]
+        assert cache["hit"] == 3
+        assert cache["miss"] == 2
+        assert cache["hit_ratio"] == pytest.approx(0.6)
+        assert profile.snapshot()["compilers"]["SQLiteCompiler.compile"]["calls"] == 2
+
+    def test_stop_removes_listener(self):
+        engine = create_engine("sqlite://")
+        profile = profile_compilation(engine)
+        profile.stop()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert profile.snapshot()["cache"] == {"hit_ratio": None}
+
+    def test_async_engine_is_unwrapped(self):
+        class _AsyncEngine:
+            sync_engine = create_engine("sqlite://")
+
+        profile = profile_compilation(_AsyncEngine())
+        with _AsyncEngine.sync_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert profile.snapshot()["cache"]["miss"] == 1
@@ -8,7 +8,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 from sqlalchemy.engine import url
 
-from sqlalchemy_cubrid.pycubrid_dialect import PyCubridDialect, PyCubridExecutionContext
+from sqlalchemy_cubrid.pycubrid_dialect import (
+    PyCubridDialect,
+    PyCubridExecutionContext,
+    _connect_accepts,
+    _pycubrid_collection_types,
+)
 
 
 class TestPyCubridDialectBasics:
@@ -71,6 +76,11 @@ class TestPyCubridDialectBasics:
 
 
 class TestPyCubridConnectArgs:
+    @pytest.fixture(autouse=True)
+    def _driver_decodes_collections(self):
+        with patch("sqlalchemy_cubrid.pycubrid_dialect._connect_accepts", return_value=True):
+            yield
+
     def test_create_connect_args_full_url(self):
         dialect = PyCubridDialect()
         parsed = url.make_url("cubrid+pycubrid://dba:pw@dbhost:33001/demodb")
@@ -84,6 +94,7 @@ class TestPyCubridConnectArgs:
             "database": "demodb",
             "user": "dba",
             "password": "pw",
+            "decode_collections": True,
         }
 
     def test_create_connect_args_defaults(self):
@@ -99,6 +110,7 @@ class TestPyCubridConnectArgs:
             "database": "",
             "user": "dba",
             "password": "",
+            "decode_collections": True,
         }
 
     def test_create_connect_args_partial_url(self):
@@ -119,6 +131,50 @@ class TestPyCubridConnectArgs:
         with pytest.raises(ValueError, match="Unexpected database URL format"):
             dialect.create_connect_args(none_url)
 
+    def test_decode_collections_only_if_driver_accepts_it(self):
+        with patch(
+            "sqlalchemy_cubrid.pycubrid_dialect._connect_accepts", return_value=False
+        ) as accepts:
+            _, kwargs = PyCubridDialect().create_connect_args(url.make_url("cubrid+pycubrid://"))
+        assert "decode_collections" not in kwargs
+        accepts.assert_called_once_with("pycubrid", "decode_collections")
+
+    def test_connect_accepts(self):
+        def new_connect(host="localhost", decode_collections=False, **kwargs):
+            pass
+
+        def old_connect(host="localhost", **kwargs):
+            pass
+
+        _connect_accepts.cache_clear()
+        modules = {
+            "fake_new_driver": types.SimpleNamespace(connect=new_connect),
+            "fake_old_driver": types.SimpleNamespace(connect=old_connect),
+        }
+        try:
+            with patch.dict(sys.modules, modules):
+                assert _connect_accepts("fake_new_driver", "decode_collections") is True
+                assert _connect_accepts("fake_old_driver", "decode_collections") is False
+            assert _connect_accepts("fake_missing_driver", "decode_collections") is False
+        finally:
+            _connect_accepts.cache_clear()
+
+
+class TestPyCubridCollectionTypes:
+    def test_driver_types_are_looked_up_once(self):
+        fake = types.SimpleNamespace(Set=frozenset, Multiset=list)
+        _pycubrid_collection_types.cache_clear()
+        try:
+            with patch(
+                "sqlalchemy_cubrid.pycubrid_dialect.import_module", return_value=fake
+            ) as mocked:
+                dialect = PyCubridDialect()
+                assert dialect._collection_param_types() == {"SET": frozenset, "MULTISET": list}
+                dialect._collection_param_types()
+            mocked.assert_called_once_with("pycubrid")
+        finally:
+            _pycubrid_collection_types.cache_clear()
+
 
 class TestPyCubridOnConnect:
     def test_on_connect_without_isolation_level(self):
@@ -0,0 +1,202 @@
+# test/test_retry.py
+"""Offline tests for the transaction retry helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, exc as sa_exc, text
+from sqlalchemy.orm import sessionmaker
+
+from sqlalchemy_cubrid.dialect import CubridDialect
+from sqlalchemy_cubrid.errors import ErrorCategory
+from sqlalchemy_cubrid.retry import (
+    DEFAULT_RETRY_ON,
+    RetryStats,
+    arun_in_transaction,
+    run_in_transaction,
+)
+
+
+class Error(Exception):
+    pass
+
+
+def _dbapi_error(code):
+    return sa_exc.DBAPIError("UPDATE t", None, Error(code))
+
+
+class _Bind:
+    """Engine stand-in whose begin() yields a connection mock."""
+
+    def __init__(self):
+        self.dialect = CubridDialect()
+        self.dialect.dbapi = MagicMock(Error=Error)
+        self.began = 0
+        self.conn = MagicMock()
+
+    @contextlib.contextmanager
+    def begin(self):
+        self.began += 1
+        yield self.conn
+
+
+class _AsyncBind(_Bind):
+    @contextlib.asynccontextmanager
+    async def begin(self):
+        self.began += 1
+        yield self.conn
+
+
+def _failing(*errors, result="done"):
+    pending = list(errors)
+
+    def fn(target):
+        if pending:
+            raise pending.pop(0)
+        return result
+
+    return fn
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("sqlalchemy_cubrid.retry.time.sleep") as sleep:
+        yield sleep
+
+
+class TestRunInTransaction:
+    def test_success_first_try(self, no_sleep):
+        bind = _Bind()
+        assert run_in_transaction(bind, lambda conn: conn) is bind.conn
+        assert bind.began == 1
+        no_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("code", [-72, -966, -73, -76])
+    def test_retries_lock_conflicts(self, code, no_sleep):
+        bind = _Bind()
+        stats = RetryStats()
+        fn = _failing(_dbapi_error(code), _dbapi_error(code))
+
+        assert run_in_transaction(bind, fn, retries=3, stats=stats) == "done"
+        assert bind.began == 3
+        assert no_sleep.call_count == 2
+        snapshot = stats.snapshot()
+        assert snapshot["calls"] == 1
+        assert snapshot["attempts"] == 3
+        assert snapshot["retries"] == 2
+        assert snapshot["failures"] == 0
+        assert sum(snapshot["by_category"].values()) == 2
+
+    def test_non_retryable_raises_immediately(self):
+        bind = _Bind()
+        stats = RetryStats()
+        with pytest.raises(sa_exc.DBAPIError):
+            run_in_transaction(bind, _failing(_dbapi_error(-670)), stats=stats)
+        assert bind.began == 1
+        assert stats.snapshot()["failures"] == 1
+
+    def test_non_dbapi_error_propagates(self):
+        bind = _Bind()
+        with pytest.raises(ZeroDivisionError):
+            run_in_transaction(bind, lambda conn: 1 / 0)
+        assert bind.began == 1
+
+    def test_gives_up_after_retries(self):
+        bind = _Bind()
+        stats = RetryStats()
+        errors = [_dbapi_error(-72) for _ in range(5)]
+        with pytest.raises(sa_exc.DBAPIError) as raised:
+            run_in_transaction(bind, _failing(*errors), retries=2, stats=stats)
+        assert raised.value is errors[2]
+        assert bind.began == 3
+        assert stats.snapshot() == {
+            "calls": 1,
+            "attempts": 3,
+            "retries": 2,
+            "failures": 1,
+            "by_category": {"deadlock": 2},
+        }
+
+    def test_custom_retry_on(self):
+        bind = _Bind()
+        fn = _failing(_dbapi_error(-670))
+        retry_on = DEFAULT_RETRY_ON | {ErrorCategory.UNIQUE_VIOLATION}
+        assert run_in_transaction(bind, fn, retry_on=retry_on) == "done"
+
+    def test_backoff_is_jittered_and_capped(self, no_sleep):
+        bind = _Bind()
+        fn = _failing(*[_dbapi_error(-72) for _ in range(4)])
+        with patch("sqlalchemy_cubrid.retry.random.uniform", side_effect=lambda a, b: b):
+            run_in_transaction(bind, fn, retries=4, backoff=0.1, max_backoff=0.3)
+        delays = [c.args[0] for c in no_sleep.call_args_list]
+        assert delays == pytest.approx([0.1, 0.2, 0.3, 0.3])
+
+    @pytest.mark.parametrize("kwargs", [{"retries": -1}, {"backoff": -0.1}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            run_in_transaction(_Bind(), lambda conn: None, **kwargs)
+
+    def test_non_cubrid_dialect_uses_module_classifier(self):
+        engine = create_engine("sqlite://")
+        fn = _failing(_dbapi_error(-76), result=None)
+
+        def body(conn):
+            fn(conn)
+            return conn.execute(text("SELECT 1")).scalar()
+
+        assert run_in_transaction(engine, body) == 1
+
+    def test_sessionmaker_bind(self):
+        engine = create_engine("sqlite://")
+        factory = sessionmaker(engine)
+        seen = []
+        fn = _failing(_dbapi_error(-73))
+
+        def body(session):
+            seen.append(session)
+            fn(session)
+            return session.execute(text("SELECT 2")).scalar()
+
+        assert run_in_transaction(factory, body) == 2
+        assert len(seen) == 2
+        assert seen[0] is not seen[1]
+
+
+class TestArunInTransaction:
+    def test_retries_then_succeeds(self):
+        bind = _AsyncBind()
+        stats = RetryStats()
+        errors = [_dbapi_error(-72)]
+
+        async def body(conn):
+            if errors:
+                raise errors.pop()
+            return conn
+
+        result = asyncio.run(arun_in_transaction(bind, body, backoff=0, stats=stats))
+
+        assert result is bind.conn
+        assert bind.began == 2
+        assert stats.snapshot()["retries"] == 1
+
+    def test_non_retryable_raises(self):
+        bind = _AsyncBind()
+        stats = RetryStats()
+
+        async def body(conn):
+            raise _dbapi_error(-670)
+
+        with pytest.raises(sa_exc.DBAPIError):
+            asyncio.run(arun_in_transaction(bind, body, stats=stats))
+        assert stats.snapshot()["failures"] == 1
+
+    def test_invalid_arguments(self):
+        async def body(conn):
+            return None
+
+        with pytest.raises(ValueError):
+            asyncio.run(arun_in_transaction(_AsyncBind(), body, retries=-1))
@@ -0,0 +1,173 @@
+# test/test_slowlog.py
+"""Offline tests for the per-fingerprint statement log."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+from sqlalchemy import bindparam, create_engine, exc as sa_exc, text
+
+from sqlalchemy_cubrid.slowlog import SlowQueryLog, fingerprint_sql, instrument_statements
+
+
+def _entry(log, sql_fragment):
+    (entry,) = [e for e in log.snapshot()["statements"] if sql_fragment in e["sql"]]
+    return entry
+
+
+class TestFingerprint:
+    @pytest.mark.parametrize(
+        "sql, expected",
+        [
+            ("SELECT * FROM t WHERE id = 42", "SELECT * FROM t WHERE id = ?"),
+            ("SELECT * FROM t WHERE name = 'it''s'", "SELECT * FROM t WHERE name = ?"),
+            ("SELECT * FROM t WHERE id IN (?, ?, ?)", "SELECT * FROM t WHERE id IN (?)"),
+            (
+                "SELECT * FROM t WHERE id IN (__[POSTCOMPILE_id_1])",
+                "SELECT * FROM t WHERE id IN ((?))",
+            ),
+            ("SELECT col1,\n  -1.5e3\nFROM t2", "SELECT col1, ? FROM t2"),
+        ],
+    )
+    def test_normalization(self, sql, expected):
+        assert fingerprint_sql(sql) == expected
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert fingerprint_sql('SELECT "tbl2".c3 FROM "tbl2"') == 'SELECT "tbl2".c3 FROM "tbl2"'
+
+
+class TestSlowQueryLog:
+    def test_aggregates_per_fingerprint(self):
+        log = SlowQueryLog()
+        log.record("SELECT * FROM t WHERE id = 1", 0.002, rows=1)
+        log.record("SELECT * FROM t WHERE id = 2", 0.004, rows=1)
+        log.record("INSERT INTO t VALUES (?, ?)", 0.01, rows=500, batch_size=500)
+
+        select = _entry(log, "SELECT")
+        assert select["count"] == 2
+        assert select["total_s"] == pytest.approx(0.006)
+        assert select["max_s"] == pytest.approx(0.004)
+        assert select["rows"] == 2
+        assert select["p50_s"] == pytest.approx(0.0025)
+        assert select["p99_s"] == pytest.approx(0.004)
+        insert = _entry(log, "INSERT")
+        assert insert["executemany"]["count"] == 1
+        assert insert["executemany"]["rows"] == 500
+        assert insert["executemany"]["batch_sizes"]["1000"] == 1
+
+    def test_top_and_slowest(self):
+        log = SlowQueryLog(top_k=2)
+        for sql, elapsed in [("SELECT 1", 0.5), ("SELECT a FROM b", 0.1), ("SELECT c FROM d", 0.3)]:
+            log.record(sql, elapsed)
+        log.record("SELECT a FROM b", 0.1)
+
+        assert [entry["sql"] for entry in log.top(2)] == ["SELECT ?", "SELECT c FROM d"]
+        assert log.top(1, by="count")[0]["sql"] == "SELECT a FROM b"
+        assert [entry["elapsed_s"] for entry in log.slowest()] == [0.5, 0.3]
+
+    def test_fingerprints_are_bounded(self):
+        log = SlowQueryLog(max_fingerprints=2)
+        for table in ("a", "b", "c", "d"):
+            log.record(f"SELECT x FROM {table}", 0.001)
+        statements = log.snapshot()["statements"]
+        assert len(statements) == 3
+        assert _entry(log, "<other>")["count"] == 2
+
+    def test_errors_and_reset(self):
+        log = SlowQueryLog()
+        log.record("SELECT 1", 0.001, error=True)
+        assert _entry(log, "SELECT")["errors"] == 1
+        log.reset()
+        assert log.snapshot()["statements"] == []
+        assert log.slowest() == []
+
+    def test_dump_is_json(self, tmp_path):
+        log = SlowQueryLog()
+        log.record("SELECT 1", 0.001)
+        path = tmp_path / "statements.json"
+        log.dump(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["statements"][0]["sql"] == "SELECT ?"
+        assert not (tmp_path / "statements.json.tmp").exists()
+
+    def test_periodic_dump(self, tmp_path):
+        log = SlowQueryLog()
+        path = tmp_path / "statements.json"
+        log.start_periodic_dump(path, interval=0.01)
+        try:
+            with pytest.raises(RuntimeError):
+                log.start_periodic_dump(path)
+            deadline = time.monotonic() + 5
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            log.stop_periodic_dump()
+        assert path.exists()
+        log.stop_periodic_dump()  # idempotent
+
+    @pytest.mark.parametrize("kwargs", [{"top_k": -1}, {"max_fingerprints": 0}])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            SlowQueryLog(**kwargs)
+
+    def test_invalid_dump_interval(self, tmp_path):
+        with pytest.raises(ValueError):
+            SlowQueryLog().start_periodic_dump(tmp_path / "x.json", interval=0)
+
+
+class TestInstrumentStatements:
+    def _engine(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name VARCHAR(20))"))
+        return engine
+
+    def test_records_executions(self):
+        engine = self._engine()
+        log = instrument_statements(engine)
+
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO t (id, name) VALUES (:id, :name)"),
+                [{"id": i, "name": f"n{i}"} for i in range(5)],
+            )
+            for i in range(3):
+                conn.execute(text("SELECT name FROM t WHERE id = :id"), {"id": i}).all()
+
+        select = _entry(log, "SELECT name")
+        assert select["count"] == 3
+        assert select["sql"] == "SELECT name FROM t WHERE id = ?"
+        insert = _entry(log, "INSERT")
+        assert insert["executemany"]["rows"] == 5
+        assert insert["rows"] == 5
+
+    def test_in_lists_share_a_fingerprint(self):
+        engine = self._engine()
+        log = instrument_statements(engine)
+        stmt = text("SELECT name FROM t WHERE id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        )
+        with engine.connect() as conn:
+            conn.execute(stmt, {"ids": [1]}).all()
+            conn.execute(stmt, {"ids": [1, 2, 3]}).all()
+        assert _entry(log, "SELECT name")["count"] == 2
+
+    def test_errors_are_counted(self):
+        engine = self._engine()
+        log = instrument_statements(engine)
+        with engine.connect() as conn:
+            with pytest.raises(sa_exc.DBAPIError):
+                conn.execute(text("SELECT * FROM missing"))
+        entry = _entry(log, "missing")
+        assert (entry["count"], entry["errors"]) == (1, 1)
+
+    def test_async_engine_is_unwrapped_and_twice_is_rejected(self):
+        class _AsyncEngine:
+            sync_engine = self._engine()
+
+        log = SlowQueryLog()
+        assert instrument_statements(_AsyncEngine(), log) is log
+        with pytest.raises(ValueError, match="already instrumented"):
+            instrument_statements(_AsyncEngine.sync_engine)
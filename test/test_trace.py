@@ -7,12 +7,15 @@ Integration tests with a live DB are in test_integration.py.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from sqlalchemy import text
 
+from sqlalchemy_cubrid.dialect import CubridDialect
+
 
 class TestTraceImport:
     """Test trace module imports and exports."""
@@ -31,6 +34,7 @@ class TestTraceImport:
         from sqlalchemy_cubrid.trace import __all__
 
         assert "trace_query" in __all__
+        assert "atrace_query" in __all__
 
 
 class TestTraceQuery:
@@ -200,3 +204,486 @@ class TestTraceQuery:
         assert output[0] == "Trace line 1"
         assert output[1] == "Trace line 2"
         assert output[2] == "Trace line 3"
+
+
+def _async_conn(trace_rows=(("Trace Statistics:",),), fail_on=None):
+    """AsyncConnection stand-in; ``execute`` records the SQL of each call."""
+    conn = MagicMock()
+    conn.dialect = CubridDialect()
+    conn.executed = []
+    statement_result = MagicMock(name="statement_result")
+
+    async def execute(statement, parameters=None):
+        sql = str(statement)
+        conn.executed.append(sql)
+        if fail_on is not None and sql == fail_on:
+            raise RuntimeError(f"{sql} failed")
+        if sql == "SHOW TRACE":
+            result = MagicMock()
+            result.fetchall.return_value = list(trace_rows)
+            return result
+        return statement_result
+
+    conn.execute = AsyncMock(side_effect=execute)
+    conn.statement_result = statement_result
+    return conn
+
+
+class TestAtraceQuery:
+    def test_basic_flow(self):
+        from sqlalchemy_cubrid.trace import atrace_query
+
+        conn = _async_conn(trace_rows=[("line 1",), (None,), ("line 2",)])
+        output = asyncio.run(atrace_query(conn, text("SELECT 1"), parameters={"x": 1}))
+
+        assert output == ["line 1", "line 2"]
+        assert conn.executed == ["SET TRACE ON", "SELECT 1", "SHOW TRACE", "SET TRACE OFF"]
+        assert conn.execute.call_args_list[1].args[1] == {"x": 1}
+
+    def test_trace_off_after_error(self):
+        from sqlalchemy_cubrid.trace import atrace_query
+
+        conn = _async_conn(fail_on="SELECT 1")
+        with pytest.raises(RuntimeError, match="SELECT 1 failed"):
+            asyncio.run(atrace_query(conn, text("SELECT 1")))
+        assert conn.executed[-1] == "SET TRACE OFF"
+
+    def test_trace_off_failure_is_swallowed(self):
+        from sqlalchemy_cubrid.trace import atrace_query
+
+        conn = _async_conn(fail_on="SET TRACE OFF")
+        assert asyncio.run(atrace_query(conn, text("SELECT 1"))) == ["Trace Statistics:"]
+
+
+class TestAsyncTraceSampler:
+    def test_unsampled_runs_plain(self):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        sink = MagicMock()
+        conn = _async_conn()
+        result = asyncio.run(AsyncTraceSampler(0.0, sink).execute(conn, text("SELECT 1")))
+
+        assert result is conn.statement_result
+        assert conn.executed == ["SELECT 1"]
+        sink.assert_not_called()
+
+    def test_sampled_returns_result_and_feeds_async_sink(self):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        received = []
+
+        async def sink(sql, trace):
+            received.append((sql, trace))
+
+        conn = _async_conn()
+        sampler = AsyncTraceSampler(1.0, sink)
+        result = asyncio.run(sampler.execute(conn, text("SELECT :x"), {"x": 1}))
+
+        assert result is conn.statement_result
+        assert conn.executed == ["SET TRACE ON", "SELECT :x", "SHOW TRACE", "SET TRACE OFF"]
+        assert received == [("SELECT ?", ["Trace Statistics:"])]
+
+    def test_rate_is_respected(self):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        sink = MagicMock()
+        sampler = AsyncTraceSampler(0.25, sink, seed=7)
+
+        async def run():
+            for _ in range(400):
+                await sampler.execute(_async_conn(), text("SELECT 1"))
+
+        asyncio.run(run())
+        assert 60 < sink.call_count < 140
+
+    @pytest.mark.parametrize("fail_on", ["SET TRACE ON", "SHOW TRACE", "SET TRACE OFF"])
+    def test_tracing_failures_do_not_fail_the_statement(self, fail_on):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        conn = _async_conn(fail_on=fail_on)
+        result = asyncio.run(AsyncTraceSampler(1.0, MagicMock()).execute(conn, text("SELECT 1")))
+        assert result is conn.statement_result
+
+    def test_statement_error_propagates_and_disables_trace(self):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        sink = MagicMock()
+        conn = _async_conn(fail_on="SELECT 1")
+        with pytest.raises(RuntimeError):
+            asyncio.run(AsyncTraceSampler(1.0, sink).execute(conn, text("SELECT 1")))
+        assert conn.executed[-1] == "SET TRACE OFF"
+        sink.assert_not_called()
+
+    def test_sink_errors_are_ignored(self):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        conn = _async_conn()
+        sampler = AsyncTraceSampler(1.0, MagicMock(side_effect=ValueError("full")))
+        assert asyncio.run(sampler.execute(conn, text("SELECT 1"))) is conn.statement_result
+
+    @pytest.mark.parametrize("rate", [-0.1, 1.5])
+    def test_invalid_rate(self, rate):
+        from sqlalchemy_cubrid.trace import AsyncTraceSampler
+
+        with pytest.raises(ValueError):
+            AsyncTraceSampler(rate, MagicMock())
+
+
+_TEXT_TRACE = """
+Query Plan:
+  SORT (group by)
+    NESTED LOOPS (inner join)
+      TABLE SCAN (o)
+      INDEX SCAN (p.fk_participant_host_year) (key range: (o.host_year=p.host_year))
+
+  rewritten query: select o.host_year, sum(p.gold) from olympic o, participant p group by o.host_year
+
+Trace Statistics:
+  SELECT (time: 12, fetch: 975, ioread: 2)
+    SCAN (table: olympic), (heap time: 2, fetch: 26, ioread: 0, readrows: 25, rows: 25)
+      SCAN (index: participant.fk_participant_host_year), (btree time: 8, fetch: 941, ioread: 2, readkeys: 5, filteredkeys: 5, rows: 916, covered: true) (lookup time: 1, rows: 14)
+    GROUPBY (time: 0, sort: true, page: 0, ioread: 0, rows: 5)
+    SUBQUERY (uncorrelated)
+      SELECT (time: 0, fetch: 2, ioread: 0)
+        SCAN (temp time: 0, fetch: 0, ioread: 0, readrows: 1, rows: 1)
+"""  # noqa: E501
+
+_JSON_TRACE = """{
+  "Trace Statistics": {
+    "SELECT": {
+      "time": 29, "fetch": 5836, "ioread": 3,
+      "SCAN": {
+        "access": "table (dba.game)",
+        "heap": {"time": 20, "fetch": 5800, "ioread": 3, "readrows": 8653, "rows": 400},
+        "SCAN": {
+          "access": "index (dba.athlete.pk_athlete_code)",
+          "btree": {"time": 3, "fetch": 30, "ioread": 0, "readkeys": 400, "rows": 400},
+          "lookup": {"time": 1, "rows": 400}
+        }
+      },
+      "MERGELIST": {
+        "outer": {
+          "SELECT": {"time": 0, "fetch": 2, "ioread": 0,
+                     "SCAN": {"access": "temp",
+                              "temp": {"time": 0, "fetch": 0, "ioread": 0, "rows": 1}}}
+        }
+      },
+      "ORDERBY": {"time": 5, "sort": true, "page": 21, "ioread": 3}
+    }
+  }
+}"""
+
+
+class TestParseTrace:
+    """parse_trace() on the text and JSON SHOW TRACE formats."""
+
+    def test_text_tree(self):
+        from sqlalchemy_cubrid.trace import parse_trace
+
+        plan = parse_trace([_TEXT_TRACE])
+
+        (root,) = plan.roots
+        assert plan.format == "text"
+        assert (root.kind, root.time, root.fetch, root.ioread) == ("SELECT", 12, 975, 2)
+        outer, groupby, subquery = root.children
+        assert (outer.access, outer.target, outer.rows) == ("table", "olympic", 25)
+        (inner,) = outer.children
+        assert (inner.access, inner.target) == ("index", "participant.fk_participant_host_year")
+        # btree + lookup groups add up; rows come from the lookup.
+        assert (inner.time, inner.fetch, inner.rows, inner.covered) == (9, 941, 14, True)
+        assert inner.stats["btree"]["readkeys"] == 5
+        assert groupby.is_sort and groupby.rows == 5
+        assert subquery.detail == "uncorrelated"
+        assert subquery.children[0].children[0].access == "temp"
+        assert plan.rewritten_query.startswith("select o.host_year")
+        assert "NESTED LOOPS" in plan.query_plan
+
+    def test_text_helpers(self):
+        from sqlalchemy_cubrid.trace import parse_trace
+
+        plan = parse_trace(_TEXT_TRACE)
+
+        assert [node.target for node in plan.full_scans()] == ["olympic"]
+        assert [node.target for node in plan.joins()] == ["olympic"]
+        assert [node.kind for node in plan.sorts()] == ["GROUPBY"]
+        assert plan.hottest_node().target == "participant.fk_participant_host_year"
+        assert len(plan.scans()) == 3
+
+    def test_json_tree(self):
+        from sqlalchemy_cubrid.trace import parse_trace
+
+        plan = parse_trace(_JSON_TRACE)
+
+        (root,) = plan.roots
+        assert plan.format == "json"
+        assert (root.kind, root.time, root.fetch) == ("SELECT", 29, 5836)
+        assert [child.kind for child in root.children] == ["SCAN", "MERGELIST", "ORDERBY"]
+        outer = root.children[0]
+        assert (outer.access, outer.target, outer.rows) == ("table", "dba.game", 400)
+        assert outer.children[0].target == "dba.athlete.pk_athlete_code"
+        assert outer.children[0].time == 4
+        assert root.children[1].children[0].children[0].access == "temp"
+        assert plan.hottest_node() is outer
+        assert plan.sorts() == [root.children[2]]
+
+    def test_to_dict_is_json_serializable(self):
+        import json
+
+        from sqlalchemy_cubrid.trace import parse_trace
+
+        data = json.loads(json.dumps(parse_trace(_JSON_TRACE).to_dict()))
+        scan = data["roots"][0]["children"][0]
+        assert scan["kind"] == "SCAN"
+        assert scan["stats"]["heap"]["readrows"] == 8653
+        assert scan["children"][0]["covered"] is False
+
+    def test_statement_without_operators(self):
+        from sqlalchemy_cubrid.trace import parse_trace
+
+        plan = parse_trace("'\nTrace Statistics:\n  SELECT (time: 0, fetch: 3)\n'")
+        assert plan.hottest_node() is None
+        assert plan.full_scans() == []
+
+    @pytest.mark.parametrize("output", ["", "Query Plan:\n  TABLE SCAN (t)", "{not json", "{}"])
+    def test_unparseable_output(self, output):
+        from sqlalchemy_cubrid.trace import parse_trace
+
+        with pytest.raises(ValueError):
+            parse_trace(output)
+
+
+class _TracingConnection:
+    """DBAPI connection stand-in whose aux cursor answers SHOW TRACE."""
+
+    def __init__(self, fail_on=None):
+        self.executed = []
+        self.fail_on = fail_on
+
+    def cursor(self):
+        conn = self
+        cursor = MagicMock()
+
+        def execute(sql, *args):
+            conn.executed.append(sql)
+            if sql == conn.fail_on:
+                raise RuntimeError(sql)
+
+        cursor.execute.side_effect = execute
+        cursor.fetchall.return_value = [(_TEXT_TRACE,)]
+        return cursor
+
+
+def _run_statement(conn, sql="SELECT * FROM t"):
+    return lambda: conn.executed.append(sql)
+
+
+class TestStatementTracer:
+    """Engine-level sampled tracing (cubrid_trace_* options)."""
+
+    def test_sampled_statement_is_traced(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        records = []
+        tracer = StatementTracer(1.0, sink=records.append)
+        conn = _TracingConnection()
+
+        tracer.execute(conn, "SELECT * FROM t", _run_statement(conn))
+
+        assert conn.executed == ["SET TRACE ON", "SELECT * FROM t", "SHOW TRACE", "SET TRACE OFF"]
+        (record,) = records
+        assert record["reason"] == "sample"
+        assert record["sql"] == "SELECT * FROM t"
+        assert record["elapsed_s"] >= 0
+        assert record["plan"]["roots"][0]["kind"] == "SELECT"
+
+    def test_unsampled_statement_runs_alone(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        sink = MagicMock()
+        tracer = StatementTracer(0.0, sink=sink)
+        conn = _TracingConnection()
+        tracer.execute(conn, "SELECT 1", _run_statement(conn, "SELECT 1"))
+        assert conn.executed == ["SELECT 1"]
+        sink.assert_not_called()
+
+    def test_slow_statement_is_traced_next_time(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        records = []
+        tracer = StatementTracer(slow_threshold=0.0, sink=records.append)
+        conn = _TracingConnection()
+
+        tracer.execute(conn, "SELECT * FROM t", _run_statement(conn))
+        assert records == []
+        tracer.execute(conn, "SELECT * FROM t", _run_statement(conn))
+        assert [record["reason"] for record in records] == ["slow"]
+        assert "SET TRACE ON" in conn.executed
+
+    def test_slow_statements_are_bounded(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        tracer = StatementTracer(slow_threshold=0.0, max_slow_statements=2)
+        conn = _TracingConnection()
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 3"):
+            tracer.execute(conn, sql, _run_statement(conn, sql))
+        assert list(tracer._slow) == ["SELECT 2", "SELECT 3"]
+
+    def test_trace_commands_are_not_traced(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        tracer = StatementTracer(1.0, sink=MagicMock())
+        conn = _TracingConnection()
+        tracer.execute(conn, "SET TRACE ON", _run_statement(conn, "SET TRACE ON"))
+        assert conn.executed == ["SET TRACE ON"]
+
+    @pytest.mark.parametrize("fail_on", ["SET TRACE ON", "SHOW TRACE", "SET TRACE OFF"])
+    def test_tracing_failures_do_not_fail_the_statement(self, fail_on):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        tracer = StatementTracer(1.0, sink=MagicMock(side_effect=ValueError("full")))
+        conn = _TracingConnection(fail_on=fail_on)
+        tracer.execute(conn, "SELECT * FROM t", _run_statement(conn))
+        assert "SELECT * FROM t" in conn.executed
+
+    def test_statement_error_propagates_and_disables_trace(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        sink = MagicMock()
+        tracer = StatementTracer(1.0, sink=sink)
+        conn = _TracingConnection()
+        with pytest.raises(RuntimeError):
+            tracer.execute(conn, "SELECT * FROM t", MagicMock(side_effect=RuntimeError))
+        assert conn.executed[-1] == "SET TRACE OFF"
+        sink.assert_not_called()
+
+    def test_unparseable_trace_has_no_plan(self):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        records = []
+        conn = _TracingConnection()
+        tracer = StatementTracer(1.0, sink=records.append)
+        original_cursor = conn.cursor
+
+        def cursor():
+            aux = original_cursor()
+            aux.fetchall.return_value = [("garbage",)]
+            return aux
+
+        conn.cursor = cursor
+        tracer.execute(conn, "SELECT * FROM t", _run_statement(conn))
+        assert records[0]["plan"] is None
+        assert records[0]["trace"] == ["garbage"]
+
+    @pytest.mark.parametrize("kwargs", [{"sample_rate": 1.5}, {"slow_threshold": -1}])
+    def test_invalid_settings(self, kwargs):
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        with pytest.raises(ValueError):
+            StatementTracer(**kwargs)
+
+    def test_default_sink_logs_json(self, caplog):
+        from sqlalchemy_cubrid.trace import log_trace_sink
+
+        with caplog.at_level("INFO", logger="sqlalchemy_cubrid.trace"):
+            log_trace_sink({"sql": "SELECT 1"})
+        assert '"sql": "SELECT 1"' in caplog.text
+
+
+class TestEngineTraceOptions:
+    def test_dialect_routes_execute_through_tracer(self):
+        records = []
+        dialect = CubridDialect(cubrid_trace_sample_rate=1.0, cubrid_trace_sink=records.append)
+        conn = _TracingConnection()
+        context = MagicMock()
+        context.root_connection.connection.dbapi_connection = conn
+        cursor = MagicMock()
+        cursor.execute.side_effect = lambda sql, *args: conn.executed.append(sql)
+
+        dialect.do_execute(cursor, "SELECT * FROM t WHERE id = ?", (1,), context)
+        dialect.do_execute_no_params(cursor, "SELECT 1", context)
+
+        assert [record["sql"] for record in records] == ["SELECT * FROM t WHERE id = ?", "SELECT 1"]
+        cursor.execute.assert_any_call("SELECT * FROM t WHERE id = ?", (1,))
+
+    def test_engine_option(self):
+        from sqlalchemy import create_engine
+
+        from sqlalchemy_cubrid.trace import StatementTracer
+
+        engine = create_engine(
+            "cubrid+pycubrid://dba@localhost/db",
+            cubrid_trace_sample_rate=0.01,
+            cubrid_trace_slow_threshold=0.5,
+        )
+        tracer = engine.dialect._statement_tracer
+        assert isinstance(tracer, StatementTracer)
+        assert (tracer.sample_rate, tracer.slow_threshold) == (0.01, 0.5)
+
+    def test_trace_query_keeps_its_trace(self):
+        pytest.importorskip("pycubrid")
+        from sqlalchemy import create_engine
+
+        from sqlalchemy_cubrid.trace import trace_query
+        from test.conftest import StubConnection
+
+        class _Session(StubConnection):
+            """Keeps one statement's trace while SET TRACE is on, like the server."""
+
+            tracing = False
+            trace = ()
+
+            def respond(self, operation, parameters):
+                result = super().respond(operation, parameters)
+                if operation.startswith("SET TRACE"):
+                    self.tracing = operation == "SET TRACE ON"
+                elif operation == "SHOW TRACE":
+                    rows, self.trace = self.trace, ()
+                    return ("trace",), rows
+                elif self.tracing:
+                    self.trace = [(_TEXT_TRACE,)]
+                return result
+
+        records = []
+        raw = _Session()
+        engine = create_engine(
+            "cubrid+pycubrid://",
+            creator=lambda: raw,
+            cubrid_trace_sample_rate=1.0,
+            cubrid_trace_sink=records.append,
+        )
+        try:
+            with engine.connect() as conn:
+                assert trace_query(conn, text("SELECT * FROM t")) == [_TEXT_TRACE]
+                conn.exec_driver_sql("SELECT * FROM u")
+        finally:
+            engine.dispose()
+
+        assert [record["sql"] for record in records] == ["SELECT * FROM u"]
+        assert records[0]["trace"] == [_TEXT_TRACE]
+
+    def test_disabled_by_default(self):
+        dialect = CubridDialect()
+        assert dialect._statement_tracer is None
+        cursor = MagicMock()
+        dialect.do_execute(cursor, "SELECT 1", (), MagicMock())
+        cursor.execute.assert_called_once_with("SELECT 1", ())
+
+
+class TestJsonlTraceSink:
+    def test_writes_and_rotates(self, tmp_path):
+        import json
+
+        from sqlalchemy_cubrid.trace import JsonlTraceSink
+
+        path = tmp_path / "trace.jsonl"
+        sink = JsonlTraceSink(path, max_bytes=200, backup_count=2)
+        try:
+            for i in range(10):
+                sink({"sql": f"SELECT {i}", "trace": ["x" * 40]})
+        finally:
+            sink.close()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[-1])["sql"] == "SELECT 9"
+        assert (tmp_path / "trace.jsonl.1").exists()
+        assert not (tmp_path / "trace.jsonl.3").exists()
@@ -7,8 +7,15 @@ visit names, repr, and inheritance.
 
 from __future__ import annotations
 
+from collections import Counter
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, insert
 from sqlalchemy.sql import sqltypes
 
+from sqlalchemy_cubrid.dialect import CubridDialect
+from sqlalchemy_cubrid.pycubrid_dialect import PyCubridDialect
+
 from sqlalchemy_cubrid.types import (
     BIGINT,
     BIT,
@@ -221,6 +228,88 @@ class TestCollectionTypes:
         assert t._ddl_values == ()
 
 
+class _Tag(sqltypes.TypeDecorator):
+    impl = VARCHAR
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return value.lower()
+
+    def process_result_value(self, value, dialect):
+        return value.upper()
+
+
+class TestCollectionProcessors:
+    """SET / MULTISET / SEQUENCE map to frozenset / Counter / tuple."""
+
+    @pytest.fixture
+    def pycubrid(self):
+        return pytest.importorskip("pycubrid")
+
+    def _processors(self, type_, dialect=None):
+        dialect = dialect or PyCubridDialect()
+        return type_.bind_processor(dialect), type_.result_processor(dialect, None)
+
+    def test_python_types(self):
+        assert SET("VARCHAR").python_type is frozenset
+        assert MULTISET("INTEGER").python_type is Counter
+        assert SEQUENCE("DOUBLE").python_type is tuple
+
+    def test_pycubrid_params(self, pycubrid):
+        bind, _ = self._processors(SET(VARCHAR(20)))
+        tags = bind({"b", "a"})
+        assert type(tags) is pycubrid.Set and sorted(tags) == ["a", "b"]
+        assert bind(None) is None
+        param = pycubrid.Set(["a"])
+        assert bind(param) is param
+        bind, _ = self._processors(MULTISET("INTEGER"))
+        assert sorted(bind(Counter({1: 2, 3: 1}))) == [1, 1, 3]
+        assert type(bind([1, 1])) is pycubrid.Multiset
+        bind, _ = self._processors(SEQUENCE("INTEGER"))
+        assert bind([3, 1, 3]) == pycubrid.Sequence([3, 1, 3])
+        assert bind(x for x in (1, 2)) == pycubrid.Sequence([1, 2])
+
+    def test_rejected_values(self, pycubrid):
+        with pytest.raises(TypeError, match="must be ordered"):
+            self._processors(SEQUENCE("INTEGER"))[0]({1, 2})
+        with pytest.raises(TypeError, match="not str"):
+            self._processors(SET("VARCHAR"))[0]("abc")
+        with pytest.raises(TypeError, match="not dict"):
+            self._processors(MULTISET("VARCHAR"))[0]({"a": 1})
+
+    def test_plain_list_without_driver_params(self):
+        bind, _ = self._processors(SET("VARCHAR"), CubridDialect())
+        assert sorted(bind(frozenset({"a", "b"}))) == ["a", "b"]
+        assert type(bind(["a"])) is list
+
+    def test_results(self, pycubrid):
+        _, result = self._processors(SET("VARCHAR"))
+        tags = frozenset({"a", "b"})
+        assert result(tags) is tags
+        assert result(["a", "b", "a"]) == tags
+        assert result(({"k": 1},)) == ({"k": 1},)
+        assert result(None) is None
+        assert result(b"\x02\x00") == b"\x02\x00"
+        _, result = self._processors(MULTISET("INTEGER"))
+        assert result([1, 1, 2]) == Counter({1: 2, 2: 1})
+        _, result = self._processors(SEQUENCE("INTEGER"))
+        assert result([3, 1, 3]) == (3, 1, 3)
+
+    def test_member_type_processors(self, pycubrid):
+        bind, result = self._processors(SET(_Tag()))
+        assert bind(["Admin", "ADMIN"]) == pycubrid.Set(["admin", "admin"])
+        assert result(frozenset({"admin", "ops"})) == frozenset({"ADMIN", "OPS"})
+        bind, result = self._processors(SEQUENCE(_Tag()))
+        assert result(["a", "b"]) == ("A", "B")
+
+    def test_executemany_binds_each_row(self, pycubrid):
+        table = Table("items", MetaData(), Column("tags", SET(VARCHAR(20))))
+        compiled = insert(table).compile(dialect=PyCubridDialect())
+        process = compiled._bind_processors["tags"]
+        rows = [process(tags) for tags in (["a"], ("b", "c"), None)]
+        assert rows == [pycubrid.Set(["a"]), pycubrid.Set(["b", "c"]), None]
+
+
 class TestRepr:
     """Test _StringType __repr__."""
 